@@ -6,8 +6,8 @@ Background Manager Module for Fish-O-Mania
 This module contains the BackgroundManager class for background elements
 """
 
-import random
 from mechanics.constants import SCREEN_WIDTH, WATER_SURFACE, WATER_BOTTOM
+from mechanics.random_streams import stream
 from background.ripple import Ripple
 from background.seaweed import Seaweed
 from background.rock import Rock
@@ -15,6 +15,10 @@ from background.bubble import Bubble
 from background.wave import Wave
 from background.sand_layers import SandLayers
 
+# Frames between random spawns (min, max) of the dynamic effects
+RIPPLE_INTERVAL = (30, 90)
+BUBBLE_INTERVAL = (20, 60)
+
 
 class BackgroundManager:
     """
@@ -29,16 +33,32 @@ class BackgroundManager:
         bubbles (list): Active bubble animations
         wave (Wave): Water surface wave
         sand (SandLayers): Sand terrain
+        scenery_rng (random.Random): Stream for seaweed and rocks
+        ripple_rng (random.Random): Stream for ripples
+        bubble_rng (random.Random): Stream for bubbles
     """
 
-    def __init__(self, sand_layer_files=None, use_terrain_files=True):
+    def __init__(self, sand_layer_files=None, use_terrain_files=True,
+                 scenery_rng=None, ripple_rng=None, bubble_rng=None):
         """
         Initialize the background manager
 
+        Each kind of element has its own random stream, so changing how
+        many ripples or bubbles appear doesn't change anything else
+
         Args:
             sand_layer_files (list): sand layer image paths
             use_terrain_files (bool): If True, load default terrain files
+            scenery_rng (random.Random): Defaults to the "scenery" stream
+            ripple_rng (random.Random): Defaults to the "ripples" stream
+            bubble_rng (random.Random): Defaults to the "bubbles" stream
         """
+        self.scenery_rng = (scenery_rng if scenery_rng is not None
+                            else stream("scenery"))
+        self.ripple_rng = (ripple_rng if ripple_rng is not None
+                           else stream("ripples"))
+        self.bubble_rng = (bubble_rng if bubble_rng is not None
+                           else stream("bubbles"))
         self.ripples = []
         self.seaweeds = []
         self.rocks = []
@@ -56,18 +76,20 @@ class BackgroundManager:
 
     def _generate_seaweed(self):
         """Generate seaweed plants at random positions"""
-        num_seaweed = random.randint(8, 12)
+        rng = self.scenery_rng
+        num_seaweed = rng.randint(8, 12)
         for _ in range(num_seaweed):
-            x = random.randint(0, SCREEN_WIDTH)
-            self.seaweeds.append(Seaweed(x))
+            x = rng.randint(0, SCREEN_WIDTH)
+            self.seaweeds.append(Seaweed(x, rng))
 
     def _generate_rocks(self):
         """Generate rocks at random positions near the bottom"""
-        num_rocks = random.randint(5, 10)
+        rng = self.scenery_rng
+        num_rocks = rng.randint(5, 10)
         for _ in range(num_rocks):
-            x = random.randint(0, SCREEN_WIDTH - 80)
-            y = WATER_BOTTOM - random.randint(0, 40)
-            self.rocks.append(Rock(x, y))
+            x = rng.randint(0, SCREEN_WIDTH - 80)
+            y = WATER_BOTTOM - rng.randint(0, 40)
+            self.rocks.append(Rock(x, y, rng))
 
     def add_ripple(self, x, y):
         """
@@ -77,7 +99,18 @@ class BackgroundManager:
             x (float): X-coordinate for ripple
             y (float): Y-coordinate for ripple
         """
-        self.ripples.append(Ripple(x, y))
+        self.ripples.append(Ripple(x, y, self.ripple_rng))
+
+    def reset_timers(self):
+        """
+        Restart the ripple and bubble spawn timers
+
+        The menu leaves them wherever it stopped; a replayed session
+        needs the effects to spawn on the same frames as when it was
+        recorded
+        """
+        self.ripple_timer = 0
+        self.bubble_timer = 0
 
     def update(self):
         """Update all background elements"""
@@ -91,9 +124,9 @@ class BackgroundManager:
 
         # Spawn random surface ripples
         self.ripple_timer += 1
-        if self.ripple_timer > random.randint(30, 90):
+        if self.ripple_timer > self.ripple_rng.randint(*RIPPLE_INTERVAL):
             self.ripple_timer = 0
-            x = random.randint(50, SCREEN_WIDTH - 50)
+            x = self.ripple_rng.randint(50, SCREEN_WIDTH - 50)
             self.add_ripple(x, WATER_SURFACE + 10)
 
         # Update seaweed animation
@@ -107,11 +140,12 @@ class BackgroundManager:
 
         # Spawn random bubbles
         self.bubble_timer += 1
-        if self.bubble_timer > random.randint(20, 60):
+        rng = self.bubble_rng
+        if self.bubble_timer > rng.randint(*BUBBLE_INTERVAL):
             self.bubble_timer = 0
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(WATER_SURFACE + 50, WATER_BOTTOM - 20)
-            self.bubbles.append(Bubble(x, y))
+            x = rng.randint(0, SCREEN_WIDTH)
+            y = rng.randint(WATER_SURFACE + 50, WATER_BOTTOM - 20)
+            self.bubbles.append(Bubble(x, y, rng))
 
     def draw(self, surface):
         """
@@ -7,9 +7,9 @@ This module contains the Bubble class for rising bubble effects.
 """
 
 import pygame
-import random
 import math
 from mechanics.constants import WATER_SURFACE, WHITE
+from mechanics.random_streams import stream
 
 
 class Bubble:
@@ -27,22 +27,25 @@ class Bubble:
         alive (bool): Whether bubble should continue animating.
     """
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=None):
         """
         Initialize a bubble at the specified position.
 
         Args:
             x (float): X-coordinate for bubble start.
             y (float): Y-coordinate for bubble start.
+            rng (random.Random): Random stream, defaults to "bubbles".
         """
+        if rng is None:
+            rng = stream("bubbles")
         self.x = x
         self.y = y
-        self.radius = random.randint(3, 8)
-        self.speed = random.uniform(0.5, 1.5)
+        self.radius = rng.randint(3, 8)
+        self.speed = rng.uniform(0.5, 1.5)
 
         # Wobble parameters
-        self.wobble = random.uniform(-0.3, 0.3)
-        self.wobble_offset = random.uniform(0, math.pi * 2)
+        self.wobble = rng.uniform(-0.3, 0.3)
+        self.wobble_offset = rng.uniform(0, math.pi * 2)
         self.time = 0
 
         self.alive = True
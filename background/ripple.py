@@ -7,7 +7,7 @@ This module contains the Ripple class for animated water surface effects
 """
 
 import pygame
-import random
+from mechanics.random_streams import stream
 
 
 class Ripple:
@@ -26,20 +26,23 @@ class Ripple:
         alive (bool): Whether the ripple should continue animating
     """
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=None):
         """
         Initialize a ripple at the specified position
 
         Args:
             x (float): X-coordinate for ripple center
             y (float): Y-coordinate for ripple center
+            rng (random.Random): Random stream, defaults to "ripples"
         """
+        if rng is None:
+            rng = stream("ripples")
         self.x = x
         self.y = y
         self.radius = 0
-        self.max_radius = random.randint(30, 80)
+        self.max_radius = rng.randint(30, 80)
         self.alpha = 255
-        self.growth_rate = random.uniform(0.5, 1.0)
+        self.growth_rate = rng.uniform(0.5, 1.0)
         self.fade_rate = 8
         self.alive = True
 
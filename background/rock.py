@@ -7,8 +7,8 @@ This module contains the Rock class for static underwater decorations.
 """
 
 import pygame
-import random
 import math
+from mechanics.random_streams import stream
 
 
 class Rock:
@@ -25,21 +25,24 @@ class Rock:
 
     """
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=None):
         """
         Initialize a rock at the specified position
 
         Args:
             x (int): X-coordinate for rock
             y (int): Y-coordinate for rock
+            rng (random.Random): Random stream, defaults to "scenery"
         """
+        if rng is None:
+            rng = stream("scenery")
         self.x = x
         self.y = y
-        self.width = random.randint(30, 80)
-        self.height = random.randint(20, 50)
+        self.width = rng.randint(30, 80)
+        self.height = rng.randint(20, 50)
 
         # Color with highlight and shadow variants
-        self.color = random.choice([
+        self.color = rng.choice([
             (105, 105, 105),  # Dim gray
             (119, 136, 153),  # Light slate gray
             (112, 128, 144),  # Slate gray
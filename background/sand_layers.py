@@ -7,6 +7,7 @@ This module contains the SandLayers class for terrain rendering
 """
 
 import pygame
+from mechanics.assets import load_image
 from mechanics.constants import SCREEN_WIDTH, WATER_BOTTOM
 
 # Configuration
@@ -65,7 +66,7 @@ class SandLayers:
         for filename in BASE_LAYER_FILES:
             filepath = f"{directory}/{filename}"
             try:
-                layer = pygame.image.load(filepath).convert_alpha()
+                layer = load_image(filepath, "background")
                 self.base_layers.append(layer)
             except (pygame.error, FileNotFoundError) as e:
                 print(f"Error loading layer {filepath}: {e}")
@@ -73,7 +74,7 @@ class SandLayers:
         # Load top outline
         top_filepath = f"{directory}/{TOP_OUTLINE_FILENAME}"
         try:
-            self.top_layer = pygame.image.load(top_filepath).convert_alpha()
+            self.top_layer = load_image(top_filepath, "background")
             self.top_layer_width = self.top_layer.get_width()
         except (pygame.error, FileNotFoundError) as e:
             print(f"Error loading top layer {top_filepath}: {e}")
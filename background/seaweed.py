@@ -7,9 +7,9 @@ This module contains the Seaweed class for animated seaweed
 """
 
 import pygame
-import random
 import math
 from mechanics.constants import SCREEN_HEIGHT
+from mechanics.random_streams import stream
 
 
 class Seaweed:
@@ -26,27 +26,30 @@ class Seaweed:
         segments (int): Number of segments for smooth curve
     """
 
-    def __init__(self, x):
+    def __init__(self, x, rng=None):
         """
         Initialize seaweed at the specified X position
 
         Args:
             x (int): X-coordinate for seaweed base
+            rng (random.Random): Random stream, defaults to "scenery"
         """
+        if rng is None:
+            rng = stream("scenery")
         self.x = x
         self.base_y = SCREEN_HEIGHT - 2
-        self.height = random.randint(80, 150)
+        self.height = rng.randint(80, 150)
         self.segments = 8
 
         # Sway animation parameters
-        self.sway_offset = random.uniform(0, math.pi * 2)
-        self.sway_speed = random.uniform(0.02, 0.05)
-        self.sway_amount = random.randint(10, 20)
+        self.sway_offset = rng.uniform(0, math.pi * 2)
+        self.sway_speed = rng.uniform(0.02, 0.05)
+        self.sway_amount = rng.randint(10, 20)
         self.time = 0
 
         # Appearance
         self.color = (34, 139, 34)  # Forest green
-        self.width = random.randint(8, 12)
+        self.width = rng.randint(8, 12)
 
     def update(self):
         """Update seaweed sway animation"""
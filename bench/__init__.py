@@ -0,0 +1,22 @@
+"""
+Benchmarks for Fish-O-Mania.
+
+Headless performance checks for the game's hot paths. Run them from the
+game directory so the asset paths resolve.
+
+Modules:
+    micro: Component micro-benchmarks with JSON results and a compare
+        command for spotting regressions.
+    scene: Whole mode loops run headless with scripted input.
+    soak: Long simulated sessions checked for memory and frame-time drift.
+    imports: The menu's import time checked against a budget.
+    replay: Recorded player sessions played back headless and timed.
+
+Usage:
+    python -m bench.micro run -o baseline.json
+    python -m bench.micro compare baseline.json
+    python -m bench.scene --frames 2000 --fish 30
+    python -m bench.soak --mode endless --minutes 120
+    python -m bench.imports
+    python -m bench.replay replays/classic-20250101-120000.fomr
+"""
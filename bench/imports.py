@@ -0,0 +1,189 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Import Time Budget for Fish-O-Mania.
+
+Imports the menu (main_menu) in fresh interpreters with
+"python -X importtime" and checks what the player waits for before the
+first menu frame:
+    - the game's own modules (mechanics, ui, background, fish, modes and
+      main_menu, self time only) must import within the budget
+    - modules only a game mode needs (PyAudio, mechanics.Recorder and the
+      modes) must not be imported by the menu at all
+
+Third-party packages are reported but not budgeted: pygame imports numpy
+itself (for surfarray), so numpy's cost is pygame's. Each run is a new
+process; the fastest of the runs is kept for every module to leave out
+noise from the machine.
+
+Run from the game directory with:
+    python -m bench.imports [--runs N] [--budget MS] [--json FILE]
+
+The exit status is 1 if the budget is exceeded or a mode-only module was
+imported.
+
+Functions:
+    parse_importtime: Parse "python -X importtime" output.
+    measure: Import a module in fresh interpreters and time it.
+    check: Compare a measurement with the budget.
+    main: Command line entry point.
+"""
+
+import os
+
+# Headless before pygame is imported anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import subprocess
+import sys
+
+# Milliseconds the game's own modules may take to import (self time)
+IMPORT_BUDGET_MS = 40.0
+
+DEFAULT_RUNS = 5
+
+# Top-level packages and modules that belong to the game
+GAME_PACKAGES = ("mechanics", "ui", "background", "fish", "modes",
+                 "main_menu")
+
+# Modules the menu must not import; a game mode loads them on first use
+MODE_ONLY_MODULES = ("pyaudio", "mechanics.Recorder", "modes.mode_classic",
+                     "modes.mode_time_attack", "modes.mode_endless")
+
+# Third-party packages reported with their cumulative time
+THIRD_PARTY = ("pygame", "numpy", "pyaudio", "sqlite3")
+
+
+def parse_importtime(output):
+    """
+    Parse "python -X importtime" output.
+
+    Args:
+        output (str): The interpreter's stderr.
+
+    Returns:
+        dict: Module name -> (self ms, cumulative ms).
+    """
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # The header line
+        modules[parts[2].strip()] = (self_us / 1000, cumulative_us / 1000)
+    return modules
+
+
+def _is_game_module(name):
+    """True for the game's own modules."""
+    return name.split(".")[0] in GAME_PACKAGES
+
+
+def measure(module="main_menu", runs=DEFAULT_RUNS):
+    """
+    Import a module in fresh interpreters and time it.
+
+    Args:
+        module (str): Module to import.
+        runs (int): Interpreters to start; the fastest time of each
+            imported module is kept.
+
+    Returns:
+        dict: Module name -> (self ms, cumulative ms).
+    """
+    fastest = {}
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+            check=True)
+        for name, times in parse_importtime(result.stderr).items():
+            if name not in fastest or times[0] < fastest[name][0]:
+                fastest[name] = times
+    return fastest
+
+
+def check(modules, budget=IMPORT_BUDGET_MS):
+    """
+    Compare a measurement with the budget.
+
+    Args:
+        modules (dict): Result of measure() or parse_importtime().
+        budget (float): Milliseconds the game's own modules may take.
+
+    Returns:
+        dict: "game_ms", "budget_ms", "third_party_ms" (package ->
+            cumulative ms), "slowest" (the game's five slowest modules),
+            "mode_only" (mode-only modules that were imported) and "ok".
+    """
+    game = {name: times[0] for name, times in modules.items()
+            if _is_game_module(name)}
+    game_ms = sum(game.values())
+    mode_only = [name for name in MODE_ONLY_MODULES if name in modules]
+    slowest = sorted(game.items(), key=lambda item: -item[1])[:5]
+    return {
+        "game_ms": game_ms,
+        "budget_ms": budget,
+        "third_party_ms": {name: modules[name][1] for name in THIRD_PARTY
+                           if name in modules},
+        "slowest": slowest,
+        "mode_only": mode_only,
+        "ok": game_ms <= budget and not mode_only,
+    }
+
+
+def _print_report(report):
+    """Print the check result."""
+    status = "ok" if report["game_ms"] <= report["budget_ms"] else "OVER"
+    print(f"game modules: {report['game_ms']:.1f} ms "
+          f"(budget {report['budget_ms']:.1f} ms) {status}")
+    for name, ms in report["slowest"]:
+        print(f"  {name:<32}{ms:>8.2f} ms")
+    for name, ms in report["third_party_ms"].items():
+        print(f"third party: {name:<20}{ms:>8.1f} ms (cumulative)")
+    if report["mode_only"]:
+        print("imported by the menu but only needed by a mode: "
+              + ", ".join(report["mode_only"]))
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Args:
+        argv (list): Arguments, defaults to sys.argv.
+
+    Returns:
+        int: Exit status, 1 if over budget.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.imports",
+        description="Check the menu's import time against a budget.")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS,
+                        help="fresh interpreters to time")
+    parser.add_argument("--budget", type=float, default=IMPORT_BUDGET_MS,
+                        help="milliseconds allowed for the game's modules")
+    parser.add_argument("--module", default="main_menu",
+                        help="module to import (default: main_menu)")
+    parser.add_argument("--json", metavar="FILE",
+                        help="also write the result as JSON")
+    args = parser.parse_args(argv)
+
+    report = check(measure(args.module, args.runs), args.budget)
+    _print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,486 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Component Micro-Benchmarks for Fish-O-Mania.
+
+Times the game's hot paths headless (SDL dummy video and audio drivers)
+at several population sizes and stores the results as JSON. The compare
+command checks a run against a saved baseline and flags regressions.
+
+Run from the game directory with:
+    python -m bench.micro run [-o FILE] [-k PATTERN] [--repeat N]
+    python -m bench.micro compare BASELINE [CURRENT] [--threshold 0.1]
+
+Without CURRENT, compare runs the benchmarks first. It exits with status
+1 if any benchmark regressed, so it can gate a change.
+
+Functions:
+    benchmark: Decorator that registers a benchmark setup function.
+    time_call: Time a callable.
+    run: Run the registered benchmarks.
+    compare: Compare two sets of results.
+    main: Command line entry point.
+"""
+
+import os
+
+# Headless before pygame is imported anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import fnmatch
+import json
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+
+import numpy as np
+import pygame
+
+from mechanics.constants import SCREEN_WIDTH, SCREEN_HEIGHT, WATER_SURFACE
+from mechanics.random_streams import seed_streams
+
+DEFAULT_REPEAT = 5  # Timing rounds per benchmark
+MIN_ROUND_TIME = 0.05  # Seconds each round should take at least
+DEFAULT_THRESHOLD = 0.10  # Relative slowdown counted as a regression
+
+# Registered benchmarks: (name, sizes, setup function)
+BENCHMARKS = []
+
+
+def benchmark(name, sizes=(None,)):
+    """
+    Register a benchmark.
+
+    The decorated function takes a size (or None) and returns the
+    callable to time; everything it does before returning is setup and
+    is not timed.
+
+    Args:
+        name (str): Benchmark name.
+        sizes (tuple): Population sizes to run it at.
+
+    Returns:
+        function: The decorator.
+    """
+    def decorator(setup):
+        BENCHMARKS.append((name, sizes, setup))
+        return setup
+    return decorator
+
+
+def result_name(name, size):
+    """Name of one benchmark/size combination, e.g. "X.update[n=15]"."""
+    return name if size is None else f"{name}[n={size}]"
+
+
+def _init_pygame():
+    """Initialize pygame with a hidden display (needed for convert())."""
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def _seed():
+    """Make setups reproducible."""
+    random.seed(1234)
+    np.random.seed(1234)
+    seed_streams(1234)
+
+
+def _fish_manager(count):
+    """Fish manager holding count fish."""
+    from fish.fish_manager import FishManager
+
+    manager = FishManager()
+    for _ in range(count):
+        manager.spawn_fish()
+    return manager
+
+
+# Fish
+
+
+@benchmark("FishManager.update", sizes=(5, 15, 50))
+def bench_fish_update(size):
+    manager = _fish_manager(size)
+    return manager.update
+
+
+@benchmark("FishManager.get_fish_at_position", sizes=(5, 15, 50))
+def bench_fish_at_position(size):
+    manager = _fish_manager(size)
+    # A miss scans every fish, the worst case for the hook check
+    position = (-100, -100)
+    return lambda: manager.get_fish_at_position(position)
+
+
+@benchmark("CastingRod.update", sizes=(5, 15, 50))
+def bench_casting_update(size):
+    from mechanics.casting import CastingRod
+
+    manager = _fish_manager(size)
+    rod = CastingRod(500, 6)
+    hook_rect = pygame.Rect(-100, WATER_SURFACE, 30, 30)
+
+    def reel():
+        # Keep the rod reeling so every call checks for fish
+        rod.rod_length = 300
+        rod.update(hook_rect, manager, None)
+    return reel
+
+
+# Background
+
+
+@benchmark("BackgroundManager.update", sizes=(0, 20, 100))
+def bench_background_update(size):
+    from background import BackgroundManager
+    from background.bubble import Bubble
+
+    manager = BackgroundManager()
+    for _ in range(size):
+        manager.bubbles.append(Bubble(
+            random.randint(0, SCREEN_WIDTH),
+            random.randint(WATER_SURFACE + 50, SCREEN_HEIGHT - 70)))
+    bubbles = list(manager.bubbles)
+
+    def update():
+        # Keep the population constant across rounds
+        manager.bubbles = list(bubbles)
+        for bubble in bubbles:
+            bubble.alive = True
+        manager.update()
+    return update
+
+
+@benchmark("BackgroundManager.draw", sizes=(0, 20, 100))
+def bench_background_draw(size):
+    from background import BackgroundManager
+    from background.bubble import Bubble
+
+    manager = BackgroundManager()
+    for _ in range(size):
+        manager.bubbles.append(Bubble(
+            random.randint(0, SCREEN_WIDTH),
+            random.randint(WATER_SURFACE + 50, SCREEN_HEIGHT - 70)))
+    surface = pygame.display.get_surface()
+    return lambda: manager.draw(surface)
+
+
+@benchmark("Wave.get_wave_points")
+def bench_wave_points(size):
+    from background.wave import Wave
+
+    wave = Wave()
+    return wave.get_wave_points
+
+
+@benchmark("Ripple.draw", sizes=(1, 10, 50))
+def bench_ripple_draw(size):
+    from background.ripple import Ripple
+
+    ripples = [Ripple(random.randint(50, SCREEN_WIDTH - 50),
+                      WATER_SURFACE + 10) for _ in range(size)]
+    for ripple in ripples:
+        ripple.radius = ripple.max_radius / 2
+        ripple.alpha = 128
+    surface = pygame.display.get_surface()
+
+    def draw():
+        for ripple in ripples:
+            ripple.draw(surface)
+    return draw
+
+
+# Modes
+
+
+@benchmark("session.draw_water_background")
+def bench_water_background(size):
+    from modes import session
+
+    surface = pygame.display.get_surface()
+    return lambda: session.draw_water_background(surface)
+
+
+@benchmark("session.render_text")
+def bench_render_text(size):
+    from modes import session
+
+    return lambda: session.render_text(session.big_font, "Score: 1234",
+                                       (255, 255, 255))
+
+
+# Audio
+
+
+@benchmark("RECORDER.get_frame_peak", sizes=(735, 2048, 8192))
+def bench_frame_peak(size):
+    from mechanics.Recorder import RECORDER
+
+    # No audio device: build the object without opening a stream
+    recorder = RECORDER.__new__(RECORDER)
+    samples = np.random.randint(-20000, 20000, size, dtype=np.int16)
+    recorder.last_frame = samples.tobytes()
+    return recorder.get_frame_peak
+
+
+# Scores
+
+
+@benchmark("load_scores")
+def bench_load_scores(size):
+    import mechanics.scores as scores
+
+    return scores.load_scores
+
+
+@benchmark("ScoreStore.load (cold)")
+def bench_load_scores_cold(size):
+    import mechanics.scores as scores
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "highscores.json")
+    with open(path, "w") as f:
+        json.dump(scores.get_default_scores(), f)
+
+    def load():
+        scores.ScoreStore(path).load()
+    load.cleanup = lambda: shutil.rmtree(directory)
+    return load
+
+
+def time_call(func, repeat=DEFAULT_REPEAT, min_time=MIN_ROUND_TIME):
+    """
+    Time a callable.
+
+    The number of calls per round is picked so a round takes at least
+    min_time; the per-call time of each round is reported.
+
+    Args:
+        func (callable): Function to time.
+        repeat (int): Number of rounds.
+        min_time (float): Minimum seconds per round.
+
+    Returns:
+        dict: Per-call "median_us", "mean_us", "min_us", "stdev_us",
+            plus "loops" per round and "rounds".
+    """
+    timer = timeit.Timer(func)
+    loops = 1
+    while True:
+        if timer.timeit(loops) >= min_time:
+            break
+        loops *= 2 if loops < 1000 else 10
+
+    per_call = [t / loops * 1e6 for t in timer.repeat(repeat, loops)]
+    return {
+        "median_us": statistics.median(per_call),
+        "mean_us": statistics.mean(per_call),
+        "min_us": min(per_call),
+        "stdev_us": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        "loops": loops,
+        "rounds": repeat,
+    }
+
+
+def run(pattern=None, repeat=DEFAULT_REPEAT, min_time=MIN_ROUND_TIME,
+        verbose=True):
+    """
+    Run the registered benchmarks.
+
+    Benchmarks whose setup fails with ImportError (e.g. no PyAudio) are
+    reported and skipped.
+
+    Args:
+        pattern (str): fnmatch pattern selecting benchmarks by name.
+        repeat (int): Timing rounds per benchmark.
+        min_time (float): Minimum seconds per round.
+        verbose (bool): Print each result as it finishes.
+
+    Returns:
+        dict: {"meta": environment info, "results": name -> timings}
+    """
+    _init_pygame()
+    results = {}
+
+    for name, sizes, setup in BENCHMARKS:
+        for size in sizes:
+            full_name = result_name(name, size)
+            if pattern and not fnmatch.fnmatch(full_name, pattern):
+                continue
+
+            _seed()
+            try:
+                func = setup(size)
+            except ImportError as e:
+                if verbose:
+                    print(f"{full_name:<48} skipped ({e})")
+                continue
+
+            try:
+                results[full_name] = time_call(func, repeat, min_time)
+            finally:
+                cleanup = getattr(func, "cleanup", None)
+                if cleanup is not None:
+                    cleanup()
+
+            if verbose:
+                timing = results[full_name]
+                print(f"{full_name:<48}{timing['median_us']:>12.2f} us"
+                      f"  (+/- {timing['stdev_us']:.2f})")
+
+    return {
+        "meta": {
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two sets of results.
+
+    A benchmark regressed if its median got slower by more than the
+    threshold and the slowdown is larger than the baseline's noise
+    (two standard deviations).
+
+    Args:
+        baseline (dict): Results from run() (or a saved JSON file).
+        current (dict): Results to check.
+        threshold (float): Relative change that counts (0.1 = 10%).
+
+    Returns:
+        list: (name, baseline_us, current_us, ratio, status) tuples,
+            where status is "regression", "improved", "ok", "new" or
+            "missing".
+    """
+    base_results = baseline["results"]
+    current_results = current["results"]
+    rows = []
+
+    for name in sorted(set(base_results) | set(current_results)):
+        base = base_results.get(name)
+        cur = current_results.get(name)
+        if base is None:
+            rows.append((name, None, cur["median_us"], None, "new"))
+            continue
+        if cur is None:
+            rows.append((name, base["median_us"], None, None, "missing"))
+            continue
+
+        base_us = base["median_us"]
+        cur_us = cur["median_us"]
+        ratio = cur_us / base_us if base_us > 0 else float("inf")
+        noise = 2 * base.get("stdev_us", 0.0)
+
+        if ratio > 1 + threshold and cur_us - base_us > noise:
+            status = "regression"
+        elif ratio < 1 - threshold and base_us - cur_us > noise:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append((name, base_us, cur_us, ratio, status))
+
+    return rows
+
+
+def _print_comparison(rows):
+    """Print the table returned by compare()."""
+    print(f"{'benchmark':<48}{'baseline':>12}{'current':>12}"
+          f"{'change':>9}  status")
+    for name, base_us, cur_us, ratio, status in rows:
+        base_str = "-" if base_us is None else f"{base_us:.2f}"
+        cur_str = "-" if cur_us is None else f"{cur_us:.2f}"
+        change = "-" if ratio is None else f"{(ratio - 1) * 100:+.1f}%"
+        flag = status.upper() if status == "regression" else status
+        print(f"{name:<48}{base_str:>12}{cur_str:>12}{change:>9}  {flag}")
+
+
+def _load(path):
+    """Read a results file."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def _save(results, path):
+    """Write a results file."""
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Args:
+        argv (list): Arguments, defaults to sys.argv.
+
+    Returns:
+        int: Exit status (1 if compare found a regression).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.micro",
+        description="Fish-O-Mania component micro-benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-o", "--output", help="write results to FILE")
+
+    compare_parser = commands.add_parser(
+        "compare", help="compare results against a baseline")
+    compare_parser.add_argument("baseline", help="baseline results file")
+    compare_parser.add_argument(
+        "current", nargs="?", help="results file (default: run now)")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="relative slowdown counted as a regression (default 0.1)")
+    compare_parser.add_argument("-o", "--output",
+                                help="write the new results to FILE")
+
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("-k", "--pattern",
+                         help="only run benchmarks matching this pattern")
+        sub.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                         help="timing rounds per benchmark")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(args.pattern, args.repeat)
+        if args.output:
+            _save(results, args.output)
+            print(f"Results written to {args.output}")
+        return 0
+
+    baseline = _load(args.baseline)
+    if args.current:
+        current = _load(args.current)
+    else:
+        current = run(args.pattern, args.repeat)
+        if args.output:
+            _save(current, args.output)
+        print()
+
+    rows = compare(baseline, current, args.threshold)
+    if args.pattern:
+        rows = [row for row in rows if fnmatch.fnmatch(row[0], args.pattern)]
+    _print_comparison(rows)
+    return 1 if any(row[4] == "regression" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
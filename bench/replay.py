@@ -0,0 +1,139 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Replay Benchmark for Fish-O-Mania.
+
+Plays sessions recorded with "python main_menu.py --record-replays" (see
+mechanics/replay) back through the real mode loop and reports frame
+times and whether each replay still reaches its recorded score. Headless
+the frames aren't limited, so a replay is a benchmark of a real player's
+session; with --window it is shown at normal speed.
+
+A score that differs means the game no longer plays the same with the
+same input: a gameplay change, or a bug to bisect with the replay.
+
+Run from the game directory with:
+    python -m bench.replay FILE [FILE ...] [--window] [--json FILE]
+
+The exit status is 1 if a replay didn't reach its recorded score.
+
+Functions:
+    play_replay: Play one replay and collect the measurements.
+    main: Command line entry point.
+"""
+
+import os
+import sys
+
+# Headless before pygame is imported anywhere, unless watching
+if "--window" not in sys.argv[1:]:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import importlib
+import json
+import shutil
+import tempfile
+import time
+
+import pygame
+
+from bench.scene import frame_stats
+from mechanics.replay import ReplayDriver, load_replay
+
+
+def play_replay(replay, realtime=False):
+    """
+    Play one replay and collect the measurements.
+
+    Scores go to a temporary file and catch logging is turned off, so a
+    replay leaves no trace in the game directory.
+
+    Args:
+        replay (Replay): The replay to play.
+        realtime (bool): Show it at normal speed instead of flat out.
+
+    Returns:
+        dict: Recorded and replayed score, game and wall time, and frame
+            statistics.
+    """
+    import mechanics.scores as scores
+
+    pygame.init()
+    module = importlib.import_module(f"modes.mode_{replay.mode}")
+    module.CATCH_LOGGING = False
+
+    score_dir = tempfile.mkdtemp()
+    scores.use_backend("json", os.path.join(score_dir, "highscores.json"))
+
+    driver = ReplayDriver(replay, realtime=realtime)
+    start = time.perf_counter()
+    try:
+        score = module.main(driver)
+    finally:
+        elapsed = time.perf_counter() - start
+        scores.flush_scores()
+        shutil.rmtree(score_dir, ignore_errors=True)
+
+    result = {
+        "mode": replay.mode,
+        "seed": replay.seed,
+        "ticks": len(replay.ticks),
+        "game_s": replay.duration_ms() / 1000,
+        "wall_s": elapsed,
+        "recorded_score": replay.score,
+        "score": score,
+        "reproduced": score == replay.score,
+    }
+    result.update(frame_stats(driver.frame_times))
+    return result
+
+
+def _print_result(path, r):
+    """Print one replay's result."""
+    status = "ok" if r["reproduced"] else "DIFFERS"
+    print(f"{path}: {r['mode']}, {r['ticks']} ticks, "
+          f"{r['game_s']:.1f} s of play in {r['wall_s']:.1f} s")
+    print(f"  score {r['score']} (recorded {r['recorded_score']}) {status}")
+    if r.get("frames"):
+        print(f"  {r['fps']:.1f} fps, mean {r['mean_ms']:.2f} ms, "
+              f"p99 {r['p99_ms']:.2f} ms, max {r['max_ms']:.2f} ms")
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Args:
+        argv (list): Arguments, defaults to sys.argv.
+
+    Returns:
+        int: Exit status, 1 if a score differs.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.replay",
+        description="Play recorded sessions back and time them.")
+    parser.add_argument("replays", nargs="+", metavar="FILE",
+                        help="replay files (.fomr)")
+    parser.add_argument("--window", action="store_true",
+                        help="show the replay at normal speed")
+    parser.add_argument("--json", metavar="FILE",
+                        help="also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    for path in args.replays:
+        result = play_replay(load_replay(path), realtime=args.window)
+        result["path"] = path
+        _print_result(path, result)
+        results.append(result)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0 if all(r["reproduced"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,455 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Scripted Scene Benchmark for Fish-O-Mania.
+
+Runs a complete mode loop headless for a fixed number of frames, without
+frame limiting, with scripted input and a fixed random seed, and reports
+frames per second, frame-time percentiles, allocations and peak RSS.
+Each mode runs in its own process so the memory numbers don't mix.
+
+Run from the game directory with:
+    python -m bench.scene [--mode MODE] [--frames N] [--seed N]
+                          [--fish N] [--spawn-delay N] [--effects X]
+
+Functions:
+    default_script: Scripted input used by the benchmark.
+    apply_overrides: Apply fish count, spawn delay and effect density.
+    run_scene: Run one mode and collect the measurements.
+    main: Command line entry point.
+
+Classes:
+    ScriptedDriver: Game driver that replays a script instead of a player.
+    SyntheticRecorder: Microphone stand-in producing scripted screams.
+"""
+
+import os
+
+# Headless before pygame is imported anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import gc
+import importlib
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pygame
+
+from mechanics.random_streams import seed_streams
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Mode name -> (module, name of its initial fish count constant)
+MODES = {
+    "classic": ("modes.mode_classic", "START_FISHES"),
+    "time_attack": ("modes.mode_time_attack", "INITIAL_FISH_COUNT"),
+    "endless": ("modes.mode_endless", "START_FISHES"),
+}
+
+DEFAULT_FRAMES = 2000
+DEFAULT_WARMUP = 60  # Frames excluded from the statistics
+DEFAULT_SEED = 1234
+
+
+def default_script(frame):
+    """
+    Scripted input for one frame.
+
+    Casts every 1.5 seconds (at 60 FPS), sweeps the boat left and right,
+    presses ENTER now and then to restart after a game over, and screams
+    for a second every five seconds (classic mode's danger fish).
+
+    Args:
+        frame (int): Frame number.
+
+    Returns:
+        tuple: (list of keys pressed this frame, set of keys held,
+            whether the player is screaming)
+    """
+    pressed = []
+    if frame % 90 == 10:
+        pressed.append(pygame.K_SPACE)
+    if frame % 600 == 599:
+        pressed.append(pygame.K_RETURN)
+
+    held = {pygame.K_LEFT if (frame // 120) % 2 else pygame.K_RIGHT}
+    screaming = frame % 300 >= 240
+    return pressed, held, screaming
+
+
+class _HeldKeys:
+    """Stand-in for pygame.key.get_pressed() built from a set of keys."""
+
+    def __init__(self, keys):
+        self.keys = keys
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+class SyntheticRecorder:
+    """
+    Microphone stand-in for classic mode.
+
+    Produces quiet noise, or a loud harmonic tone while the driver's
+    script says the player is screaming. Implements the parts of the
+    RECORDER interface the mode loop uses.
+
+    Attributes:
+        rate (int): Sample rate in Hz.
+        frames_per_buffer (int): Samples per block.
+        frames (list): Blocks read since the last reset.
+        last_frame (bytes): Most recent block.
+        last_read_time (float): perf_counter() after the last read.
+    """
+
+    def __init__(self, driver, rate=44100, frames_per_buffer=735):
+        self.driver = driver
+        self.rate = rate
+        self.frames_per_buffer = frames_per_buffer
+        self.frames = []
+        self.last_frame = None
+        self.last_read_time = None
+
+        t = np.arange(frames_per_buffer) / rate
+        rng = np.random.default_rng(0)
+        self._quiet = (rng.normal(0, 200, frames_per_buffer)
+                       .astype(np.int16).tobytes())
+        tone = sum(np.sin(2 * np.pi * 600 * k * t) / k for k in range(1, 6))
+        self._scream = (tone * 7000).astype(np.int16).tobytes()
+
+    def start_recording(self):
+        self.frames = []
+        self.read_frames()
+
+    def read_frames(self):
+        data = self._scream if self.driver.screaming else self._quiet
+        self.frames.append(data)
+        self.last_frame = data
+        self.last_read_time = time.perf_counter()
+        return data
+
+    def get_samples(self):
+        return b"".join(self.frames)
+
+    def get_peak(self):
+        if not self.frames:
+            return 0
+        return int(np.max(np.abs(np.frombuffer(self.get_samples(),
+                                               dtype=np.int16))))
+
+    def get_frame_peak(self):
+        if self.last_frame is None:
+            return 0
+        return int(np.max(np.abs(np.frombuffer(self.last_frame,
+                                               dtype=np.int16))))
+
+    def get_onset_time(self, threshold):
+        if self.last_frame is None:
+            return None
+        audio = np.abs(np.frombuffer(self.last_frame, dtype=np.int16)
+                       .astype(np.int32))
+        loud = np.flatnonzero(audio >= threshold)
+        if len(loud) == 0:
+            return None
+        return self.last_read_time - (len(audio) - loud[0]) / self.rate
+
+    def pause_recording(self):
+        pass
+
+    def restart_recording(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class ScriptedDriver:
+    """
+    Game driver that replays a script for a fixed number of frames.
+
+    The loop is never slowed down; tick() only records how long each
+    frame took. After the last frame a QUIT event ends the mode.
+
+    Attributes:
+        frames (int): Frames to run before quitting.
+        warmup (int): Leading frames left out of frame_times.
+        frame (int): Current frame number.
+        frame_times (list): Seconds per measured frame.
+        screaming (bool): Whether the script screams this frame.
+    """
+
+    def __init__(self, frames=DEFAULT_FRAMES, warmup=DEFAULT_WARMUP,
+                 script=default_script):
+        """
+        Initialize the driver.
+
+        Args:
+            frames (int): Frames to run before quitting.
+            warmup (int): Leading frames left out of the statistics.
+            script (callable): script(frame) -> (pressed, held, screaming).
+        """
+        self.frames = frames
+        self.warmup = warmup
+        self.script = script
+        self.frame = 0
+        self.frame_times = []
+        self.screaming = False
+        self._held = _HeldKeys(set())
+        self._last_tick = None
+
+    def get_events(self):
+        # Drain real events so the SDL queue does not fill up
+        pygame.event.get()
+
+        if self.frame >= self.frames:
+            return [pygame.event.Event(pygame.QUIT)]
+
+        pressed, held, self.screaming = self.script(self.frame)
+        # Keys that start being held get a KEYDOWN, like a real keyboard
+        pressed = list(pressed) + sorted(held - self._held.keys)
+        self._held = _HeldKeys(held)
+        return [pygame.event.Event(pygame.KEYDOWN, key=key, mod=0)
+                for key in pressed]
+
+    def get_pressed(self):
+        return self._held
+
+    def create_recorder(self):
+        recorder = SyntheticRecorder(self)
+        recorder.start_recording()
+        return recorder
+
+    def tick(self):
+        now = time.perf_counter()
+        elapsed = 0.0
+        if self._last_tick is not None:
+            elapsed = now - self._last_tick
+            if self.frame > self.warmup:
+                self.frame_times.append(elapsed)
+        self._last_tick = now
+        self.frame += 1
+        return int(elapsed * 1000)
+
+
+def apply_overrides(mode_module, fish_attr, fish=None, spawn_delay=None,
+                    effects=None):
+    """
+    Apply benchmark overrides to the game's tuning constants.
+
+    Args:
+        mode_module (module): The mode being benchmarked.
+        fish_attr (str): Name of its initial fish count constant.
+        fish (int): Initial (and maximum) number of fish.
+        spawn_delay (int): Frames between automatic fish spawns.
+        effects (float): Ripple/bubble density multiplier (1 = normal).
+    """
+    import fish.fish_manager as fish_manager
+    import background.background_manager as background_manager
+
+    if fish is not None:
+        setattr(mode_module, fish_attr, fish)
+        fish_manager.MAX_FISH = max(fish_manager.MAX_FISH, fish)
+    if spawn_delay is not None:
+        fish_manager.SPAWN_DELAY = spawn_delay
+    if effects is not None and effects > 0:
+        for name in ("RIPPLE_INTERVAL", "BUBBLE_INTERVAL"):
+            low, high = getattr(background_manager, name)
+            setattr(background_manager, name,
+                    (max(1, int(low / effects)), max(1, int(high / effects))))
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB, or None."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def frame_stats(frame_times):
+    """
+    Summarize frame times.
+
+    Args:
+        frame_times (list): Seconds per frame.
+
+    Returns:
+        dict: fps and mean/p50/p90/p99/max frame time in milliseconds.
+    """
+    times = np.asarray(frame_times, dtype=np.float64) * 1000
+    if len(times) == 0:
+        return {"frames": 0}
+    p50, p90, p99 = np.percentile(times, [50, 90, 99])
+    return {
+        "frames": len(times),
+        "fps": 1000 / times.mean(),
+        "mean_ms": float(times.mean()),
+        "p50_ms": float(p50),
+        "p90_ms": float(p90),
+        "p99_ms": float(p99),
+        "max_ms": float(times.max()),
+    }
+
+
+def run_scene(mode, frames=DEFAULT_FRAMES, seed=DEFAULT_SEED, fish=None,
+              spawn_delay=None, effects=None, warmup=DEFAULT_WARMUP):
+    """
+    Run one mode and collect the measurements.
+
+    Scores go to a temporary file and catch logging is turned off, so a
+    benchmark run leaves no trace in the game directory.
+
+    Args:
+        mode (str): "classic", "time_attack" or "endless".
+        frames (int): Frames to run.
+        seed (int): Seed for the game's random streams and NumPy.
+        fish (int): Initial fish count override.
+        spawn_delay (int): Spawn delay override in frames.
+        effects (float): Ripple/bubble density multiplier.
+        warmup (int): Leading frames left out of the statistics.
+
+    Returns:
+        dict: Frame statistics, allocations and peak RSS.
+    """
+    import mechanics.scores as scores
+
+    module_name, fish_attr = MODES[mode]
+    pygame.init()
+    module = importlib.import_module(module_name)
+    module.CATCH_LOGGING = False
+    apply_overrides(module, fish_attr, fish, spawn_delay, effects)
+
+    score_dir = tempfile.mkdtemp()
+    scores.use_backend("json", os.path.join(score_dir, "highscores.json"))
+
+    seed_streams(seed)
+    np.random.seed(seed)
+    driver = ScriptedDriver(frames, warmup)
+
+    gc.collect()
+    collections_before = [stats["collections"] for stats in gc.get_stats()]
+    blocks_before = sys.getallocatedblocks()
+    start = time.perf_counter()
+    try:
+        module.main(driver)
+    finally:
+        elapsed = time.perf_counter() - start
+        scores.flush_scores()
+        shutil.rmtree(score_dir, ignore_errors=True)
+
+    collections = [stats["collections"] - before for stats, before
+                   in zip(gc.get_stats(), collections_before)]
+    result = {
+        "mode": mode,
+        "seed": seed,
+        "wall_s": elapsed,
+        "allocated_blocks_delta": sys.getallocatedblocks() - blocks_before,
+        "gc_collections": collections,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    result.update(frame_stats(driver.frame_times))
+    return result
+
+
+def _run_in_subprocess(mode, args):
+    """Run one mode in a fresh interpreter and return its result."""
+    handle, path = tempfile.mkstemp(suffix=".json")
+    os.close(handle)
+    command = [sys.executable, "-m", "bench.scene", "--mode", mode,
+               "--in-process", "--json", path,
+               "--frames", str(args.frames), "--seed", str(args.seed),
+               "--warmup", str(args.warmup)]
+    if args.fish is not None:
+        command += ["--fish", str(args.fish)]
+    if args.spawn_delay is not None:
+        command += ["--spawn-delay", str(args.spawn_delay)]
+    if args.effects is not None:
+        command += ["--effects", str(args.effects)]
+
+    try:
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        with open(path) as f:
+            return json.load(f)[0]
+    finally:
+        os.remove(path)
+
+
+def _print_results(results):
+    """Print one line per mode."""
+    print(f"{'mode':<13}{'fps':>9}{'mean':>8}{'p50':>8}{'p90':>8}"
+          f"{'p99':>8}{'max':>8}{'blocks':>10}{'gc0/1/2':>14}{'rss MB':>9}")
+    for r in results:
+        if not r.get("frames"):
+            print(f"{r['mode']:<13}  no frames measured")
+            continue
+        gc_str = "/".join(str(n) for n in r["gc_collections"])
+        rss = "-" if r["peak_rss_mb"] is None else f"{r['peak_rss_mb']:.1f}"
+        print(f"{r['mode']:<13}{r['fps']:>9.1f}{r['mean_ms']:>8.2f}"
+              f"{r['p50_ms']:>8.2f}{r['p90_ms']:>8.2f}{r['p99_ms']:>8.2f}"
+              f"{r['max_ms']:>8.2f}{r['allocated_blocks_delta']:>10}"
+              f"{gc_str:>14}{rss:>9}")
+    print("(frame times in ms)")
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Args:
+        argv (list): Arguments, defaults to sys.argv.
+
+    Returns:
+        int: Exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.scene",
+        description="Scripted end-to-end frame benchmark.")
+    parser.add_argument("--mode", choices=sorted(MODES) + ["all"],
+                        default="all", help="mode to run (default: all)")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES,
+                        help="frames to run per mode")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP,
+                        help="leading frames left out of the statistics")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--fish", type=int, help="initial fish count")
+    parser.add_argument("--spawn-delay", type=int,
+                        help="frames between automatic fish spawns")
+    parser.add_argument("--effects", type=float,
+                        help="ripple/bubble density multiplier")
+    parser.add_argument("--json", help="write the results to FILE")
+    parser.add_argument("--in-process", action="store_true",
+                        help="don't start a process per mode")
+    args = parser.parse_args(argv)
+
+    modes = sorted(MODES) if args.mode == "all" else [args.mode]
+    results = []
+    for mode in modes:
+        if args.in_process:
+            results.append(run_scene(mode, args.frames, args.seed, args.fish,
+                                     args.spawn_delay, args.effects,
+                                     args.warmup))
+        else:
+            results.append(_run_in_subprocess(mode, args))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    if not (args.in_process and args.json):
+        _print_results(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
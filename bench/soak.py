@@ -0,0 +1,400 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Soak Test for Fish-O-Mania.
+
+Drives a mode headless with the scripted input from bench.scene for a
+long simulated session (60 frames per simulated second) and samples the
+process at a fixed interval:
+    - traced memory and the top allocating source lines (tracemalloc)
+    - live object counts by type, and the lengths of the lists known to
+      grow over a session (recorder frames, background effects)
+    - resident set size
+    - frame-time percentiles over the interval
+
+At the end a straight line is fitted through the samples. The run fails
+(exit status 1) when memory or the 95th percentile frame time grows by
+more than the tolerance over the session, and the report lists the types
+and source lines that grew the most, which is where a leak will be.
+
+Run from the game directory with:
+    python -m bench.soak [--mode MODE] [--minutes N] [--sample-every S]
+                         [--memory-tolerance F] [--frame-tolerance F]
+                         [--json FILE]
+
+Functions:
+    current_rss_mb: Resident set size of this process.
+    object_counts: Live objects by type name.
+    growth: Relative growth along a fitted line.
+    run_soak: Run a mode and collect samples.
+    check: Compare the samples' trends with the tolerances.
+    main: Command line entry point.
+
+Classes:
+    SoakDriver: Scripted driver that samples the process as it runs.
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import collections
+import gc
+import importlib
+import json
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pygame
+
+from bench.scene import MODES, ScriptedDriver, apply_overrides, frame_stats
+from mechanics.constants import FPS
+from mechanics.random_streams import seed_streams
+
+DEFAULT_MINUTES = 30  # Simulated session length
+DEFAULT_SAMPLE_EVERY = 60  # Simulated seconds between samples
+MEMORY_TOLERANCE = 0.10  # Allowed relative memory growth over the run
+FRAME_TOLERANCE = 0.25  # Allowed relative p95 frame-time growth
+TOP_ALLOCATORS = 10
+TOP_TYPES = 15
+TRACE_DEPTH = 4  # Stack frames kept per tracemalloc allocation
+
+# BackgroundManager lists whose lengths are reported in each sample
+WATCHED_BACKGROUND = ("ripples", "bubbles", "seaweeds", "rocks")
+
+# Left out of the traced memory: the harness's own samples and frame
+# times grow over a run and would read as a leak in the game
+TRACE_FILTERS = (tracemalloc.Filter(False, tracemalloc.__file__),
+                 tracemalloc.Filter(False, "*/bench/*"))
+
+
+def current_rss_mb():
+    """
+    Get the resident set size of this process.
+
+    Returns:
+        float: RSS in MB, or None where it can't be read.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak, not current, but still shows growth
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def object_counts():
+    """
+    Count live objects tracked by the garbage collector.
+
+    Returns:
+        tuple: (collections.Counter of type name -> count, dict of the
+            lengths of lists known to grow over a session)
+    """
+    counts = collections.Counter()
+    watched = collections.Counter()
+    # gc.get_objects() leaves out objects frozen by mechanics.gc_policy
+    frozen = gc.get_freeze_count()
+    if frozen:
+        gc.unfreeze()
+    objects = gc.get_objects()
+    if frozen:
+        gc.freeze()
+    for obj in objects:
+        name = type(obj).__name__
+        counts[name] += 1
+        if name == "BackgroundManager":
+            for attr in WATCHED_BACKGROUND:
+                watched[f"background.{attr}"] += len(getattr(obj, attr))
+    return counts, dict(watched)
+
+
+def growth(times, values):
+    """
+    Relative growth over a run along a least-squares line.
+
+    Args:
+        times (list): Sample times.
+        values (list): Sampled values.
+
+    Returns:
+        float: (fitted end - fitted start) / fitted start, 0 with fewer
+            than three samples.
+    """
+    if len(values) < 3:
+        return 0.0
+    slope, intercept = np.polyfit(times, values, 1)
+    start = slope * times[0] + intercept
+    end = slope * times[-1] + intercept
+    if start <= 0:
+        return 0.0
+    return float((end - start) / start)
+
+
+class SoakDriver(ScriptedDriver):
+    """
+    Scripted driver that samples memory and frame times as it runs.
+
+    Sampling time is not charged to the frame it happens in, and each
+    interval's frame times are dropped once summarised, so the driver's
+    own memory stays flat however long the run.
+
+    Attributes:
+        sample_frames (int): Frames between samples.
+        use_tracemalloc (bool): Whether tracemalloc is sampled.
+        samples (list): One dict per sample.
+        first_counts (Counter): Object counts at the first sample.
+        last_counts (Counter): Object counts at the last sample.
+        first_snapshot (Snapshot): tracemalloc snapshot at the first sample.
+        last_snapshot (Snapshot): tracemalloc snapshot at the last sample.
+        verbose (bool): Print each sample as it is taken.
+        recorder (SyntheticRecorder): Recorder handed to the mode, if any.
+    """
+
+    def __init__(self, frames, sample_frames, use_tracemalloc=True,
+                 verbose=True):
+        super().__init__(frames, warmup=0)
+        self.sample_frames = sample_frames
+        self.use_tracemalloc = use_tracemalloc
+        self.verbose = verbose
+        self.samples = []
+        self.first_counts = None
+        self.last_counts = None
+        self.first_snapshot = None
+        self.last_snapshot = None
+        self.recorder = None
+
+    def create_recorder(self):
+        self.recorder = super().create_recorder()
+        return self.recorder
+
+    def tick(self):
+        elapsed = super().tick()
+        if self.frame % self.sample_frames == 0:
+            self.sample()
+            # Don't charge the sample to the next frame
+            self._last_tick = time.perf_counter()
+        return elapsed
+
+    def sample(self):
+        """Record one sample of memory, objects and frame times."""
+        gc.collect()
+        counts, watched = object_counts()
+        if self.recorder is not None:
+            watched["recorder.frames"] = len(self.recorder.frames)
+        if self.first_counts is None:
+            self.first_counts = counts
+        self.last_counts = counts
+
+        window = self.frame_times
+        self.frame_times = []
+        stats = frame_stats(window)
+
+        sample = {
+            "minute": self.frame / FPS / 60,
+            "frame": self.frame,
+            "rss_mb": current_rss_mb(),
+            "objects": sum(counts.values()),
+            "top_types": counts.most_common(TOP_TYPES),
+            "watched": watched,
+            "p50_ms": stats.get("p50_ms"),
+            "p95_ms": (float(np.percentile(window, 95) * 1000)
+                       if window else None),
+            "max_ms": stats.get("max_ms"),
+        }
+
+        if self.use_tracemalloc:
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                TRACE_FILTERS)
+            if self.first_snapshot is None:
+                self.first_snapshot = snapshot
+            self.last_snapshot = snapshot
+            sample["traced_mb"] = sum(
+                stat.size for stat in snapshot.statistics("filename")) / 2**20
+            sample["top_allocators"] = [
+                (str(stat.traceback[0]), stat.size, stat.count)
+                for stat in snapshot.statistics("lineno")[:TOP_ALLOCATORS]]
+
+        self.samples.append(sample)
+        if self.verbose:
+            traced = sample.get("traced_mb")
+            print(f"{sample['minute']:7.1f} min  "
+                  f"rss {sample['rss_mb'] or 0:7.1f} MB  "
+                  + (f"traced {traced:7.2f} MB  " if traced is not None
+                     else "")
+                  + f"objects {sample['objects']:8d}  "
+                  f"p95 {sample['p95_ms'] or 0:6.2f} ms  "
+                  + " ".join(f"{name}={size}" for name, size
+                             in sorted(watched.items())), flush=True)
+
+
+def run_soak(mode, minutes=DEFAULT_MINUTES, sample_every=DEFAULT_SAMPLE_EVERY,
+             seed=0, fish=None, use_tracemalloc=True, verbose=True):
+    """
+    Run a mode for a simulated session and sample it.
+
+    Args:
+        mode (str): "classic", "time_attack" or "endless".
+        minutes (float): Simulated session length.
+        sample_every (float): Simulated seconds between samples.
+        seed (int): Seed for the game's random streams and NumPy.
+        fish (int): Initial fish count override.
+        use_tracemalloc (bool): Sample tracemalloc (slower).
+        verbose (bool): Print each sample.
+
+    Returns:
+        SoakDriver: The driver holding the samples.
+    """
+    import mechanics.scores as scores
+
+    module_name, fish_attr = MODES[mode]
+    pygame.init()
+    module = importlib.import_module(module_name)
+    module.CATCH_LOGGING = False
+    apply_overrides(module, fish_attr, fish)
+
+    score_dir = tempfile.mkdtemp()
+    scores.use_backend("json", os.path.join(score_dir, "highscores.json"))
+
+    seed_streams(seed)
+    np.random.seed(seed)
+    driver = SoakDriver(int(minutes * 60 * FPS),
+                        max(1, int(sample_every * FPS)),
+                        use_tracemalloc, verbose)
+
+    if use_tracemalloc:
+        tracemalloc.start(TRACE_DEPTH)
+    try:
+        module.main(driver)
+    finally:
+        if use_tracemalloc:
+            tracemalloc.stop()
+        scores.flush_scores()
+        shutil.rmtree(score_dir, ignore_errors=True)
+    return driver
+
+
+def check(driver, memory_tolerance=MEMORY_TOLERANCE,
+          frame_tolerance=FRAME_TOLERANCE, skip=1):
+    """
+    Check the samples' trends against the tolerances.
+
+    The first samples are skipped because caches (fish frames, fonts)
+    fill during the first minutes and that is not a leak.
+
+    Args:
+        driver (SoakDriver): Driver holding the samples.
+        memory_tolerance (float): Allowed relative memory growth.
+        frame_tolerance (float): Allowed relative p95 frame-time growth.
+        skip (int): Leading samples ignored.
+
+    Returns:
+        dict: Metric name -> (growth, tolerance, passed).
+    """
+    samples = driver.samples[skip:]
+    results = {}
+    for name, tolerance in (("rss_mb", memory_tolerance),
+                            ("traced_mb", memory_tolerance),
+                            ("objects", memory_tolerance),
+                            ("p95_ms", frame_tolerance)):
+        points = [(s["minute"], s[name]) for s in samples
+                  if s.get(name) is not None]
+        if not points:
+            continue
+        times, values = zip(*points)
+        value = growth(list(times), list(values))
+        results[name] = (value, tolerance, value <= tolerance)
+    return results
+
+
+def _growth_report(driver, limit=TOP_TYPES):
+    """Types and source lines that grew the most between first and last."""
+    report = {"types": [], "allocators": []}
+    if driver.first_counts is not None:
+        diff = driver.last_counts.copy()
+        diff.subtract(driver.first_counts)
+        report["types"] = [(name, count) for name, count
+                           in diff.most_common(limit) if count > 0]
+    if driver.first_snapshot is not None:
+        stats = driver.last_snapshot.compare_to(driver.first_snapshot,
+                                                "lineno")
+        report["allocators"] = [
+            (str(stat.traceback[0]), stat.size_diff, stat.count_diff)
+            for stat in stats[:limit] if stat.size_diff > 0]
+    return report
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Args:
+        argv (list): Arguments, defaults to sys.argv.
+
+    Returns:
+        int: 0 if no trend exceeded its tolerance, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.soak",
+        description="Long-session memory and frame-time drift test.")
+    parser.add_argument("--mode", choices=sorted(MODES), default="endless")
+    parser.add_argument("--minutes", type=float, default=DEFAULT_MINUTES,
+                        help="simulated session length")
+    parser.add_argument("--sample-every", type=float,
+                        default=DEFAULT_SAMPLE_EVERY,
+                        help="simulated seconds between samples")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fish", type=int, help="initial fish count")
+    parser.add_argument("--memory-tolerance", type=float,
+                        default=MEMORY_TOLERANCE,
+                        help="allowed relative memory growth")
+    parser.add_argument("--frame-tolerance", type=float,
+                        default=FRAME_TOLERANCE,
+                        help="allowed relative p95 frame-time growth")
+    parser.add_argument("--no-tracemalloc", action="store_true",
+                        help="skip tracemalloc (faster, less detail)")
+    parser.add_argument("--json", help="write the samples and verdict to FILE")
+    args = parser.parse_args(argv)
+
+    driver = run_soak(args.mode, args.minutes, args.sample_every, args.seed,
+                      args.fish, not args.no_tracemalloc)
+    results = check(driver, args.memory_tolerance, args.frame_tolerance)
+    report = _growth_report(driver)
+
+    print()
+    for name, (value, tolerance, passed) in results.items():
+        status = "ok" if passed else "FAIL"
+        print(f"{name:<10} growth {value:+7.1%}  (tolerance {tolerance:.0%})"
+              f"  {status}")
+    if report["types"]:
+        print("\nObject types that grew:")
+        for name, count in report["types"]:
+            print(f"  {count:+8d}  {name}")
+    if report["allocators"]:
+        print("\nAllocations that grew:")
+        for where, size, count in report["allocators"]:
+            print(f"  {size / 1024:+9.1f} KB {count:+7d}  {where}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"mode": args.mode, "samples": driver.samples,
+                       "trends": results, "growth": report}, f, indent=2)
+
+    return 0 if all(passed for _, _, passed in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,9 +7,12 @@ This module contains the AnimatedFish class that all fish inherit from
 """
 
 import pygame
-import random
 from mechanics.constants import SCREEN_WIDTH, WATER_SURFACE, WATER_BOTTOM
 from fish.death_animation import DeathAnimation
+from mechanics.assets import get_asset, load_image
+from mechanics.tracing import span
+from mechanics import game_clock
+from mechanics.random_streams import stream
 
 
 class AnimatedFish(pygame.sprite.Sprite):
@@ -33,7 +36,7 @@ class AnimatedFish(pygame.sprite.Sprite):
 
     def __init__(self, sprite_sheet_path, frame_width, frame_height,
                  num_frames, x, y, speed_x, fish_type="generic",
-                 death_animation_path=None):
+                 death_animation_path=None, rng=None):
         """
         Initialize the animated fish.
 
@@ -47,6 +50,7 @@ class AnimatedFish(pygame.sprite.Sprite):
             speed_x: horizontal movement speed
             fish_type : name of the fish type
             death_animation_path (str): Path to death animation sprite sheet
+            rng (random.Random): Random stream, defaults to "fish"
         """
         # super().__init__() is a Python call that runs
         # the parent class’s constructor (__init__ method)
@@ -54,6 +58,8 @@ class AnimatedFish(pygame.sprite.Sprite):
         # object gets properly initialized.
         # Any method could be called by super().method(args)
         super().__init__()
+        if rng is None:
+            rng = stream("fish")
 
         # Fish properties
         self.fish_type = fish_type
@@ -61,7 +67,7 @@ class AnimatedFish(pygame.sprite.Sprite):
         self.frame_height = frame_height
         self.num_frames = num_frames
         self.speed_x = speed_x
-        self.speed_y = random.uniform(-0.5, 0.5)
+        self.speed_y = rng.uniform(-0.5, 0.5)
 
         # Death animation
         self.death_animation_path = death_animation_path
@@ -74,13 +80,15 @@ class AnimatedFish(pygame.sprite.Sprite):
         # moves from one frame to the next one
         # we set frames of delay randomly so that the different types
         # moves at different speed
-        self.frame_delay = random.randint(5, 10)
+        self.frame_delay = rng.randint(5, 10)
 
-        # Load sprite sheet
-        # convert alpha
-        self.sprite_sheet = (
-            pygame.image.load(sprite_sheet_path).convert_alpha())
-        self.frames = self._load_frames()
+        # Load sprite sheet and frames, shared by every fish of the type
+        with span("load fish sprite", "assets", {"path": sprite_sheet_path}):
+            self.sprite_sheet = load_image(sprite_sheet_path, "fish")
+            self.frames = get_asset(
+                ("fish frames", sprite_sheet_path, frame_width, frame_height,
+                 num_frames, fish_type == "Danger Fish"),
+                self._load_frames, "fish")
 
         # Set initial image and position
         self.image = self.frames[self.current_frame]
@@ -155,7 +163,7 @@ class AnimatedFish(pygame.sprite.Sprite):
         """Check if the release cooldown has expired"""
         if not self.recently_released:
             return True
-        return (pygame.time.get_ticks() -
+        return (game_clock.get_ticks() -
                 self.release_time >= self.release_cooldown)
 
     def start_rising(self):
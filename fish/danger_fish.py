@@ -13,7 +13,7 @@ from fish.animated_fish import AnimatedFish
 class DangerFish(AnimatedFish):
     """Danger fish(Angler Fish) - lose a life if caught in classic mode"""
 
-    def __init__(self, x, y, moving_right=True):
+    def __init__(self, x, y, moving_right=True, rng=None):
         speed = 0.7 if moving_right else -0.7
 
         super().__init__(
@@ -25,7 +25,8 @@ class DangerFish(AnimatedFish):
             y=y,
             speed_x=speed,
             fish_type="Danger Fish",
-            death_animation_path="graphics/danger_fish_death.png"
+            death_animation_path="graphics/danger_fish_death.png",
+            rng=rng
         )
         self.value = 25
         self.rarity = "danger"
@@ -8,6 +8,12 @@ Handles the animation that plays when a fish is caught
 
 import pygame
 
+from mechanics.assets import get_asset, load_image
+from mechanics.game_log import get_logger
+from mechanics.tracing import span
+
+log = get_logger("death_animation")
+
 
 class DeathAnimation(pygame.sprite.Sprite):
     """Death animation that plays when a fish is caught"""
@@ -41,14 +47,18 @@ class DeathAnimation(pygame.sprite.Sprite):
 
         # Load sprite sheet
         try:
-            self.sprite_sheet = (
-                pygame.image.load(sprite_sheet_path).convert_alpha())
-            self.frames = self._load_frames()
+            with span("load death animation", "assets",
+                      {"path": sprite_sheet_path}):
+                self.sprite_sheet = load_image(sprite_sheet_path, "death")
+                self.frames = get_asset(
+                    ("death frames", sprite_sheet_path, frame_width,
+                     frame_height, num_frames, is_danger_fish),
+                    self._load_frames, "death")
             self.image = self.frames[self.current_frame]
             self.rect = self.image.get_rect()
             self.rect.center = (x, y)
         except pygame.error as e:
-            print(f"Error loading death animation: {e}")
+            log.warning("Error loading death animation: %s", e)
             self.finished = True
             dummy_size = (frame_width * 2, frame_height * 2)
             self.image = pygame.Surface(dummy_size, pygame.SRCALPHA)
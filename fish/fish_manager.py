@@ -5,7 +5,6 @@ This File Manages spawning, updating, and tracking all fish.
 """
 
 import pygame
-import random
 from mechanics.constants import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
@@ -14,21 +13,36 @@ from mechanics.constants import (
     WATER_SURFACE,
     WATER_BOTTOM,
 )
+from mechanics.assets import get_asset, load_image, load_sound
+from mechanics.game_log import fields, get_logger
 from mechanics.lives_manager import LivesManager
+from mechanics.metrics import SPAWNS
+from mechanics.random_streams import stream
+from mechanics.tracing import instant
 # Import the fish classes
 from fish.turtle import Turtle
 from fish.shark import Shark
 from fish.octopus import Octopus
 from fish.danger_fish import DangerFish
 
+log = get_logger("fish_manager")
+
 
 class FishManager:
     """
     Manages all fish in the game.
     Handles spawning, updating, and organizing fish into groups.
+
+    Spawning draws from the "spawn" random stream and each new fish from
+    the "fish" stream (see mechanics/random_streams); pass rng and
+    fish_rng to use other streams.
     """
 
-    def __init__(self):
+    def __init__(self, rng=None, fish_rng=None):
+        # Random streams
+        self.rng = rng if rng is not None else stream("spawn")
+        self.fish_rng = fish_rng if fish_rng is not None else stream("fish")
+
         # Sprite groups for different fish types
         self.all_fish = pygame.sprite.Group()
         self.danger_fish = pygame.sprite.Group()
@@ -39,10 +53,10 @@ class FishManager:
         self.death_animations = pygame.sprite.Group()
 
         # Sound effects - Good Catches
-        self.catch_sound = pygame.mixer.Sound("sounds/bubble.mp3")
+        self.catch_sound = load_sound("sounds/bubble.mp3")
         self.catch_sound.set_volume(0.5)
         # Sound effects - Bad Catches
-        self.penalty_sound = pygame.mixer.Sound("sounds/dead.mp3")
+        self.penalty_sound = load_sound("sounds/dead.mp3")
         self.penalty_sound.set_volume(0.5)
 
         # Lives manager
@@ -80,23 +94,15 @@ class FishManager:
 
         for fish_type, data in fish_data.items():
             try:
-                # Load sprite sheet
-                sprite_sheet = pygame.image.load(data["path"]).convert_alpha()
-                frames = []
-
-                # Extract all frames (48x48 each)
-                for i in range(data["frames"]):
-                    x = i * 48
-                    frame = pygame.Surface((48, 48), pygame.SRCALPHA)
-                    frame.blit(sprite_sheet, (0, 0), (x, 0, 48, 48))
-                    # Scale to display size (64x64)
-                    frame = pygame.transform.scale(frame, (64, 64))
-                    frames.append(frame)
-
+                frames = get_asset(
+                    ("catch frames", data["path"], data["frames"]),
+                    lambda: self._load_catch_frames(data),
+                    "fish")
                 animations[fish_type] = frames
-                print(f"Loaded {len(frames)} frames for {fish_type}")
+                log.debug("Loaded %d frames for %s", len(frames), fish_type)
             except pygame.error as e:
-                print(f"Error loading animation for {fish_type}: {e}")
+                log.warning("Error loading animation for %s: %s",
+                            fish_type, e)
                 # Create placeholder
                 placeholder = pygame.Surface((64, 64), pygame.SRCALPHA)
                 pygame.draw.circle(placeholder, (100, 100, 100),
@@ -105,6 +111,22 @@ class FishManager:
 
         return animations
 
+    def _load_catch_frames(self, data):
+        """Load the frames of one fish type for the recent catches."""
+        # Load sprite sheet
+        sprite_sheet = load_image(data["path"], "fish")
+        frames = []
+
+        # Extract all frames (48x48 each)
+        for i in range(data["frames"]):
+            x = i * 48
+            frame = pygame.Surface((48, 48), pygame.SRCALPHA)
+            frame.blit(sprite_sheet, (0, 0), (x, 0, 48, 48))
+            # Scale to display size (64x64)
+            frame = pygame.transform.scale(frame, (64, 64))
+            frames.append(frame)
+        return frames
+
     def spawn_fish(self, fish_class=None):
         """
         Spawn a new fish.
@@ -114,7 +136,7 @@ class FishManager:
         """
         if fish_class is None:
             # Generate a random number to determine which fish to spawn
-            random_num = random.random()
+            random_num = self.rng.random()
             # 30% chance for Danger Fish type
             if random_num < 0.3:
                 fish_class = "danger"
@@ -129,33 +151,35 @@ class FishManager:
                 fish_class = "turtle"
 
         # Determine a random position for the Fish to spawn
-        x = random.randint(50, SCREEN_WIDTH - 50)
-        y = random.randint(WATER_SURFACE + 20, WATER_BOTTOM - 20)
+        x = self.rng.randint(50, SCREEN_WIDTH - 50)
+        y = self.rng.randint(WATER_SURFACE + 20, WATER_BOTTOM - 20)
 
         # Create the appropriate fish type
         # (Turtle, Danger Fish, Shark, or Octopus)
         try:
             if fish_class == "turtle":
-                fish = Turtle(x, y)
+                fish = Turtle(x, y, rng=self.fish_rng)
                 self.rare_fish.add(fish)
 
             elif fish_class == "danger":
-                fish = DangerFish(x, y)
+                fish = DangerFish(x, y, rng=self.fish_rng)
                 self.danger_fish.add(fish)
 
             elif fish_class == "shark":
-                fish = Shark(x, y)
+                fish = Shark(x, y, rng=self.fish_rng)
                 self.danger_fish.add(fish)
 
             else:  # octopus
-                fish = Octopus(x, y)
+                fish = Octopus(x, y, rng=self.fish_rng)
                 self.large_fish.add(fish)
 
             self.all_fish.add(fish)
+            instant("spawn", "fish", {"type": fish.fish_type})
+            SPAWNS.inc((fish.fish_type,))
             return fish
 
         except pygame.error as e:
-            print(f"Error spawning fish: {e}")
+            log.warning("Error spawning fish: %s", e)
             return None
 
     def update(self):
@@ -300,7 +324,8 @@ class FishManager:
         # Get fish info before removing
         info = fish.get_info()
 
-        print(f"Caught: {info['type']} (+{info['value']} points)")
+        log.info("Caught: %s (+%d points)", info['type'], info['value'],
+                 extra=fields(type=info['type'], value=info['value']))
         self.catch_sound.play()
 
         # Add to recent catches with animation data
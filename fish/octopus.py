@@ -12,7 +12,7 @@ from fish.animated_fish import AnimatedFish
 class Octopus(AnimatedFish):
     """Large, slow-moving octopus."""
 
-    def __init__(self, x, y, moving_right=True):
+    def __init__(self, x, y, moving_right=True, rng=None):
         speed = 0.5 if moving_right else -0.5
 
         super().__init__(
@@ -24,7 +24,8 @@ class Octopus(AnimatedFish):
             y=y,
             speed_x=speed,
             fish_type="Octopus",
-            death_animation_path="graphics/octopus_death.png"
+            death_animation_path="graphics/octopus_death.png",
+            rng=rng
         )
         self.value = 100
         self.rarity = "uncommon"
@@ -12,7 +12,7 @@ from fish.animated_fish import AnimatedFish
 class Shark(AnimatedFish):
     """Fast-moving shark, harder to catch."""
 
-    def __init__(self, x, y, moving_right=True):
+    def __init__(self, x, y, moving_right=True, rng=None):
         speed = 0.75 if moving_right else -0.75
 
         super().__init__(
@@ -24,7 +24,8 @@ class Shark(AnimatedFish):
             y=y,
             speed_x=speed,
             fish_type="Shark",
-            death_animation_path="graphics/shark_death.png"
+            death_animation_path="graphics/shark_death.png",
+            rng=rng
         )
         self.value = 75
         self.rarity = "uncommon"
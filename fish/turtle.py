@@ -12,7 +12,7 @@ from fish.animated_fish import AnimatedFish
 class Turtle(AnimatedFish):
     """Rare, valuable turtle."""
 
-    def __init__(self, x, y, moving_right=True):
+    def __init__(self, x, y, moving_right=True, rng=None):
         speed = 0.5 if moving_right else -0.5
 
         super().__init__(
@@ -24,7 +24,8 @@ class Turtle(AnimatedFish):
             y=y,
             speed_x=speed,
             fish_type="Turtle",
-            death_animation_path="graphics/turtle_death.png"
+            death_animation_path="graphics/turtle_death.png",
+            rng=rng
         )
         self.value = 150
         self.rarity = "rare"
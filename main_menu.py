@@ -12,114 +12,122 @@ handling the game loop and launching different game modes
 Run the game with:
     python main.py
 
+Options:
+    --trace [FILE]: Record a Chrome/Perfetto trace of the session.
+    --startup-profile [FILE]: Write startup and mode switch timings.
+    --hitch-sampler [DIR]: Save stack samples of slow frames.
+    --metrics-port PORT: Serve metrics at http://127.0.0.1:PORT/metrics.
+    --log-level LEVEL: DEBUG, INFO, WARNING or ERROR.
+    --record-replays [DIR]: Record every session for replaying.
+
+Environment variables:
+    FISH_SCORES_BACKEND: "sqlite" to keep a full leaderboard in
+        highscores.db instead of the best-per-mode highscores.json.
+    FISH_PLAYER: Player name recorded with each session.
+    FISH_TRACE: Trace file to record (same as --trace).
+    FISH_STARTUP_PROFILE: Timings file to write (same as
+        --startup-profile).
+    FISH_HITCH_SAMPLER: Hitch report directory, or 1 (same as
+        --hitch-sampler).
+    FISH_METRICS_PORT: Metrics port (same as --metrics-port).
+    FISH_LOG_LEVEL: Log level (same as --log-level).
+    FISH_LOG_FORMAT: "json" for one JSON object per log line.
+    FISH_REPLAYS: Replay directory, or 1 (same as --record-replays).
+    FISH_ASSET_BUDGET_MB: Memory budget for cached images and sounds;
+        least recently used ones are released between modes.
+
 Functions:
+    parse_args: Parse command line options
     main: Main entry point and game loop
 """
 
-import pygame
+import argparse
+import os
 import sys
-from mechanics.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
-from ui import MenuScreen
-
-# Initialize pygame
-pygame.init()
+# First, so the imports below are timed
+from mechanics import startup
+import pygame
+from mechanics.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from mechanics.scores import set_player, use_backend
+from mechanics.tracing import flush_trace, start_tracing
+from mechanics.hitch_sampler import start_sampler
+from mechanics.metrics import start_server
+from mechanics.game_log import set_level
+from mechanics.replay import start_replays
+from ui import MenuScene, SceneManager
+
+# Initialize pygame once; the scenes and modes reuse it. The modes' timers
+# run on mechanics.game_clock, not pygame.time.get_ticks(); pygame.init()
+# is for the display, fonts and mixer the menu needs from its first frame
+with startup.phase("pygame.init", "init"):
+    pygame.init()
 
 # Screen setup
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+with startup.phase("set_mode", "init"):
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Fish-O-Mania")
 clock = pygame.time.Clock()
 
 
+def parse_args(argv=None):
+    """
+    Parse command line options.
+
+    Args:
+        argv (list): Arguments, defaults to sys.argv.
+
+    Returns:
+        argparse.Namespace: Parsed options.
+    """
+    parser = argparse.ArgumentParser(description="Fish-O-Mania")
+    parser.add_argument(
+        "--trace", nargs="?", const="", metavar="FILE",
+        help="record a Chrome/Perfetto trace (default: trace-<time>.json)")
+    parser.add_argument(
+        "--startup-profile", nargs="?", const="", metavar="FILE",
+        help="write startup and mode switch timings "
+             "(default: startup-profile.json)")
+    parser.add_argument(
+        "--hitch-sampler", nargs="?", const="", metavar="DIR",
+        help="save stack samples of slow frames (default: hitch_reports)")
+    parser.add_argument(
+        "--metrics-port", type=int, metavar="PORT",
+        help="serve frame, catch and audio metrics on localhost")
+    parser.add_argument(
+        "--log-level", metavar="LEVEL",
+        help="DEBUG, INFO, WARNING or ERROR (default: INFO)")
+    parser.add_argument(
+        "--record-replays", nargs="?", const="", metavar="DIR",
+        help="record every session for replaying (default: replays)")
+    return parser.parse_args(argv)
+
+
 def main():
     """Main entry point and game loop"""
-    menu = MenuScreen()
-    running = True
-
-    while running:
-        mouse_clicked = False
-
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    mouse_clicked = True
-
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if menu.showing_high_scores:
-                        menu.showing_high_scores = False
-                    else:
-                        running = False
-
-                elif not menu.transitioning:
-                    if menu.showing_high_scores:
-                        # Close high scores on Enter or Escape
-                        if event.key in [pygame.K_RETURN, pygame.K_ESCAPE]:
-                            menu.showing_high_scores = False
-                    else:
-                        # Keyboard navigation
-                        if event.key == pygame.K_UP:
-                            menu.move_selection(-1)
-                        elif event.key == pygame.K_DOWN:
-                            menu.move_selection(1)
-                        elif event.key == pygame.K_RETURN:
-                            action = menu.select_current()
-                            if action in ["classic", "time_attack", "endless"]:
-                                pygame.mixer.music.stop()
-                                menu.start_transition(action)
-                            elif action == "high_scores":
-                                menu.showing_high_scores = True
-                            elif action == "quit":
-                                running = False
-
-        # Handle mouse clicks
-        if mouse_clicked and not menu.transitioning:
-            if not menu.showing_high_scores:
-                action = menu.handle_click(pygame.mouse.get_pos())
-                if action in ["classic", "time_attack", "endless"]:
-                    pygame.mixer.music.stop()
-                    menu.start_transition(action)
-                elif action == "high_scores":
-                    menu.showing_high_scores = True
-                elif action == "quit":
-                    running = False
-
-        # Update menu
-        result = menu.update()
-
-        # Launch game modes after transition
-        if result == "classic":
-            print("Launching Classic Mode...")
-            pygame.display.set_caption("Fish-O-Mania: Classic Mode")
-            from modes.mode_classic import main as classic_main
-            classic_main()
-            pygame.display.set_caption("Fish-O-Mania")
-            menu = MenuScreen()
-
-        elif result == "time_attack":
-            print("Launching Time Attack...")
-            pygame.display.set_caption("Fish-O-Mania: Time Attack")
-            from modes.mode_time_attack import main as time_attack_main
-            time_attack_main()
-            pygame.display.set_caption("Fish-O-Mania")
-            menu = MenuScreen()
-
-        elif result == "endless":
-            print("Launching Endless Mode...")
-            pygame.display.set_caption("Fish-O-Mania: Endless Mode")
-            from modes.mode_endless import main as endless_main
-            endless_main()
-            pygame.display.set_caption("Fish-O-Mania")
-            menu = MenuScreen()
-
-        # Draw menu
-        menu.draw(screen)
-        pygame.display.flip()
-        clock.tick(FPS)
-
+    args = parse_args()
+    if args.trace is not None:
+        start_tracing(args.trace or None)
+    if args.startup_profile is not None:
+        startup.enable_report(args.startup_profile or None)
+    if args.hitch_sampler is not None:
+        start_sampler(args.hitch_sampler or None)
+    if args.metrics_port is not None:
+        start_server(args.metrics_port)
+    if args.log_level is not None:
+        set_level(args.log_level)
+    if args.record_replays is not None:
+        start_replays(args.record_replays or None)
+
+    # Score backend and player name for shared machines
+    backend = os.environ.get("FISH_SCORES_BACKEND")
+    if backend:
+        use_backend(backend)
+    set_player(os.environ.get("FISH_PLAYER"))
+
+    # The menu and the modes share the display and the background
+    SceneManager(screen, clock).run(MenuScene())
+
+    flush_trace()
     pygame.quit()
     sys.exit()
 
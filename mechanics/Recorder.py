@@ -3,6 +3,8 @@ import pyaudio
 import numpy as np
 import time
 
+from mechanics.metrics import RECORDER_PEAK, RECORDER_READ_SECONDS
+
 
 class RECORDER:
     # fpb equals frames_per_buffer,
@@ -15,6 +17,7 @@ class RECORDER:
         self.stream = None
         self.frames = []
         self.last_frame = None  # Store the most recent frame
+        self.last_read_time = None  # perf_counter() after the last read
 
     def start_recording(self):
         if self.stream is None:
@@ -32,6 +35,7 @@ class RECORDER:
                                 exception_on_overflow=False)
         self.frames.append(data)
         self.last_frame = data
+        self.last_read_time = time.perf_counter()
 
     def pause_recording(self):
         if self.stream is not None and self.stream.is_active():
@@ -52,10 +56,14 @@ class RECORDER:
 
     def read_frames(self):
         if self.stream is not None and self.stream.is_active():
+            start = time.perf_counter()
             data = self.stream.read(self.frames_per_buffer,
                                     exception_on_overflow=False)
             self.frames.append(data)
             self.last_frame = data  # Store as most recent frame
+            self.last_read_time = time.perf_counter()
+            RECORDER_READ_SECONDS.observe(self.last_read_time - start)
+            RECORDER_PEAK.observe(self.get_frame_peak())
             return data
         return None
 
@@ -81,3 +89,20 @@ class RECORDER:
             return 0
         peak = np.max(np.abs(audio_data))
         return int(peak)
+
+    def get_onset_time(self, threshold):
+        """Estimate when the most recent frame first reached threshold.
+
+        The read returns once the block is full, so a sample n samples
+        before the end of the block arrived n / rate seconds before it.
+        Returns a time.perf_counter() value, or None if no sample of the
+        most recent frame reached threshold.
+        """
+        if self.last_frame is None or self.last_read_time is None:
+            return None
+        audio_data = np.frombuffer(self.last_frame, dtype=np.int16)
+        loud = np.flatnonzero(np.abs(audio_data.astype(np.int32))
+                              >= threshold)
+        if len(loud) == 0:
+            return None
+        return self.last_read_time - (len(audio_data) - loud[0]) / self.rate
@@ -7,7 +7,27 @@ Modules:
     constants: Game configuration values.
     casting: Fishing rod mechanics.
     lives_manager: Player lives system.
-    scores: High score persistence.
+    scores: High score persistence (JSON or SQLite leaderboard).
+    session_journal: Append-only log of finished sessions.
+    scream_detector: Spectral scream classifier (worker process).
+    catch_log: Per-session columnar catch event log.
+    catch_analysis: Offline catch rate analysis of the catch logs.
+    profiler: F3 frame profiler overlay.
+    tracing: Chrome/Perfetto trace export.
+    startup: Startup and mode switch timing.
+    pacing: Frame pacing histogram and hitch counts.
+    latency: Input-to-display latency.
+    gc_policy: Garbage collection freezing, deferral and timing.
+    hitch_sampler: Stack samples of slow frames for flame graphs.
+    metrics: Prometheus metrics endpoint on localhost.
+    flight_recorder: Last seconds of frames, dumped on crashes and hitches.
+    game_log: Leveled, structured logging written off the game thread.
+    assets: Shared, size-accounted asset cache with LRU eviction.
+    keyboard_recorder: Keyboard stand-in for the microphone.
+    game_clock: Game time, moved on by each frame's length.
+    replay: Session recording and deterministic playback.
+    random_streams: Seeded random streams per subsystem.
+    Recorder: Microphone recorder (imports PyAudio; loaded on first use).
 
 Usage:
     from mechanics import CastingRod, LivesManager
@@ -15,22 +35,31 @@ Usage:
     from mechanics.scores import update_high_score
 """
 
+# First, so the imports below are timed
+from mechanics import startup  # noqa: F401
 from mechanics.casting import CastingRod
 from mechanics.lives_manager import LivesManager
 from mechanics.scores import (
+    ScoreStore,
+    SqliteScoreStore,
     get_default_scores,
     load_scores,
     save_scores,
     update_high_score,
     get_high_score,
     get_all_high_scores,
-    reset_scores
+    reset_scores,
+    flush_scores,
+    get_top_scores,
+    set_player,
+    use_backend
 )
-from mechanics.Recorder import RECORDER
 
 __all__ = [
     'CastingRod',
     'LivesManager',
+    'ScoreStore',
+    'SqliteScoreStore',
     'get_default_scores',
     'load_scores',
     'save_scores',
@@ -38,4 +67,17 @@ __all__ = [
     'get_high_score',
     'get_all_high_scores',
     'reset_scores',
-]
\ No newline at end of file
+    'flush_scores',
+    'get_top_scores',
+    'set_player',
+    'use_backend',
+]
+
+
+def __getattr__(name):
+    # RECORDER imports PyAudio and numpy, which only classic mode needs,
+    # so it is loaded on first use instead of with the package
+    if name == "RECORDER":
+        from mechanics.Recorder import RECORDER
+        return RECORDER
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
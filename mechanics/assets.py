@@ -0,0 +1,331 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Asset Cache for Fish-O-Mania.
+
+Decoded images, animation frames and sounds are loaded once and shared:
+every fish of a type uses the same frames, and coming back to a mode
+reuses its sounds and graphics instead of decoding them again.
+
+The cache knows the size in bytes of everything it holds (pixels for a
+Surface, decoded samples for a Sound) and reports totals by category:
+    fish: fish animation frames (sprites and catch display)
+    death: death animation frames
+    ui: lives icons, boat and hook images
+    background: sand layers
+    sounds: sound effects
+    music: mode background tracks
+
+With a memory budget set (FISH_ASSET_BUDGET_MB), trim() evicts the least
+recently used assets until the cache fits. The menu calls it after each
+mode, when nothing is drawing the previous mode's assets; assets are
+never evicted during gameplay, where a reload would be a hitch. Assets
+something still holds (the menu's boat, the shared sand layers) are
+skipped: evicting them frees nothing and the next load would make a
+second copy.
+
+Functions:
+    get_asset: Get a cached asset, loading it on first use.
+    load_image: Load an image through the cache.
+    load_sound: Load a sound through the cache.
+    asset_size: Size in bytes of a decoded asset.
+    set_budget: Set the memory budget.
+    trim: Evict least recently used assets down to the budget.
+    get_asset_report: Cached assets and bytes by category.
+    clear_assets: Forget every cached asset.
+
+Classes:
+    AssetCache: Size-aware LRU cache of decoded assets.
+"""
+
+import os
+import sys
+from collections import OrderedDict
+
+import pygame
+
+from mechanics.game_log import fields, get_logger
+from mechanics.tracing import span
+
+# Environment variable with the memory budget in megabytes
+BUDGET_ENV = "FISH_ASSET_BUDGET_MB"
+
+log = get_logger("assets")
+
+
+def _refcount(entries, key):
+    """References to a cached asset, as sys.getrefcount sees them."""
+    return sys.getrefcount(entries[key][0])
+
+
+# References to an asset only the cache holds
+_CACHE_ONLY_REFS = _refcount({None: (object(), None, 0)}, None)
+
+
+def asset_size(asset):
+    """
+    Get the decoded size of an asset.
+
+    Args:
+        asset: A pygame.Surface, pygame.mixer.Sound, or a list, tuple or
+            dict of them.
+
+    Returns:
+        int: Size in bytes (0 for anything else).
+    """
+    if isinstance(asset, pygame.Surface):
+        return asset.get_pitch() * asset.get_height()
+    if isinstance(asset, pygame.mixer.Sound):
+        mixer = pygame.mixer.get_init()
+        if mixer is None:
+            return 0
+        frequency, size, channels = mixer
+        return int(asset.get_length() * frequency) * channels * (
+            abs(size) // 8)
+    if isinstance(asset, dict):
+        asset = list(asset.values())
+    if isinstance(asset, (list, tuple)):
+        return sum(asset_size(item) for item in asset)
+    return 0
+
+
+class AssetCache:
+    """
+    Size-aware least recently used cache of decoded assets.
+
+    Attributes:
+        budget (int): Memory budget in bytes, or None for no limit.
+        total_bytes (int): Bytes held by the cache.
+        hits (int): Lookups served from the cache.
+        loads (int): Assets loaded.
+        evictions (int): Assets evicted by trim().
+    """
+
+    def __init__(self, budget=None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            budget (int): Memory budget in bytes, or None for no limit.
+        """
+        self.budget = budget
+        self.total_bytes = 0
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+        # key -> (asset, category, size), least recently used first
+        self._entries = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, loader, category):
+        """
+        Get an asset, loading it on first use.
+
+        Args:
+            key (tuple): Identifies the asset and how it was processed.
+            loader (callable): Returns the asset; errors are passed on
+                and nothing is cached.
+            category (str): Category used in reports.
+
+        Returns:
+            The cached asset.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        asset = loader()
+        size = asset_size(asset)
+        self._entries[key] = (asset, category, size)
+        self.total_bytes += size
+        self.loads += 1
+        return asset
+
+    def in_use(self, key):
+        """
+        Check whether anything outside the cache holds an asset.
+
+        Args:
+            key (tuple): The asset's key.
+
+        Returns:
+            bool: True if the asset is referenced elsewhere.
+        """
+        return _refcount(self._entries, key) > _CACHE_ONLY_REFS
+
+    def trim(self, budget=None):
+        """
+        Evict least recently used assets until the cache fits.
+
+        Assets still in use are kept, so the cache can stay over budget
+        when everything left is in use.
+
+        Args:
+            budget (int): Bytes to fit in, defaults to the cache's budget.
+
+        Returns:
+            list: Keys of the evicted assets.
+        """
+        budget = self.budget if budget is None else budget
+        evicted = []
+        if budget is None:
+            return evicted
+        for key in list(self._entries):
+            if self.total_bytes <= budget:
+                break
+            if self.in_use(key):
+                continue
+            _, _, size = self._entries.pop(key)
+            self.total_bytes -= size
+            evicted.append(key)
+        self.evictions += len(evicted)
+        return evicted
+
+    def report(self):
+        """
+        Get cached assets and bytes by category.
+
+        Returns:
+            dict: Category -> {"count", "bytes"}, plus "total" with the
+                budget.
+        """
+        categories = {}
+        for _, category, size in self._entries.values():
+            totals = categories.setdefault(category,
+                                           {"count": 0, "bytes": 0})
+            totals["count"] += 1
+            totals["bytes"] += size
+        categories["total"] = {"count": len(self._entries),
+                               "bytes": self.total_bytes,
+                               "budget": self.budget}
+        return categories
+
+    def clear(self):
+        """Forget every cached asset."""
+        self._entries.clear()
+        self.total_bytes = 0
+
+
+def _env_budget():
+    """Read the budget from the environment, in bytes."""
+    value = os.environ.get(BUDGET_ENV)
+    if not value:
+        return None
+    try:
+        return int(float(value) * 1024 * 1024)
+    except ValueError:
+        log.warning("Ignoring %s=%r: not a number", BUDGET_ENV, value,
+                    extra=fields(variable=BUDGET_ENV, value=value))
+        return None
+
+
+# Shared cache used by the module-level functions
+_cache = AssetCache(_env_budget())
+
+
+def get_asset(key, loader, category):
+    """
+    Get a cached asset, loading it on first use.
+
+    Args:
+        key (tuple): Identifies the asset and how it was processed.
+        loader (callable): Returns the asset.
+        category (str): Category used in reports.
+
+    Returns:
+        The cached asset.
+    """
+    return _cache.get(key, loader, category)
+
+
+def load_image(path, category, scale=None, alpha=True):
+    """
+    Load an image through the cache.
+
+    Args:
+        path (str): Image file.
+        category (str): Category used in reports.
+        scale (tuple): Size to scale to, or None.
+        alpha (bool): Convert to the display format with per-pixel alpha.
+
+    Returns:
+        pygame.Surface: The shared image; don't draw on it.
+    """
+    def loader():
+        with span("load image", "assets", {"path": path}):
+            image = pygame.image.load(path)
+            if alpha:
+                image = image.convert_alpha()
+            if scale is not None:
+                image = pygame.transform.scale(image, scale)
+            return image
+
+    return _cache.get(("image", path, scale, alpha), loader, category)
+
+
+def load_sound(path, category="sounds"):
+    """
+    Load a sound through the cache.
+
+    The Sound object is shared, so set its volume where it is loaded and
+    use the same volume everywhere.
+
+    Args:
+        path (str): Sound file.
+        category (str): Category used in reports.
+
+    Returns:
+        pygame.mixer.Sound: The shared sound.
+    """
+    def loader():
+        with span("load sound", "assets", {"path": path}):
+            return pygame.mixer.Sound(path)
+
+    return _cache.get(("sound", path), loader, category)
+
+
+def set_budget(megabytes):
+    """
+    Set the memory budget.
+
+    Args:
+        megabytes (float): Budget in MB, or None for no limit.
+    """
+    _cache.budget = (None if megabytes is None
+                     else int(megabytes * 1024 * 1024))
+
+
+def trim():
+    """
+    Evict least recently used assets down to the budget. Call between
+    modes, never during gameplay.
+
+    Returns:
+        list: Keys of the evicted assets.
+    """
+    evicted = _cache.trim()
+    if evicted:
+        log.info("Evicted %d assets, %.1f MB cached", len(evicted),
+                 _cache.total_bytes / (1024 * 1024),
+                 extra=fields(evicted=len(evicted),
+                              cached_bytes=_cache.total_bytes))
+    return evicted
+
+
+def get_asset_report():
+    """
+    Get cached assets and bytes by category.
+
+    Returns:
+        dict: See AssetCache.report.
+    """
+    return _cache.report()
+
+
+def clear_assets():
+    """Forget every cached asset."""
+    _cache.clear()
@@ -11,7 +11,8 @@ Classes:
     CastingRod: Manages the fishing rod state and behavior of collision.
 """
 
-import pygame
+from mechanics import game_clock
+from mechanics.tracing import instant
 
 
 class CastingRod:
@@ -35,6 +36,8 @@ class CastingRod:
         auto_reel: if True, auto-switch to reel when hitting bottom.
         attached_fish: reference to currently hooked fish.
         pending_danger_fish: danger fish waiting for scream resolution.
+        cast_count: number of casts started from the surface.
+        cast_start_time: ticks when the current cast left the surface.
     """
 
     def __init__(self, rod_max_length, rod_speed, auto_reel=True):
@@ -61,6 +64,10 @@ class CastingRod:
         self.catch_cooldown_end_time = 0
         self.catch_cooldown_duration = 2000  # 2 seconds cooldown
 
+        # Cast statistics (for the catch log)
+        self.cast_count = 0
+        self.cast_start_time = 0
+
     def is_on_cooldown(self):
         """
         Check if the hook is still on catch cooldown.
@@ -68,13 +75,22 @@ class CastingRod:
         Returns:
             bool: True if cooldown is active, False otherwise.
         """
-        return pygame.time.get_ticks() < self.catch_cooldown_end_time
+        return game_clock.get_ticks() < self.catch_cooldown_end_time
 
     def start_cooldown(self):
         """Start the catch cooldown period."""
-        self.catch_cooldown_end_time = pygame.time.get_ticks() + \
+        self.catch_cooldown_end_time = game_clock.get_ticks() + \
             self.catch_cooldown_duration
 
+    def time_since_cast(self):
+        """
+        Get the time since the current cast left the surface.
+
+        Returns:
+            float: Seconds since the cast started.
+        """
+        return (game_clock.get_ticks() - self.cast_start_time) / 1000
+
     def toggle_cast(self):
         """Toggle between casting and reeling states."""
         self.is_casting = not self.is_casting
@@ -97,6 +113,11 @@ class CastingRod:
             return None
 
         if self.is_casting:
+            # A new cast starts when the hook leaves the surface
+            if self.rod_length == 0:
+                self.cast_count += 1
+                self.cast_start_time = game_clock.get_ticks()
+
             # Extend the rod downward
             if self.rod_length < self.rod_max_length:
                 self.rod_length += self.rod_speed
@@ -117,6 +138,7 @@ class CastingRod:
                         if is_danger:
                             # Hook the danger fish - enters pending state
                             fish.is_hooked = True
+                            instant("danger fish hooked", "danger")
 
                             self.pending_danger_fish = fish
                             self.attached_fish = fish
@@ -161,6 +183,7 @@ class CastingRod:
             or None if no pending fish.
         """
         if self.pending_danger_fish is not None:
+            instant("danger fish caught", "danger")
             fish = self.pending_danger_fish
             fish_value = getattr(fish, 'value', 25)
             fish_type = getattr(fish, 'fish_type', 'Danger Fish')
@@ -215,13 +238,14 @@ class CastingRod:
         so it can't be immediately re-caught.
         """
         if self.pending_danger_fish is not None:
+            instant("danger fish released", "danger")
             # Clear hooked flag
             self.pending_danger_fish.is_hooked = False
 
             # Mark fish as recently released -
             # it can't be caught again for a while
             self.pending_danger_fish.recently_released = True
-            self.pending_danger_fish.release_time = pygame.time.get_ticks()
+            self.pending_danger_fish.release_time = game_clock.get_ticks()
 
             # Clear pending state
             self.pending_danger_fish = None
@@ -237,3 +261,5 @@ class CastingRod:
         self.attached_fish = None
         self.pending_danger_fish = None
         self.catch_cooldown_end_time = 0
+        self.cast_count = 0
+        self.cast_start_time = 0
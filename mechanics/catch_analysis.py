@@ -0,0 +1,319 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Catch Analysis for Fish-O-Mania.
+
+Offline tool for the session logs written by mechanics.catch_log. All
+sessions are loaded into one set of NumPy columns (each column file is
+read with a single np.fromfile call) and the catch rates are computed
+with vectorized group-bys, so thousands of sessions take seconds.
+
+Run from the game directory with:
+    python -m mechanics.catch_analysis [log_dir] [--depth-band PIXELS]
+
+Functions:
+    load_sessions: Load all session logs in a directory.
+    rates_by_species: Catch rate per species.
+    rates_by_depth: Catch rate per depth band.
+    rates_by_mode: Catch rate per game mode.
+    main: Command line entry point.
+
+Classes:
+    CatchData: Events and per-session totals of many sessions.
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from mechanics.catch_log import (
+    CATCH_LOG_DIR,
+    COLUMNS,
+    EVENT_CATCH,
+    EVENT_PENALTY,
+    EVENT_RELEASE,
+    META_FILE
+)
+
+DEPTH_BAND = 100  # Default depth band height in pixels
+
+
+class CatchData:
+    """
+    Events and per-session totals of many sessions.
+
+    Attributes:
+        columns (dict): Column name -> array over all events. Besides the
+            logged columns, "session" holds each event's session index and
+            "species" is remapped to indices into the shared species list.
+        species (list): Fish type names.
+        modes (list): Game mode names.
+        session_mode (np.ndarray): Mode index of each session.
+        session_duration (np.ndarray): Length of each session in seconds.
+        session_casts (np.ndarray): Casts made in each session.
+    """
+
+    def __init__(self, columns, species, modes, session_mode,
+                 session_duration, session_casts):
+        self.columns = columns
+        self.species = species
+        self.modes = modes
+        self.session_mode = session_mode
+        self.session_duration = session_duration
+        self.session_casts = session_casts
+
+    @property
+    def event_count(self):
+        """int: Number of events across all sessions."""
+        return len(self.columns["event"])
+
+    @property
+    def session_count(self):
+        """int: Number of sessions loaded."""
+        return len(self.session_mode)
+
+    def catches(self):
+        """
+        Get a mask of events where a fish was landed.
+
+        Returns:
+            np.ndarray: True for catch and penalty events.
+        """
+        event = self.columns["event"]
+        return (event == EVENT_CATCH) | (event == EVENT_PENALTY)
+
+
+def _read_session(path, meta):
+    """Read the column files of one session, trimmed to equal length."""
+    columns = {}
+    for name, dtype in meta.get("columns", COLUMNS).items():
+        file_path = os.path.join(path, name + ".bin")
+        if os.path.exists(file_path):
+            columns[name] = np.fromfile(file_path, dtype=dtype)
+        else:
+            columns[name] = np.zeros(0, dtype=dtype)
+
+    # A crash can leave the last batch partly written
+    length = min(len(column) for column in columns.values())
+    return {name: column[:length] for name, column in columns.items()}
+
+
+def load_sessions(directory=CATCH_LOG_DIR):
+    """
+    Load all session logs in a directory.
+
+    Args:
+        directory (str): Directory containing session sub-directories.
+
+    Returns:
+        CatchData: All events of all sessions.
+    """
+    species = []
+    species_index = {}
+    modes = []
+    mode_index = {}
+    parts = {name: [] for name in COLUMNS}
+    session_ids = []
+    session_mode = []
+    session_duration = []
+    session_casts = []
+
+    try:
+        entries = sorted(os.listdir(directory))
+    except OSError:
+        entries = []
+
+    for entry in entries:
+        path = os.path.join(directory, entry)
+        try:
+            with open(os.path.join(path, META_FILE)) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            continue
+
+        session = len(session_mode)
+        mode = meta.get("mode", "unknown")
+        if mode not in mode_index:
+            mode_index[mode] = len(modes)
+            modes.append(mode)
+        session_mode.append(mode_index[mode])
+        session_duration.append(meta.get("duration", 0.0))
+        session_casts.append(meta.get("casts", 0))
+
+        columns = _read_session(path, meta)
+
+        # Map this session's species codes onto the shared table
+        lookup = []
+        for name in meta.get("species", []):
+            if name not in species_index:
+                species_index[name] = len(species)
+                species.append(name)
+            lookup.append(species_index[name])
+        lookup = np.asarray(lookup, dtype=np.int32)
+        codes = columns["species"].astype(np.int32)
+        if len(lookup):
+            codes = lookup[np.minimum(codes, len(lookup) - 1)]
+        columns["species"] = codes
+
+        for name in COLUMNS:
+            parts[name].append(columns[name])
+        session_ids.append(
+            np.full(len(columns["event"]), session, dtype=np.int32))
+
+    merged = {}
+    for name, dtype in COLUMNS.items():
+        if name == "species":
+            dtype = np.int32
+        merged[name] = (np.concatenate(parts[name]) if parts[name]
+                        else np.zeros(0, dtype=dtype))
+    merged["session"] = (np.concatenate(session_ids) if session_ids
+                         else np.zeros(0, dtype=np.int32))
+
+    return CatchData(
+        merged,
+        species,
+        modes,
+        np.asarray(session_mode, dtype=np.int32),
+        np.asarray(session_duration, dtype=np.float64),
+        np.asarray(session_casts, dtype=np.int64),
+    )
+
+
+def _per_minute(counts, minutes):
+    """Divide counts by minutes, 0 where no time was played."""
+    return np.divide(counts, minutes, out=np.zeros(len(counts)),
+                     where=minutes > 0)
+
+
+def rates_by_species(data):
+    """
+    Catch rate per species.
+
+    Args:
+        data (CatchData): Loaded sessions.
+
+    Returns:
+        list: (species, catches, releases, catches per minute, share)
+            tuples, most caught first.
+    """
+    groups = len(data.species)
+    species = data.columns["species"]
+    catches = np.bincount(species[data.catches()], minlength=groups)
+    releases = np.bincount(
+        species[data.columns["event"] == EVENT_RELEASE], minlength=groups)
+
+    minutes = data.session_duration.sum() / 60
+    per_minute = catches / minutes if minutes > 0 else np.zeros(groups)
+    share = catches / max(1, catches.sum())
+
+    order = np.argsort(-catches, kind="stable")
+    return [(data.species[i], int(catches[i]), int(releases[i]),
+             float(per_minute[i]), float(share[i])) for i in order]
+
+
+def rates_by_depth(data, band=DEPTH_BAND):
+    """
+    Catch rate per depth band.
+
+    Args:
+        data (CatchData): Loaded sessions.
+        band (int): Band height in pixels.
+
+    Returns:
+        list: (band_start, band_end, catches, catches per minute, mean
+            seconds from cast to catch) tuples, shallowest first.
+    """
+    mask = data.catches()
+    bands = (data.columns["depth"][mask] // band).astype(np.int64)
+    if len(bands) == 0:
+        return []
+
+    groups = int(bands.max()) + 1
+    catches = np.bincount(bands, minlength=groups)
+    since_cast = np.bincount(bands, weights=data.columns["since_cast"][mask],
+                             minlength=groups)
+    mean_since_cast = np.divide(since_cast, catches,
+                                out=np.zeros(groups), where=catches > 0)
+
+    minutes = data.session_duration.sum() / 60
+    per_minute = catches / minutes if minutes > 0 else np.zeros(groups)
+
+    return [(i * band, (i + 1) * band, int(catches[i]),
+             float(per_minute[i]), float(mean_since_cast[i]))
+            for i in range(groups) if catches[i]]
+
+
+def rates_by_mode(data):
+    """
+    Catch rate per game mode.
+
+    Args:
+        data (CatchData): Loaded sessions.
+
+    Returns:
+        list: (mode, sessions, catches, catches per minute, catches per
+            cast) tuples in the order modes were first seen.
+    """
+    groups = len(data.modes)
+    mask = data.catches()
+    event_mode = data.session_mode[data.columns["session"][mask]]
+
+    catches = np.bincount(event_mode, minlength=groups)
+    sessions = np.bincount(data.session_mode, minlength=groups)
+    minutes = np.bincount(data.session_mode, weights=data.session_duration,
+                          minlength=groups) / 60
+    casts = np.bincount(data.session_mode, weights=data.session_casts,
+                        minlength=groups)
+
+    per_minute = _per_minute(catches, minutes)
+    per_cast = _per_minute(catches, casts)
+    return [(data.modes[i], int(sessions[i]), int(catches[i]),
+             float(per_minute[i]), float(per_cast[i]))
+            for i in range(groups)]
+
+
+def main(argv=None):
+    """
+    Print catch rate tables for a directory of session logs.
+
+    Args:
+        argv (list): Command line arguments, defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(
+        description="Catch rates from Fish-O-Mania session logs.")
+    parser.add_argument("directory", nargs="?", default=CATCH_LOG_DIR,
+                        help="directory with session logs")
+    parser.add_argument("--depth-band", type=int, default=DEPTH_BAND,
+                        help="depth band height in pixels")
+    args = parser.parse_args(argv)
+
+    data = load_sessions(args.directory)
+    print(f"{data.session_count} sessions, {data.event_count} events")
+
+    print("\nBy mode:")
+    print(f"  {'mode':<14}{'sessions':>9}{'catches':>9}"
+          f"{'per min':>9}{'per cast':>10}")
+    for mode, sessions, catches, per_minute, per_cast in rates_by_mode(data):
+        print(f"  {mode:<14}{sessions:>9}{catches:>9}"
+              f"{per_minute:>9.2f}{per_cast:>10.2f}")
+
+    print("\nBy species:")
+    print(f"  {'species':<16}{'catches':>9}{'released':>9}"
+          f"{'per min':>9}{'share':>8}")
+    for name, catches, releases, per_minute, share in rates_by_species(data):
+        print(f"  {name:<16}{catches:>9}{releases:>9}"
+              f"{per_minute:>9.2f}{share:>8.1%}")
+
+    print("\nBy depth:")
+    print(f"  {'depth (px)':<14}{'catches':>9}{'per min':>9}"
+          f"{'cast->catch':>13}")
+    for start, end, catches, per_minute, since_cast in rates_by_depth(
+            data, args.depth_band):
+        print(f"  {f'{start}-{end}':<14}{catches:>9}{per_minute:>9.2f}"
+              f"{since_cast:>12.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Catch Log for Fish-O-Mania.
+
+Records every catch, penalty catch and danger fish release of a session
+so catch rates can be analysed offline (see mechanics/catch_analysis.py).
+Events are buffered in memory and appended in batches to a columnar
+session directory: one raw binary file per column plus a meta.json
+describing the session, so thousands of sessions can be loaded straight
+into NumPy arrays without parsing anything per event.
+
+The batches are written on a background thread, one at a time and in
+order, so neither a full batch nor the flush at game over touches the
+disk on the frame thread. A session without events writes nothing.
+
+Session directory layout:
+    meta.json: mode, start time, duration, casts, species table, columns
+    <column>.bin: little-endian values of one column, one per event
+
+Functions:
+    new_session_dir: Create a fresh directory for a session.
+
+Classes:
+    CatchLogger: Buffers catch events and flushes them in batches.
+"""
+
+import json
+import os
+import time
+
+import numpy as np
+
+from mechanics.constants import WATER_SURFACE
+from mechanics.game_log import fields, get_logger
+from mechanics.metrics import CATCH_EVENTS
+from mechanics.tracing import instant
+
+# Directory holding one sub-directory per session
+CATCH_LOG_DIR = "catch_logs"
+
+# Events buffered before they are appended to the column files
+BATCH_SIZE = 32
+
+# Event kinds
+EVENT_CATCH = 0  # Normal fish caught
+EVENT_PENALTY = 1  # Danger fish caught, life lost
+EVENT_RELEASE = 2  # Danger fish released by screaming
+EVENT_NAMES = ["catch", "penalty", "release"]
+
+# Column name -> dtype of its binary file
+COLUMNS = {
+    "t": "<f4",  # Seconds since the session started
+    "event": "u1",  # EVENT_* kind
+    "species": "u1",  # Index into the session's species table
+    "value": "<i2",  # Points of the fish
+    "depth": "<f4",  # Hook depth below the water surface (pixels)
+    "hook_x": "<i2",  # Hook position on screen
+    "hook_y": "<i2",
+    "since_cast": "<f4",  # Seconds between the cast and the catch
+}
+
+META_FILE = "meta.json"
+
+log = get_logger("catch_log")
+
+# Writes the session files in order off the frame thread; started on
+# first use so sessions without catch logging never start it
+_executor = None
+
+
+def _submit(job):
+    """
+    Run a job on the writer thread.
+
+    Args:
+        job (callable): Writes files.
+
+    Returns:
+        concurrent.futures.Future: The job's future.
+    """
+    global _executor
+    if _executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _executor = ThreadPoolExecutor(max_workers=1,
+                                       thread_name_prefix="catch-log")
+    return _executor.submit(job)
+
+
+def new_session_dir(mode, directory=CATCH_LOG_DIR):
+    """
+    Create a fresh directory for a session.
+
+    Args:
+        mode (str): Game mode ("classic", "time_attack", or "endless").
+        directory (str): Parent directory for all session logs.
+
+    Returns:
+        str: Path of the new session directory.
+    """
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    base = os.path.join(directory, f"{mode}-{stamp}-{os.getpid()}")
+    path = base
+    suffix = 1
+    while os.path.exists(path):
+        path = f"{base}-{suffix}"
+        suffix += 1
+    os.makedirs(path)
+    return path
+
+
+class CatchLogger:
+    """
+    Per-session catch event logger with batched columnar writes.
+
+    Events are kept in per-column Python lists and handed to the writer
+    thread once per batch, so logging a catch on the frame thread only
+    appends a few numbers. A disabled logger ignores every call.
+
+    Attributes:
+        mode (str): Game mode of the session.
+        path (str): Session directory, None until the first batch has
+            been written (see wait()).
+        enabled (bool): Whether events are recorded at all.
+        event_count (int): Number of events logged so far.
+    """
+
+    def __init__(self, mode, directory=CATCH_LOG_DIR, enabled=True,
+                 batch_size=BATCH_SIZE):
+        """
+        Start logging a session.
+
+        Args:
+            mode (str): Game mode ("classic", "time_attack", or "endless").
+            directory (str): Parent directory for all session logs.
+            enabled (bool): If False, nothing is recorded or written.
+            batch_size (int): Events buffered before a flush.
+        """
+        self.mode = mode
+        self.directory = directory
+        self.enabled = enabled
+        self.batch_size = batch_size
+        self.path = None
+        self.event_count = 0
+
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        self._casts = 0
+        self._species = {}
+        self._buffer = {name: [] for name in COLUMNS}
+        self._closed = False
+        self._pending = None
+
+    def _species_code(self, fish_type):
+        """Get the species table index for a fish type."""
+        code = self._species.get(fish_type)
+        if code is None:
+            code = len(self._species)
+            self._species[fish_type] = code
+        return code
+
+    def log(self, event, fish_type, value, hook_position, since_cast=0.0):
+        """
+        Record one event.
+
+        Args:
+            event (int): EVENT_CATCH, EVENT_PENALTY or EVENT_RELEASE.
+            fish_type (str): Fish type name, e.g. "Shark".
+            value (int): Points of the fish.
+            hook_position (tuple): (x, y) of the hook point on screen.
+            since_cast (float): Seconds since the cast started.
+        """
+        instant(EVENT_NAMES[event], "catch",
+                {"type": fish_type, "value": value})
+        CATCH_EVENTS.inc((EVENT_NAMES[event], fish_type))
+        if not self.enabled or self._closed:
+            return
+
+        hook_x, hook_y = hook_position
+        buffer = self._buffer
+        buffer["t"].append(time.perf_counter() - self._start)
+        buffer["event"].append(event)
+        buffer["species"].append(self._species_code(fish_type))
+        buffer["value"].append(value)
+        buffer["depth"].append(max(0, hook_y - WATER_SURFACE))
+        buffer["hook_x"].append(hook_x)
+        buffer["hook_y"].append(hook_y)
+        buffer["since_cast"].append(since_cast)
+        self.event_count += 1
+
+        if len(buffer["t"]) >= self.batch_size:
+            self.flush()
+
+    def log_catch(self, result, hook_rect, casting_manager):
+        """
+        Record a catch returned by the casting rod.
+
+        Args:
+            result (dict): Catch info with "type", "value" and optionally
+                "penalty" (danger fish caught).
+            hook_rect (pygame.Rect): Hook rectangle at the time of the catch.
+            casting_manager (CastingRod): Rod, for the time since the cast.
+        """
+        event = EVENT_PENALTY if result.get("penalty") else EVENT_CATCH
+        self.log(event, result["type"], result["value"],
+                 (hook_rect.centerx, hook_rect.bottom),
+                 casting_manager.time_since_cast())
+
+    def log_release(self, fish, hook_rect, casting_manager):
+        """
+        Record a danger fish released by screaming.
+
+        Args:
+            fish (Fish): The released fish.
+            hook_rect (pygame.Rect): Hook rectangle at the time of release.
+            casting_manager (CastingRod): Rod, for the time since the cast.
+        """
+        self.log(EVENT_RELEASE, getattr(fish, "fish_type", "Danger Fish"),
+                 getattr(fish, "value", 0),
+                 (hook_rect.centerx, hook_rect.bottom),
+                 casting_manager.time_since_cast())
+
+    def flush(self, casts=None):
+        """
+        Queue the buffered events to be appended to the column files and
+        meta.json to be rewritten, on the writer thread.
+
+        Does nothing until the first event, so an empty session leaves
+        no directory behind.
+
+        Args:
+            casts (int): Number of casts so far, stored in meta.json.
+        """
+        if casts is not None:
+            self._casts = casts
+        if not self.enabled or self.event_count == 0:
+            return
+
+        columns = self._buffer
+        self._buffer = {name: [] for name in COLUMNS}
+        meta = {
+            "mode": self.mode,
+            "start_time": self.start_time,
+            "duration": time.perf_counter() - self._start,
+            "casts": self._casts,
+            "events": self.event_count,
+            "species": sorted(self._species, key=self._species.get),
+            "columns": COLUMNS,
+        }
+        self._pending = _submit(lambda: self._write(columns, meta))
+
+    def _write(self, columns, meta):
+        """
+        Writer thread: append a batch and rewrite meta.json.
+
+        Args:
+            columns (dict): Column name -> list of values, maybe empty.
+            meta (dict): Contents of meta.json.
+        """
+        try:
+            if self.path is None:
+                self.path = new_session_dir(self.mode, self.directory)
+
+            if columns["t"]:
+                for name, dtype in COLUMNS.items():
+                    column = np.asarray(columns[name], dtype=dtype)
+                    with open(os.path.join(self.path, name + ".bin"),
+                              "ab") as f:
+                        f.write(column.tobytes())
+
+            with open(os.path.join(self.path, META_FILE), "w") as f:
+                json.dump(meta, f, indent=2)
+        except OSError as e:
+            log.error("Error writing catch log: %s", e,
+                      extra=fields(mode=self.mode, error=str(e)))
+
+    def wait(self, timeout=None):
+        """
+        Wait until the queued batches have been written.
+
+        Args:
+            timeout (float): Maximum seconds to wait, or None for no limit.
+        """
+        if self._pending is not None:
+            from concurrent.futures import wait
+            wait([self._pending], timeout)
+
+    def close(self, casts=None):
+        """
+        Queue the remaining events and finish the session; returns
+        without waiting for the files.
+
+        Args:
+            casts (int): Number of casts during the session.
+        """
+        if self._closed:
+            return
+        self.flush(casts)
+        self._closed = True
@@ -43,3 +43,15 @@ START_FISHES = 5  # Number of fish spawned at game start
 BOAT_SPEED = 8  # Horizontal movement speed of the boat (pixels per frame)
 ROD_MAX_LENGTH = 500  # Maximum depth the fishing line can extend (pixels)
 ROD_SPEED = 6  # Speed of casting/reeling the fishing line (pixels per frame)
+
+# SCREAM DETECTION
+
+# If True, classic mode classifies screams spectrally in a worker process
+# (mechanics/scream_detector.py) instead of using the raw peak threshold
+SPECTRAL_SCREAM_DETECTION = False
+
+# CATCH LOGGING
+
+# If True, every session's catches are logged to catch_logs/ for
+# offline analysis (python -m mechanics.catch_analysis)
+CATCH_LOGGING = True
@@ -0,0 +1,326 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Flight Recorder for Fish-O-Mania.
+
+Keeps the last FLIGHT_SECONDS seconds of per-frame data in a ring buffer
+of fixed size, so memory stays constant however long a kiosk runs. Each
+frame records:
+    - the frame time
+    - the inputs handled that frame (keys, screams)
+    - fish counts (all, danger, rare, large)
+    - the rod state from CastingRod (length, casting, hooked fish, casts)
+    - the boat position and score
+    - the mode's state flags (paused, game_over, angler_pause_active,
+      showing_release_message, ...)
+
+The buffer is written to flight_recordings/ as JSON:
+    - on an unhandled exception, with the traceback
+    - on a severe hitch (a frame longer than SEVERE_HITCH_MS)
+    - when the player presses F9
+
+During play the frames are copied on the game thread and the file is
+written on a background thread, so a dump doesn't make a hitch of its
+own; only the exception dump, with the game about to exit, is written
+before returning.
+
+Usage in a game loop:
+    flight = start_flight("classic")
+    while running:
+        for event in driver.get_events():
+            if event.type == pygame.KEYDOWN:
+                flight.key_down(event.key)
+        ...update and draw...
+        frame_ms = driver.tick()
+        flight.frame(frame_ms, fish_manager, casting_manager, boat_x,
+                     score, paused=paused, game_over=game_over)
+    end_flight()
+
+Functions:
+    start_flight: Start recording a mode's session.
+    end_flight: Stop recording (the buffer is kept for a crash dump).
+    dump_flight: Write the buffer now.
+    install_excepthook: Dump the buffer on unhandled exceptions.
+
+Classes:
+    FlightRecorder: Ring buffer of frames and the dump file writer.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+import pygame
+
+from mechanics.constants import FPS
+from mechanics.game_log import fields, get_logger
+
+FLIGHT_DIR = "flight_recordings"
+FLIGHT_SECONDS = 10  # Seconds of frames kept
+SEVERE_HITCH_MS = 250  # Frames slower than this are dumped
+MIN_DUMP_INTERVAL = 30.0  # Seconds between automatic hitch dumps
+MAX_HITCH_DUMPS = 3  # Hitch dumps per session
+MAX_INPUTS = 8  # Inputs kept per frame
+
+# Names of the per-frame values, in the order they are stored
+FIELDS = ("t", "frame_ms", "inputs", "fish", "danger", "rare", "large",
+          "rod_length", "casting", "hooked", "casts", "boat_x", "score",
+          "flags")
+
+log = get_logger("flight_recorder")
+
+
+class FlightRecorder:
+    """
+    The last few seconds of frames, written to disk when something
+    goes wrong.
+
+    Attributes:
+        name (str): Current session name (the mode).
+        directory (str): Where dumps are written.
+        hitch_ms (float): Frames longer than this trigger a dump.
+        frames (int): Frames recorded this session.
+        dumps (list): Paths written this session.
+    """
+
+    def __init__(self, seconds=FLIGHT_SECONDS, fps=FPS,
+                 directory=FLIGHT_DIR, hitch_ms=SEVERE_HITCH_MS):
+        """
+        Initialize an empty recorder.
+
+        Args:
+            seconds (float): Seconds of frames kept.
+            fps (int): Frame rate, to size the ring buffer.
+            directory (str): Where dumps are written.
+            hitch_ms (float): Frames longer than this trigger a dump.
+        """
+        self.directory = directory
+        self.hitch_ms = hitch_ms
+        self._ring = deque(maxlen=int(seconds * fps))
+        self._writers = []
+        self.begin_session("")
+
+    def begin_session(self, name):
+        """
+        Forget the previous session's frames.
+
+        Args:
+            name (str): Session name used for the dump files.
+        """
+        self.name = name
+        self.frames = 0
+        self.dumps = []
+        self._ring.clear()
+        self._inputs = []
+        self._start = time.perf_counter()
+        self._last_dump = -MIN_DUMP_INTERVAL
+        self._hitch_dumps = 0
+        self._dump_count = 0
+
+    def input(self, kind):
+        """
+        Note an input handled this frame.
+
+        Args:
+            kind (str): Input name, e.g. "space" or "scream".
+        """
+        if len(self._inputs) < MAX_INPUTS:
+            self._inputs.append(kind)
+
+    def key_down(self, key):
+        """
+        Note a KEYDOWN handled this frame.
+
+        Args:
+            key (int): pygame key constant.
+        """
+        self.input(pygame.key.name(key))
+
+    def frame(self, frame_ms, fish_manager, rod, boat_x, score, **flags):
+        """
+        Record a frame. Call once per frame after clock.tick().
+
+        A frame slower than hitch_ms writes a dump in the background, at
+        most MAX_HITCH_DUMPS times per session and once per
+        MIN_DUMP_INTERVAL. The first frame of a session (loading) is
+        never a hitch.
+
+        Args:
+            frame_ms (int): Frame time from clock.tick().
+            fish_manager (FishManager): Fish on screen.
+            rod (CastingRod): The fishing rod.
+            boat_x (int): Boat position.
+            score (int): Current score.
+            **flags: The mode's state flags, e.g. paused=True.
+        """
+        now = time.perf_counter()
+        hooked = rod.attached_fish
+        self._ring.append((
+            now - self._start, frame_ms, self._inputs,
+            len(fish_manager.all_fish), len(fish_manager.danger_fish),
+            len(fish_manager.rare_fish), len(fish_manager.large_fish),
+            rod.rod_length, rod.is_casting,
+            getattr(hooked, "fish_type", None) if hooked else None,
+            rod.cast_count, boat_x, score, flags))
+        self._inputs = []
+        self.frames += 1
+
+        if (frame_ms > self.hitch_ms and self.frames > 1
+                and self._hitch_dumps < MAX_HITCH_DUMPS
+                and now - self._last_dump >= MIN_DUMP_INTERVAL):
+            self._hitch_dumps += 1
+            self.dump("hitch", {"frame_ms": frame_ms}, background=True)
+
+    def records(self):
+        """
+        Get the buffered frames, oldest first.
+
+        Returns:
+            list: One dict per frame with the FIELDS keys.
+        """
+        return [dict(zip(FIELDS, record)) for record in list(self._ring)]
+
+    def dump(self, reason, details=None, background=False):
+        """
+        Write the buffered frames to the dump directory.
+
+        The frames are copied right away; with background=True the file
+        is written on a background thread (see wait()).
+
+        Args:
+            reason (str): "exception", "hitch" or "hotkey".
+            details (dict): Extra information, e.g. the traceback.
+            background (bool): Write the file on a background thread.
+
+        Returns:
+            str: Path written, or None if it couldn't be written. In the
+                background, the path being written.
+        """
+        self._last_dump = time.perf_counter()
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(
+            self.directory,
+            f"{self.name or 'session'}-{stamp}-{reason}-{self._dump_count}"
+            f".json")
+        self._dump_count += 1
+        report = {
+            "name": self.name,
+            "reason": reason,
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "frames": self.frames,
+            "details": details or {},
+            "records": list(self._ring),
+        }
+        if not background:
+            return self._write(path, report)
+
+        self._writers = [t for t in self._writers if t.is_alive()]
+        thread = threading.Thread(target=self._write, args=(path, report),
+                                  name="flight-dump", daemon=True)
+        self._writers.append(thread)
+        thread.start()
+        return path
+
+    def _write(self, path, report):
+        """
+        Write a dump file.
+
+        Args:
+            path (str): File to write.
+            report (dict): The dump, with the ring buffer's records.
+
+        Returns:
+            str: Path written, or None if it couldn't be written.
+        """
+        report["records"] = [dict(zip(FIELDS, record))
+                             for record in report["records"]]
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(report, f, default=str)
+        except OSError as e:
+            log.error("Error writing flight recording: %s", e,
+                      extra=fields(error=str(e)))
+            return None
+        self.dumps.append(path)
+        log.info("Flight recording (%s) written to %s", report["reason"],
+                 path, extra=fields(reason=report["reason"], path=path))
+        return path
+
+    def wait(self, timeout=None):
+        """
+        Wait for dumps being written in the background.
+
+        Args:
+            timeout (float): Maximum seconds to wait per dump, or None.
+        """
+        for thread in self._writers:
+            thread.join(timeout)
+        self._writers = [t for t in self._writers if t.is_alive()]
+
+
+# Shared recorder used by the module-level functions
+_recorder = FlightRecorder()
+_previous_excepthook = None
+
+
+def _excepthook(exc_type, exc, tb):
+    """sys.excepthook: dump the buffer, then report as usual."""
+    _recorder.wait()
+    if _recorder.frames:
+        _recorder.dump("exception", {
+            "exception": "".join(
+                traceback.format_exception(exc_type, exc, tb))})
+    _previous_excepthook(exc_type, exc, tb)
+
+
+def install_excepthook():
+    """Dump the buffer on unhandled exceptions (safe to call twice)."""
+    global _previous_excepthook
+    if _previous_excepthook is None:
+        _previous_excepthook = sys.excepthook
+        sys.excepthook = _excepthook
+
+
+def start_flight(mode):
+    """
+    Start recording a mode's session.
+
+    Args:
+        mode (str): Mode name, used for the dump files.
+
+    Returns:
+        FlightRecorder: The shared recorder.
+    """
+    install_excepthook()
+    _recorder.begin_session(mode)
+    return _recorder
+
+
+def end_flight():
+    """
+    Stop recording a session.
+
+    The frames are kept until the next session, so a crash back in the
+    menu still has the last moments of play. Dumps still being written
+    are finished first.
+    """
+    _recorder._inputs = []
+    _recorder.wait()
+
+
+def dump_flight(reason="hotkey"):
+    """
+    Write the buffer now.
+
+    Args:
+        reason (str): Why the buffer was written.
+
+    Returns:
+        str: Path written, or None.
+    """
+    return _recorder.dump(reason)
@@ -0,0 +1,40 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Game Clock for Fish-O-Mania.
+
+Game time in milliseconds, read by everything that times play: the time
+attack countdown, endless mode's time played, the scream window, catch
+cooldowns and the danger fish release cooldown. It only moves when the
+session ticks, by the length of the frame, so game time is the sum of
+the frame times. A replayed session therefore sees exactly the times the
+recorded one did, however fast it is played back (see mechanics/replay).
+
+Functions:
+    get_ticks: Game time in milliseconds.
+    advance: Move game time on by one frame.
+"""
+
+# Milliseconds of play so far; only advance() moves it
+_ticks = 0
+
+
+def get_ticks():
+    """
+    Get the game time.
+
+    Returns:
+        int: Milliseconds, like pygame.time.get_ticks().
+    """
+    return _ticks
+
+
+def advance(ms):
+    """
+    Move game time on by one frame.
+
+    Args:
+        ms (int): Length of the frame in milliseconds.
+    """
+    global _ticks
+    _ticks += ms
@@ -0,0 +1,96 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Game Driver for Fish-O-Mania.
+
+The mode loops get their input (events, held keys, microphone) and their
+frame pacing from a driver instead of calling pygame directly, so the
+same loop can be driven by a player or by a script (see bench/scene.py).
+
+Classes:
+    GameDriver: Live driver: real pygame input, microphone and FPS limit.
+"""
+
+import pygame
+
+from mechanics.constants import FPS
+from mechanics.game_log import fields, get_logger
+from mechanics.keyboard_recorder import KeyboardRecorder
+
+log = get_logger("game_driver")
+
+
+class GameDriver:
+    """
+    Live input and frame pacing for a mode loop.
+
+    Attributes:
+        clock (pygame.time.Clock): Clock used to limit the frame rate.
+        fps (int): Target frames per second.
+    """
+
+    def __init__(self, clock=None, fps=FPS):
+        """
+        Initialize the driver.
+
+        Args:
+            clock (pygame.time.Clock): Clock to tick, or None for a new one.
+            fps (int): Target frames per second.
+        """
+        self.clock = clock if clock is not None else pygame.time.Clock()
+        self.fps = fps
+
+    def get_events(self):
+        """
+        Get the events for this frame.
+
+        Returns:
+            list: pygame events.
+        """
+        return pygame.event.get()
+
+    def get_pressed(self):
+        """
+        Get the keys held down this frame.
+
+        Returns:
+            Sequence indexed by pygame key constants.
+        """
+        return pygame.key.get_pressed()
+
+    def create_recorder(self):
+        """
+        Create the microphone recorder (classic mode).
+
+        PyAudio is only imported here. Without it, or when no microphone
+        can be opened, classic mode is played with the keyboard instead.
+
+        Returns:
+            RECORDER: The recording microphone recorder, or a recording
+                KeyboardRecorder reading this driver's held keys.
+        """
+        recorder = None
+        try:
+            from mechanics.Recorder import RECORDER
+            recorder = RECORDER()
+            # Opens the stream, so a missing microphone fails here
+            recorder.start_recording()
+            return recorder
+        except (ImportError, OSError) as error:
+            if recorder is not None:
+                recorder.close()
+            keyboard = KeyboardRecorder(get_pressed=self.get_pressed)
+            log.warning("No microphone (%s); hold %s to scream",
+                        error, keyboard.key_name,
+                        extra=fields(error=str(error)))
+            keyboard.start_recording()
+            return keyboard
+
+    def tick(self):
+        """
+        End the frame, waiting to keep the target frame rate.
+
+        Returns:
+            int: Milliseconds since the previous tick.
+        """
+        return self.clock.tick(self.fps)
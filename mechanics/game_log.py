@@ -0,0 +1,190 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Game Logging for Fish-O-Mania.
+
+Leveled, structured logging for gameplay messages (catches, lives,
+asset loading errors) built on the standard logging module.
+
+Calls on the game thread only put the record on an in-memory queue; a
+background thread (logging.handlers.QueueListener) formats it and writes
+it to stdout, so a slow stdout (e.g. a journald pipe on a kiosk) can't
+block a frame. Message arguments are formatted on the background thread
+too, so pass them as arguments rather than as an f-string:
+    log.info("Caught %s (+%d points)", fish_type, value,
+             extra=fields(type=fish_type, value=value))
+
+A call below the current level returns after one cached level check.
+
+Environment variables:
+    FISH_LOG_LEVEL: DEBUG, INFO (default), WARNING or ERROR.
+    FISH_LOG_FORMAT: "text" (default) or "json" for one JSON object per
+        line with the structured fields as keys.
+
+Functions:
+    get_logger: Get a game logger.
+    fields: Structured fields for the extra= argument.
+    start_logging: Set up the queue and the background writer.
+    stop_logging: Write the queued records and stop the writer.
+    set_level: Change the level.
+
+Classes:
+    TextFormatter: "LEVEL name: message key=value" lines.
+    JsonFormatter: One JSON object per line.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_LEVEL_ENV = "FISH_LOG_LEVEL"
+LOG_FORMAT_ENV = "FISH_LOG_FORMAT"
+ROOT_LOGGER = "fish"
+
+
+class TextFormatter(logging.Formatter):
+    """Formats records as "LEVEL name: message key=value ..."."""
+
+    def format(self, record):
+        """
+        Format a record.
+
+        Args:
+            record (logging.LogRecord): The record.
+
+        Returns:
+            str: One line of text (more with a traceback).
+        """
+        text = f"{record.levelname} {record.name}: {record.getMessage()}"
+        record_fields = getattr(record, "fields", None)
+        if record_fields:
+            text += " " + " ".join(f"{key}={value}"
+                                   for key, value in record_fields.items())
+        if record.exc_info:
+            text += "\n" + self.formatException(record.exc_info)
+        return text
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line."""
+
+    def format(self, record):
+        """
+        Format a record.
+
+        Args:
+            record (logging.LogRecord): The record.
+
+        Returns:
+            str: A JSON object with time, level, logger, message and the
+                structured fields.
+        """
+        data = {
+            "time": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        data.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queues records as they are; formatting is left to the listener."""
+
+    def prepare(self, record):
+        return record
+
+
+def get_logger(name):
+    """
+    Get a game logger.
+
+    Args:
+        name (str): Logger name under "fish", e.g. "fish_manager".
+
+    Returns:
+        logging.Logger: The logger.
+    """
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def fields(**values):
+    """
+    Structured fields for a log call.
+
+    Args:
+        **values: Field names and values.
+
+    Returns:
+        dict: Value for the extra= argument of a log call.
+    """
+    return {"fields": values}
+
+
+# Background writer, None while stopped
+_listener = None
+
+
+def start_logging(level=None, fmt=None, stream=None):
+    """
+    Route game logs through an in-memory queue to a background writer.
+
+    Args:
+        level (str): Level name, defaults to FISH_LOG_LEVEL or INFO.
+        fmt (str): "text" or "json", defaults to FISH_LOG_FORMAT or text.
+        stream (file): Where records are written, defaults to stdout.
+    """
+    global _listener
+    stop_logging()
+
+    level = level or os.environ.get(LOG_LEVEL_ENV) or "INFO"
+    fmt = fmt or os.environ.get(LOG_FORMAT_ENV) or "text"
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter() if fmt == "json"
+                        else TextFormatter())
+    records = queue.SimpleQueue()
+
+    logger = logging.getLogger(ROOT_LOGGER)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(_DeferredQueueHandler(records))
+    logger.propagate = False
+    set_level(level)
+
+    _listener = QueueListener(records, output)
+    _listener.start()
+
+
+def stop_logging():
+    """Write every queued record and stop the background writer."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def set_level(level):
+    """
+    Change the level of every game logger.
+
+    Args:
+        level (str): Level name, e.g. "DEBUG" or "WARNING".
+    """
+    logger = logging.getLogger(ROOT_LOGGER)
+    try:
+        logger.setLevel(level.upper())
+    except ValueError as e:
+        print(f"Unknown log level: {e}", file=sys.stderr)
+        logger.setLevel(logging.INFO)
+
+
+start_logging()
+atexit.register(stop_logging)
@@ -0,0 +1,232 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Garbage Collection Policy for Fish-O-Mania.
+
+Every frame creates short-lived garbage (overlay and text surfaces,
+ripple surfaces, wave point lists, catch dicts, list comprehensions),
+which keeps the cyclic garbage collector busy. Young-generation
+collections are short, but a full (generation 2) collection walks every
+tracked object and shows up as a 10-30 ms hitch in the middle of play.
+
+This module:
+    - freezes the long-lived objects after assets are loaded
+      (gc.freeze()), so later collections don't walk them
+    - defers full collections during gameplay and runs them at natural
+      pauses instead: the pause screen, game over, the endless summary
+      and menu transitions
+    - still allows a full collection after MAX_DEFERRED_FRAMES frames
+      without a pause, so a long endless session can't grow unbounded
+    - times every collection and reports it to the mode's frame pacing
+      stats (and to the trace, when tracing is on)
+
+Functions:
+    install: Start timing collections.
+    freeze: Collect, then freeze the surviving objects.
+    begin_gameplay: Defer full collections while a mode is played.
+    frame: Count a gameplay frame.
+    natural_pause: Run the deferred full collection now.
+    end_gameplay: Restore the normal collection thresholds and unfreeze.
+    get_gc_stats: Collection counts and times so far.
+
+Classes:
+    GCPolicy: Collection timing and scheduling.
+"""
+
+import gc
+import time
+
+from mechanics.metrics import GC_PAUSE_SECONDS
+from mechanics.tracing import complete
+
+# Generation 2 threshold during gameplay; large enough that full
+# collections only run at natural pauses
+DEFERRED_THRESHOLD = 1000000
+MAX_DEFERRED_FRAMES = 60 * 120  # Two minutes at 60 FPS
+MIN_PAUSE_INTERVAL = 1.0  # Seconds between collections at natural pauses
+
+
+class GCPolicy:
+    """
+    Times collections and defers full ones during gameplay.
+
+    Attributes:
+        pacing (FramePacing): Frame stats receiving the collection pauses,
+            or None.
+        collections (list): Collections per generation.
+        total_ms (list): Milliseconds spent per generation.
+        max_ms (list): Longest collection per generation in ms.
+        deferred (bool): Whether full collections are being deferred.
+        forced (int): Full collections run because a session went
+            MAX_DEFERRED_FRAMES frames without a pause.
+    """
+
+    def __init__(self):
+        """Initialize with nothing recorded."""
+        self.pacing = None
+        self.collections = [0, 0, 0]
+        self.total_ms = [0.0, 0.0, 0.0]
+        self.max_ms = [0.0, 0.0, 0.0]
+        self.deferred = False
+        self.forced = 0
+        self._installed = False
+        self._start = None
+        self._thresholds = gc.get_threshold()
+        self._frames = 0
+        self._last_pause = 0.0
+
+    def install(self):
+        """Start timing collections (safe to call more than once)."""
+        if not self._installed:
+            gc.callbacks.append(self._callback)
+            self._installed = True
+
+    def _callback(self, phase, info):
+        """gc.callbacks hook: time each collection."""
+        if phase == "start":
+            self._start = time.perf_counter()
+            return
+        if self._start is None:
+            return
+
+        end = time.perf_counter()
+        generation = info["generation"]
+        elapsed_ms = (end - self._start) * 1000
+        self.collections[generation] += 1
+        self.total_ms[generation] += elapsed_ms
+        if elapsed_ms > self.max_ms[generation]:
+            self.max_ms[generation] = elapsed_ms
+        GC_PAUSE_SECONDS.observe(end - self._start, (str(generation),))
+        if self.pacing is not None:
+            self.pacing.record_gc(generation, elapsed_ms)
+        complete(f"gc gen{generation}", self._start, end, "gc",
+                 {"collected": info["collected"]})
+        self._start = None
+
+    def freeze(self):
+        """
+        Collect, then move every surviving object to the permanent
+        generation so later collections skip it. Call after loading.
+        """
+        gc.collect()
+        gc.freeze()
+
+    def begin_gameplay(self, pacing=None):
+        """
+        Defer full collections while a mode is played.
+
+        Args:
+            pacing (FramePacing): Frame stats receiving collection pauses.
+        """
+        self.install()
+        self.pacing = pacing
+        if not self.deferred:
+            self._thresholds = gc.get_threshold()
+            threshold0, threshold1, _ = self._thresholds
+            gc.set_threshold(threshold0, threshold1, DEFERRED_THRESHOLD)
+            self.deferred = True
+        self._frames = 0
+
+    def frame(self):
+        """
+        Count a gameplay frame; runs the full collection if there has
+        been no natural pause for MAX_DEFERRED_FRAMES frames.
+        """
+        self._frames += 1
+        if self.deferred and self._frames >= MAX_DEFERRED_FRAMES:
+            self.forced += 1
+            self._collect()
+
+    def natural_pause(self):
+        """
+        Run the deferred full collection now (pause screen, game over,
+        menu transition), unless one ran very recently.
+        """
+        if time.perf_counter() - self._last_pause >= MIN_PAUSE_INTERVAL:
+            self._collect()
+
+    def _collect(self):
+        """Run a full collection and restart the deferral count."""
+        gc.collect()
+        self._frames = 0
+        self._last_pause = time.perf_counter()
+
+    def end_gameplay(self):
+        """
+        Restore the normal thresholds and stop reporting to pacing.
+
+        Unfreezes the frozen objects, so whatever the finished session
+        left in reference cycles can be collected; the menu freezes what
+        is left again when it resumes.
+        """
+        gc.unfreeze()
+        if self.deferred:
+            gc.set_threshold(*self._thresholds)
+            self.deferred = False
+        self.pacing = None
+
+    def stats(self):
+        """
+        Get collection counts and times.
+
+        Returns:
+            dict: "collections", "total_ms" and "max_ms" (per generation),
+                "forced" and "frozen" (objects in the permanent
+                generation).
+        """
+        return {
+            "collections": list(self.collections),
+            "total_ms": list(self.total_ms),
+            "max_ms": list(self.max_ms),
+            "forced": self.forced,
+            "frozen": gc.get_freeze_count(),
+        }
+
+
+# Shared policy used by the module-level functions
+_policy = GCPolicy()
+
+
+def install():
+    """Start timing collections."""
+    _policy.install()
+
+
+def freeze():
+    """Collect, then freeze the surviving objects. Call after loading."""
+    _policy.freeze()
+
+
+def begin_gameplay(pacing=None):
+    """
+    Defer full collections while a mode is played.
+
+    Args:
+        pacing (FramePacing): Frame stats receiving collection pauses.
+    """
+    _policy.begin_gameplay(pacing)
+
+
+def frame():
+    """Count a gameplay frame."""
+    _policy.frame()
+
+
+def natural_pause():
+    """Run the deferred full collection now."""
+    _policy.natural_pause()
+
+
+def end_gameplay():
+    """Restore the normal collection thresholds."""
+    _policy.end_gameplay()
+
+
+def get_gc_stats():
+    """
+    Get collection counts and times so far.
+
+    Returns:
+        dict: See GCPolicy.stats.
+    """
+    return _policy.stats()
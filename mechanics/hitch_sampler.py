@@ -0,0 +1,345 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Hitch Sampler for Fish-O-Mania.
+
+A low-overhead sampling profiler for the rare slow frames. A background
+thread records the main thread's stack (sys._current_frames()) every few
+milliseconds into a ring buffer. When a frame's work (from the end of one
+clock.tick() to the start of the next) goes over the frame budget, the
+samples taken during it are kept as a hitch. The time spent sleeping in
+tick() isn't counted: tick() oversleeping by a millisecond or two is the
+OS scheduler, not the game, and would otherwise flag most frames. At
+the end of the session the hitches are written to hitch_reports/:
+    <mode>-<time>.folded: collapsed stacks of all hitches, one
+        "frame;frame;frame count" line per stack, ready for
+        flamegraph.pl, speedscope or inferno
+    <mode>-<time>.json: every hitch with its frame number, duration and
+        its own collapsed stacks
+
+Unlike cProfile, the game code runs at full speed: the only cost is the
+sampler thread taking the GIL for a few microseconds per sample. A
+sample can only be taken when the main thread releases the GIL, so a
+long call that holds it shows up as one stack repeated afterwards.
+
+The sampler is off by default. Turn it on with the FISH_HITCH_SAMPLER
+environment variable (set to 1, or to the report directory) or with
+"python main_menu.py --hitch-sampler [DIR]".
+
+Functions:
+    start_sampler: Start the sampler thread.
+    is_sampling: Whether the sampler is running.
+    begin_session: Start collecting hitches for a mode.
+    begin_frame: Mark the start of a frame's work.
+    end_frame: Mark the end of a frame's work; keeps its samples if slow.
+    end_session: Write the session's hitch report.
+    stop_sampler: Stop the sampler thread.
+
+Classes:
+    HitchSampler: Sampler thread, ring buffer and hitch collection.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+from mechanics.constants import FPS
+from mechanics.game_log import fields, get_logger
+
+# Environment variable that turns the sampler on
+SAMPLER_ENV = "FISH_HITCH_SAMPLER"
+HITCH_REPORT_DIR = "hitch_reports"
+
+SAMPLE_INTERVAL = 0.002  # Seconds between stack samples
+RING_SIZE = 2000  # Samples kept (4 seconds at the default interval)
+MAX_HITCHES = 200  # Hitches kept per session
+MAX_DEPTH = 64  # Stack frames recorded per sample
+
+# Frames whose work takes longer than this are hitches: they can't make
+# the frame budget whatever tick() does
+HITCH_MS = 1000 / FPS + 1
+
+log = get_logger("hitch_sampler")
+
+
+class HitchSampler:
+    """
+    Samples the main thread's stack and keeps the samples of slow frames.
+
+    Attributes:
+        interval (float): Seconds between samples.
+        threshold_ms (float): Frames whose work takes longer than this
+            are hitches.
+        directory (str): Where session reports are written.
+        name (str): Current session name (the mode).
+        frames (int): Frames seen this session.
+        hitches (list): This session's hitches, each a dict with "frame",
+            "duration_ms", "samples" and "stacks" (collapsed stack ->
+            sample count).
+        dropped (int): Hitches not kept because of MAX_HITCHES.
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL, threshold_ms=HITCH_MS,
+                 directory=HITCH_REPORT_DIR, ring_size=RING_SIZE,
+                 thread_id=None):
+        """
+        Initialize the sampler (not started).
+
+        Args:
+            interval (float): Seconds between samples.
+            threshold_ms (float): Frames whose work takes longer than
+                this are hitches.
+            directory (str): Where session reports are written.
+            ring_size (int): Samples kept in the ring buffer.
+            thread_id (int): Thread to sample, defaults to the main thread.
+        """
+        self.interval = interval
+        self.threshold_ms = threshold_ms
+        self.directory = directory
+        self.thread_id = (thread_id if thread_id is not None
+                          else threading.main_thread().ident)
+        self._ring = deque(maxlen=ring_size)
+        self._labels = {}
+        self._thread = None
+        self._stop = threading.Event()
+        self.begin_session("")
+
+    def start(self):
+        """Start the sampler thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run,
+                                        name="hitch-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the sampler thread."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _label(self, code):
+        """Get the "file:function" label of a code object."""
+        label = self._labels.get(code)
+        if label is None:
+            label = (f"{os.path.basename(code.co_filename)}:"
+                     f"{code.co_name}")
+            self._labels[code] = label
+        return label
+
+    def collapse(self, frame):
+        """
+        Collapse a stack into "outer;...;inner" form.
+
+        Args:
+            frame (frame): Innermost frame.
+
+        Returns:
+            str: Frame labels from the outermost call inwards.
+        """
+        labels = []
+        while frame is not None and len(labels) < MAX_DEPTH:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        labels.reverse()
+        return ";".join(labels)
+
+    def sample(self):
+        """Record the sampled thread's stack once."""
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is not None:
+            self._ring.append((time.perf_counter(), self.collapse(frame)))
+
+    def _run(self):
+        """Sampler thread: sample until stopped."""
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def begin_session(self, name):
+        """
+        Start collecting hitches for a session.
+
+        Args:
+            name (str): Session name used for the report files.
+        """
+        self.name = name
+        self.frames = 0
+        self.hitches = []
+        self.dropped = 0
+        self._frame_start = None
+
+    def begin_frame(self):
+        """Mark the start of a frame's work (after clock.tick())."""
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """
+        Mark the end of a frame's work (before clock.tick()).
+
+        If the work since begin_frame() took longer than threshold_ms,
+        the samples taken during it are kept as a hitch.
+
+        Returns:
+            dict: The hitch, or None if the frame was on time or no
+                frame was begun.
+        """
+        now = time.perf_counter()
+        start = self._frame_start
+        self._frame_start = None
+        if start is None:
+            return None
+        self.frames += 1
+
+        duration_ms = (now - start) * 1000
+        if duration_ms <= self.threshold_ms:
+            return None
+        if len(self.hitches) >= MAX_HITCHES:
+            self.dropped += 1
+            return None
+
+        stacks = Counter(stack for t, stack in list(self._ring)
+                         if start <= t <= now)
+        hitch = {
+            "frame": self.frames,
+            "duration_ms": duration_ms,
+            "samples": sum(stacks.values()),
+            "stacks": dict(stacks),
+        }
+        self.hitches.append(hitch)
+        return hitch
+
+    def folded(self):
+        """
+        Collapsed stacks of all hitches, for flame graph tools.
+
+        Returns:
+            list: "stack count" lines, most samples first.
+        """
+        total = Counter()
+        for hitch in self.hitches:
+            total.update(hitch["stacks"])
+        return [f"{stack} {count}" for stack, count in total.most_common()]
+
+    def write(self):
+        """
+        Write the session's hitches to the report directory.
+
+        Returns:
+            str: Path of the .folded file, or None if there were no
+                hitches or the files couldn't be written.
+        """
+        if not self.hitches:
+            return None
+        base = os.path.join(
+            self.directory,
+            f"{self.name or 'session'}-{time.strftime('%Y%m%d-%H%M%S')}")
+        report = {
+            "name": self.name,
+            "threshold_ms": self.threshold_ms,
+            "interval_ms": self.interval * 1000,
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "hitches": self.hitches,
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(base + ".folded", "w") as f:
+                f.write("\n".join(self.folded()) + "\n")
+            with open(base + ".json", "w") as f:
+                json.dump(report, f, indent=2)
+        except OSError as e:
+            log.error("Error writing hitch report: %s", e,
+                      extra=fields(error=str(e)))
+            return None
+        return base + ".folded"
+
+
+# Shared sampler used by the module-level functions, None while off
+_sampler = None
+
+
+def start_sampler(directory=None, interval=SAMPLE_INTERVAL):
+    """
+    Start the sampler thread.
+
+    Args:
+        directory (str): Report directory, defaults to hitch_reports.
+        interval (float): Seconds between samples.
+    """
+    global _sampler
+    if _sampler is None:
+        _sampler = HitchSampler(interval,
+                                directory=directory or HITCH_REPORT_DIR)
+    _sampler.start()
+
+
+def is_sampling():
+    """
+    Check whether the sampler is running.
+
+    Returns:
+        bool: True if hitches are being collected.
+    """
+    return _sampler is not None
+
+
+def begin_session(mode):
+    """
+    Start collecting hitches for a mode's session.
+
+    Args:
+        mode (str): Mode name, used for the report files.
+    """
+    if _sampler is not None:
+        _sampler.begin_session(mode)
+
+
+def begin_frame():
+    """Mark the start of a frame's work; returns at once while off."""
+    if _sampler is not None:
+        _sampler.begin_frame()
+
+
+def end_frame():
+    """Mark the end of a frame's work; returns at once while off."""
+    if _sampler is not None:
+        _sampler.end_frame()
+
+
+def end_session():
+    """
+    Write the session's hitch report.
+
+    Returns:
+        str: Path of the .folded file, or None.
+    """
+    if _sampler is None:
+        return None
+    path = _sampler.write()
+    if path is not None:
+        log.info("Hitch report: %d slow frames of %d written to %s",
+                 len(_sampler.hitches), _sampler.frames, path,
+                 extra=fields(hitches=len(_sampler.hitches),
+                              frames=_sampler.frames, path=path))
+    _sampler.begin_session("")
+    return path
+
+
+def stop_sampler():
+    """Stop the sampler thread."""
+    global _sampler
+    if _sampler is not None:
+        _sampler.stop()
+        _sampler = None
+
+
+# Turn the sampler on from the environment for any entry point
+_env_dir = os.environ.get(SAMPLER_ENV)
+if _env_dir:
+    start_sampler(None if _env_dir == "1" else _env_dir)
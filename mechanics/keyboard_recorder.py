@@ -0,0 +1,155 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Keyboard Recorder for Fish-O-Mania.
+
+Classic mode is controlled by screaming into the microphone. When PyAudio
+isn't installed or no microphone can be opened, the game driver hands
+the mode this recorder instead: holding the scream key (S) produces loud
+blocks and releasing it produces silence, so the hook and the danger fish
+escape work from the keyboard and the mode loop doesn't change.
+
+Only the standard library and pygame are used, so falling back costs
+no numpy or PyAudio import.
+
+Classes:
+    KeyboardRecorder: RECORDER stand-in driven by a held key.
+"""
+
+import time
+from array import array
+
+import pygame
+
+# Key held to "scream"
+SCREAM_KEY = pygame.K_s
+
+# Peak amplitude of a block while the key is held (int16 samples)
+SCREAM_AMPLITUDE = 20000
+
+
+class KeyboardRecorder:
+    """
+    Microphone stand-in for classic mode.
+
+    Implements the parts of the RECORDER interface the mode loop uses.
+    Each read returns a block of loud samples while the scream key is
+    held and a silent block otherwise.
+
+    Attributes:
+        rate (int): Sample rate in Hz.
+        frames_per_buffer (int): Samples per block.
+        frames (list): Blocks read since the last reset.
+        last_frame (bytes): Most recent block.
+        last_read_time (float): perf_counter() after the last read.
+        key (int): pygame key constant held to scream.
+        key_name (str): Name of the key for on-screen hints.
+    """
+
+    def __init__(self, rate=44100, frames_per_buffer=735, key=SCREAM_KEY,
+                 get_pressed=None):
+        """
+        Initialize the recorder.
+
+        Args:
+            rate (int): Sample rate in Hz.
+            frames_per_buffer (int): Samples per block.
+            key (int): pygame key constant held to scream.
+            get_pressed (callable): Returns the held keys, defaults to
+                pygame.key.get_pressed (GameDriver passes its own).
+        """
+        self.get_pressed = (get_pressed if get_pressed is not None
+                            else pygame.key.get_pressed)
+        self.rate = rate
+        self.frames_per_buffer = frames_per_buffer
+        self.key = key
+        self.key_name = pygame.key.name(key).upper()
+        self.frames = []
+        self.last_frame = None
+        self.last_read_time = None
+        self._active = False
+
+        self._quiet = bytes(2 * frames_per_buffer)
+        self._scream = array("h", [SCREAM_AMPLITUDE]
+                             * frames_per_buffer).tobytes()
+
+    def start_recording(self):
+        """Start reading and read the first block."""
+        self._active = True
+        self.frames = []
+        self.read_frames()
+
+    def pause_recording(self):
+        """Stop reading until restart_recording()."""
+        self._active = False
+
+    def restart_recording(self):
+        """Resume reading after pause_recording()."""
+        self._active = True
+
+    def close(self):
+        """Stop reading."""
+        self._active = False
+
+    def read_frames(self):
+        """
+        Read one block: loud while the scream key is held.
+
+        Returns:
+            bytes: The block, or None while paused.
+        """
+        if not self._active:
+            return None
+        held = self.get_pressed()[self.key]
+        data = self._scream if held else self._quiet
+        self.frames.append(data)
+        self.last_frame = data
+        self.last_read_time = time.perf_counter()
+        return data
+
+    def get_samples(self):
+        """
+        Get every block read since the last reset.
+
+        Returns:
+            bytes: The blocks joined together.
+        """
+        return b"".join(self.frames)
+
+    def get_peak(self):
+        """
+        Get the peak amplitude of every block since the last reset.
+
+        Returns:
+            int: SCREAM_AMPLITUDE if the key was held for any block, else 0.
+        """
+        scream = self._scream
+        return (SCREAM_AMPLITUDE
+                if any(frame is scream for frame in self.frames) else 0)
+
+    def get_frame_peak(self):
+        """
+        Get the peak amplitude of the most recent block.
+
+        Returns:
+            int: SCREAM_AMPLITUDE while the key is held, else 0.
+        """
+        return SCREAM_AMPLITUDE if self.last_frame is self._scream else 0
+
+    def get_onset_time(self, threshold):
+        """
+        Get when the most recent block reached a threshold.
+
+        Key presses have no position inside a block, so this is the time
+        of the read.
+
+        Args:
+            threshold (int): Peak amplitude that counts as loud.
+
+        Returns:
+            float: A time.perf_counter() value, or None if the block was
+                quieter than threshold.
+        """
+        if self.last_read_time is None or self.get_frame_peak() < threshold:
+            return None
+        return self.last_read_time
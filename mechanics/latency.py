@@ -0,0 +1,284 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Input-to-Display Latency for Fish-O-Mania.
+
+Timestamps each input and measures how long it takes until the first
+presented frame that reflects it:
+    - space: the hook starts moving or changes direction
+    - left/right: the boat moves that way
+    - pause: the pause state changes
+    - scream: the hook starts moving down (classic mode); the input time
+      is when the microphone signal crossed the threshold, estimated
+      from the sample position in the recorder's latest block
+
+Key inputs are timestamped when the loop reads the event, so the time an
+event waits in the SDL queue is not included.
+
+Inputs that aren't reflected within MAX_PENDING seconds (e.g. space while
+game over) are dropped and counted as expired.
+
+Usage in a game loop:
+    latency = start_latency("classic")
+    while running:
+        for event in driver.get_events():
+            if event.type == pygame.KEYDOWN:
+                latency.key_down(event.key)
+        ...update...
+        latency.observe(boat_x, casting_manager.rod_length, paused)
+        ...draw...
+        pygame.display.flip()
+        latency.presented()
+    end_latency(latency)
+
+Functions:
+    start_latency: Get a mode's tracker at the start of a session.
+    end_latency: Log the summary at the end of a session.
+    get_latency_summaries: Summaries for every mode played so far.
+    reset_latency: Forget all measurements.
+
+Classes:
+    InputLatency: Pending inputs and latency samples per input kind.
+"""
+
+import time
+from collections import deque
+
+import pygame
+
+from mechanics.game_log import fields, get_logger
+
+INPUT_KINDS = ("space", "left", "right", "pause", "scream")
+KEY_KINDS = {
+    pygame.K_SPACE: "space",
+    pygame.K_LEFT: "left",
+    pygame.K_RIGHT: "right",
+    pygame.K_p: "pause",
+}
+
+MAX_PENDING = 1.0  # Seconds before an unreflected input is dropped
+SAMPLES = 512  # Latencies kept per input kind
+
+log = get_logger("latency")
+
+
+class InputLatency:
+    """
+    Input-to-display latency per input kind.
+
+    Attributes:
+        name (str): Label used in summaries (the mode name).
+        samples (dict): Input kind -> deque of recent latencies in seconds.
+        counts (dict): Input kind -> latencies measured in total.
+        expired (dict): Input kind -> inputs dropped unreflected.
+    """
+
+    def __init__(self, name=""):
+        """
+        Initialize an empty tracker.
+
+        Args:
+            name (str): Label used in summaries.
+        """
+        self.name = name
+        self.samples = {kind: deque(maxlen=SAMPLES) for kind in INPUT_KINDS}
+        self.counts = dict.fromkeys(INPUT_KINDS, 0)
+        self.expired = dict.fromkeys(INPUT_KINDS, 0)
+        self.begin_session()
+
+    def begin_session(self):
+        """Forget pending inputs and the previous frame's state."""
+        self._pending = {}
+        self._reflected = []
+        self._last = None
+
+    def input(self, kind, t=None):
+        """
+        Timestamp an input; later inputs of a pending kind are ignored.
+
+        Args:
+            kind (str): One of INPUT_KINDS.
+            t (float): perf_counter() time of the input, defaults to now.
+        """
+        if kind not in self._pending:
+            self._pending[kind] = time.perf_counter() if t is None else t
+
+    def key_down(self, key):
+        """
+        Timestamp a KEYDOWN if it is one of the measured keys.
+
+        Args:
+            key (int): pygame key constant.
+        """
+        kind = KEY_KINDS.get(key)
+        if kind is not None and kind not in self._pending:
+            self._pending[kind] = time.perf_counter()
+
+    def reflected(self, kind):
+        """
+        Note that the frame being built reflects a pending input.
+
+        Args:
+            kind (str): One of INPUT_KINDS.
+        """
+        if kind in self._pending and kind not in self._reflected:
+            self._reflected.append(kind)
+
+    def observe(self, boat_x, rod_length, paused):
+        """
+        Compare this frame's state with the last one's and note the
+        pending inputs it reflects. Call once per frame before drawing.
+
+        Args:
+            boat_x (int): Boat position.
+            rod_length (float): Hook depth below the rod.
+            paused (bool): Whether the game is paused.
+        """
+        last = self._last
+        direction = 0  # Hook movement this frame: 1 down, -1 up, 0 still
+        if last is not None:
+            last_x, last_rod, last_direction, last_paused = last
+            direction = (rod_length > last_rod) - (rod_length < last_rod)
+            if self._pending:
+                if boat_x < last_x:
+                    self.reflected("left")
+                elif boat_x > last_x:
+                    self.reflected("right")
+                # Hook started moving or turned around
+                if direction and direction != last_direction:
+                    self.reflected("space")
+                    if direction > 0:
+                        self.reflected("scream")
+                if paused != last_paused:
+                    self.reflected("pause")
+        self._last = (boat_x, rod_length, direction, paused)
+
+    def presented(self, t=None):
+        """
+        Record latencies for the inputs reflected by the frame just
+        presented. Call right after pygame.display.flip().
+
+        Args:
+            t (float): perf_counter() time of the flip, defaults to now.
+        """
+        if not self._pending:
+            return
+        now = time.perf_counter() if t is None else t
+
+        for kind in self._reflected:
+            self.samples[kind].append(now - self._pending.pop(kind))
+            self.counts[kind] += 1
+        self._reflected.clear()
+
+        for kind, start in list(self._pending.items()):
+            if now - start > MAX_PENDING:
+                del self._pending[kind]
+                self.expired[kind] += 1
+
+    def stats(self, kind):
+        """
+        Latency statistics for one input kind over the recent samples.
+
+        Args:
+            kind (str): One of INPUT_KINDS.
+
+        Returns:
+            tuple: (count, mean, p50, p95, max) in milliseconds, or None
+                if nothing was measured.
+        """
+        samples = sorted(self.samples[kind])
+        if not samples:
+            return None
+        n = len(samples)
+        return (self.counts[kind],
+                1000 * sum(samples) / n,
+                1000 * samples[(n - 1) // 2],
+                1000 * samples[min(n - 1, (95 * n) // 100)],
+                1000 * samples[-1])
+
+    def summary(self):
+        """
+        Summarize every input kind.
+
+        Returns:
+            dict: Input kind -> dict with count, expired, mean_ms, p50_ms,
+                p95_ms and max_ms (None values if nothing was measured).
+        """
+        result = {}
+        for kind in INPUT_KINDS:
+            stats = self.stats(kind) or (0, None, None, None, None)
+            result[kind] = dict(zip(
+                ("count", "mean_ms", "p50_ms", "p95_ms", "max_ms"), stats))
+            result[kind]["expired"] = self.expired[kind]
+        return result
+
+    def format_lines(self):
+        """
+        Get one line of text per measured input kind.
+
+        Returns:
+            list: e.g. ["space     12   25.1   33.4   41.0"].
+        """
+        lines = []
+        for kind in INPUT_KINDS:
+            stats = self.stats(kind)
+            if stats is not None:
+                count, mean, p50, p95, worst = stats
+                lines.append(f"{kind:<8}{count:5d} {mean:6.1f} {p50:6.1f} "
+                             f"{p95:6.1f} {worst:6.1f}")
+        return lines
+
+
+# Trackers by mode name, kept for the whole process
+_trackers = {}
+
+
+def start_latency(mode):
+    """
+    Get a mode's tracker at the start of a session.
+
+    Args:
+        mode (str): Mode name.
+
+    Returns:
+        InputLatency: The mode's tracker.
+    """
+    latency = _trackers.get(mode)
+    if latency is None:
+        latency = _trackers[mode] = InputLatency(mode)
+    latency.begin_session()
+    return latency
+
+
+def end_latency(latency):
+    """
+    Log the summary at the end of a session, one line per input kind.
+
+    Args:
+        latency (InputLatency): The mode's tracker.
+    """
+    for kind in INPUT_KINDS:
+        stats = latency.stats(kind)
+        if stats is None:
+            continue
+        count, mean, p50, p95, worst = stats
+        log.info("Input latency %s %s: %d inputs, mean %.1f ms, "
+                 "p50 %.1f ms, p95 %.1f ms, max %.1f ms", latency.name,
+                 kind, count, mean, p50, p95, worst,
+                 extra=fields(mode=latency.name, kind=kind, count=count,
+                              mean_ms=mean, p95_ms=p95, max_ms=worst))
+
+
+def get_latency_summaries():
+    """
+    Get summaries for every mode played in this process.
+
+    Returns:
+        dict: Mode name -> summary dict (see InputLatency.summary).
+    """
+    return {mode: latency.summary() for mode, latency in _trackers.items()}
+
+
+def reset_latency():
+    """Forget all measurements for every mode."""
+    _trackers.clear()
@@ -6,6 +6,11 @@ This file manages the player's lives system.
 
 import pygame
 
+from mechanics.assets import load_image
+from mechanics.game_log import fields, get_logger
+
+log = get_logger("lives_manager")
+
 
 class LivesManager:
     """Manages player lives and displays them."""
@@ -28,13 +33,11 @@ class LivesManager:
 
         # Load life icons
         try:
-            self.live_icon = pygame.image.load(live_icon_path).convert_alpha()
             # Scale icons to standard size (64x64)
-            self.live_icon = (
-                pygame.transform.scale(self.live_icon,
-                                       (self.icon_size, self.icon_size)))
+            self.live_icon = load_image(live_icon_path, "ui",
+                                        (self.icon_size, self.icon_size))
         except (pygame.error, FileNotFoundError) as e:
-            print(f"Error loading live icon: {e}")
+            log.warning("Error loading live icon: %s", e)
             # Create a placeholder green circle
             self.live_icon = pygame.Surface(
                 (self.icon_size, self.icon_size), pygame.SRCALPHA)
@@ -43,12 +46,10 @@ class LivesManager:
                                (self.icon_size//2, self.icon_size//2), 28)
 
         try:
-            self.dead_icon = pygame.image.load(dead_icon_path).convert_alpha()
-            self.dead_icon = (
-                pygame.transform.scale(self.dead_icon,
-                                       (self.icon_size, self.icon_size)))
+            self.dead_icon = load_image(dead_icon_path, "ui",
+                                        (self.icon_size, self.icon_size))
         except (pygame.error, FileNotFoundError) as e:
-            print(f"Error loading dead icon: {e}")
+            log.warning("Error loading dead icon: %s", e)
             # Create a placeholder red circle
             self.dead_icon = pygame.Surface(
                 (self.icon_size, self.icon_size), pygame.SRCALPHA)
@@ -64,7 +65,8 @@ class LivesManager:
         """
         if self.current_lives > 0:
             self.current_lives -= 1
-            print(f"Life lost! Remaining lives: {self.current_lives}")
+            log.info("Life lost! Remaining lives: %d", self.current_lives,
+                     extra=fields(lives=self.current_lives))
 
             if self.current_lives <= 0:
                 self.game_over = True
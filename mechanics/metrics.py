@@ -0,0 +1,442 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Metrics for Fish-O-Mania.
+
+Counters, gauges and histograms in the Prometheus text format, for
+monitoring kiosks:
+    fish_frame_seconds: frame time per mode (histogram)
+    fish_frame_phase_seconds: update and draw time per mode (histogram)
+    fish_population: fish on screen by kind, from FishManager.get_stats()
+    fish_spawns_total: spawns per species
+    fish_catch_events_total: catches, penalties and releases per species
+    fish_recorder_read_seconds: time blocked reading a microphone block
+    fish_recorder_peak: peak amplitude of each microphone block
+    fish_score_writes_total: score writes by result
+    fish_score_write_seconds: time per score write
+    fish_gc_pause_seconds: garbage collection pauses per generation
+
+Metrics are always collected. Recording is a dict lookup and an integer
+increment with no locks: nearly every metric is written by one thread
+only (the game loop, or the score writer for the score metrics) and the
+server thread only reads, which is safe under the GIL. GC pauses are
+recorded by whichever thread collected; two threads recording one at
+the same moment can lose a count, which is fine for monitoring.
+
+The HTTP server is opt-in. Start it with the FISH_METRICS_PORT
+environment variable or "python main_menu.py --metrics-port PORT"; it
+listens on 127.0.0.1 only and serves GET /metrics from a daemon thread.
+Check a running game with "python -m mechanics.metrics PORT".
+
+Functions:
+    start_server: Serve the metrics on localhost.
+    stop_server: Stop the server.
+    render: All metrics in the Prometheus text format.
+    scrape: Fetch and parse a metrics page (for checks and tests).
+    main: Print a running game's metrics.
+
+Classes:
+    Counter: Monotonic count per label set.
+    Gauge: Current value per label set.
+    Histogram: Bucketed observations per label set.
+    LoopMetrics: Frame, update/draw and population metrics of a mode loop.
+"""
+
+import bisect
+import os
+import sys
+import threading
+import time
+
+from mechanics.game_log import fields, get_logger
+
+# Environment variable that starts the server
+METRICS_ENV = "FISH_METRICS_PORT"
+
+# Frames between fish population updates
+POPULATION_EVERY = 60
+
+FRAME_BUCKETS = (0.004, 0.008, 0.012, 0.016, 0.017, 0.020, 0.025, 0.033,
+                 0.050, 0.100, 0.250)
+PHASE_BUCKETS = (0.0005, 0.001, 0.002, 0.004, 0.008, 0.012, 0.016, 0.025,
+                 0.050, 0.100)
+PEAK_BUCKETS = (500, 1000, 2000, 5000, 10000, 20000, 32767)
+WRITE_BUCKETS = (0.001, 0.005, 0.010, 0.050, 0.100, 0.500, 1.0)
+
+log = get_logger("metrics")
+
+# Every metric, in the order they are rendered
+_metrics = []
+
+
+def _format_labels(names, values, extra=""):
+    """Format a label set as {name="value",...}."""
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    """Format a sample value the way Prometheus expects."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """Common parts of the metric types."""
+
+    kind = ""
+
+    def __init__(self, name, help_text, labelnames=()):
+        """
+        Create and register a metric.
+
+        Args:
+            name (str): Metric name.
+            help_text (str): Description shown in # HELP.
+            labelnames (tuple): Label names; values are passed as a tuple
+                in the same order.
+        """
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        _metrics.append(self)
+
+    def reset(self):
+        """Forget every recorded value."""
+        self.values = {}
+
+    def render(self):
+        """Render the metric's lines in the Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.help}",
+                 f"# TYPE {self.name} {self.kind}"]
+        # list() copies the items in one step under the GIL
+        for labels, value in sorted(list(self.values.items())):
+            lines.extend(self._render_series(labels, value))
+        return lines
+
+    def _render_series(self, labels, value):
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} "
+                f"{_format_value(value)}"]
+
+
+class Counter(_Metric):
+    """Monotonic count per label set."""
+
+    kind = "counter"
+
+    def inc(self, labels=(), amount=1):
+        """
+        Add to the count.
+
+        Args:
+            labels (tuple): Label values.
+            amount (int): Amount added.
+        """
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+
+class Gauge(_Metric):
+    """Current value per label set."""
+
+    kind = "gauge"
+
+    def set(self, value, labels=()):
+        """
+        Set the value.
+
+        Args:
+            value (float): New value.
+            labels (tuple): Label values.
+        """
+        self.values[labels] = value
+
+
+class Histogram(_Metric):
+    """Observations counted in fixed buckets per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name, help_text, buckets, labelnames=()):
+        """
+        Create and register a histogram.
+
+        Args:
+            name (str): Metric name.
+            help_text (str): Description shown in # HELP.
+            buckets (tuple): Ascending bucket upper bounds.
+            labelnames (tuple): Label names.
+        """
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, labels=()):
+        """
+        Record one observation.
+
+        Args:
+            value (float): Observed value.
+            labels (tuple): Label values.
+        """
+        series = self.values.get(labels)
+        if series is None:
+            # [per-bucket counts (last is +Inf), sum, count]
+            series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            self.values[labels] = series
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def _render_series(self, labels, series):
+        counts, total, count = series
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),),
+                                       list(counts)):
+            cumulative += bucket_count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{self.name}_bucket"
+                         f"{_format_labels(self.labelnames, labels, le)} "
+                         f"{cumulative}")
+        label_text = _format_labels(self.labelnames, labels)
+        lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+        lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+FRAME_SECONDS = Histogram(
+    "fish_frame_seconds", "Frame time including the frame limiter.",
+    FRAME_BUCKETS, ("mode",))
+PHASE_SECONDS = Histogram(
+    "fish_frame_phase_seconds", "Time spent updating and drawing a frame.",
+    PHASE_BUCKETS, ("mode", "phase"))
+FISH_POPULATION = Gauge(
+    "fish_population", "Fish on screen by kind.", ("kind",))
+SPAWNS = Counter(
+    "fish_spawns_total", "Fish spawned by species.", ("species",))
+CATCH_EVENTS = Counter(
+    "fish_catch_events_total", "Catches, penalties and releases.",
+    ("event", "species"))
+RECORDER_READ_SECONDS = Histogram(
+    "fish_recorder_read_seconds", "Time blocked reading a microphone block.",
+    PHASE_BUCKETS)
+RECORDER_PEAK = Histogram(
+    "fish_recorder_peak", "Peak amplitude of each microphone block.",
+    PEAK_BUCKETS)
+SCORE_WRITES = Counter(
+    "fish_score_writes_total", "Score writes by result.", ("result",))
+SCORE_WRITE_SECONDS = Histogram(
+    "fish_score_write_seconds", "Time per score write.", WRITE_BUCKETS)
+GC_PAUSE_SECONDS = Histogram(
+    "fish_gc_pause_seconds", "Garbage collection pauses.", PHASE_BUCKETS,
+    ("generation",))
+
+
+class LoopMetrics:
+    """
+    Frame, update/draw split and fish population metrics of a mode loop.
+
+    Usage in a game loop:
+        loop_metrics = LoopMetrics("classic", fish_manager.get_stats)
+        while running:
+            loop_metrics.begin_frame()
+            ...events and update...
+            loop_metrics.end_update()
+            ...draw...
+            pygame.display.flip()
+            loop_metrics.end_draw()
+            loop_metrics.end_frame(driver.tick())
+
+    Attributes:
+        mode (str): Mode label.
+        population (callable): Returns FishManager.get_stats(), or None.
+        frames (int): Frames recorded.
+    """
+
+    def __init__(self, mode, population=None):
+        """
+        Initialize for a mode.
+
+        Args:
+            mode (str): Mode label.
+            population (callable): Returns a dict of fish counts.
+        """
+        self.mode = mode
+        self.population = population
+        self.frames = 0
+        self._frame_labels = (mode,)
+        self._update_labels = (mode, "update")
+        self._draw_labels = (mode, "draw")
+        self._start = None
+        self._mark = None
+
+    def begin_frame(self):
+        """Mark the top of the loop."""
+        self._start = time.perf_counter()
+
+    def end_update(self):
+        """Mark the end of event handling and updates."""
+        now = time.perf_counter()
+        if self._start is not None:
+            PHASE_SECONDS.observe(now - self._start, self._update_labels)
+        self._mark = now
+
+    def end_draw(self):
+        """Mark the end of drawing (after flip)."""
+        if self._mark is not None:
+            PHASE_SECONDS.observe(time.perf_counter() - self._mark,
+                                  self._draw_labels)
+            self._mark = None
+
+    def end_frame(self, frame_ms):
+        """
+        Record the frame time and, now and then, the fish population.
+
+        Args:
+            frame_ms (int): Frame time from clock.tick().
+        """
+        FRAME_SECONDS.observe(frame_ms / 1000, self._frame_labels)
+        self.frames += 1
+        if self.population is not None and self.frames % POPULATION_EVERY == 1:
+            for kind, value in self.population().items():
+                if isinstance(value, int) and not isinstance(value, bool):
+                    FISH_POPULATION.set(value, (kind,))
+
+
+def render():
+    """
+    Render every metric.
+
+    Returns:
+        str: The metrics page in the Prometheus text format.
+    """
+    lines = []
+    for metric in list(_metrics):
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# Running server, None while off
+_server = None
+
+
+def start_server(port, host="127.0.0.1"):
+    """
+    Serve the metrics at http://host:port/metrics on a daemon thread.
+
+    Args:
+        port (int): TCP port, 0 for any free port.
+        host (str): Address to listen on; keep it local.
+
+    Returns:
+        int: The port listened on, or None if the server couldn't start.
+    """
+    global _server
+    if _server is not None:
+        return _server.server_address[1]
+
+    # Imported here so the game doesn't pay for http.server at startup
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type",
+                             "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    try:
+        _server = HTTPServer((host, port), Handler)
+    except OSError as e:
+        log.error("Error starting metrics server: %s", e,
+                  extra=fields(port=port, error=str(e)))
+        return None
+    threading.Thread(target=_server.serve_forever, name="metrics",
+                     daemon=True).start()
+    port = _server.server_address[1]
+    log.info("Metrics at http://%s:%d/metrics", host, port,
+             extra=fields(port=port))
+    return port
+
+
+def stop_server():
+    """Stop the metrics server."""
+    global _server
+    if _server is not None:
+        _server.shutdown()
+        _server.server_close()
+        _server = None
+
+
+def scrape(port, host="127.0.0.1", timeout=5.0):
+    """
+    Fetch a metrics page and parse its samples, like a scraper would.
+
+    Args:
+        port (int): Port of the metrics server.
+        host (str): Host of the metrics server.
+        timeout (float): Seconds to wait for the response.
+
+    Returns:
+        dict: Sample name with labels (e.g. 'fish_spawns_total{species=
+            "Shark"}') -> value.
+    """
+    from urllib.request import urlopen
+
+    with urlopen(f"http://{host}:{port}/metrics", timeout=timeout) as f:
+        text = f.read().decode()
+
+    samples = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        name, value = line.rsplit(" ", 1)
+        samples[name] = float(value)
+    return samples
+
+
+def main(argv=None):
+    """
+    Print a running game's metrics.
+
+    Args:
+        argv (list): [PORT], defaults to sys.argv[1:] or FISH_METRICS_PORT.
+
+    Returns:
+        int: Exit status.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    port = argv[0] if argv else os.environ.get(METRICS_ENV)
+    if not port:
+        print("usage: python -m mechanics.metrics PORT")
+        return 2
+    try:
+        samples = scrape(int(port))
+    except OSError as e:
+        print(f"Could not scrape metrics: {e}")
+        return 1
+    for name, value in sorted(samples.items()):
+        print(f"{name} {value:g}")
+    return 0
+
+
+# Start the server from the environment for any entry point
+_env_port = os.environ.get(METRICS_ENV)
+if _env_port:
+    start_server(int(_env_port))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Frame Pacing Statistics for Fish-O-Mania.
+
+Keeps the frame times returned by clock.tick() in a fixed-size histogram
+and counts frames over the frame budget, hitches (frames longer than two
+budgets) and the longest runs of each. Recording a frame is a handful of
+integer operations, so it stays on in every build; the numbers from
+different machines and builds can be compared directly.
+
+Each mode records into a per-mode collector for the whole process, and
+logs its totals so far, over every session of the mode, when a session
+ends.
+
+Usage in a game loop:
+    pacing = start_pacing("classic")
+    while running:
+        ...
+        pacing.record(driver.tick())
+    end_pacing(pacing)
+
+Functions:
+    start_pacing: Get a mode's collector at the start of a session.
+    end_pacing: Log the mode's totals at the end of a session.
+    get_pacing_summaries: Summaries for every mode played so far.
+    reset_pacing: Forget all recorded frames.
+
+Classes:
+    FramePacing: Histogram of frame times with budget and hitch counts.
+"""
+
+from mechanics.constants import FPS
+from mechanics.game_log import fields, get_logger
+
+HISTOGRAM_MS = 100  # 1 ms bins up to here; longer frames share the last bin
+HITCH_FACTOR = 2  # Frames longer than this many budgets are hitches
+
+# clock.tick() reports whole milliseconds (16 or 17 at 60 FPS), so a frame
+# only counts as over budget past this much slack
+OVER_BUDGET_SLACK_MS = 1
+
+log = get_logger("pacing")
+
+
+class FramePacing:
+    """
+    Frame-time histogram with over-budget and hitch counts.
+
+    Attributes:
+        name (str): Label used in summaries (the mode name).
+        budget_ms (float): Frame budget in milliseconds.
+        counts (list): Frames per 1 ms bin; the last bin holds every
+            frame of HISTOGRAM_MS or longer.
+        frames (int): Frames recorded.
+        total_ms (int): Sum of the recorded frame times.
+        max_ms (int): Longest frame.
+        over_budget (int): Frames over the budget.
+        hitches (int): Frames over HITCH_FACTOR budgets.
+        longest_over_budget_run (int): Longest run of frames over budget.
+        longest_hitch_run (int): Longest run of hitches.
+        sessions (int): Sessions recorded.
+        gc_pauses (list): Garbage collections per generation during play
+            (see mechanics.gc_policy).
+        gc_ms (float): Milliseconds spent in those collections.
+        gc_max_ms (float): Longest collection in milliseconds.
+    """
+
+    def __init__(self, name="", fps=FPS):
+        """
+        Initialize an empty collector.
+
+        Args:
+            name (str): Label used in summaries.
+            fps (int): Target frame rate the budget is derived from.
+        """
+        self.name = name
+        self.budget_ms = 1000 / fps
+        self._over_ms = self.budget_ms + OVER_BUDGET_SLACK_MS
+        self._hitch_ms = self.budget_ms * HITCH_FACTOR
+        self.reset()
+
+    def reset(self):
+        """Forget all recorded frames."""
+        self.counts = [0] * (HISTOGRAM_MS + 1)
+        self.frames = 0
+        self.total_ms = 0
+        self.max_ms = 0
+        self.over_budget = 0
+        self.hitches = 0
+        self.longest_over_budget_run = 0
+        self.longest_hitch_run = 0
+        self.sessions = 0
+        self.gc_pauses = [0, 0, 0]
+        self.gc_ms = 0.0
+        self.gc_max_ms = 0.0
+        self._over_run = 0
+        self._hitch_run = 0
+        self._skip = 0
+
+    def begin_session(self):
+        """
+        Start a session.
+
+        The first tick of a session includes the loading done before the
+        loop, so it is not recorded.
+        """
+        self.sessions += 1
+        self._skip = 1
+        self._over_run = 0
+        self._hitch_run = 0
+
+    def record(self, frame_ms):
+        """
+        Record one frame.
+
+        Args:
+            frame_ms (int): Frame time in milliseconds, as returned by
+                clock.tick().
+        """
+        if self._skip:
+            self._skip -= 1
+            return
+
+        frame_ms = int(frame_ms)
+        self.counts[frame_ms if frame_ms < HISTOGRAM_MS else HISTOGRAM_MS] += 1
+        self.frames += 1
+        self.total_ms += frame_ms
+        if frame_ms > self.max_ms:
+            self.max_ms = frame_ms
+
+        if frame_ms > self._over_ms:
+            self.over_budget += 1
+            self._over_run += 1
+            if self._over_run > self.longest_over_budget_run:
+                self.longest_over_budget_run = self._over_run
+
+            if frame_ms > self._hitch_ms:
+                self.hitches += 1
+                self._hitch_run += 1
+                if self._hitch_run > self.longest_hitch_run:
+                    self.longest_hitch_run = self._hitch_run
+            else:
+                self._hitch_run = 0
+        else:
+            self._over_run = 0
+            self._hitch_run = 0
+
+    def record_gc(self, generation, pause_ms):
+        """
+        Record a garbage collection pause.
+
+        Args:
+            generation (int): Generation collected (0-2).
+            pause_ms (float): Duration in milliseconds.
+        """
+        self.gc_pauses[generation] += 1
+        self.gc_ms += pause_ms
+        if pause_ms > self.gc_max_ms:
+            self.gc_max_ms = pause_ms
+
+    def percentile(self, q):
+        """
+        Frame time at a percentile, from the histogram.
+
+        Args:
+            q (float): Percentile between 0 and 100.
+
+        Returns:
+            int: Upper edge of the bin holding the percentile in ms (frames
+                of HISTOGRAM_MS or longer report max_ms), or 0 if empty.
+        """
+        if self.frames == 0:
+            return 0
+        target = max(1, -(-self.frames * q // 100))  # ceil
+        seen = 0
+        for ms, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return ms if ms < HISTOGRAM_MS else self.max_ms
+        return self.max_ms
+
+    def summary(self):
+        """
+        Summarize the recorded frames.
+
+        Returns:
+            dict: Frame count, mean fps and frame time, percentiles, and
+                the over-budget and hitch counts and longest runs, and
+                the garbage collection pauses.
+        """
+        mean = self.total_ms / self.frames if self.frames else 0.0
+        return {
+            "name": self.name,
+            "sessions": self.sessions,
+            "frames": self.frames,
+            "budget_ms": self.budget_ms,
+            "mean_ms": mean,
+            "fps": 1000 / mean if mean > 0 else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms,
+            "over_budget": self.over_budget,
+            "over_budget_pct": (100 * self.over_budget / self.frames
+                                if self.frames else 0.0),
+            "hitches": self.hitches,
+            "longest_over_budget_run": self.longest_over_budget_run,
+            "longest_hitch_run": self.longest_hitch_run,
+            "gc_pauses": list(self.gc_pauses),
+            "gc_ms": self.gc_ms,
+            "gc_max_ms": self.gc_max_ms,
+        }
+
+    def format_summary(self):
+        """
+        Get the summary as one line of text.
+
+        Returns:
+            str: e.g. "classic: 3600 frames, 59.8 fps, p50 17 ms, ...".
+        """
+        s = self.summary()
+        return (f"{s['name']}: {s['frames']} frames, {s['fps']:.1f} fps, "
+                f"p50 {s['p50_ms']} ms, p95 {s['p95_ms']} ms, "
+                f"p99 {s['p99_ms']} ms, max {s['max_ms']} ms, "
+                f"{s['over_budget']} over budget ({s['over_budget_pct']:.1f}%,"
+                f" longest run {s['longest_over_budget_run']}), "
+                f"{s['hitches']} hitches (longest run "
+                f"{s['longest_hitch_run']}), gc "
+                f"{'/'.join(str(n) for n in s['gc_pauses'])} "
+                f"({s['gc_ms']:.1f} ms, max {s['gc_max_ms']:.1f} ms)")
+
+
+# Collectors by mode name, kept for the whole process
+_collectors = {}
+
+
+def start_pacing(mode):
+    """
+    Get a mode's collector at the start of a session.
+
+    Args:
+        mode (str): Mode name.
+
+    Returns:
+        FramePacing: The mode's collector.
+    """
+    pacing = _collectors.get(mode)
+    if pacing is None:
+        pacing = _collectors[mode] = FramePacing(mode)
+    pacing.begin_session()
+    return pacing
+
+
+def end_pacing(pacing):
+    """
+    Log the mode's totals at the end of a session.
+
+    The collector keeps adding up the mode's sessions, so the numbers
+    cover every session of the mode played in this process.
+
+    Args:
+        pacing (FramePacing): The mode's collector.
+    """
+    if pacing.frames:
+        s = pacing.summary()
+        log.info("Frame pacing, %d sessions so far: %s", s["sessions"],
+                 pacing.format_summary(),
+                 extra=fields(mode=s["name"], sessions=s["sessions"],
+                              frames=s["frames"], p99_ms=s["p99_ms"],
+                              over_budget=s["over_budget"],
+                              hitches=s["hitches"]))
+
+
+def get_pacing_summaries():
+    """
+    Get summaries for every mode played in this process.
+
+    Returns:
+        dict: Mode name -> summary dict (see FramePacing.summary).
+    """
+    return {mode: pacing.summary() for mode, pacing in _collectors.items()}
+
+
+def reset_pacing():
+    """Forget all recorded frames for every mode."""
+    _collectors.clear()
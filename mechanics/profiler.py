@@ -0,0 +1,245 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Frame Profiler for Fish-O-Mania.
+
+In-game overlay (toggled with F3 in every mode) that shows how long each
+phase of the game loop takes: rolling mean, 95th percentile and maximum
+per phase, plus a graph of recent frame times against the frame budget.
+When given an InputLatency tracker (mechanics.latency) it also shows the
+input-to-display latency per input kind.
+
+The game loop marks phase boundaries with lap(name); each lap is charged
+the time since the previous mark. When tracing is on (mechanics.tracing)
+every lap is also recorded as a span. While the overlay is hidden and
+tracing is off every call returns immediately, so the instrumentation
+can stay in the loop.
+
+Classes:
+    FrameProfiler: Collects per-phase timings and draws the overlay.
+"""
+
+import time
+
+import numpy as np
+import pygame
+
+from mechanics.constants import SCREEN_WIDTH, FPS, WHITE
+from mechanics.tracing import complete, is_tracing
+
+HISTORY = 240  # Frames kept for the rolling statistics and the graph
+MAX_PHASES = 16  # Phases that can be tracked at once
+REFRESH_FRAMES = 15  # Frames between statistics/text updates
+
+PANEL_WIDTH = 360
+GRAPH_HEIGHT = 60
+LINE_HEIGHT = 18
+
+
+class FrameProfiler:
+    """
+    Rolling per-phase frame timings with an on-screen overlay.
+
+    Usage in a game loop:
+        profiler.begin_frame()
+        ...handle events...
+        profiler.lap("events")
+        fish_manager.update()
+        profiler.lap("fish update")
+        ...
+        profiler.draw(screen)
+        pygame.display.flip()
+        profiler.lap("flip")
+
+    Attributes:
+        enabled (bool): Whether timings are collected and drawn.
+        tracing (bool): Whether phases are recorded as trace spans.
+        history (int): Number of frames kept.
+        latency (InputLatency): Input latency tracker shown, or None.
+    """
+
+    def __init__(self, enabled=False, history=HISTORY, latency=None):
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled (bool): Start with the overlay shown.
+            history (int): Number of frames kept for the statistics.
+            latency (InputLatency): Input latency tracker to show.
+        """
+        self.enabled = enabled
+        self.latency = latency
+        self.tracing = is_tracing()
+        self.history = history
+        self.font = None
+        self.reset()
+
+    def reset(self):
+        """Forget all recorded frames."""
+        self._names = []
+        self._index = {}
+        self._samples = np.zeros((MAX_PHASES, self.history))
+        self._frame_times = np.zeros(self.history)
+        self._slot = 0
+        self._frames = 0
+        self._frame_start = None
+        self._last = None
+        self._stats = None
+        self._text = []
+        self._active = self.enabled or self.tracing
+
+    def toggle(self):
+        """Show or hide the overlay (F3)."""
+        self.enabled = not self.enabled
+        self.reset()
+
+    def begin_frame(self):
+        """Mark the start of a frame (top of the game loop)."""
+        if not self._active:
+            return
+
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            if self.tracing:
+                complete("frame", self._frame_start, now, "frame")
+            if self.enabled:
+                self._frame_times[self._slot] = now - self._frame_start
+                self._frames += 1
+                self._slot = self._frames % self.history
+                self._samples[:, self._slot] = 0.0
+        self._frame_start = now
+        self._last = now
+
+    def lap(self, name):
+        """
+        Charge the time since the previous mark to a phase.
+
+        Args:
+            name (str): Phase name shown in the overlay.
+        """
+        if not self._active or self._last is None:
+            return
+
+        now = time.perf_counter()
+        if self.tracing:
+            complete(name, self._last, now, "frame")
+        if self.enabled:
+            index = self._index.get(name)
+            if index is None and len(self._names) < MAX_PHASES:
+                index = len(self._names)
+                self._index[name] = index
+                self._names.append(name)
+            if index is not None:
+                self._samples[index, self._slot] += now - self._last
+        self._last = now
+
+    def stats(self):
+        """
+        Compute statistics over the recorded frames.
+
+        Returns:
+            dict: "frame" and each phase name mapped to (mean, p95, max)
+                in milliseconds, or None before the first full frame.
+        """
+        # Completed frames only; the current slot is still filling
+        count = min(self._frames, self.history - 1)
+        if count == 0:
+            return None
+
+        slots = (self._slot - 1 - np.arange(count)) % self.history
+        samples = self._samples[:len(self._names)][:, slots] * 1000
+        frame_times = self._frame_times[slots] * 1000
+
+        result = {"frame": (float(frame_times.mean()),
+                            float(np.percentile(frame_times, 95)),
+                            float(frame_times.max()))}
+        if len(self._names):
+            means = samples.mean(axis=1)
+            p95s = np.percentile(samples, 95, axis=1)
+            maxes = samples.max(axis=1)
+            for i, name in enumerate(self._names):
+                result[name] = (float(means[i]), float(p95s[i]),
+                                float(maxes[i]))
+        return result
+
+    def _refresh_text(self):
+        """Recompute statistics and re-render the overlay text."""
+        if self.font is None:
+            # Monospace so the columns line up
+            self.font = pygame.font.SysFont("monospace", 14)
+
+        self._stats = self.stats()
+        self._text = []
+        if self._stats is None:
+            return
+
+        mean, p95, worst = self._stats["frame"]
+        fps = 1000 / mean if mean > 0 else 0
+        lines = [(f"frame  {mean:5.1f}  {p95:5.1f}  {worst:5.1f} ms"
+                  f"  ({fps:.0f} fps)", WHITE),
+                 ("phase            mean    p95    max", (180, 200, 220))]
+        budget = 1000 / FPS
+        for name in self._names:
+            mean, p95, worst = self._stats[name]
+            color = (255, 120, 120) if p95 > budget / 2 else WHITE
+            lines.append((f"{name:<15}{mean:6.2f} {p95:6.2f} {worst:6.2f}",
+                          color))
+        if self.latency is not None:
+            latency_lines = self.latency.format_lines()
+            if latency_lines:
+                lines.append(("input       n   mean    p50    p95    max",
+                              (180, 200, 220)))
+                lines.extend((line, WHITE) for line in latency_lines)
+        self._text = [self.font.render(text, True, color)
+                      for text, color in lines]
+
+    def draw(self, surface):
+        """
+        Draw the overlay in the top right corner.
+
+        Args:
+            surface (pygame.Surface): Surface to draw on.
+        """
+        if not self.enabled:
+            return
+
+        if self._frames % REFRESH_FRAMES == 0 or not self._text:
+            self._refresh_text()
+
+        height = 10 + LINE_HEIGHT * len(self._text) + GRAPH_HEIGHT + 10
+        x = SCREEN_WIDTH - PANEL_WIDTH - 10
+        y = 10
+
+        panel = pygame.Surface((PANEL_WIDTH, height))
+        panel.set_alpha(190)
+        panel.fill((0, 0, 0))
+        surface.blit(panel, (x, y))
+
+        text_y = y + 8
+        for text in self._text:
+            surface.blit(text, (x + 8, text_y))
+            text_y += LINE_HEIGHT
+
+        self._draw_graph(surface, x + 8, text_y + 4,
+                         PANEL_WIDTH - 16, GRAPH_HEIGHT)
+
+    def _draw_graph(self, surface, x, y, width, height):
+        """Draw recent frame times, oldest on the left."""
+        count = min(self._frames, self.history - 1)
+        if count < 2:
+            return
+
+        budget = 1000 / FPS
+        scale = height / (budget * 2)  # Full height is two frame budgets
+
+        # Frame budget line
+        budget_y = y + height - int(budget * scale)
+        pygame.draw.line(surface, (80, 160, 80),
+                         (x, budget_y), (x + width, budget_y))
+
+        slots = (self._slot - count + np.arange(count)) % self.history
+        times = np.minimum(self._frame_times[slots] * 1000, budget * 2)
+        xs = x + np.arange(count) * width // max(1, self.history - 1)
+        ys = y + height - (times * scale).astype(int)
+        pygame.draw.lines(surface, (255, 215, 0), False,
+                          list(zip(xs.tolist(), ys.tolist())))
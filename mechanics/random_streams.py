@@ -0,0 +1,106 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Random Streams for Fish-O-Mania.
+
+Every part of the game that rolls dice draws from its own named stream
+(a random.Random) instead of the shared random module:
+    spawn: which fish spawns and where (FishManager)
+    fish: each fish's drift and animation speed (AnimatedFish)
+    scenery: seaweed and rock placement and looks (BackgroundManager,
+        Seaweed, Rock)
+    ripples: when and where ripples appear, and their size (Ripple)
+    bubbles: when and where bubbles appear, and their size (Bubble)
+    messages: which message is shown (classic mode's release message)
+
+All streams come from one seed. Because they are separate, a given seed
+gives the same fish, in the same places, whatever the background does
+with its own streams: more or fewer effects (bench/scene.py --effects)
+don't shift the fish. That keeps benchmark runs comparable and replays
+(mechanics/replay) exact.
+
+Classes take the stream as an optional rng argument, so a test or a
+benchmark can hand in its own; by default they use the shared streams.
+Reseeding updates the shared streams in place, so objects holding one
+follow the new seed.
+
+Usage:
+    from mechanics.random_streams import seed_streams, stream
+
+    seed_streams(1234)
+    x = stream("spawn").randint(50, 750)
+
+Functions:
+    stream: Get a named stream.
+    seed_streams: Seed every stream from one seed.
+    get_seed: The seed the streams were last seeded with.
+"""
+
+import random
+
+# Names of the game's streams
+STREAMS = ("spawn", "fish", "scenery", "ripples", "bubbles", "messages")
+
+# Shared streams by name, created on first use
+_streams = {}
+
+# Seed of the shared streams
+_seed = random.getrandbits(64)
+
+
+def _stream_seed(seed, name):
+    """
+    Seed of one stream.
+
+    A string seed is hashed with SHA-512 by random.Random, so every
+    stream gets an independent sequence that is the same in every run.
+    """
+    return f"{seed}:{name}"
+
+
+def stream(name):
+    """
+    Get a named stream.
+
+    Args:
+        name (str): Stream name, one of STREAMS.
+
+    Returns:
+        random.Random: The shared stream, the same object on every call.
+
+    Raises:
+        KeyError: If the name isn't one of STREAMS.
+    """
+    rng = _streams.get(name)
+    if rng is None:
+        if name not in STREAMS:
+            raise KeyError(f"Unknown random stream: {name}")
+        rng = _streams[name] = random.Random(_stream_seed(_seed, name))
+    return rng
+
+
+def seed_streams(seed=None):
+    """
+    Seed every stream from one seed.
+
+    Args:
+        seed (int): The seed, or None for a new random one.
+
+    Returns:
+        int: The seed used.
+    """
+    global _seed
+    _seed = seed if seed is not None else random.getrandbits(64)
+    for name, rng in _streams.items():
+        rng.seed(_stream_seed(_seed, name))
+    return _seed
+
+
+def get_seed():
+    """
+    Get the seed the streams were last seeded with.
+
+    Returns:
+        int: The seed.
+    """
+    return _seed
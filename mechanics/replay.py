@@ -0,0 +1,577 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Replays for Fish-O-Mania.
+
+Records what a mode's session was given each frame and plays it back.
+Everything that decides a game comes in through the driver (see
+mechanics/game_driver), so a replay is just the driver's input:
+    - the seed of the game's random streams, set when the session starts
+    - per tick: the frame's length in milliseconds (game time, see
+      mechanics/game_clock), the held keys the modes read, the keys
+      pressed, and the loudness (peak) of the microphone block read
+
+A tick is 6 bytes and the ticks are zlib compressed, so a minute of play
+takes a few kilobytes. The final score is stored with them, so playing a
+replay back shows whether the game still plays the same. Keys pressed in
+the same frame are played back in a fixed order (PRESSED_KEYS).
+
+Played back headless (bench/replay.py) a replay runs as fast as the
+machine can draw, which makes real player sessions into benchmarks,
+lets a performance regression be bisected with the same input and
+reproduces a bug report without anyone at the microphone.
+
+The spectral scream detector runs in another process, so its result
+depends on timing; recorded and replayed sessions use the peak instead.
+
+Recording is off by default. Turn it on with the FISH_REPLAYS
+environment variable (set to 1, or to the replay directory) or with
+"python main_menu.py --record-replays [DIR]".
+
+Functions:
+    start_replays: Record every session from now on.
+    is_recording: Whether sessions are recorded.
+    begin_session: Wrap a session's driver to record it.
+    end_session: Save a recorded session.
+    load_replay: Read a replay file.
+
+Classes:
+    Replay: A recorded session: mode, seed, ticks and final score.
+    RecordingDriver: Driver that records the driver it wraps.
+    ReplayDriver: Driver that plays a replay back.
+    ReplayRecorder: Microphone stand-in playing back the loudness.
+"""
+
+import os
+import random
+import struct
+import time
+import zlib
+from datetime import datetime
+
+import pygame
+
+from mechanics.constants import FPS
+from mechanics.game_log import fields, get_logger
+from mechanics.keyboard_recorder import SCREAM_KEY
+
+# Environment variable that turns recording on
+REPLAY_ENV = "FISH_REPLAYS"
+REPLAY_DIR = "replays"
+REPLAY_EXTENSION = ".fomr"
+
+MAGIC = b"FOMR"
+VERSION = 1
+
+# Magic, version, seed, final score, tick count; the mode name follows
+HEADER = struct.Struct("<4sBQqI")
+# Frame ms, held keys, pressed keys, microphone peak
+TICK = struct.Struct("<HBBH")
+
+# Keys the modes read while held (boat, keyboard scream), one bit each
+HELD_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, SCREAM_KEY)
+# Keys the modes act on when pressed, one bit each
+PRESSED_KEYS = (pygame.K_SPACE, pygame.K_p, pygame.K_RETURN,
+                pygame.K_ESCAPE, pygame.K_F3, pygame.K_F9)
+QUIT_BIT = 0x80
+
+MAX_FRAME_MS = 0xFFFF
+MAX_PEAK = 0xFFFF
+
+log = get_logger("replay")
+
+
+def _key_bits(keys, held):
+    """Bit mask of the held keys."""
+    bits = 0
+    for i, key in enumerate(keys):
+        if held[key]:
+            bits |= 1 << i
+    return bits
+
+
+class _HeldKeys:
+    """Stand-in for pygame.key.get_pressed() built from a bit mask."""
+
+    def __init__(self, bits):
+        self.bits = bits
+
+    def __getitem__(self, key):
+        if key in HELD_KEYS:
+            return bool(self.bits & (1 << HELD_KEYS.index(key)))
+        return False
+
+
+class Replay:
+    """
+    A recorded session.
+
+    Attributes:
+        mode (str): Mode name ("classic", "time_attack" or "endless").
+        seed (int): Seed of the game's random streams.
+        ticks (list): (frame ms, held bits, pressed bits, peak) per tick.
+        score (int): Final score, or None while recording.
+    """
+
+    def __init__(self, mode, seed, ticks=None, score=None):
+        """
+        Initialize a replay.
+
+        Args:
+            mode (str): Mode name.
+            seed (int): Seed of the game's random streams.
+            ticks (list): Recorded ticks.
+            score (int): Final score.
+        """
+        self.mode = mode
+        self.seed = seed
+        self.ticks = ticks if ticks is not None else []
+        self.score = score
+
+    def duration_ms(self):
+        """
+        Get the game time the replay covers.
+
+        Returns:
+            int: Sum of the frame times in milliseconds.
+        """
+        return sum(tick[0] for tick in self.ticks)
+
+    def to_bytes(self):
+        """
+        Encode the replay.
+
+        Returns:
+            bytes: Header, mode name and compressed ticks.
+        """
+        mode = self.mode.encode("ascii")
+        body = b"".join(TICK.pack(*tick) for tick in self.ticks)
+        score = 0 if self.score is None else self.score
+        return (HEADER.pack(MAGIC, VERSION, self.seed, score,
+                            len(self.ticks))
+                + bytes([len(mode)]) + mode + zlib.compress(body, 9))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Decode a replay.
+
+        Args:
+            data (bytes): Result of to_bytes().
+
+        Returns:
+            Replay: The decoded replay.
+
+        Raises:
+            ValueError: If data isn't a replay this version can read.
+        """
+        if len(data) < HEADER.size + 1:
+            raise ValueError("Not a replay: too short")
+        magic, version, seed, score, count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a replay")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+        offset = HEADER.size
+        length = data[offset]
+        mode = data[offset + 1:offset + 1 + length].decode("ascii")
+        body = zlib.decompress(data[offset + 1 + length:])
+        if len(body) != count * TICK.size:
+            raise ValueError("Replay is truncated")
+        ticks = list(TICK.iter_unpack(body))
+        return cls(mode, seed, ticks, score)
+
+    def save(self, path):
+        """
+        Write the replay to a file.
+
+        Args:
+            path (str): File to write.
+        """
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+def load_replay(path):
+    """
+    Read a replay file.
+
+    Args:
+        path (str): File written by Replay.save().
+
+    Returns:
+        Replay: The replay.
+    """
+    with open(path, "rb") as f:
+        return Replay.from_bytes(f.read())
+
+
+class RecordingDriver:
+    """
+    Driver that records the driver it wraps.
+
+    The session gets the wrapped driver's input unchanged; each tick the
+    keys and the microphone peak it saw are added to the replay.
+
+    Attributes:
+        driver (GameDriver): The wrapped driver.
+        replay (Replay): The replay being recorded.
+        seed (int): Seed the session sets the random streams to.
+    """
+
+    def __init__(self, driver, mode, seed=None):
+        """
+        Initialize the driver.
+
+        Args:
+            driver (GameDriver): Driver to record.
+            mode (str): Mode name.
+            seed (int): Seed for the session, or None for a new one.
+        """
+        self.driver = driver
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.replay = Replay(mode, self.seed)
+        self._held = 0
+        self._pressed = 0
+        self._peak = 0
+
+    def get_events(self):
+        """Get the wrapped driver's events and note the keys."""
+        events = self.driver.get_events()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self._pressed |= QUIT_BIT
+            elif event.type == pygame.KEYDOWN and event.key in PRESSED_KEYS:
+                self._pressed |= 1 << PRESSED_KEYS.index(event.key)
+        # Held keys only change when events are read
+        self._held = _key_bits(HELD_KEYS, self.driver.get_pressed())
+        return events
+
+    def get_pressed(self):
+        """Get the wrapped driver's held keys."""
+        return self.driver.get_pressed()
+
+    def create_recorder(self):
+        """Create the wrapped driver's recorder, noting each block's peak."""
+        recorder = self.driver.create_recorder()
+        read_frames = recorder.read_frames
+
+        def recorded_read_frames():
+            data = read_frames()
+            if data is not None:
+                self._peak = min(recorder.get_frame_peak(), MAX_PEAK)
+            return data
+
+        # Wrapped on the instance, so the mode still sees its own class
+        recorder.read_frames = recorded_read_frames
+        return recorder
+
+    def tick(self):
+        """End the frame on the wrapped driver and record the tick."""
+        frame_ms = self.driver.tick()
+        self.replay.ticks.append((min(frame_ms, MAX_FRAME_MS), self._held,
+                                  self._pressed, self._peak))
+        self._pressed = 0
+        self._peak = 0
+        return frame_ms
+
+
+class ReplayRecorder:
+    """
+    Microphone stand-in playing back a replay's loudness.
+
+    Each read returns the peak recorded for the tick. Implements the
+    parts of the RECORDER interface the mode loop uses.
+
+    Attributes:
+        rate (int): Sample rate in Hz.
+        frames_per_buffer (int): Samples per block.
+        frames (list): Peaks read since the last reset.
+        last_frame (int): Most recent peak.
+        last_read_time (float): perf_counter() after the last read.
+        key_name (str): Name of the keyboard scream key, for hints.
+    """
+
+    def __init__(self, driver, rate=44100, frames_per_buffer=735):
+        """
+        Initialize the recorder.
+
+        Args:
+            driver (ReplayDriver): Driver whose tick gives the peak.
+            rate (int): Sample rate in Hz.
+            frames_per_buffer (int): Samples per block.
+        """
+        self.driver = driver
+        self.rate = rate
+        self.frames_per_buffer = frames_per_buffer
+        self.key_name = pygame.key.name(SCREAM_KEY).upper()
+        self.frames = []
+        self.last_frame = None
+        self.last_read_time = None
+
+    def start_recording(self):
+        """Start reading and read the first block."""
+        self.frames = []
+        self.read_frames()
+
+    def pause_recording(self):
+        """Nothing to pause."""
+
+    def restart_recording(self):
+        """Nothing to restart."""
+
+    def close(self):
+        """Nothing to close."""
+
+    def read_frames(self):
+        """
+        Read the tick's block.
+
+        Returns:
+            int: The recorded peak.
+        """
+        peak = self.driver.peak()
+        self.frames.append(peak)
+        self.last_frame = peak
+        self.last_read_time = time.perf_counter()
+        return peak
+
+    def get_samples(self):
+        """
+        Get every block read since the last reset.
+
+        Returns:
+            bytes: One block of each peak's level per read.
+        """
+        return b"".join(
+            struct.pack(f"<{self.frames_per_buffer}h",
+                        *[min(peak, 32767)] * self.frames_per_buffer)
+            for peak in self.frames)
+
+    def get_peak(self):
+        """
+        Get the peak of every block since the last reset.
+
+        Returns:
+            int: The loudest recorded peak.
+        """
+        return max(self.frames, default=0)
+
+    def get_frame_peak(self):
+        """
+        Get the peak of the most recent block.
+
+        Returns:
+            int: The recorded peak.
+        """
+        return self.last_frame or 0
+
+    def get_onset_time(self, threshold):
+        """
+        Get when the most recent block reached a threshold.
+
+        Args:
+            threshold (int): Peak amplitude that counts as loud.
+
+        Returns:
+            float: The time of the read, or None if it was quieter.
+        """
+        if self.last_read_time is None or self.get_frame_peak() < threshold:
+            return None
+        return self.last_read_time
+
+
+class ReplayDriver:
+    """
+    Driver that plays a replay back.
+
+    Headless, the loop runs as fast as it can and tick() only records how
+    long each frame really took. In real time the frames are paced at
+    FPS, for watching. After the last tick a QUIT event ends the mode.
+
+    Attributes:
+        replay (Replay): The replay.
+        seed (int): Seed the session sets the random streams to.
+        realtime (bool): Pace the frames for watching.
+        frame (int): Current tick.
+        frame_times (list): Seconds each frame really took.
+    """
+
+    def __init__(self, replay, realtime=False, clock=None, fps=FPS):
+        """
+        Initialize the driver.
+
+        Args:
+            replay (Replay): Replay to play.
+            realtime (bool): Pace the frames for watching.
+            clock (pygame.time.Clock): Clock for real time, or None.
+            fps (int): Frame rate in real time.
+        """
+        self.replay = replay
+        self.seed = replay.seed
+        self.realtime = realtime
+        self.clock = clock if clock is not None else pygame.time.Clock()
+        self.fps = fps
+        self.frame = 0
+        self.frame_times = []
+        self._last_tick = None
+
+    def _tick_data(self):
+        """The current tick, or None past the end."""
+        if self.frame < len(self.replay.ticks):
+            return self.replay.ticks[self.frame]
+        return None
+
+    def get_events(self):
+        """
+        Get the recorded key presses for this tick.
+
+        Returns:
+            list: pygame events.
+        """
+        # Drain real events so the SDL queue does not fill up; closing
+        # the window stops a replay being watched
+        real = pygame.event.get()
+        tick = self._tick_data()
+        if tick is None or any(e.type == pygame.QUIT for e in real):
+            return [pygame.event.Event(pygame.QUIT)]
+
+        pressed = tick[2]
+        events = [pygame.event.Event(pygame.KEYDOWN, key=key, mod=0)
+                  for i, key in enumerate(PRESSED_KEYS)
+                  if pressed & (1 << i)]
+        if pressed & QUIT_BIT:
+            events.append(pygame.event.Event(pygame.QUIT))
+        return events
+
+    def get_pressed(self):
+        """
+        Get the recorded held keys for this tick.
+
+        Returns:
+            Sequence indexed by pygame key constants.
+        """
+        tick = self._tick_data()
+        return _HeldKeys(0 if tick is None else tick[1])
+
+    def peak(self):
+        """
+        Get the recorded microphone peak for this tick.
+
+        Returns:
+            int: Peak amplitude.
+        """
+        tick = self._tick_data()
+        return 0 if tick is None else tick[3]
+
+    def create_recorder(self):
+        """
+        Create the microphone stand-in.
+
+        Returns:
+            ReplayRecorder: Recorder playing back the peaks, started.
+        """
+        recorder = ReplayRecorder(self)
+        recorder.start_recording()
+        return recorder
+
+    def tick(self):
+        """
+        End the frame.
+
+        Returns:
+            int: The recorded frame length in milliseconds.
+        """
+        if self.realtime:
+            self.clock.tick(self.fps)
+        now = time.perf_counter()
+        if self._last_tick is not None:
+            self.frame_times.append(now - self._last_tick)
+        self._last_tick = now
+
+        tick = self._tick_data()
+        self.frame += 1
+        return 0 if tick is None else tick[0]
+
+
+# Directory sessions are recorded to, None while off
+_directory = None
+
+
+def start_replays(directory=None):
+    """
+    Record every session from now on.
+
+    Args:
+        directory (str): Replay directory, defaults to replays.
+    """
+    global _directory
+    _directory = directory or REPLAY_DIR
+
+
+def is_recording():
+    """
+    Check whether sessions are recorded.
+
+    Returns:
+        bool: True after start_replays().
+    """
+    return _directory is not None
+
+
+def begin_session(mode, driver):
+    """
+    Wrap a session's driver to record it.
+
+    Args:
+        mode (str): Mode name.
+        driver (GameDriver): The session's driver.
+
+    Returns:
+        GameDriver: A RecordingDriver while recording (and the driver
+            isn't a replay already), otherwise driver itself.
+    """
+    if _directory is None or isinstance(driver, ReplayDriver):
+        return driver
+    return RecordingDriver(driver, mode)
+
+
+def end_session(driver, score):
+    """
+    Save a recorded session.
+
+    The final score is stored in any RecordingDriver's replay; the file
+    is only written while recording is on.
+
+    Args:
+        driver (GameDriver): The driver begin_session() returned.
+        score (int): Final score.
+
+    Returns:
+        str: Path of the replay, or None if nothing was written.
+    """
+    if not isinstance(driver, RecordingDriver):
+        return None
+    replay = driver.replay
+    replay.score = score
+    if _directory is None:
+        return None
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(_directory,
+                        f"{replay.mode}-{stamp}{REPLAY_EXTENSION}")
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        replay.save(path)
+    except OSError as e:
+        log.error("Error writing replay: %s", e,
+                  extra=fields(error=str(e)))
+        return None
+    log.info("Replay: %d ticks written to %s", len(replay.ticks), path,
+             extra=fields(ticks=len(replay.ticks), path=path))
+    return path
+
+
+# Turn recording on from the environment for any entry point
+_env_dir = os.environ.get(REPLAY_ENV)
+if _env_dir:
+    start_replays(None if _env_dir == "1" else _env_dir)
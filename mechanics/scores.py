@@ -6,6 +6,29 @@ High Score System
 This module handles saving and loading high scores to/from a JSON file.
 It supports all 3 game modes with only time attack having an added metric.
 
+Parsed scores are kept in memory by a ScoreStore and only re-read when
+the file's modification time or size changes, so the game over screens
+and the high scores overlay can query scores every frame.
+
+Finished sessions are appended to an append-only journal next to the
+score file (see mechanics/session_journal.py) and folded into the
+summary, which is periodically compacted back into highscores.json.
+
+Alternatively, use_backend("sqlite") stores every session in an SQLite
+database with indexes for top-N per mode, per-day and per-player bests,
+for shared kiosks that want a real leaderboard. The module functions
+work the same with either backend.
+
+Saving never touches the disk on the calling thread: the new scores are
+visible to readers immediately, and a background ScoreWriter performs
+the journal appends and writes the summary atomically (temp file, fsync,
+rename).
+
+Classes:
+    ScoreWriter: Background thread that performs score file I/O.
+    ScoreStore: In-memory view of the score file and journal.
+    SqliteScoreStore: Leaderboard database with the same interface.
+
 Functions:
     get_default_scores: Returns the default score structure.
     load_scores: Loads scores from file.
@@ -14,15 +37,46 @@ Functions:
     get_high_score: Gets the high score for a specific mode.
     get_all_high_scores: Gets all high scores.
     reset_scores: Resets all scores to zero.
+    flush_scores: Waits until queued score writes reach the disk.
+    get_top_scores: Gets the best sessions for a mode, best first.
+    set_player: Sets the player name recorded with new sessions.
+    use_backend: Switches between the JSON and SQLite backends.
 """
 
+import atexit
+import copy
 import json
 import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import closing, contextmanager
 from datetime import datetime
 
+from mechanics.game_log import fields, get_logger
+from mechanics.metrics import SCORE_WRITE_SECONDS, SCORE_WRITES
+from mechanics.tracing import instant, span
+from mechanics.session_journal import (
+    COMPACT_THRESHOLD,
+    SessionJournal,
+    apply_session,
+    journal_path,
+    make_record,
+)
+
 # File path for persistent score storage
 SCORES_FILE = "highscores.json"
 
+# Database used by the SQLite backend
+SCORES_DB_FILE = "highscores.db"
+
+# Name recorded with sessions when no player name was set
+DEFAULT_PLAYER = "Player"
+
+log = get_logger("scores")
+
 
 def get_default_scores():
     """
@@ -51,27 +105,47 @@ def get_default_scores():
     }
 
 
-def load_scores():
+def _file_signature(path):
+    """
+    Identify the current version of a file on disk.
+
+    Args:
+        path (str): File to check.
+
+    Returns:
+        tuple: (path, mtime in ns, size), with None values if missing.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return path, None, None
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _read_scores_file(path):
     """
-    Load scores from the JSON file.
+    Read and parse a score file, merged with the defaults.
 
     If the file doesn't exist or is corrupted, returns default scores.
     Also merges with defaults to handle any newly added fields.
 
+    Args:
+        path (str): Score file to read.
+
     Returns:
         dict: Score data for all game modes.
     """
     # If file doesn't exist, return defaults (first time playing)
-    if not os.path.exists(SCORES_FILE):
+    if not os.path.exists(path):
         return get_default_scores()
 
     # Check if file is empty
-    if os.path.getsize(SCORES_FILE) == 0:
+    if os.path.getsize(path) == 0:
         return get_default_scores()
 
     # File exists, try to read it
     try:
-        with open(SCORES_FILE, 'r') as f:
+        with open(path, 'r') as f:
             scores = json.load(f)
     except (json.JSONDecodeError, IOError) as e:
         # File corrupted or unreadable, return defaults
@@ -94,68 +168,947 @@ def load_scores():
     return scores
 
 
+def _atomic_write_json(path, data):
+    """
+    Write JSON so that readers only ever see the old or the new file.
+
+    The data goes to a temporary file in the same directory, is flushed
+    and fsynced, and then renamed over the target.
+
+    Args:
+        path (str): Destination file.
+        data: JSON-serialisable data.
+
+    Raises:
+        OSError: If the file could not be written.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".scores-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class ScoreWriter:
+    """
+    Background thread that performs score file I/O in order.
+
+    Jobs run one at a time in submission order. A job submitted with a
+    key replaces a still-queued job with the same key, so a burst of
+    summary saves costs a single disk write.
+    """
+
+    def __init__(self):
+        """Initialize the writer. The thread starts on first submit."""
+        self._condition = threading.Condition()
+        self._queue = deque()  # [key, job, callback] entries
+        self._busy = False
+        self._thread = None
+
+    def submit(self, job, key=None, callback=None):
+        """
+        Queue a job for the writer thread.
+
+        Args:
+            job (callable): Performs the I/O; may raise OSError.
+            key: If not None, replaces a queued job with the same key.
+            callback (callable): Called as callback(ok) on the writer
+                thread once the job finished or failed.
+        """
+        instant("score write queued", "scores")
+        with self._condition:
+            for entry in self._queue:
+                if key is not None and entry[0] == key:
+                    entry[1] = job
+                    entry[2] = callback
+                    break
+            else:
+                self._queue.append([key, job, callback])
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="ScoreWriter", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout=None):
+        """
+        Block until every queued job has run.
+
+        Args:
+            timeout (float): Maximum seconds to wait, or None for no limit.
+
+        Returns:
+            bool: True if all jobs finished, False on timeout.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._busy, timeout)
+
+    def _run(self):
+        """Writer thread loop."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue)
+                _, job, callback = self._queue.popleft()
+                self._busy = True
+
+            start = time.perf_counter()
+            try:
+                with span("score write", "scores"):
+                    job()
+                ok = True
+            except (OSError, TypeError, ValueError, sqlite3.Error) as e:
+                log.error("Error saving scores: %s", e,
+                          extra=fields(error=str(e)))
+                ok = False
+            SCORE_WRITE_SECONDS.observe(time.perf_counter() - start)
+            SCORE_WRITES.inc(("ok" if ok else "error",))
+
+            if callback is not None:
+                callback(ok)
+
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+
+
+# Shared writer used by all score stores
+_writer = ScoreWriter()
+atexit.register(_writer.flush, 5.0)
+
+
+def _replace_summary(path, journal, scores):
+    """
+    Writer job: make scores the new summary and empty the journal.
+
+    Args:
+        path (str): Summary score file.
+        journal (SessionJournal): Journal belonging to the file.
+        scores (dict): New summary.
+    """
+    with journal.exclusive() as f:
+        _atomic_write_json(path, scores)
+        f.truncate(0)
+
+
+def _compact(path, journal):
+    """
+    Writer job: fold the whole journal into the summary file.
+
+    Runs under the journal's exclusive lock so no other instance can
+    append between reading the journal and truncating it.
+
+    Args:
+        path (str): Summary score file.
+        journal (SessionJournal): Journal belonging to the file.
+    """
+    with journal.exclusive() as f:
+        scores = _read_scores_file(path)
+        records, _ = journal.read_from(0)
+        for record in records:
+            _apply_record(scores, record)
+        _atomic_write_json(path, scores)
+        f.truncate(0)
+
+
+def _apply_record(scores, record):
+    """
+    Fold a journal record into a full score summary.
+
+    Args:
+        scores (dict): Score data for all modes (modified in place).
+        record (dict): Session record.
+
+    Returns:
+        tuple: (is_new_high, old_score)
+    """
+    mode = record["mode"]
+    if mode not in scores:
+        scores[mode] = get_default_scores()[mode]
+    return apply_session(scores[mode], record)
+
+
+class ScoreStore:
+    """
+    In-memory view of the high score summary and session journal.
+
+    The summary file holds the best score per mode as of the last
+    compaction; finished sessions are appended to the journal next to
+    it. The store keeps the merged result in memory and serves reads
+    from there. Each read only stats the two files: the summary is
+    re-parsed when its mtime or size changes, and only journal records
+    appended since the last read are folded in, so sessions recorded by
+    other game instances show up without re-reading everything.
+
+    While one of our own writes is still queued on the writer thread
+    the in-memory copy is newer than the files and is served as is.
+
+    Attributes:
+        path (str): Summary file backing this store. Defaults to the
+            module-level SCORES_FILE, looked up on every access.
+    """
+
+    def __init__(self, path=None):
+        """
+        Initialize the store.
+
+        Args:
+            path (str): Score file to use, or None for SCORES_FILE.
+        """
+        self._path = path
+        self._scores = None
+        self._signature = None
+        self._journal_offset = 0
+
+        # Writes are numbered; the files are current once the newest one
+        # has been written
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._written_generation = 0
+        self._pending_path = None
+
+    @property
+    def path(self):
+        """str: Summary file currently backing this store."""
+        return self._path if self._path is not None else SCORES_FILE
+
+    @property
+    def journal(self):
+        """SessionJournal: Journal belonging to the summary file."""
+        return SessionJournal(journal_path(self.path))
+
+    def load(self):
+        """
+        Get the cached scores, refreshing them only if the files changed.
+
+        The returned dict is shared with the cache and must not be
+        modified; use load_scores() for a private copy.
+
+        Returns:
+            dict: Score data for all game modes.
+        """
+        path = self.path
+        with self._lock:
+            if (self._generation != self._written_generation
+                    and path == self._pending_path):
+                # Our own write is still queued; memory is authoritative
+                return self._scores
+
+        scores = self._scores
+        signature = _file_signature(path)
+        offset = self._journal_offset
+        if scores is None or signature != self._signature:
+            scores = _read_scores_file(path)
+            offset = 0
+
+        journal = self.journal
+        size = journal.size()
+        if size < offset:
+            # Compacted by another instance since our last read
+            signature = _file_signature(path)
+            scores = _read_scores_file(path)
+            offset = 0
+
+        if size > offset:
+            records, offset = journal.read_from(offset)
+            if records:
+                if scores is self._scores:
+                    scores = copy.deepcopy(scores)
+                for record in records:
+                    _apply_record(scores, record)
+
+        with self._lock:
+            self._scores = scores
+            self._signature = signature
+            self._journal_offset = offset
+        return scores
+
+    def record_session(self, mode, score, fish_count=0, time_played=0,
+                       player=DEFAULT_PLAYER):
+        """
+        Record a finished session.
+
+        The summary in memory is updated immediately; the record is
+        appended to the journal on the writer thread, which compacts
+        the journal once it grows past COMPACT_THRESHOLD.
+
+        Args:
+            mode (str): Game mode ("classic", "time_attack", or "endless").
+            score (int): The player score.
+            fish_count (int): Number of fish caught this session.
+            time_played (float): Time played in seconds.
+            player (str): Player name.
+
+        Returns:
+            tuple: (is_new_high, old_score)
+        """
+        scores = copy.deepcopy(self.load())
+        record = make_record(mode, score, fish_count, time_played,
+                             player=player)
+        result = _apply_record(scores, record)
+
+        path = self.path
+        journal = self.journal
+
+        def job():
+            if journal.append([record]) >= COMPACT_THRESHOLD:
+                _compact(path, journal)
+
+        self._queue_write(path, scores, job)
+        return result
+
+    def save(self, scores):
+        """
+        Replace the summary and queue it to be written to disk.
+
+        Readers see the new scores immediately. On the writer thread the
+        summary file is replaced atomically and the journal emptied.
+
+        Args:
+            scores (dict): Score data to save.
+
+        Returns:
+            bool: True once the save has been queued.
+        """
+        path = self.path
+        journal = self.journal
+        snapshot = copy.deepcopy(scores)
+        self._queue_write(
+            path, snapshot,
+            lambda: _replace_summary(path, journal, snapshot),
+            key=("replace", path))
+        return True
+
+    def _queue_write(self, path, scores, job, key=None):
+        """
+        Publish scores in memory and queue the job that persists them.
+
+        Args:
+            path (str): Summary file the job writes.
+            scores (dict): New in-memory scores.
+            job (callable): Writer job.
+            key: Coalescing key for the writer.
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._scores = scores
+            self._pending_path = path
+
+        _writer.submit(job, key=key,
+                       callback=lambda ok: self._on_written(generation))
+
+    def _on_written(self, generation):
+        """
+        Writer thread callback after a job finished (or failed).
+
+        Once the newest write has landed the next read goes back to the
+        files, which now contain everything we wrote.
+
+        Args:
+            generation (int): Write number of the finished job.
+        """
+        with self._lock:
+            if generation == self._generation:
+                self._written_generation = generation
+
+    def top_scores(self, mode, limit=10, offset=0):
+        """
+        Get the best sessions for a mode, best first.
+
+        The JSON summary only keeps the best session per mode, so this
+        returns at most one entry.
+
+        Args:
+            mode (str): Game mode to query.
+            limit (int): Maximum number of entries.
+            offset (int): Number of entries to skip (for paging).
+
+        Returns:
+            list: Dicts with player, score, fish_count, time_played, date.
+        """
+        entry = self.load().get(mode)
+        if not entry or entry["high_score"] <= 0:
+            return []
+        best = {
+            "player": None,
+            "score": entry["high_score"],
+            "fish_count": entry.get("best_fish_count", 0),
+            "time_played": entry.get("best_time", 0),
+            "date": entry.get("date"),
+        }
+        return [best][offset:offset + limit]
+
+    def flush(self, timeout=None):
+        """
+        Block until queued writes have finished.
+
+        Args:
+            timeout (float): Maximum seconds to wait, or None for no limit.
+
+        Returns:
+            bool: True if all writes finished, False on timeout.
+        """
+        return _writer.flush(timeout)
+
+    def compact(self):
+        """Fold the journal into the summary file now (blocking)."""
+        path = self.path
+        journal = self.journal
+        _writer.submit(lambda: _compact(path, journal))
+        self.flush()
+
+    def invalidate(self):
+        """
+        Drop the cached scores so the next read hits the files.
+
+        Doesn't wait for the writer thread: while one of our own writes
+        is still queued the scores in memory are kept, and the files are
+        read again once it has landed.
+        """
+        with self._lock:
+            if self._generation == self._written_generation:
+                self._scores = None
+            self._signature = None
+            self._journal_offset = 0
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    fish_count INTEGER NOT NULL,
+    time_played REAL NOT NULL,
+    played_at REAL NOT NULL,
+    day TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_mode_score
+    ON sessions (mode, score DESC, played_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_mode_day_score
+    ON sessions (mode, day, score DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_player_mode_score
+    ON sessions (player, mode, score DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_mode_fish
+    ON sessions (mode, fish_count DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_mode_time
+    ON sessions (mode, time_played DESC);
+"""
+
+_INSERT_SESSION = (
+    "INSERT INTO sessions (player, mode, score, fish_count, time_played, "
+    "played_at, day) VALUES (?, ?, ?, ?, ?, ?, ?)")
+
+
+def _format_date(timestamp):
+    """Format a unix timestamp the way the score summary stores dates."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+
+def _session_row(row):
+    """Convert a (player, score, fish, time, played_at) row to a dict."""
+    player, score, fish_count, time_played, played_at = row
+    return {
+        "player": player,
+        "score": score,
+        "fish_count": fish_count,
+        "time_played": time_played,
+        "date": _format_date(played_at),
+    }
+
+
+class SqliteScoreStore:
+    """
+    SQLite-backed leaderboard with the same interface as ScoreStore.
+
+    Every finished session is stored with the player name, so besides
+    the best-per-mode summary the store can answer top-N, per-day and
+    per-player queries straight from indexes. The summary is cached in
+    memory and only recomputed when the database changed (checked with
+    PRAGMA data_version, which also sees commits by other processes).
+    Inserts run on the shared writer thread. Queries never wait for it:
+    they read the committed rows and merge in the sessions still queued.
+
+    Attributes:
+        path (str): Database file.
+    """
+
+    def __init__(self, path=None):
+        """
+        Open (and if needed create) the leaderboard database.
+
+        Args:
+            path (str): Database file, or None for SCORES_DB_FILE.
+        """
+        self.path = path if path is not None else SCORES_DB_FILE
+        self._conn = self._connect()
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+        self._scores = None
+        self._data_version = None
+
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._written_generation = 0
+        # (generation, replace, sessions) of the writes still queued
+        self._pending = []
+
+    def _connect(self):
+        """Open a connection with the settings every user needs."""
+        conn = sqlite3.connect(self.path, timeout=5.0,
+                               check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _write(self, statements):
+        """
+        Writer job: run statements in one transaction on a fresh connection.
+
+        Args:
+            statements (list): (sql, parameters) pairs.
+        """
+        with closing(self._connect()) as conn:
+            with conn:
+                for sql, params in statements:
+                    conn.execute(sql, params)
+
+    def _queue_write(self, scores, sessions, replace=False):
+        """
+        Publish scores in memory and queue the inserts that persist them.
+
+        Args:
+            scores (dict): New in-memory summary.
+            sessions (list): (player, mode, score, fish_count,
+                time_played, played_at, day) rows to insert.
+            replace (bool): Delete every session first.
+        """
+        statements = [("DELETE FROM sessions", ())] if replace else []
+        statements += [(_INSERT_SESSION, row) for row in sessions]
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._scores = scores
+            self._pending.append((generation, replace, sessions))
+
+        _writer.submit(lambda: self._write(statements),
+                       callback=lambda ok: self._on_written(generation))
+
+    def _on_written(self, generation):
+        """Writer thread callback after a job finished (or failed)."""
+        with self._lock:
+            self._pending = [entry for entry in self._pending
+                             if entry[0] > generation]
+            if generation == self._generation:
+                self._written_generation = generation
+
+    def _committed(self, row):
+        """Check whether a queued session row is in the database."""
+        player, mode, score, _, _, played_at, _ = row
+        return self._conn.execute(
+            "SELECT 1 FROM sessions WHERE player = ? AND mode = ? "
+            "AND score = ? AND played_at = ? LIMIT 1",
+            (player, mode, score, played_at)).fetchone() is not None
+
+    @contextmanager
+    def _reading(self):
+        """
+        Read the committed rows in one transaction, with the queued ones.
+
+        Yields:
+            tuple: (replaced, queued). replaced is True if a queued save()
+                replaces every session, so the database must be ignored;
+                queued are the session rows (as given to _queue_write)
+                that aren't in the database yet.
+        """
+        # Copy the queue before the read starts: a session is then either
+        # in the copy or already committed and visible to the read
+        with self._lock:
+            pending = list(self._pending)
+        replaced = False
+        queued = []
+        for _, replace, sessions in pending:
+            if replace:
+                replaced = True
+                queued = []
+            queued.extend(sessions)
+
+        self._conn.execute("BEGIN")
+        try:
+            if not replaced:
+                queued = [row for row in queued if not self._committed(row)]
+            yield replaced, queued
+        finally:
+            self._conn.commit()
+
+    def _query_summary(self):
+        """
+        Build the best-per-mode summary from the database.
+
+        Returns:
+            dict: Score data for all game modes.
+        """
+        scores = get_default_scores()
+        modes = [row[0] for row in self._conn.execute(
+            "SELECT DISTINCT mode FROM sessions")]
+
+        for mode in modes:
+            if mode not in scores:
+                continue
+            entry = scores[mode]
+            best = self._conn.execute(
+                "SELECT score, played_at FROM sessions WHERE mode = ? "
+                "ORDER BY score DESC, played_at LIMIT 1", (mode,)).fetchone()
+            if best and best[0] > 0:
+                entry["high_score"] = best[0]
+                entry["date"] = _format_date(best[1])
+
+            fish = self._conn.execute(
+                "SELECT MAX(fish_count) FROM sessions WHERE mode = ?",
+                (mode,)).fetchone()[0]
+            entry["best_fish_count"] = fish or 0
+
+            if "best_time" in entry:
+                best_time = self._conn.execute(
+                    "SELECT MAX(time_played) FROM sessions WHERE mode = ?",
+                    (mode,)).fetchone()[0]
+                entry["best_time"] = best_time or 0
+
+        return scores
+
+    def load(self):
+        """
+        Get the cached summary, recomputing it only if the database changed.
+
+        The returned dict is shared with the cache and must not be
+        modified; use load_scores() for a private copy.
+
+        Returns:
+            dict: Score data for all game modes.
+        """
+        with self._lock:
+            if self._generation != self._written_generation:
+                # Our own insert is still queued; memory is authoritative
+                return self._scores
+
+        data_version = self._conn.execute(
+            "PRAGMA data_version").fetchone()[0]
+        if self._scores is None or data_version != self._data_version:
+            scores = self._query_summary()
+            with self._lock:
+                self._scores = scores
+                self._data_version = data_version
+        return self._scores
+
+    def record_session(self, mode, score, fish_count=0, time_played=0,
+                       player=DEFAULT_PLAYER):
+        """
+        Record a finished session.
+
+        Args:
+            mode (str): Game mode ("classic", "time_attack", or "endless").
+            score (int): The player score.
+            fish_count (int): Number of fish caught this session.
+            time_played (float): Time played in seconds.
+            player (str): Player name.
+
+        Returns:
+            tuple: (is_new_high, old_score)
+        """
+        scores = copy.deepcopy(self.load())
+        record = make_record(mode, score, fish_count, time_played,
+                             player=player)
+        result = _apply_record(scores, record)
+
+        day = datetime.fromtimestamp(record["timestamp"]).strftime("%Y-%m-%d")
+        self._queue_write(scores, [(player, mode, score, fish_count,
+                                    time_played, record["timestamp"], day)])
+        return result
+
+    def save(self, scores):
+        """
+        Replace all sessions with one summary session per mode.
+
+        Used for resets and for importing a JSON summary. Modes whose
+        summary is all zeros get no session at all.
+
+        Args:
+            scores (dict): Score data to save.
+
+        Returns:
+            bool: True once the save has been queued.
+        """
+        snapshot = copy.deepcopy(scores)
+        sessions = []
+        for mode, entry in snapshot.items():
+            high_score = entry.get("high_score", 0)
+            fish_count = entry.get("best_fish_count", 0)
+            best_time = entry.get("best_time", 0)
+            if not (high_score or fish_count or best_time):
+                continue
+            played_at = datetime.now().timestamp()
+            if entry.get("date"):
+                played_at = datetime.strptime(
+                    entry["date"], "%Y-%m-%d %H:%M").timestamp()
+            day = datetime.fromtimestamp(played_at).strftime("%Y-%m-%d")
+            sessions.append((DEFAULT_PLAYER, mode, high_score, fish_count,
+                             best_time, played_at, day))
+
+        self._queue_write(snapshot, sessions, replace=True)
+        return True
+
+    def top_scores(self, mode, limit=10, offset=0):
+        """
+        Get the best sessions for a mode, best first.
+
+        Args:
+            mode (str): Game mode to query.
+            limit (int): Maximum number of entries.
+            offset (int): Number of entries to skip (for paging).
+
+        Returns:
+            list: Dicts with player, score, fish_count, time_played, date.
+        """
+        with self._reading() as (replaced, queued):
+            queued = [row[:1] + row[2:6] for row in queued if row[1] == mode]
+            # With sessions to merge, fetch every row up to the page's end
+            window = (limit + offset, 0) if queued else (limit, offset)
+            rows = [] if replaced else self._conn.execute(
+                "SELECT player, score, fish_count, time_played, played_at "
+                "FROM sessions WHERE mode = ? "
+                "ORDER BY score DESC, played_at LIMIT ? OFFSET ?",
+                (mode, *window)).fetchall()
+        if queued:
+            rows = sorted(rows + queued, key=lambda row: (-row[1], row[4]))
+            rows = rows[offset:offset + limit]
+        return [_session_row(row) for row in rows]
+
+    def daily_bests(self, mode, days=7):
+        """
+        Get the best session of each of the most recent days played.
+
+        Args:
+            mode (str): Game mode to query.
+            days (int): Number of days to return.
+
+        Returns:
+            list: Dicts with day plus the session fields, newest day first.
+        """
+        with self._reading() as (replaced, queued):
+            rows = [] if replaced else self._conn.execute(
+                "SELECT day, player, MAX(score), fish_count, time_played, "
+                "played_at FROM sessions WHERE mode = ? "
+                "GROUP BY day ORDER BY day DESC LIMIT ?",
+                (mode, days)).fetchall()
+
+        bests = {row[0]: row for row in rows}
+        for row in queued:
+            day = row[6]
+            if row[1] == mode and (day not in bests
+                                   or row[2] > bests[day][2]):
+                bests[day] = (day,) + row[:1] + row[2:6]
+        rows = sorted(bests.values(), key=lambda row: row[0],
+                      reverse=True)[:days]
+        return [{"day": row[0], **_session_row(row[1:])} for row in rows]
+
+    def player_bests(self, player):
+        """
+        Get a player's profile: best session per mode plus totals.
+
+        Args:
+            player (str): Player name.
+
+        Returns:
+            dict: {"sessions", "total_fish", "total_time", "bests"} where
+                bests maps mode to that mode's best session.
+        """
+        bests = {}
+        sessions, total_fish, total_time = 0, 0, 0
+        with self._reading() as (replaced, queued):
+            if not replaced:
+                for mode in get_default_scores():
+                    row = self._conn.execute(
+                        "SELECT player, score, fish_count, time_played, "
+                        "played_at FROM sessions WHERE player = ? "
+                        "AND mode = ? ORDER BY score DESC LIMIT 1",
+                        (player, mode)).fetchone()
+                    if row:
+                        bests[mode] = row
+
+                sessions, total_fish, total_time = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(fish_count), 0), "
+                    "COALESCE(SUM(time_played), 0) FROM sessions "
+                    "WHERE player = ?", (player,)).fetchone()
+
+        for row in queued:
+            if row[0] != player:
+                continue
+            mode = row[1]
+            sessions += 1
+            total_fish += row[3]
+            total_time += row[4]
+            if mode not in bests or row[2] > bests[mode][1]:
+                bests[mode] = row[:1] + row[2:6]
+        return {
+            "sessions": sessions,
+            "total_fish": total_fish,
+            "total_time": total_time,
+            "bests": {mode: _session_row(row) for mode, row in bests.items()},
+        }
+
+    def flush(self, timeout=None):
+        """
+        Block until queued writes have finished.
+
+        Args:
+            timeout (float): Maximum seconds to wait, or None for no limit.
+
+        Returns:
+            bool: True if all writes finished, False on timeout.
+        """
+        return _writer.flush(timeout)
+
+    def invalidate(self):
+        """
+        Drop the cached summary so the next read queries the database.
+
+        Like ScoreStore.invalidate, keeps the summary of our own inserts
+        still queued instead of waiting for them.
+        """
+        with self._lock:
+            if self._generation == self._written_generation:
+                self._scores = None
+            self._data_version = None
+
+    def close(self):
+        """Wait for queued writes and close the read connection."""
+        self.flush()
+        self._conn.close()
+
+
+# Shared store used by the module-level functions
+_store = ScoreStore()
+
+# Player name recorded with new sessions
+_player = DEFAULT_PLAYER
+
+
+def use_backend(name, path=None):
+    """
+    Choose where the module-level functions keep scores.
+
+    Args:
+        name (str): "json" for highscores.json plus the session journal,
+            or "sqlite" for the leaderboard database.
+        path (str): File to use, or None for SCORES_FILE / SCORES_DB_FILE.
+
+    Returns:
+        ScoreStore or SqliteScoreStore: The new active store.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    global _store
+    if name == "json":
+        store = ScoreStore(path)
+    elif name == "sqlite":
+        store = SqliteScoreStore(path)
+    else:
+        raise ValueError(f"Unknown score backend: {name}")
+
+    old_store = _store
+    old_store.flush()
+    if isinstance(old_store, SqliteScoreStore):
+        old_store.close()
+    _store = store
+    return store
+
+
+def get_score_store():
+    """
+    Get the store behind the module-level functions.
+
+    Returns:
+        ScoreStore or SqliteScoreStore: The active store.
+    """
+    return _store
+
+
+def set_player(name):
+    """
+    Set the player name recorded with new sessions.
+
+    Args:
+        name (str): Player name, or None/empty for DEFAULT_PLAYER.
+    """
+    global _player
+    _player = name or DEFAULT_PLAYER
+
+
+def load_scores():
+    """
+    Load scores, served from memory unless the files changed.
+
+    If the file doesn't exist or is corrupted, returns default scores.
+    Also merges with defaults to handle any newly added fields.
+
+    Returns:
+        dict: Score data for all game modes (a copy, safe to modify).
+    """
+    return copy.deepcopy(_store.load())
+
+
 def save_scores(scores):
     """
     Save scores to the JSON file.
 
+    The new scores are visible to readers right away; the file itself is
+    written atomically on a background thread (see flush_scores). Saving
+    replaces the summary, so the session journal is emptied as well.
+
     Args:
         scores (dict): Score data to save.
 
     Returns:
-        bool: True if save was successful, False otherwise.
+        bool: True once the save has been queued.
     """
-    try:
-        with open(SCORES_FILE, 'w') as f:
-            json.dump(scores, f, indent=2)
-        return True
-    except IOError as e:
-        print(f"Error saving scores: {e}")
-        return False
+    return _store.save(scores)
 
 
-def update_high_score(mode, score, fish_count=0, time_played=0):
+def update_high_score(mode, score, fish_count=0, time_played=0,
+                      player=None):
     """
     Update high score for a game mode if the new score is higher
 
     Also updates best fish count and best time (for endless mode)
-    if records are beaten
+    if records are beaten. The session is appended to the session
+    journal (or leaderboard database) rather than rewriting the file.
 
     Args:
         mode (str): Game mode ("classic", "time_attack", or "endless")
         score (int): The player score
         fish_count (int): Number of fish caught this session
         time_played (float): Time played in seconds (endless mode only)
+        player (str): Player name, defaults to the one from set_player
 
     Returns:
         dict: Contains "is_new_high", "old_score", and "new_score"
     """
-    scores = load_scores()
-
-    # Ensure mode exists in scores
-    if mode not in scores:
-        scores[mode] = get_default_scores()[mode]
-
-    old_score = scores[mode]["high_score"]
-    is_new_high = score > old_score
-
-    # Update high score if beaten
-    if is_new_high:
-        scores[mode]["high_score"] = score
-        scores[mode]["date"] = (
-            datetime.now().strftime("%Y-%m-%d %H:%M"))
-
-    # Update best fish count if beaten
-    current_best_fish = scores[mode].get("best_fish_count", 0)
-    if fish_count > current_best_fish:
-        scores[mode]["best_fish_count"] = fish_count
-
-    # Update best time for endless mode
-    if mode == "endless":
-        current_best_time = scores[mode].get("best_time", 0)
-        if time_played > current_best_time:
-            scores[mode]["best_time"] = time_played
-
-    save_scores(scores)
+    is_new_high, old_score = _store.record_session(
+        mode, score, fish_count, time_played,
+        player=player or _player)
 
     return {
         "is_new_high": is_new_high,
@@ -174,7 +1127,7 @@ def get_high_score(mode):
     Returns:
         int: High score for the mode, or 0 if mode not found
     """
-    scores = load_scores()
+    scores = _store.load()
     if mode in scores:
         return scores[mode]["high_score"]
     return 0
@@ -193,3 +1146,35 @@ def get_all_high_scores():
 def reset_scores():
     """Reset all scores to their default zero values"""
     save_scores(get_default_scores())
+
+
+def get_top_scores(mode, limit=10, offset=0):
+    """
+    Get the best sessions for a mode, best first.
+
+    With the JSON backend only the best session per mode is known.
+
+    Args:
+        mode (str): Game mode to query.
+        limit (int): Maximum number of entries.
+        offset (int): Number of entries to skip (for paging).
+
+    Returns:
+        list: Dicts with player, score, fish_count, time_played, date.
+    """
+    return _store.top_scores(mode, limit, offset)
+
+
+def flush_scores(timeout=None):
+    """
+    Wait until all queued score writes have reached the disk.
+
+    Called automatically at interpreter exit.
+
+    Args:
+        timeout (float): Maximum seconds to wait, or None for no limit.
+
+    Returns:
+        bool: True if all writes finished, False on timeout.
+    """
+    return _store.flush(timeout)
@@ -0,0 +1,276 @@
+"""
+Zac, Aradhya
+
+Spectral Scream Detector for Fish-O-Mania.
+
+Peak amplitude alone cannot tell a scream from a slammed door or a cough,
+so this module classifies microphone blocks by their spectrum instead.
+The DSP runs in a separate worker process that reads raw blocks from a
+multiprocessing.shared_memory ring buffer; the game process only copies
+each block in and reads back a boolean and a confidence value.
+
+Shared memory layout:
+    header (int64 x 4): write count, stop flag, result sequence, reserved
+    result (float64 x 2): is_scream (0/1), confidence (0-1)
+    ring (int16 x capacity x block_size): most recent audio blocks
+
+Functions:
+    scream_confidence: Per-block scream confidence from band energies.
+
+Classes:
+    ScreamDetector: Owns the ring buffer and the worker process.
+"""
+
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Frequency bands (Hz)
+VOICE_LOW = 300  # Below this is rumble: doors, desk knocks, handling noise
+VOICE_HIGH = 3400  # Upper edge of the voice band
+
+# Loudness range (RMS of int16 samples) mapped onto 0-1
+MIN_RMS = 1500  # Anything quieter is never a scream
+FULL_RMS = 3500  # Roughly a 5000 peak sine, the old peak threshold
+
+# Fraction of energy that has to sit in the voice band
+MIN_VOICE_RATIO = 0.3
+FULL_VOICE_RATIO = 0.7
+
+# Tonality (1 - spectral flatness) of the voice band. White noise sits
+# around 0.45, voiced screams are strongly harmonic and close to 1.
+MIN_TONALITY = 0.5
+FULL_TONALITY = 0.9
+
+DEFAULT_THRESHOLD = 0.5  # Confidence needed to count as a scream
+SMOOTHING = 0.5  # Weight of the newest block in the running confidence
+
+# Header slots
+_WRITE_COUNT = 0
+_STOP = 1
+_RESULT_SEQ = 2
+_HEADER_SLOTS = 4
+
+# Result slots
+_IS_SCREAM = 0
+_CONFIDENCE = 1
+_RESULT_SLOTS = 2
+
+
+def _ramp(values, low, high):
+    """Map values linearly from [low, high] onto [0, 1], clipped."""
+    return np.clip((values - low) / (high - low), 0.0, 1.0)
+
+
+def scream_confidence(blocks, rate):
+    """
+    Compute a scream confidence for each audio block.
+
+    All blocks are transformed in a single batched FFT. The confidence
+    is the product of three scores: loudness, the share of energy in the
+    voice band, and how harmonic (non-noisy) that band is.
+
+    Args:
+        blocks (np.ndarray): 2D array of int16 samples, one block per row.
+        rate (int): Sample rate in Hz.
+
+    Returns:
+        np.ndarray: Confidence in [0, 1] for each block.
+    """
+    blocks = np.asarray(blocks, dtype=np.float32)
+    if blocks.ndim == 1:
+        blocks = blocks[np.newaxis, :]
+    block_size = blocks.shape[1]
+
+    window = np.hanning(block_size).astype(np.float32)
+    power = np.abs(np.fft.rfft(blocks * window, axis=1)) ** 2
+    freqs = np.fft.rfftfreq(block_size, 1.0 / rate)
+
+    eps = 1e-12
+    voice = power[:, (freqs >= VOICE_LOW) & (freqs < VOICE_HIGH)]
+    total_energy = power.sum(axis=1) + eps
+    voice_energy = voice.sum(axis=1)
+
+    # Spectral flatness: geometric mean over arithmetic mean
+    flatness = (np.exp(np.mean(np.log(voice + eps), axis=1)) /
+                (np.mean(voice, axis=1) + eps))
+
+    rms = np.sqrt(np.mean(blocks ** 2, axis=1))
+
+    loudness = _ramp(rms, MIN_RMS, FULL_RMS)
+    voice_score = _ramp(voice_energy / total_energy,
+                        MIN_VOICE_RATIO, FULL_VOICE_RATIO)
+    tonal_score = _ramp(1.0 - flatness, MIN_TONALITY, FULL_TONALITY)
+
+    return loudness * voice_score * tonal_score
+
+
+def _attach(shm, capacity, block_size):
+    """Create numpy views over the shared memory block."""
+    header = np.ndarray((_HEADER_SLOTS,), dtype=np.int64, buffer=shm.buf)
+    offset = header.nbytes
+    result = np.ndarray((_RESULT_SLOTS,), dtype=np.float64,
+                        buffer=shm.buf, offset=offset)
+    offset += result.nbytes
+    ring = np.ndarray((capacity, block_size), dtype=np.int16,
+                      buffer=shm.buf, offset=offset)
+    return header, result, ring
+
+
+def _shared_size(capacity, block_size):
+    """Bytes needed for the header, result and ring."""
+    return (_HEADER_SLOTS * 8 + _RESULT_SLOTS * 8 +
+            capacity * block_size * 2)
+
+
+def _worker_main(shm_name, capacity, block_size, rate, threshold,
+                 poll_interval):
+    """
+    Worker process loop: classify new blocks until told to stop.
+
+    Args:
+        shm_name (str): Name of the shared memory block.
+        capacity (int): Number of blocks in the ring.
+        block_size (int): Samples per block.
+        rate (int): Sample rate in Hz.
+        threshold (float): Confidence needed to report a scream.
+        poll_interval (float): Seconds to sleep when no new data arrived.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    header, result, ring = _attach(shm, capacity, block_size)
+    read_count = 0
+    confidence = 0.0
+
+    try:
+        while not header[_STOP]:
+            write_count = int(header[_WRITE_COUNT])
+            if write_count == read_count:
+                time.sleep(poll_interval)
+                continue
+
+            # Skip blocks that were overwritten before we got to them
+            start = max(read_count, write_count - capacity)
+            slots = np.arange(start, write_count) % capacity
+            for value in scream_confidence(ring[slots], rate):
+                confidence += SMOOTHING * (float(value) - confidence)
+
+            result[_CONFIDENCE] = confidence
+            result[_IS_SCREAM] = 1.0 if confidence >= threshold else 0.0
+            header[_RESULT_SEQ] += 1
+            read_count = write_count
+    finally:
+        del header, result, ring
+        shm.close()
+
+
+class ScreamDetector:
+    """
+    Spectral scream detector running in a worker process.
+
+    The game process calls push() with every block read from the
+    RECORDER and reads is_screaming / confidence each frame. Both sides
+    only touch the shared memory block, so no DSP happens on the frame
+    thread and no pipes or locks are involved.
+
+    Attributes:
+        rate (int): Sample rate in Hz.
+        block_size (int): Samples per block.
+        capacity (int): Number of blocks the ring buffer holds.
+        threshold (float): Confidence needed to count as a scream.
+    """
+
+    def __init__(self, rate=44100, block_size=735, capacity=32,
+                 threshold=DEFAULT_THRESHOLD, poll_interval=0.005):
+        """
+        Create the ring buffer and start the worker process.
+
+        Args:
+            rate (int): Sample rate in Hz.
+            block_size (int): Samples per block (RECORDER frames_per_buffer).
+            capacity (int): Number of blocks the ring buffer holds.
+            threshold (float): Confidence needed to count as a scream.
+            poll_interval (float): Worker sleep time when idle, in seconds.
+        """
+        self.rate = rate
+        self.block_size = block_size
+        self.capacity = capacity
+        self.threshold = threshold
+
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=_shared_size(capacity, block_size))
+        self._header, self._result, self._ring = _attach(
+            self._shm, capacity, block_size)
+        self._header[:] = 0
+        self._result[:] = 0.0
+
+        self._process = multiprocessing.Process(
+            target=_worker_main,
+            args=(self._shm.name, capacity, block_size, rate,
+                  threshold, poll_interval),
+            daemon=True,
+        )
+        self._process.start()
+
+    def push(self, data):
+        """
+        Copy one block of raw int16 audio into the ring buffer.
+
+        Args:
+            data (bytes): Raw block as returned by RECORDER.read_frames().
+        """
+        if not data or self._shm is None:
+            return
+        samples = np.frombuffer(data, dtype=np.int16)[:self.block_size]
+        write_count = int(self._header[_WRITE_COUNT])
+        slot = self._ring[write_count % self.capacity]
+        slot[:len(samples)] = samples
+        slot[len(samples):] = 0
+        # Publish only after the block is fully written
+        self._header[_WRITE_COUNT] = write_count + 1
+
+    @property
+    def is_screaming(self):
+        """bool: Whether the latest classified audio is a scream."""
+        if self._shm is None:
+            return False
+        return bool(self._result[_IS_SCREAM])
+
+    @property
+    def confidence(self):
+        """float: Smoothed scream confidence between 0 and 1."""
+        if self._shm is None:
+            return 0.0
+        return float(self._result[_CONFIDENCE])
+
+    @property
+    def result_sequence(self):
+        """int: Number of results the worker has published."""
+        if self._shm is None:
+            return 0
+        return int(self._header[_RESULT_SEQ])
+
+    def poll(self):
+        """
+        Read the latest classification.
+
+        Returns:
+            tuple: (is_screaming, confidence)
+        """
+        return self.is_screaming, self.confidence
+
+    def close(self):
+        """Stop the worker process and release the shared memory."""
+        if self._shm is None:
+            return
+        self._header[_STOP] = 1
+        self._process.join(timeout=1.0)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=1.0)
+
+        del self._header, self._result, self._ring
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
@@ -0,0 +1,231 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Session Journal for Fish-O-Mania
+
+Append-only log of finished game sessions, stored as JSON Lines next to
+the high score file. Recording a session appends one short line instead
+of rewriting the whole score file, and several game instances can append
+to the same journal safely. The best-per-mode summary is derived from the
+journal by folding records into it (see apply_session), and the journal
+is periodically compacted back into the summary file by mechanics.scores.
+
+Functions:
+    journal_path: Journal file that belongs to a score file.
+    make_record: Build a session record.
+    apply_session: Fold a session record into a score summary.
+
+Classes:
+    SessionJournal: Append, tail-read, lock and truncate the journal file.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from mechanics.game_log import fields, get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, single instance only
+    fcntl = None
+
+# Compact the journal into the summary file once it grows past this size
+COMPACT_THRESHOLD = 64 * 1024  # bytes, roughly 700 sessions
+
+# Logged under the score store's name, which the journal belongs to
+log = get_logger("scores")
+
+
+def journal_path(scores_path):
+    """
+    Get the journal file that belongs to a score file.
+
+    Args:
+        scores_path (str): Path of the summary score file.
+
+    Returns:
+        str: e.g. "highscores.journal.jsonl" for "highscores.json".
+    """
+    root, _ = os.path.splitext(scores_path)
+    return root + ".journal.jsonl"
+
+
+def make_record(mode, score, fish_count=0, time_played=0, timestamp=None,
+                player=None):
+    """
+    Build a session record.
+
+    Args:
+        mode (str): Game mode ("classic", "time_attack", or "endless").
+        score (int): Final score.
+        fish_count (int): Number of fish caught.
+        time_played (float): Session length in seconds.
+        timestamp (float): Unix time the session ended, defaults to now.
+        player (str): Player name, if known.
+
+    Returns:
+        dict: The session record.
+    """
+    return {
+        "player": player,
+        "mode": mode,
+        "score": score,
+        "fish_count": fish_count,
+        "time_played": time_played,
+        "timestamp": time.time() if timestamp is None else timestamp,
+    }
+
+
+def apply_session(entry, record):
+    """
+    Fold a session record into one mode's summary entry.
+
+    Every field only ever moves to its maximum, so applying the same
+    record twice has no further effect.
+
+    Args:
+        entry (dict): Summary for the record's mode (modified in place).
+        record (dict): Session record from make_record.
+
+    Returns:
+        tuple: (is_new_high, old_score)
+    """
+    old_score = entry["high_score"]
+    is_new_high = record["score"] > old_score
+
+    # Update high score if beaten
+    if is_new_high:
+        entry["high_score"] = record["score"]
+        entry["date"] = datetime.fromtimestamp(
+            record["timestamp"]).strftime("%Y-%m-%d %H:%M")
+
+    # Update best fish count if beaten
+    if record["fish_count"] > entry.get("best_fish_count", 0):
+        entry["best_fish_count"] = record["fish_count"]
+
+    # Update best time for endless mode
+    if "best_time" in entry and record["time_played"] > entry["best_time"]:
+        entry["best_time"] = record["time_played"]
+
+    return is_new_high, old_score
+
+
+class SessionJournal:
+    """
+    Append-only JSON Lines file of session records.
+
+    Appends take a shared lock and compaction takes an exclusive one
+    (where fcntl is available), so appends from several processes never
+    interleave with a compaction. Each append is a single write() on a
+    file opened in append mode.
+
+    Attributes:
+        path (str): Journal file path.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize the journal.
+
+        Args:
+            path (str): Journal file path (created on first append).
+        """
+        self.path = path
+
+    def size(self):
+        """
+        Get the journal size in bytes.
+
+        Returns:
+            int: Size of the file, 0 if it does not exist.
+        """
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def append(self, records):
+        """
+        Append session records durably.
+
+        Args:
+            records (list): Session records to append.
+
+        Returns:
+            int: Journal size in bytes after the append.
+        """
+        data = "".join(
+            json.dumps(record, separators=(",", ":")) + "\n"
+            for record in records
+        ).encode("utf-8")
+
+        with open(self.path, "ab") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+            try:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+                return os.fstat(f.fileno()).st_size
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def read_from(self, offset=0):
+        """
+        Read complete records written after a byte offset.
+
+        A trailing partial line (an append still in progress) is left
+        for the next read.
+
+        Args:
+            offset (int): Byte offset to start reading from.
+
+        Returns:
+            tuple: (list of records, offset just past the last full line)
+        """
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            return [], offset
+
+        end = data.rfind(b"\n") + 1
+        records = []
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError as e:
+                log.warning("Skipping corrupt journal line: %s", e,
+                            extra=fields(path=self.path, error=str(e)))
+        return records, offset + end
+
+    @contextmanager
+    def exclusive(self):
+        """
+        Hold the journal exclusively (no appends) for a compaction.
+
+        Yields:
+            file: The journal opened for reading and writing.
+        """
+        with open(self.path, "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield f
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def remove(self):
+        """Delete the journal file if it exists."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,419 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Startup and Mode Switch Timing for Fish-O-Mania.
+
+Measures the wall-clock time from process start to the first menu frame,
+and from choosing a mode in the menu to that mode's first gameplay frame,
+broken down by phase:
+    - imports of the heavy modules (pygame, numpy, the menu and the game
+      modes; pyaudio through mechanics.Recorder when classic mode starts)
+    - the modes' import-time pygame.init()/set_mode() and font creation
+    - MenuScreen() construction
+    - load_sounds(), load_graphics(), the initial spawn_fish() calls and
+      opening the microphone
+
+Phase timing is always on and costs next to nothing. The report is
+written as JSON when FISH_STARTUP_PROFILE is set (to the output file, or
+to 1 for startup-profile.json) or with "python main_menu.py
+--startup-profile [FILE]". It is rewritten after every first frame, so it
+is complete whenever the game is closed.
+
+Imports are only timed when the report is on: a finder is put in front
+of sys.meta_path when this module is imported with either switch given,
+and taken out again at the first menu frame, so later imports (a mode's
+first start) go through the normal import system. This module only uses
+the standard library (and mechanics.game_log, which does too) and is
+imported first by the mechanics package, so the imports after it are
+timed.
+
+Functions:
+    phase: Context manager timing one phase.
+    mark: Record a named point in the current section.
+    begin_mode_switch: Start timing a switch from the menu to a mode.
+    first_frame: End the current section at its first drawn frame.
+    enable_report: Write the report to a file from now on.
+    start_import_timing: Time the first imports of TIMED_IMPORTS.
+    stop_import_timing: Stop timing imports.
+    write_report: Write the report now.
+    get_report: Get the report as a dict.
+
+Classes:
+    StartupTimer: Sections of timed phases.
+"""
+
+import importlib.abc
+import json
+import os
+import sys
+import threading
+import time
+
+from mechanics.game_log import fields, get_logger
+
+# Environment variable and main_menu option that turn the report on
+STARTUP_ENV = "FISH_STARTUP_PROFILE"
+STARTUP_OPTION = "--startup-profile"
+DEFAULT_REPORT_FILE = "startup-profile.json"
+
+# Modules whose first import is timed (including everything they import)
+TIMED_IMPORTS = frozenset({
+    "pygame",
+    "numpy",
+    "pyaudio",
+    "sqlite3",
+    "mechanics.Recorder",
+    "mechanics.casting",
+    "mechanics.scores",
+    "mechanics.scream_detector",
+    "fish.fish_manager",
+    "background",
+    "ui",
+    "ui.menu_screen",
+    "modes.session",
+    "modes.mode_classic",
+    "modes.mode_time_attack",
+    "modes.mode_endless",
+})
+
+log = get_logger("startup")
+
+
+def _process_age():
+    """
+    Seconds since the process started, from /proc on Linux.
+
+    Returns:
+        float: Age of the process, or None where it can't be read.
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            # Field 22 (starttime) counts from boot in clock ticks; the
+            # command name in field 2 may contain spaces, so split after it
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class _Phase:
+    """Context manager that records one phase on exit."""
+
+    def __init__(self, timer, name, group):
+        self.timer = timer
+        self.name = name
+        self.group = group
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.timer.record(self.name, self.start, time.perf_counter(),
+                          self.group)
+        return False
+
+
+class StartupTimer:
+    """
+    Times phases in sections that end at their first drawn frame.
+
+    The "startup" section runs from process start to the first menu
+    frame. Each mode switch is its own section from the menu selection
+    to the mode's first gameplay frame. Phases recorded while no section
+    is open are ignored.
+
+    Attributes:
+        origin (float): perf_counter() value at process start.
+        origin_source (str): "process" if read from the OS, else "import"
+            (the time this module was imported).
+        sections (list): Finished and open sections, oldest first.
+        path (str): Report file, or None while the report is off.
+    """
+
+    def __init__(self):
+        """Open the startup section at process start."""
+        now = time.perf_counter()
+        age = _process_age()
+        self.origin = now - age if age is not None else now
+        self.origin_source = "process" if age is not None else "import"
+        self.sections = []
+        self.path = None
+        self._current = None
+        self._lock = threading.Lock()
+        self._open("startup", self.origin)
+
+    def _open(self, name, start):
+        """Start a new section."""
+        self._current = {"name": name, "start": start, "phases": [],
+                         "marks": {}, "total_ms": None}
+        self.sections.append(self._current)
+
+    def record(self, name, start, end, group="phase"):
+        """
+        Record a phase from perf_counter() times.
+
+        Args:
+            name (str): Phase name.
+            start (float): perf_counter() at the start.
+            end (float): perf_counter() at the end.
+            group (str): Kind of phase ("import", "init", "assets", ...).
+        """
+        with self._lock:
+            section = self._current
+            if section is None:
+                return
+            section["phases"].append({
+                "name": name,
+                "group": group,
+                "start_ms": (start - section["start"]) * 1000,
+                "duration_ms": (end - start) * 1000,
+            })
+
+    def phase(self, name, group="phase"):
+        """
+        Get a context manager that times its block as a phase.
+
+        Args:
+            name (str): Phase name.
+            group (str): Kind of phase.
+
+        Returns:
+            _Phase: The context manager.
+        """
+        return _Phase(self, name, group)
+
+    def mark(self, name):
+        """
+        Record a named point in the current section.
+
+        Args:
+            name (str): Name of the point.
+        """
+        section = self._current
+        if section is not None:
+            section["marks"][name] = ((time.perf_counter() - section["start"])
+                                      * 1000)
+
+    def begin_mode_switch(self, mode):
+        """
+        Start timing a switch from the menu to a mode.
+
+        Args:
+            mode (str): Mode chosen in the menu.
+        """
+        self._open(mode, time.perf_counter())
+
+    def first_frame(self):
+        """
+        End the open section; called after every flip().
+
+        Returns:
+            dict: The section just finished, or None if none was open.
+        """
+        section = self._current
+        if section is None:
+            return None
+        section["total_ms"] = (time.perf_counter() - section["start"]) * 1000
+        self._current = None
+        return section
+
+    def report(self):
+        """
+        Build the report.
+
+        Returns:
+            dict: Process start source, startup and mode switch sections.
+        """
+        sections = []
+        for section in self.sections:
+            section = dict(section)
+            section["phases"] = sorted(section["phases"],
+                                       key=lambda p: p["start_ms"])
+            del section["start"]
+            sections.append(section)
+        return {
+            "origin": self.origin_source,
+            "startup": sections[0],
+            "mode_switches": sections[1:],
+        }
+
+    def write(self):
+        """
+        Write the report to the report file.
+
+        Returns:
+            bool: True if the file was written.
+        """
+        if self.path is None:
+            return False
+        try:
+            with open(self.path, "w") as f:
+                json.dump(self.report(), f, indent=2)
+            return True
+        except OSError as e:
+            log.error("Error writing startup profile: %s", e,
+                      extra=fields(path=self.path, error=str(e)))
+            return False
+
+
+class _TimedLoader:
+    """Loader wrapper that times exec_module() of a module."""
+
+    def __init__(self, loader, name):
+        self._loader = loader
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Keep the real loader visible to the module
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        with _timer.phase(f"import {self._name}", "import"):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Finder that wraps the loaders of TIMED_IMPORTS."""
+
+    def find_spec(self, name, path, target=None):
+        if name not in TIMED_IMPORTS:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, name)
+        return spec
+
+
+# Shared timer used by the module-level functions
+_timer = StartupTimer()
+
+# Import finder while imports are timed
+_import_timer = None
+
+
+def phase(name, group="phase"):
+    """
+    Time a with block as a phase of the current section.
+
+    Args:
+        name (str): Phase name.
+        group (str): Kind of phase ("init", "assets", "ui", ...).
+
+    Returns:
+        Context manager timing the block.
+    """
+    return _timer.phase(name, group)
+
+
+def mark(name):
+    """
+    Record a named point in the current section.
+
+    Args:
+        name (str): Name of the point.
+    """
+    _timer.mark(name)
+
+
+def begin_mode_switch(mode):
+    """
+    Start timing a switch from the menu to a mode.
+
+    Args:
+        mode (str): Mode chosen in the menu.
+    """
+    _timer.begin_mode_switch(mode)
+
+
+def first_frame():
+    """
+    End the current section at its first drawn frame.
+
+    Call after every pygame.display.flip(); it returns at once unless a
+    section is open. Writes the report if it is on.
+    """
+    if _timer._current is None:
+        return
+    section = _timer.first_frame()
+    if section["name"] == "startup":
+        stop_import_timing()
+    if _timer.write():
+        log.info("Startup: %s first frame after %.0f ms", section["name"],
+                 section["total_ms"],
+                 extra=fields(section=section["name"],
+                              total_ms=round(section["total_ms"], 1)))
+
+
+def enable_report(path=None):
+    """
+    Write the report to a file from now on.
+
+    Args:
+        path (str): Output file, or None for startup-profile.json.
+    """
+    _timer.path = path or DEFAULT_REPORT_FILE
+
+
+def start_import_timing():
+    """Time the first imports of TIMED_IMPORTS from now on."""
+    global _import_timer
+    if _import_timer is None:
+        _import_timer = _ImportTimer()
+        sys.meta_path.insert(0, _import_timer)
+
+
+def stop_import_timing():
+    """Stop timing imports and take the finder out of sys.meta_path."""
+    global _import_timer
+    if _import_timer is not None:
+        if _import_timer in sys.meta_path:
+            sys.meta_path.remove(_import_timer)
+        _import_timer = None
+
+
+def write_report():
+    """
+    Write the report now.
+
+    Returns:
+        bool: True if the file was written.
+    """
+    return _timer.write()
+
+
+def get_report():
+    """
+    Get the report.
+
+    Returns:
+        dict: Process start source, startup and mode switch sections.
+    """
+    return _timer.report()
+
+
+# Turn the report on from the environment for any entry point. The
+# command line option is only parsed once main_menu's imports are done,
+# so look for it here to time them; main() sets the report file
+_env_path = os.environ.get(STARTUP_ENV)
+if _env_path:
+    enable_report(None if _env_path == "1" else _env_path)
+if _env_path or any(arg.split("=", 1)[0] == STARTUP_OPTION
+                    for arg in sys.argv[1:]):
+    start_import_timing()
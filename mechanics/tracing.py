@@ -0,0 +1,370 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Tracing for Fish-O-Mania.
+
+Records named spans and instant events in the Chrome Trace Event format,
+which can be opened in chrome://tracing or https://ui.perfetto.dev to
+look at a timeline of a session (loop phases, asset loads, spawns,
+catches, danger fish pauses and score writes).
+
+Tracing is off by default. Turn it on with the FISH_TRACE environment
+variable (set to the output file, or to 1 for a timestamped file) or
+with "python main_menu.py --trace [FILE]". Events are buffered in memory
+and written when flush_trace() is called (after each session and at
+exit). Each flush appends only the events recorded since the last one
+and empties the buffer, so flushing after every game costs the same
+however long the game has been running.
+
+Functions:
+    start_tracing: Start recording events.
+    is_tracing: Whether events are being recorded.
+    span: Context manager that records a span.
+    traced: Decorator that records a span around each call.
+    complete: Record a span from explicit start/end times.
+    instant: Record an instant event.
+    flush_trace: Write the buffered events to the trace file.
+
+Classes:
+    Tracer: Event buffer and trace file writer.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+from mechanics.game_log import fields, get_logger
+
+# Environment variable that turns tracing on
+TRACE_ENV = "FISH_TRACE"
+
+# Events kept in memory between flushes; later events are dropped and
+# counted
+MAX_EVENTS = 1000000
+
+# End of the trace file; each flush writes its events in front of it
+TRACE_TAIL = b'],"displayTimeUnit":"ms"}'
+
+log = get_logger("tracing")
+
+
+def default_trace_path():
+    """
+    Get a timestamped trace file name.
+
+    Returns:
+        str: e.g. "trace-20240101-120000.json".
+    """
+    return time.strftime("trace-%Y%m%d-%H%M%S.json")
+
+
+class _NullSpan:
+    """Span used while tracing is off; does nothing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Context manager that records one complete event on exit."""
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.complete(self.name, self.start, time.perf_counter(),
+                             self.cat, self.args)
+        return False
+
+
+class Tracer:
+    """
+    Buffers trace events and writes them as Trace Event JSON.
+
+    Timestamps are microseconds since the tracer was created, taken from
+    time.perf_counter(). Events from other threads (e.g. the score
+    writer) get their own track.
+
+    Attributes:
+        enabled (bool): Whether events are recorded.
+        path (str): Output file.
+        dropped (int): Events dropped because the buffer was full.
+    """
+
+    def __init__(self):
+        """Create a disabled tracer."""
+        self.enabled = False
+        self.path = None
+        self.dropped = 0
+        self._events = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._thread_names = {}
+        # Threads already named in the file, and whether it was started
+        self._written_threads = set()
+        self._file_started = False
+        self._written_dropped = 0
+
+    def start(self, path=None):
+        """
+        Start recording events.
+
+        Args:
+            path (str): Output file, or None for a timestamped name.
+        """
+        self.path = path or default_trace_path()
+        self.enabled = True
+        self._written_threads = set()
+        self._file_started = False
+
+    def _add(self, event):
+        """Append an event, naming the thread's track on first use."""
+        tid = threading.get_ident()
+        event["pid"] = self._pid
+        event["tid"] = tid
+        with self._lock:
+            if tid not in self._thread_names:
+                self._thread_names[tid] = threading.current_thread().name
+            if len(self._events) >= MAX_EVENTS:
+                self.dropped += 1
+                return
+            self._events.append(event)
+
+    def _us(self, seconds):
+        """Convert a perf_counter() value to trace microseconds."""
+        return (seconds - self._origin) * 1e6
+
+    def complete(self, name, start, end, cat="game", args=None):
+        """
+        Record a span from explicit perf_counter() times.
+
+        Args:
+            name (str): Span name.
+            start (float): perf_counter() at the start.
+            end (float): perf_counter() at the end.
+            cat (str): Category, used for filtering in the viewer.
+            args (dict): Extra values shown for the event.
+        """
+        if not self.enabled:
+            return
+        event = {"name": name, "cat": cat, "ph": "X",
+                 "ts": self._us(start), "dur": (end - start) * 1e6}
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    def span(self, name, cat="game", args=None):
+        """
+        Get a context manager that records a span around its block.
+
+        Args:
+            name (str): Span name.
+            cat (str): Category.
+            args (dict): Extra values shown for the event.
+
+        Returns:
+            Context manager (a shared no-op one while tracing is off).
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def instant(self, name, cat="game", args=None):
+        """
+        Record an instant event.
+
+        Args:
+            name (str): Event name.
+            cat (str): Category.
+            args (dict): Extra values shown for the event.
+        """
+        if not self.enabled:
+            return
+        event = {"name": name, "cat": cat, "ph": "i", "s": "t",
+                 "ts": self._us(time.perf_counter())}
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    def flush(self):
+        """
+        Write the events recorded since the last flush to the trace file.
+
+        The first flush writes a new file; later ones replace its closing
+        TRACE_TAIL with the new events and the tail again, so the file is
+        always a valid JSON document. Written events leave the buffer.
+        Dropped events are reported as a "dropped events" counter.
+
+        Returns:
+            bool: True if the file was written.
+        """
+        if not self.enabled:
+            return False
+
+        with self._lock:
+            events = self._events
+            self._events = []
+            thread_names = dict(self._thread_names)
+            dropped = self.dropped
+
+        metadata = []
+        if not self._file_started:
+            metadata.append({"name": "process_name", "ph": "M",
+                             "pid": self._pid,
+                             "args": {"name": "Fish-O-Mania"}})
+        for tid, thread_name in thread_names.items():
+            if tid not in self._written_threads:
+                metadata.append({"name": "thread_name", "ph": "M",
+                                 "pid": self._pid, "tid": tid,
+                                 "args": {"name": thread_name}})
+        if dropped != self._written_dropped:
+            metadata.append({"name": "dropped events", "ph": "C",
+                             "pid": self._pid,
+                             "ts": self._us(time.perf_counter()),
+                             "args": {"dropped": dropped}})
+
+        try:
+            body = ",".join(json.dumps(event, separators=(",", ":"))
+                            for event in metadata + events).encode()
+            if not self._file_started:
+                with open(self.path, "wb") as f:
+                    f.write(b'{"traceEvents":[' + body + TRACE_TAIL)
+            elif body:
+                with open(self.path, "r+b") as f:
+                    f.seek(-len(TRACE_TAIL), os.SEEK_END)
+                    f.write(b"," + body + TRACE_TAIL)
+        except (OSError, TypeError, ValueError) as e:
+            log.error("Error writing trace: %s", e,
+                      extra=fields(path=self.path, error=str(e)))
+            # Keep the events for the next flush
+            with self._lock:
+                self._events[:0] = events
+            return False
+
+        self._file_started = True
+        self._written_threads.update(thread_names)
+        self._written_dropped = dropped
+        return True
+
+
+# Shared tracer used by the module-level functions
+_tracer = Tracer()
+
+
+def start_tracing(path=None):
+    """
+    Start recording events and write them at exit.
+
+    Args:
+        path (str): Output file, or None for a timestamped name.
+    """
+    if not _tracer.enabled:
+        atexit.register(_tracer.flush)
+    _tracer.start(path)
+
+
+def is_tracing():
+    """
+    Check whether events are being recorded.
+
+    Returns:
+        bool: True if tracing is on.
+    """
+    return _tracer.enabled
+
+
+def span(name, cat="game", args=None):
+    """
+    Record a span around a with block.
+
+    Args:
+        name (str): Span name.
+        cat (str): Category.
+        args (dict): Extra values shown for the event.
+
+    Returns:
+        Context manager recording the span.
+    """
+    return _tracer.span(name, cat, args)
+
+
+def traced(name, cat="game"):
+    """
+    Decorator that records a span around each call of a function.
+
+    Args:
+        name (str): Span name.
+        cat (str): Category.
+
+    Returns:
+        function: The decorator.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            with _tracer.span(name, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def complete(name, start, end, cat="game", args=None):
+    """
+    Record a span from explicit perf_counter() times.
+
+    Args:
+        name (str): Span name.
+        start (float): perf_counter() at the start.
+        end (float): perf_counter() at the end.
+        cat (str): Category.
+        args (dict): Extra values shown for the event.
+    """
+    _tracer.complete(name, start, end, cat, args)
+
+
+def instant(name, cat="game", args=None):
+    """
+    Record an instant event.
+
+    Args:
+        name (str): Event name.
+        cat (str): Category.
+        args (dict): Extra values shown for the event.
+    """
+    _tracer.instant(name, cat, args)
+
+
+def flush_trace():
+    """
+    Write the buffered events to the trace file.
+
+    Returns:
+        bool: True if the file was written.
+    """
+    return _tracer.flush()
+
+
+# Turn tracing on from the environment for any entry point
+_env_path = os.environ.get(TRACE_ENV)
+if _env_path:
+    start_tracing(None if _env_path == "1" else _env_path)
@@ -4,6 +4,7 @@ Game Modes Package for Fish-O-Mania.
 This package contains all playable game modes.
 
 Modules:
+    session: Game loop shared by the modes.
     mode_classic: Standard mode with lives system.
     mode_time_attack: Race against the clock.
     mode_endless: Relaxed mode with no penalties.
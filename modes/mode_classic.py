@@ -10,48 +10,73 @@ The standard game mode with a lives system. Players catch fish to earn
 points while avoiding danger fish that cost lives. Game ends when all
 lives are lost.
 
+The game loop is the shared session (modes/session.py); this module
+holds the lives and scream rules and the classic screens.
+
 Functions:
+    load_sounds: Load the classic mode sounds.
+    is_scream_detected: Decide whether the player is screaming.
+    draw_pause_overlay: Draw the pause screen.
+    draw_release_message: Draw the message after a danger fish escapes.
+    draw_game_over_screen: Draw the game over screen.
+    draw_danger_fish_overlay: Draw the scream window for a danger fish.
     main: Main game loop for classic mode.
+
+Classes:
+    ClassicRules: Lives, scream control and the danger fish scream window.
 """
 
 import pygame
-import random
-from mechanics.Recorder import RECORDER
 from mechanics.constants import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
-    FPS,
     WHITE,
-    SKY_BLUE,
-    AZURE,
-    DEEP_BLUE,
-    WATER_SURFACE,
-    BOAT_SPEED,
-    ROD_MAX_LENGTH,
-    ROD_SPEED,
     START_FISHES,
+    SPECTRAL_SCREAM_DETECTION,
+    CATCH_LOGGING,
+)
+from mechanics.assets import load_sound
+from mechanics.tracing import traced
+from mechanics import game_clock, startup
+from mechanics.scores import get_high_score
+from mechanics.scream_detector import ScreamDetector
+from mechanics.keyboard_recorder import KeyboardRecorder
+from mechanics.random_streams import stream
+from mechanics.game_log import get_logger
+from modes.session import (  # noqa: F401 (re-exported)
+    GameSession,
+    Rules,
+    big_font,
+    dim,
+    draw_water_background,
+    font,
+    load_graphics,
+    render_text,
 )
-from fish.fish_manager import FishManager
-from background import BackgroundManager
-from mechanics.casting import CastingRod
-from mechanics.scores import update_high_score, get_high_score
 
-# Initialize pygame
-pygame.init()
+log = get_logger("mode_classic")
 
-# Display setup
-SCREEN_RESOLUTION = (SCREEN_WIDTH, SCREEN_HEIGHT)
-screen = pygame.display.set_mode(SCREEN_RESOLUTION)
-clock = pygame.time.Clock()
-font = pygame.font.Font(None, 24)
-big_font = pygame.font.Font(None, 36)
+with startup.phase("mode_classic fonts", "init"):
+    title_font = pygame.font.Font(None, 34)
 
 # Funny release messages # keep only one
 RELEASE_MESSAGES = [
     "The fish chooses life today."
 ]
 
+# Scream window for a hooked danger fish
+ANGLER_PAUSE_DURATION = 5000  # Milliseconds to scream the fish free
+SCREAM_PEAK_THRESHOLD = 5000
+SCREAM_INCREMENT = 1  # 1% per frame with scream detected
+
+# Scream threshold for controlling the hook
+HOOK_SCREAM_THRESHOLD = 5000
+
+# How long the release message is shown (milliseconds)
+RELEASE_MESSAGE_DURATION = 2000
+
 
+@traced("load_sounds", "assets")
 def load_sounds():
     """
     Load and configure all sound effects.
@@ -60,10 +85,10 @@ def load_sounds():
         dict: Dictionary of loaded sound objects.
     """
     sounds = {
-        'background_classic': pygame.mixer.Sound("sounds/classic.mp3"),
-        'casting': pygame.mixer.Sound("sounds/casting-whoosh.mp3"),
-        'bubble': pygame.mixer.Sound("sounds/bubble.mp3"),
-        'game_over': pygame.mixer.Sound("sounds/game_over.mp3")
+        'background_classic': load_sound("sounds/classic.mp3", "music"),
+        'casting': load_sound("sounds/casting-whoosh.mp3"),
+        'bubble': load_sound("sounds/bubble.mp3"),
+        'game_over': load_sound("sounds/game_over.mp3")
     }
 
     # Set volumes
@@ -75,67 +100,24 @@ def load_sounds():
     return sounds
 
 
-def load_graphics():
+def is_scream_detected(recorder, scream_detector, peak_threshold):
     """
-    Load and configure all graphic assets.
-
-    Returns:
-        dict: Dictionary containing loaded images and their rects.
-    """
-    # Load boat
-    boat_image = pygame.image.load("graphics/boat.png")
-    boat_image = pygame.transform.scale(boat_image, (310, 260))
-    boat_x = SCREEN_WIDTH // 2 - boat_image.get_width() // 2 - 300
-    boat_y = WATER_SURFACE - boat_image.get_height() // 2 - 20
-
-    # Load fishing hook
-    hook_image = pygame.image.load("graphics/fishing_hook.png")
-    hook_image = pygame.transform.scale(hook_image, (30, 30))
-    hook_rect = hook_image.get_rect()
-
-    return {
-        'boat_image': boat_image,
-        'boat_x': boat_x,
-        'boat_y': boat_y,
-        'hook_image': hook_image,
-        'hook_rect': hook_rect
-    }
+    Decide whether the player is currently screaming.
 
-
-def draw_water_background(surface):
-    """
-    Draw the sky and water gradient background.
+    Uses the spectral detector's result when one is running, otherwise
+    falls back to comparing the latest frame peak with a threshold.
 
     Args:
-        surface (pygame.Surface): Surface to draw on.
-    """
-    # Sky
-    surface.fill(SKY_BLUE)
-
-    # Water area
-    pygame.draw.rect(
-        surface,
-        DEEP_BLUE,
-        (0, WATER_SURFACE, SCREEN_WIDTH, SCREEN_HEIGHT - WATER_SURFACE)
-    )
-
-    # Water surface line
-    pygame.draw.line(
-        surface,
-        WHITE,
-        (0, WATER_SURFACE),
-        (SCREEN_WIDTH, WATER_SURFACE),
-        2
-    )
+        recorder (RECORDER): Audio recorder instance.
+        scream_detector (ScreamDetector): Spectral detector, or None.
+        peak_threshold (int): Peak amplitude that counts as a scream.
 
-    # Water gradient
-    for y in range(WATER_SURFACE, SCREEN_HEIGHT):
-        ratio = (y - WATER_SURFACE) / (SCREEN_HEIGHT - WATER_SURFACE)
-        color = tuple(
-            int(AZURE[i] + (DEEP_BLUE[i] - AZURE[i]) * ratio)
-            for i in range(3)
-        )
-        pygame.draw.line(surface, color, (0, y), (SCREEN_WIDTH, y))
+    Returns:
+        bool: True if a scream is detected.
+    """
+    if scream_detector is not None:
+        return scream_detector.is_screaming
+    return recorder.get_frame_peak() >= peak_threshold
 
 
 def draw_pause_overlay(surface):
@@ -145,12 +127,7 @@ def draw_pause_overlay(surface):
     Args:
         surface (pygame.Surface): Surface to draw on.
     """
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    # set transparency
-    overlay.set_alpha(150)
-    # fill the screen with a color
-    overlay.fill((0, 0, 50))
-    surface.blit(overlay, (0, 0))
+    dim(surface, (0, 0, 50), 150)
 
     center_x = SCREEN_WIDTH // 2
     center_y = SCREEN_HEIGHT // 2
@@ -172,11 +149,7 @@ def draw_release_message(surface, message):
         surface (pygame.Surface): Surface to draw on
         message (str): The release message to display
     """
-    overlay = pygame.Surface(
-        (SCREEN_WIDTH, SCREEN_HEIGHT))
-    overlay.set_alpha(150)
-    overlay.fill((0, 100, 0))
-    surface.blit(overlay, (0, 0))
+    dim(surface, (0, 100, 0), 150)
 
     msg_text = big_font.render(
         message, True, (0, 255, 0))
@@ -206,11 +179,7 @@ def draw_game_over_screen(
     current_high = get_high_score("classic")
 
     # Semi-transparent overlay
-    overlay = pygame.Surface((
-        SCREEN_WIDTH, SCREEN_HEIGHT))
-    overlay.set_alpha(180)
-    overlay.fill((0, 0, 0))
-    surface.blit(overlay, (0, 0))
+    dim(surface, (0, 0, 0), 180)
 
     center_x = SCREEN_WIDTH // 2
     center_y = SCREEN_HEIGHT // 2
@@ -279,7 +248,9 @@ def draw_danger_fish_overlay(
         scream_progress,
         angler_pause_start_time,
         ANGLER_PAUSE_DURATION,
-        SCREAM_PEAK_THRESHOLD):
+        SCREAM_PEAK_THRESHOLD,
+        scream_detected=None,
+        scream_control="SCREAM"):
     """
     Draw the danger fish scream overlay with progress bar.
 
@@ -290,9 +261,16 @@ def draw_danger_fish_overlay(
         angler_pause_start_time (int): Start time of the pause.
         ANGLER_PAUSE_DURATION (int): Total duration allowed.
         SCREAM_PEAK_THRESHOLD (int): Threshold for detecting screams.
+        scream_detected (bool): Result from the spectral detector, or
+            None to compare the frame peak with SCREAM_PEAK_THRESHOLD.
+        scream_control (str): How to scream, e.g. "HOLD S" without a
+            microphone.
     """
     current_peak = recorder.get_frame_peak()
-    is_screaming = current_peak >= SCREAM_PEAK_THRESHOLD
+    if scream_detected is None:
+        is_screaming = current_peak >= SCREAM_PEAK_THRESHOLD
+    else:
+        is_screaming = scream_detected
     progress = scream_progress / 100.0
 
     # Rounded rectangle prompt dimensions
@@ -327,7 +305,6 @@ def draw_danger_fish_overlay(
         inner_border_rect, 2, border_radius=corner_radius - 3)
 
     # Title with shadow effect
-    title_font = pygame.font.Font(None, 34)
     shadow_offset = 2
 
     title_text = " DANGER FISH! "
@@ -340,7 +317,7 @@ def draw_danger_fish_overlay(
     surface.blit(title_render, title_rect)
 
     # Subtitle
-    subtitle_text = "SCREAM TO ESCAPE!"
+    subtitle_text = f"{scream_control} TO ESCAPE!"
     subtitle_render = font.render(subtitle_text, True, (255, 180, 180))
     subtitle_rect = subtitle_render.get_rect(
         center=(rect_center_x, rect_center_y - 65))
@@ -396,7 +373,7 @@ def draw_danger_fish_overlay(
         surface.blit(hint_text, hint_rect)
 
     # Time remaining
-    pause_elapsed = pygame.time.get_ticks() - angler_pause_start_time
+    pause_elapsed = game_clock.get_ticks() - angler_pause_start_time
     time_left = ANGLER_PAUSE_DURATION - pause_elapsed
     remain_ms = max(0, time_left)
     remain_s = remain_ms / 1000
@@ -415,362 +392,251 @@ def draw_danger_fish_overlay(
     surface.blit(time_text, time_rect)
 
 
-def main():
+class ClassicRules(Rules):
     """
-    Main game loop for Classic Mode.
-
-    Returns:
-        int: Final score achieved.
+    Lives and scream control.
+
+    The hook goes down while space is toggled on or the player screams.
+    A hooked danger fish opens a scream window: scream the bar full to
+    release it, or it is caught and costs a life.
+
+    Attributes:
+        recorder (RECORDER): Microphone, or a KeyboardRecorder.
+        scream_detector (ScreamDetector): Spectral detector, or None.
+        scream_control (str): How to scream, for on-screen hints.
+        spacebar_casting (bool): Space has the hook going down.
+        was_screaming (bool): Screaming last frame, for timing onsets.
+        angler_pause_active (bool): The scream window is open.
+        angler_pause_start_time (int): pygame ticks when it opened.
+        scream_progress (float): Scream window progress (0-100).
+        showing_release_message (bool): The release message is shown.
+        release_message_start_time (int): pygame ticks when it was shown.
+        current_release_message (str): The message shown.
     """
-    pygame.init()
-
-    # Load assets
-    sounds = load_sounds()
-    graphics = load_graphics()
-    sounds['background_classic'].play(-1)  # Loop background music
-
-    # Initialize game state
-    running = True
-    game_over = False
-    paused = False
-    pygame.display.set_caption("Fish-O-Mania: Classic Mode")
-    # Tracks spacebar casting or scream casting
-    spacebar_casting = False
-
-    # Initialize managers
-    fish_manager = FishManager()
-    background_manager = BackgroundManager()
-    casting_manager = CastingRod(ROD_MAX_LENGTH,
-                                 ROD_SPEED, auto_reel=False)
-
-    # Spawn initial fish
-    for i in range(START_FISHES):
-        fish_manager.spawn_fish()
-
-    # Game variables
-    score = 0
-    caught_fish = []
-    fish_caught_count = 0
-    boat_x = graphics['boat_x']
-    boat_y = graphics['boat_y']
-    high_score_result = None
-
-    # Scream control variables
-    angler_pause_active = False
-    angler_pause_start_time = 0
-    ANGLER_PAUSE_DURATION = 5000
-    SCREAM_PEAK_THRESHOLD = 5000
-
-    # Frame-by-frame scream progress for danger fish (0-100%)
-    scream_progress = 0
-    SCREAM_INCREMENT = 1  # 1% per frame with scream detected
-
-    # Scream threshold for controlling the hook
-    HOOK_SCREAM_THRESHOLD = 5000
-
-    # Release message state
-    showing_release_message = False
-    release_message_start_time = 0
-    RELEASE_MESSAGE_DURATION = 2000
-    current_release_message = ""
-
-    # Fade in effect
-    fade_alpha = 255
-
-    # Initialize audio recorder
-    recorder = RECORDER()
-    recorder.start_recording()
-
-    # Main game loop
-    while running:
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-
-                if event.key == pygame.K_SPACE:
-                    if (not game_over
-                            and not paused
-                            and not angler_pause_active
-                            and not showing_release_message):
-                        # If pressed depress and vice versa
-                        spacebar_casting = not spacebar_casting
-                        sounds['casting'].play()
-
-                elif event.key == pygame.K_p:
-                    if (
-                            not game_over
-                            and not angler_pause_active
-                            and not showing_release_message
-                    ):
-                        paused = not paused
-
-                elif event.key == pygame.K_RETURN:
-                    if game_over:
-                        # Restart game
-                        fish_manager.clear_all()
-                        casting_manager.reset()
-                        score = 0
-                        caught_fish = []
-                        fish_caught_count = 0
-                        spacebar_casting = False
-                        for i in range(START_FISHES):
-                            fish_manager.spawn_fish()
-                        game_over = False
-                        high_score_result = None
-                        angler_pause_active = False
-                        showing_release_message = False
-                        scream_progress = 0
-                        recorder.frames = []
-                        fade_alpha = 255
-
-        # Check if release message duration is over
-        if showing_release_message:
-            now = pygame.time.get_ticks()
-            if now - release_message_start_time >= RELEASE_MESSAGE_DURATION:
-                showing_release_message = False
-
-        # Update game state (only when not game over,
-        # not paused, and not in special states)
-        if (
-                not game_over
-                and not paused
-                and not angler_pause_active
-                and not showing_release_message
-        ):
-            fish_manager.update()
-            background_manager.update()
-
-            recorder.read_frames()
-
-            # Check if screaming
-            hook_peak = recorder.get_frame_peak()
-            is_screaming = hook_peak >= HOOK_SCREAM_THRESHOLD
-
-            """ use either spacebar or screaming to lower the hook
-            Hook goes down if spacebar pressed to cast or currently screaming
-            Hook goes up if spacebar toggled to reel and not screaming"""
-
-            if spacebar_casting or is_screaming:
-                # Screaming/spacebar casting - hook goes down
-                casting_manager.is_casting = True
-            else:
-                # Not screaming - hook goes up
-                casting_manager.is_casting = False
-
-            # Auto-reset spacebar toggle when hook reaches bottom or top
-            if casting_manager.rod_length >= casting_manager.rod_max_length:
-                spacebar_casting = False
-            # Auto-switch to reel mode
-
-            # Boat movement
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_LEFT]:
-                boat_x -= BOAT_SPEED
-            if keys[pygame.K_RIGHT]:
-                boat_x += BOAT_SPEED
-
-            # Keep boat on screen
-            boat_x = max(
-                0,
-                min(boat_x, SCREEN_WIDTH - graphics['boat_image'].get_width())
-            )
-
-            # Calculate hook position
-            rod_x = boat_x + graphics['boat_image'].get_width() - 65
-            rod_top_y = boat_y + 160
-
-            # Update casting and check for catches
-            caught = casting_manager.update(
-                graphics['hook_rect'],
-                fish_manager,
-                sounds['bubble']
-            )
-
-            if caught:
-                if caught['penalty']:
-                    print("Danger fish hooked! "
-                          "Scream to fill the bar and escape!")
-                    angler_pause_active = True
-                    angler_pause_start_time = pygame.time.get_ticks()
-                    scream_progress = 0
-                    recorder.frames = []
-                else:
-                    score += caught["value"]
-                    fish_caught_count += 1
-                    print(f"Caught: {caught['type']} (+{caught['value']} pts)")
-                    caught_fish.append(caught)
-
-                if caught.get('game_over') and not caught['penalty']:
-                    print("GAME OVER!")
-                    game_over = True
-                    high_score_result = update_high_score(
-                        "classic", score, fish_caught_count)
-                    sounds['game_over'].play()
-
-            # Update hook rect position
-            hook_x = rod_x
-            hook_y = rod_top_y + casting_manager.rod_length
-            graphics['hook_rect'].x = (
-                    hook_x - graphics['hook_image'].get_width() // 2
-            )
-            graphics['hook_rect'].y = hook_y
-
-        # Danger fish scream window
-        elif angler_pause_active and not game_over:
-            recorder.read_frames()
-            current_frame_peak = recorder.get_frame_peak()
-            now = pygame.time.get_ticks()
-
-            if current_frame_peak >= SCREAM_PEAK_THRESHOLD:
-                scream_progress += SCREAM_INCREMENT
-
-                if scream_progress >= 100:
-                    print(f"Scream success! "
-                          f"Progress reached 100% - Fish escaped!")
-                    angler_pause_active = False
-                    casting_manager.release_danger_fish()
-                    recorder.frames = []
-                    scream_progress = 0
-
-                    showing_release_message = True
-                    release_message_start_time = pygame.time.get_ticks()
-                    current_release_message = random.choice(RELEASE_MESSAGES)
-
-            if (
-                    angler_pause_active
-                    and now - angler_pause_start_time >= ANGLER_PAUSE_DURATION
-            ):
-                print("Time's up! Fish caught but life lost!")
-                angler_pause_active = False
-                scream_progress = 0
-
-                catch_result = casting_manager.catch_danger_fish(fish_manager)
-
-                if catch_result:
-                    score += catch_result["value"]
-                    fish_caught_count += 1
-                    print(f"Caught: {catch_result['type']} "
-                          f"(+{catch_result['value']} pts)")
-
-                    lives_mgr = fish_manager.lives_manager
-                    lives_before = lives_mgr.get_current_lives()
-                    fish_manager.lives_manager.lose_life()
-                    lives_left = fish_manager.lives_manager.get_current_lives()
-                    print(f"Lives: {lives_before} -> {lives_left}")
-
-                    caught_fish.append({
-                        "type": catch_result["type"],
-                        "value": catch_result["value"],
-                        "rarity": catch_result["rarity"],
-                        "penalty": True,
-                        "game_over": lives_left <= 0,
-                    })
-
-                    if lives_left <= 0:
-                        game_over = True
-                        high_score_result = update_high_score(
-                            "classic", score, fish_caught_count)
-                        sounds['game_over'].play()
-
-                recorder.frames = []
-
-        # Drawing
-        draw_water_background(screen)
-        background_manager.draw(screen)
-
-        # Draw boat
-        screen.blit(graphics['boat_image'], (boat_x, boat_y))
-
-        # Draw fishing line
-        rod_x = boat_x + graphics['boat_image'].get_width() - 65
-        rod_top_y = boat_y + 160
-        hook_x = rod_x
-        hook_y = rod_top_y + casting_manager.rod_length
-
-        pygame.draw.line(
-            screen,
-            WHITE,
-            (rod_x - 5, rod_top_y),
-            (hook_x - 5, hook_y),
-            2
-        )
-
-        # Draw hook
-        screen.blit(graphics['hook_image'], graphics['hook_rect'])
-
-        # Draw fish
-        fish_manager.draw(screen)
 
-        # Draw UI
-        stats = fish_manager.get_stats()
-
-        score_text = big_font.render(f"Score: {score}", True, WHITE)
-        screen.blit(score_text, (10, 10))
+    mode = "classic"
+    caption = "Fish-O-Mania: Classic Mode"
+    music = "background_classic"
+    auto_reel = False
+
+    recorder = None
+    scream_detector = None
+
+    def load_sounds(self):
+        """Load the classic mode sounds."""
+        return load_sounds()
+
+    def start(self, session):
+        """Open the microphone once and reset the scream state."""
+        if self.recorder is None:
+            # Without a microphone a held key screams
+            with startup.phase("start_recording", "setup"):
+                self.recorder = session.driver.create_recorder()
+            keyboard_scream = isinstance(self.recorder, KeyboardRecorder)
+            self.scream_control = (
+                f"HOLD {self.recorder.key_name}" if keyboard_scream
+                else "SCREAM")
+
+            # Optional spectral scream classifier (runs in its own process,
+            # so replays can't repeat it and use the peak)
+            replaying = getattr(session.driver, "seed", None) is not None
+            if (SPECTRAL_SCREAM_DETECTION and not keyboard_scream
+                    and not replaying):
+                self.scream_detector = ScreamDetector(
+                    self.recorder.rate, self.recorder.frames_per_buffer)
+        else:
+            self.recorder.frames = []
+
+        self.spacebar_casting = False
+        self.was_screaming = False
+        self.angler_pause_active = False
+        self.angler_pause_start_time = 0
+        self.scream_progress = 0
+        self.showing_release_message = False
+        self.release_message_start_time = 0
+        self.current_release_message = ""
+
+    def blocking(self):
+        """The scream window and the release message hold play."""
+        return self.angler_pause_active or self.showing_release_message
+
+    def cast(self, session):
+        """Toggle the hook going down."""
+        # If pressed depress and vice versa
+        self.spacebar_casting = not self.spacebar_casting
+
+    def read_scream(self):
+        """Read a block from the microphone and feed the detector."""
+        data = self.recorder.read_frames()
+        if self.scream_detector is not None:
+            self.scream_detector.push(data)
+
+    def update(self, session):
+        """Hide the release message after its time."""
+        if self.showing_release_message:
+            now = game_clock.get_ticks()
+            if (now - self.release_message_start_time
+                    >= RELEASE_MESSAGE_DURATION):
+                self.showing_release_message = False
+
+    def control(self, session):
+        """Lower the hook while space is on or the player screams."""
+        self.read_scream()
+        session.profiler.lap("recorder")
+
+        # Check if screaming
+        is_screaming = is_scream_detected(
+            self.recorder, self.scream_detector, HOOK_SCREAM_THRESHOLD)
+        if is_screaming and not self.was_screaming:
+            session.latency.input("scream", self.recorder.get_onset_time(
+                HOOK_SCREAM_THRESHOLD))
+            session.flight.input("scream")
+        self.was_screaming = is_screaming
+
+        # Hook goes down if spacebar pressed to cast or currently screaming
+        # Hook goes up if spacebar toggled to reel and not screaming
+        casting_manager = session.casting_manager
+        casting_manager.is_casting = self.spacebar_casting or is_screaming
+
+        # Auto-reset spacebar toggle when hook reaches the bottom
+        if casting_manager.rod_length >= casting_manager.rod_max_length:
+            self.spacebar_casting = False
+
+    def on_penalty(self, session, result):
+        """Open the scream window."""
+        log.info("Danger fish hooked! Scream to fill the bar and escape!")
+        self.angler_pause_active = True
+        self.angler_pause_start_time = game_clock.get_ticks()
+        self.scream_progress = 0
+        self.recorder.frames = []
+
+    def update_blocked(self, session):
+        """Run the scream window."""
+        if not self.angler_pause_active:
+            return
+        casting_manager = session.casting_manager
+        self.read_scream()
+        now = game_clock.get_ticks()
+
+        if is_scream_detected(
+                self.recorder, self.scream_detector, SCREAM_PEAK_THRESHOLD):
+            self.scream_progress += SCREAM_INCREMENT
+
+            if self.scream_progress >= 100:
+                log.info("Scream success! "
+                         "Progress reached 100% - Fish escaped!")
+                self.angler_pause_active = False
+                session.catch_logger.log_release(
+                    casting_manager.pending_danger_fish,
+                    session.graphics['hook_rect'], casting_manager)
+                casting_manager.release_danger_fish()
+                self.recorder.frames = []
+                self.scream_progress = 0
+
+                self.showing_release_message = True
+                self.release_message_start_time = game_clock.get_ticks()
+                self.current_release_message = stream("messages").choice(
+                    RELEASE_MESSAGES)
+
+        if (self.angler_pause_active
+                and now - self.angler_pause_start_time
+                >= ANGLER_PAUSE_DURATION):
+            log.info("Time's up! Fish caught but life lost!")
+            self.angler_pause_active = False
+            self.scream_progress = 0
+
+            catch_result = casting_manager.catch_danger_fish(
+                session.fish_manager)
+
+            if catch_result:
+                lives_mgr = session.fish_manager.lives_manager
+                lives_before = lives_mgr.get_current_lives()
+                lives_mgr.lose_life()
+                lives_left = lives_mgr.get_current_lives()
+                log.info("Lives: %d -> %d", lives_before, lives_left)
+
+                session.add_catch({
+                    "type": catch_result["type"],
+                    "value": catch_result["value"],
+                    "rarity": catch_result["rarity"],
+                    "penalty": True,
+                    "game_over": lives_left <= 0,
+                })
+
+                if lives_left <= 0:
+                    session.end_game()
+
+            self.recorder.frames = []
+
+    def draw_hud(self, session, surface):
+        """Draw the score and, during play, the instructions."""
+        super().draw_hud(session, surface)
 
         # Instructions (only when playing)
-        if (
-                not game_over
-                and not paused
-                and not angler_pause_active
-                and not showing_release_message
-        ):
+        if session.playing():
             instructions = [
-                "SPACE / SCREAM: Cast / Reel",
+                f"SPACE / {self.scream_control}: Cast / Reel",
                 "Arrow keys: Move boat",
                 "P: Pause | ESC: Quit",
             ]
             y_offset = 50
             for instruction in instructions:
-                text = font.render(instruction, True, WHITE)
-                screen.blit(text, (10, y_offset))
+                text = render_text(font, instruction, WHITE)
+                surface.blit(text, (10, y_offset))
                 y_offset += 25
 
-        # Draw pause overlay
-        if paused:
-            draw_pause_overlay(screen)
+    def draw_overlays(self, session, surface):
+        """Draw the pause, scream window, release and game over overlays."""
+        if session.paused:
+            draw_pause_overlay(surface)
 
-        # Draw danger fish overlay
-        if angler_pause_active and not game_over:
+        if self.angler_pause_active and not session.game_over:
             draw_danger_fish_overlay(
-                screen, recorder, scream_progress,
-                angler_pause_start_time,
-                ANGLER_PAUSE_DURATION, SCREAM_PEAK_THRESHOLD
+                surface, self.recorder, self.scream_progress,
+                self.angler_pause_start_time,
+                ANGLER_PAUSE_DURATION, SCREAM_PEAK_THRESHOLD,
+                scream_detected=(
+                    None if self.scream_detector is None
+                    else self.scream_detector.is_screaming),
+                scream_control=self.scream_control
             )
 
-        # Show release message overlay
-        if showing_release_message and not game_over:
-            draw_release_message(screen, current_release_message)
+        if self.showing_release_message and not session.game_over:
+            draw_release_message(surface, self.current_release_message)
 
-        # Draw game over screen
-        if game_over:
+        if session.game_over:
             draw_game_over_screen(
-                screen, score, fish_caught_count, high_score_result)
-
-        # Draw red flash effect
-        fish_manager.draw_red_flash(screen)
-
-        # Fade in effect
-        if fade_alpha > 0:
-            fade_surf = pygame.Surface(
-                (SCREEN_WIDTH, SCREEN_HEIGHT))
-            fade_surf.fill((0, 0, 0))
-            fade_surf.set_alpha(fade_alpha)
-            screen.blit(fade_surf, (0, 0))
-            fade_alpha = max(0, fade_alpha - 8)
-
-        # Update display
-        pygame.display.flip()
-        clock.tick(FPS)
-
-    # Cleanup
-    sounds['background_classic'].stop()
-    recorder.close()
-    return score
+                surface, session.score, session.fish_caught_count,
+                session.high_score_result)
+
+    def flight_flags(self, session):
+        """Record the scream window and release message too."""
+        return {"paused": session.paused, "game_over": session.game_over,
+                "angler_pause_active": self.angler_pause_active,
+                "showing_release_message": self.showing_release_message}
+
+    def close(self, session):
+        """Close the microphone and the detector."""
+        self.recorder.close()
+        if self.scream_detector is not None:
+            self.scream_detector.close()
+
+
+def main(driver=None, background=None):
+    """
+    Main game loop for Classic Mode.
+
+    Args:
+        driver (GameDriver): Input and frame pacing, defaults to live
+            keyboard input at FPS.
+        background (BackgroundManager): Background shared with the menu,
+            defaults to a new one.
+
+    Returns:
+        int: Final score achieved.
+    """
+    rules = ClassicRules(START_FISHES, CATCH_LOGGING)
+    return GameSession(rules, driver, background).run()
 
 
 if __name__ == '__main__':
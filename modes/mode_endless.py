@@ -9,41 +9,43 @@ Endless Mode for Fish-O-Mania.
 A relaxing game mode with no lives or timer. Players can fish at their
 own pace without any penalties. Perfect for casual play and practicing.
 
+The game loop is the shared session (modes/session.py); this module
+holds the endless rules and screens.
+
 Functions:
     format_time: Formats seconds into MM:SS string.
+    load_sounds: Load the endless mode sounds.
+    draw_pause_overlay: Draw the pause screen.
     draw_game_over_screen: Draw the summary screen when quitting.
     main: Main game loop for endless mode.
+
+Classes:
+    EndlessRules: No lives or timer; ESC ends the session.
 """
 
-import pygame
 from mechanics.constants import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
-    FPS,
     WHITE,
-    SKY_BLUE,
-    AZURE,
-    DEEP_BLUE,
-    WATER_SURFACE,
-    BOAT_SPEED,
-    ROD_MAX_LENGTH,
-    ROD_SPEED,
-    START_FISHES
+    START_FISHES,
+    CATCH_LOGGING
 )
 from fish.relaxed_fish_manager import RelaxedFishManager
-from background import BackgroundManager
-from mechanics.casting import CastingRod
+from mechanics.assets import load_sound
+from mechanics.tracing import traced
+from mechanics import game_clock
 from mechanics.scores import update_high_score, get_high_score
-
-# Initialize pygame
-pygame.init()
-
-# Display setup
-SCREEN_RESOLUTION = (SCREEN_WIDTH, SCREEN_HEIGHT)
-screen = pygame.display.set_mode(SCREEN_RESOLUTION)
-clock = pygame.time.Clock()
-font = pygame.font.Font(None, 24)
-big_font = pygame.font.Font(None, 36)
+from modes.session import (  # noqa: F401 (re-exported)
+    GameSession,
+    Rules,
+    big_font,
+    dim,
+    draw_water_background,
+    font,
+    handle_danger_fish_catch,
+    load_graphics,
+    render_text,
+)
 
 
 def format_time(seconds):
@@ -61,6 +63,7 @@ def format_time(seconds):
     return f"{mins:02d}:{secs:02d}"
 
 
+@traced("load_sounds", "assets")
 def load_sounds():
     """
     Load and configure all sound effects.
@@ -69,8 +72,8 @@ def load_sounds():
         dict: Dictionary of loaded sound objects.
     """
     sounds = {
-        'background_endless': pygame.mixer.Sound("sounds/endless.mp3"),
-        'casting': pygame.mixer.Sound("sounds/casting-whoosh.mp3"),
+        'background_endless': load_sound("sounds/endless.mp3", "music"),
+        'casting': load_sound("sounds/casting-whoosh.mp3"),
     }
 
     # Slightly quieter for relaxing mode
@@ -80,56 +83,6 @@ def load_sounds():
     return sounds
 
 
-def load_graphics():
-    """
-    Load and configure all graphic assets.
-
-    Returns:
-        dict: Dictionary containing loaded images and their rects.
-    """
-    # Load boat
-    boat_image = pygame.image.load("graphics/boat.png")
-    boat_image = pygame.transform.scale(boat_image, (310, 260))
-    boat_x = SCREEN_WIDTH // 2 - boat_image.get_width() // 2 - 300
-    boat_y = WATER_SURFACE - boat_image.get_height() // 2 - 20
-
-    # Load fishing hook
-    hook_image = pygame.image.load("graphics/fishing_hook.png")
-    hook_image = pygame.transform.scale(hook_image, (30, 30))
-    hook_rect = hook_image.get_rect()
-
-    return {
-        'boat_image': boat_image,
-        'boat_x': boat_x,
-        'boat_y': boat_y,
-        'hook_image': hook_image,
-        'hook_rect': hook_rect
-    }
-
-
-def draw_water_background(surface):
-    """
-    Draw the sky and water gradient background.
-
-    Args:
-        surface (pygame.Surface): Surface to draw on.
-    """
-    surface.fill(SKY_BLUE)
-    pygame.draw.rect(
-        surface,
-        DEEP_BLUE,
-        (0, WATER_SURFACE, SCREEN_WIDTH, SCREEN_HEIGHT - WATER_SURFACE)
-    )
-
-    for y in range(WATER_SURFACE, SCREEN_HEIGHT):
-        ratio = (y - WATER_SURFACE) / (SCREEN_HEIGHT - WATER_SURFACE)
-        color = tuple(
-            int(AZURE[i] + (DEEP_BLUE[i] - AZURE[i]) * ratio)
-            for i in range(3)
-        )
-        pygame.draw.line(surface, color, (0, y), (SCREEN_WIDTH, y))
-
-
 def draw_pause_overlay(surface):
     """
     Draw the pause screen overlay.
@@ -137,10 +90,7 @@ def draw_pause_overlay(surface):
     Args:
         surface (pygame.Surface): Surface to draw on.
     """
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    overlay.set_alpha(150)
-    overlay.fill((0, 0, 50))
-    surface.blit(overlay, (0, 0))
+    dim(surface, (0, 0, 50), 150)
 
     center_x = SCREEN_WIDTH // 2
     center_y = SCREEN_HEIGHT // 2
@@ -169,10 +119,7 @@ def draw_game_over_screen(surface, score,
     current_high = get_high_score("endless")
 
     # Overlay
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    overlay.set_alpha(180)
-    overlay.fill((0, 0, 0))
-    surface.blit(overlay, (0, 0))
+    dim(surface, (0, 0, 0), 180)
 
     center_x = SCREEN_WIDTH // 2
     center_y = SCREEN_HEIGHT // 2
@@ -224,263 +171,78 @@ def draw_game_over_screen(surface, score,
     surface.blit(quit_text, quit_rect)
 
 
-def handle_danger_fish_catch(casting_manager, fish_manager):
+class EndlessRules(Rules):
     """
-    Handle catching a danger fish immediately (no scream mechanic).
+    No lives or timer. ESC ends the session and shows the summary; ESC
+    again leaves the mode.
 
-    Args:
-        casting_manager: The casting rod manager.
-        fish_manager: The fish manager.
-
-    Returns:
-        dict: Fish info if a danger fish was caught, None otherwise.
-    """
-    if casting_manager.pending_danger_fish is not None:
-        fish = casting_manager.pending_danger_fish
-        fish_value = getattr(fish, 'value', 25)
-        fish_type = getattr(fish, 'fish_type', 'Danger Fish')
-        fish_rarity = getattr(fish, 'rarity', 'danger')
-
-        # Mark fish as caught
-        fish.is_hooked = False
-        fish.is_caught = True
-        fish.caught = True
-
-        # Create death animation
-        death_anim = fish.create_death_animation()
-        if death_anim:
-            fish_manager.death_animations.add(death_anim)
-
-        # Remove from sprite groups
-        fish.kill()
-
-        # Add to recent catches display
-        catch_data = {
-            "type": fish_type,
-            "value": fish_value,
-            "rarity": fish_rarity,
-            "current_frame": 0,
-            "frame_counter": 0,
-            "frame_delay": 8,
-        }
-        fish_manager.recent_catches.append(catch_data)
-        if len(fish_manager.recent_catches) > fish_manager.max_recent_catches:
-            fish_manager.recent_catches.pop(0)
-
-        # Clear pending state
-        casting_manager.pending_danger_fish = None
-        casting_manager.attached_fish = None
-        casting_manager.start_cooldown()
-
-        return {
-            "type": fish_type,
-            "value": fish_value,
-            "rarity": fish_rarity,
-            "penalty": True
-        }
-    return None
-
-
-def main():
+    Attributes:
+        start_ticks (int): pygame ticks when the session started.
+        elapsed (float): Seconds played (display only, no limit).
+        high_score (int): Endless high score shown in the HUD.
     """
-    Main game loop for Endless Mode.
 
-    Returns:
-        int: Final score achieved.
-    """
-    pygame.init()
-
-    # Load assets
-    sounds = load_sounds()
-    graphics = load_graphics()
-    sounds['background_endless'].play(-1)
-
-    # Initialize game state
-    running = True
-    paused = False
-    show_summary = False
-    pygame.display.set_caption("Fish-O-Mania: Endless Mode")
-
-    # Initialize managers
-    fish_manager = RelaxedFishManager()
-    background_manager = BackgroundManager()
-    casting_manager = CastingRod(ROD_MAX_LENGTH, ROD_SPEED)
-
-    # Spawn initial fish
-    for i in range(START_FISHES):
-        fish_manager.spawn_fish()
-
-    # Game variables
-    score = 0
-    caught_fish = []
-    fish_caught_count = 0
-    boat_x = graphics['boat_x']
-    boat_y = graphics['boat_y']
-    high_score_result = None
-
-    # Session timer (display only, no limit)
-    start_ticks = pygame.time.get_ticks()
-    elapsed = 0
-
-    # Fade in effect
-    fade_alpha = 255
-
-    # Main game loop
-    while running:
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if show_summary:
-                        # Exit game from summary screen
-                        running = False
-                    else:
-                        # Show summary screen
-                        elapsed = (pygame.time.get_ticks() -
-                                   start_ticks) / 1000
-                        high_score_result = update_high_score(
-                            "endless", score, fish_caught_count, elapsed
-                        )
-                        show_summary = True
-
-                elif event.key == pygame.K_SPACE:
-                    if not paused and not show_summary:
-                        casting_manager.toggle_cast()
-                        sounds['casting'].play()
-
-                elif event.key == pygame.K_p:
-                    if not show_summary:
-                        paused = not paused
-
-                elif event.key == pygame.K_RETURN:
-                    if show_summary:
-                        # Restart game
-                        fish_manager.clear_all()
-                        casting_manager.reset()
-                        score = 0
-                        caught_fish = []
-                        fish_caught_count = 0
-                        for i in range(START_FISHES):
-                            fish_manager.spawn_fish()
-                        show_summary = False
-                        high_score_result = None
-                        start_ticks = pygame.time.get_ticks()
-
-        # Update game state (when not paused or showing summary)
-        if not paused and not show_summary:
-            fish_manager.update()
-            background_manager.update()
-
-            # Boat movement
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_LEFT]:
-                boat_x -= BOAT_SPEED
-            if keys[pygame.K_RIGHT]:
-                boat_x += BOAT_SPEED
-
-            boat_x = max(
-                0,
-                min(boat_x, SCREEN_WIDTH - graphics['boat_image'].get_width())
-            )
-
-            # Hook position
-            rod_x = boat_x + graphics['boat_image'].get_width() - 65
-            rod_top_y = boat_y + 160
-
-            # Casting
-            result = casting_manager.update(
-                graphics['hook_rect'],
-                fish_manager,
-                sounds['casting']
-            )
-
-            if result:
-                if result.get('penalty'):
-                    # Danger fish caught - handle immediately
-                    danger_result = handle_danger_fish_catch(
-                        casting_manager, fish_manager)
-                    if danger_result:
-                        score += danger_result["value"]
-                        fish_caught_count += 1
-                        caught_fish.append(danger_result)
-                        fish_manager.catch_sound.play()
-                else:
-                    score += result["value"]
-                    fish_caught_count += 1
-                    caught_fish.append(result)
-
-            # Update hook rect
-            hook_x = rod_x
-            hook_y = rod_top_y + casting_manager.rod_length
-            graphics['hook_rect'].x = (
-                hook_x - graphics['hook_image'].get_width() // 2
-            )
-            graphics['hook_rect'].y = hook_y
-
-            # Session time
-            elapsed = (pygame.time.get_ticks() - start_ticks) / 1000
-
-        # Drawing
-        draw_water_background(screen)
-        background_manager.draw(screen)
-
-        # Boat
-        screen.blit(graphics['boat_image'], (boat_x, boat_y))
-
-        # Fishing line
-        rod_x = boat_x + graphics['boat_image'].get_width() - 65
-        rod_top_y = boat_y + 160
-        hook_x = rod_x
-        hook_y = rod_top_y + casting_manager.rod_length
-
-        pygame.draw.line(
-            screen,
-            WHITE,
-            (rod_x - 5, rod_top_y),
-            (hook_x - 5, hook_y),
-            2
-        )
-
-        # Hook
-        screen.blit(graphics['hook_image'], graphics['hook_rect'])
-
-        # Fish
-        fish_manager.draw(screen)
-
-        # UI - Score and stats
-        current_high = get_high_score("endless")
-
-        score_text = big_font.render(f"Score: {score}", True, WHITE)
-        screen.blit(score_text, (10, 10))
-
-        count_text = font.render(
-            f"Fish caught: {fish_caught_count}", True, WHITE)
-        screen.blit(count_text, (10, 50))
-
-        time_text = font.render(f"Time: {format_time(elapsed)}", True, WHITE)
-        screen.blit(time_text, (10, 75))
-
-        high_text = font.render(
-            f"High Score: {current_high}",
-            True,
-            (200, 200, 200)
-        )
-        screen.blit(high_text, (10, 100))
+    mode = "endless"
+    caption = "Fish-O-Mania: Endless Mode"
+    music = "background_endless"
+    fish_manager_class = RelaxedFishManager
+
+    def load_sounds(self):
+        """Load the endless mode sounds."""
+        return load_sounds()
+
+    def start(self, session):
+        """Start the session clock."""
+        self.start_ticks = game_clock.get_ticks()
+        self.elapsed = 0
+        # Only changes when a session ends
+        self.high_score = get_high_score("endless")
+
+    def on_escape(self, session):
+        """End the session, or leave from the summary."""
+        if session.game_over:
+            # Exit game from summary screen
+            return True
+        # Show summary screen
+        self.elapsed = (game_clock.get_ticks() - self.start_ticks) / 1000
+        session.end_game()
+        return False
+
+    def update_play(self, session):
+        """Advance the session clock."""
+        self.elapsed = (game_clock.get_ticks() - self.start_ticks) / 1000
+
+    def save_score(self, session):
+        """Save the score with the time played."""
+        result = update_high_score("endless", session.score,
+                                   session.fish_caught_count, self.elapsed)
+        self.high_score = get_high_score("endless")
+        return result
+
+    def draw_hud(self, session, surface):
+        """Draw the score, stats, mode indicator and instructions."""
+        super().draw_hud(session, surface)
+
+        count_text = render_text(
+            font, f"Fish caught: {session.fish_caught_count}", WHITE)
+        surface.blit(count_text, (10, 50))
+
+        time_text = render_text(
+            font, f"Time: {format_time(self.elapsed)}", WHITE)
+        surface.blit(time_text, (10, 75))
+
+        high_text = render_text(
+            font, f"High Score: {self.high_score}", (200, 200, 200))
+        surface.blit(high_text, (10, 100))
 
         # Mode indicator
-        mode_text = font.render(
-            "ENDLESS MODE - No lives, just vibes",
-            True,
-            (200, 255, 200)
-        )
+        mode_text = render_text(
+            font, "ENDLESS MODE - No lives, just vibes", (200, 255, 200))
         mode_rect = mode_text.get_rect(center=(SCREEN_WIDTH // 2, 20))
-        screen.blit(mode_text, mode_rect)
+        surface.blit(mode_text, mode_rect)
 
         # Instructions
-        if not show_summary:
+        if not session.game_over:
             instructions = [
                 "SPACE: Cast",
                 "P: Pause",
@@ -488,37 +250,40 @@ def main():
             ]
             y_offset = SCREEN_HEIGHT - 80
             for instruction in instructions:
-                text = font.render(instruction, True, WHITE)
-                screen.blit(text, (10, y_offset))
+                text = render_text(font, instruction, WHITE)
+                surface.blit(text, (10, y_offset))
                 y_offset += 22
 
-        # Pause overlay
-        if paused:
-            draw_pause_overlay(screen)
-
-        # Summary screen
-        if show_summary:
-            draw_game_over_screen(screen, score,
-                                  fish_caught_count,
-                                  elapsed, high_score_result)
-
-        # Draw red flash effect
-        fish_manager.draw_red_flash(screen)
-
-        # Fade in
-        if fade_alpha > 0:
-            fade_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            fade_surf.fill((0, 0, 0))
-            fade_surf.set_alpha(fade_alpha)
-            screen.blit(fade_surf, (0, 0))
-            fade_alpha -= 8
-
-        pygame.display.flip()
-        clock.tick(FPS)
-
-    # Cleanup
-    sounds['background_endless'].stop()
-    return score
+    def draw_pause(self, session, surface):
+        """Draw the pause overlay."""
+        draw_pause_overlay(surface)
+
+    def draw_game_over(self, session, surface):
+        """Draw the session summary."""
+        draw_game_over_screen(surface, session.score,
+                              session.fish_caught_count,
+                              self.elapsed, session.high_score_result)
+
+    def flight_flags(self, session):
+        """Record the summary screen as show_summary."""
+        return {"paused": session.paused, "show_summary": session.game_over}
+
+
+def main(driver=None, background=None):
+    """
+    Main game loop for Endless Mode.
+
+    Args:
+        driver (GameDriver): Input and frame pacing, defaults to live
+            keyboard input at FPS.
+        background (BackgroundManager): Background shared with the menu,
+            defaults to a new one.
+
+    Returns:
+        int: Final score achieved.
+    """
+    rules = EndlessRules(START_FISHES, CATCH_LOGGING)
+    return GameSession(rules, driver, background).run()
 
 
 if __name__ == '__main__':
@@ -10,45 +10,52 @@ A fast-paced game mode where players have a limited time to catch as
 many fish as possible. Fish move faster than normal, and catching danger
 fish costs a life but still awards points.
 
+The game loop is the shared session (modes/session.py); this module
+holds the timer rules and the time attack screens.
+
 Functions:
+    load_sounds: Load the time attack sounds.
+    draw_pause_overlay: Draw the pause screen with the time left.
+    draw_game_over_screen: Draw the time's up screen.
     main: Main game loop for time attack mode.
+
+Classes:
+    TimeAttackRules: Countdown timer rules.
 """
 
 import pygame
 from mechanics.constants import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
-    FPS,
     WHITE,
-    SKY_BLUE,
-    AZURE,
-    DEEP_BLUE,
-    WATER_SURFACE,
-    BOAT_SPEED,
-    ROD_MAX_LENGTH,
-    ROD_SPEED
+    CATCH_LOGGING
 )
 from fish.fast_fish_manager import FastFishManager
-from background import BackgroundManager
-from mechanics.casting import CastingRod
-from mechanics.scores import update_high_score, get_high_score
-
-# Initialize pygame
-pygame.init()
+from mechanics.assets import load_sound
+from mechanics.tracing import traced
+from mechanics import game_clock, startup
+from mechanics.scores import get_high_score
+from modes.session import (  # noqa: F401 (re-exported)
+    GameSession,
+    Rules,
+    big_font,
+    dim,
+    draw_water_background,
+    font,
+    handle_danger_fish_catch,
+    load_graphics,
+    render_text,
+)
 
-# Display setup
-SCREEN_RESOLUTION = (SCREEN_WIDTH, SCREEN_HEIGHT)
-screen = pygame.display.set_mode(SCREEN_RESOLUTION)
-clock = pygame.time.Clock()
-font = pygame.font.Font(None, 24)
-big_font = pygame.font.Font(None, 36)
-timer_font = pygame.font.Font(None, 72)
+with startup.phase("mode_time_attack fonts", "init"):
+    timer_font = pygame.font.Font(None, 72)
 
 # Time attack settings
 GAME_DURATION = 30  # Seconds
 INITIAL_FISH_COUNT = 8  # More fish at start
 
 
+@traced("load_sounds", "assets")
 def load_sounds():
     """
     Load and configure all sound effects.
@@ -57,8 +64,9 @@ def load_sounds():
         dict: Dictionary of loaded sound objects.
     """
     sounds = {
-        'background_timeattack': pygame.mixer.Sound("sounds/timeattack.mp3"),
-        'casting': pygame.mixer.Sound("sounds/casting-whoosh.mp3"),
+        'background_timeattack': load_sound("sounds/timeattack.mp3",
+                                            "music"),
+        'casting': load_sound("sounds/casting-whoosh.mp3"),
     }
 
     sounds['background_timeattack'].set_volume(0.3)
@@ -67,56 +75,6 @@ def load_sounds():
     return sounds
 
 
-def load_graphics():
-    """
-    Load and configure all graphic assets.
-
-    Returns:
-        dict: Dictionary containing loaded images and their rects.
-    """
-    # Load boat
-    boat_image = pygame.image.load("graphics/boat.png")
-    boat_image = pygame.transform.scale(boat_image, (310, 260))
-    boat_x = SCREEN_WIDTH // 2 - boat_image.get_width() // 2 - 300
-    boat_y = WATER_SURFACE - boat_image.get_height() // 2 - 20
-
-    # Load fishing hook
-    hook_image = pygame.image.load("graphics/fishing_hook.png")
-    hook_image = pygame.transform.scale(hook_image, (30, 30))
-    hook_rect = hook_image.get_rect()
-
-    return {
-        'boat_image': boat_image,
-        'boat_x': boat_x,
-        'boat_y': boat_y,
-        'hook_image': hook_image,
-        'hook_rect': hook_rect
-    }
-
-
-def draw_water_background(surface):
-    """
-    Draw the sky and water gradient background.
-
-    Args:
-        surface (pygame.Surface): Surface to draw on.
-    """
-    surface.fill(SKY_BLUE)
-    pygame.draw.rect(
-        surface,
-        DEEP_BLUE,
-        (0, WATER_SURFACE, SCREEN_WIDTH, SCREEN_HEIGHT - WATER_SURFACE)
-    )
-
-    for y in range(WATER_SURFACE, SCREEN_HEIGHT):
-        ratio = (y - WATER_SURFACE) / (SCREEN_HEIGHT - WATER_SURFACE)
-        color = tuple(
-            int(AZURE[i] + (DEEP_BLUE[i] - AZURE[i]) * ratio)
-            for i in range(3)
-        )
-        pygame.draw.line(surface, color, (0, y), (SCREEN_WIDTH, y))
-
-
 def draw_pause_overlay(surface, time_remaining):
     """
     Draw the pause screen overlay.
@@ -125,10 +83,7 @@ def draw_pause_overlay(surface, time_remaining):
         surface (pygame.Surface): Surface to draw on.
         time_remaining (float): Time remaining when paused.
     """
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    overlay.set_alpha(150)
-    overlay.fill((0, 0, 50))
-    surface.blit(overlay, (0, 0))
+    dim(surface, (0, 0, 50), 150)
 
     center_x = SCREEN_WIDTH // 2
     center_y = SCREEN_HEIGHT // 2
@@ -163,10 +118,7 @@ def draw_game_over_screen(surface, score,
     current_high = get_high_score("time_attack")
 
     # Overlay
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    overlay.set_alpha(180)
-    overlay.fill((0, 0, 0))
-    surface.blit(overlay, (0, 0))
+    dim(surface, (0, 0, 0), 180)
 
     center_x = SCREEN_WIDTH // 2
     center_y = SCREEN_HEIGHT // 2
@@ -216,266 +168,75 @@ def draw_game_over_screen(surface, score,
     surface.blit(quit_text, quit_rect)
 
 
-def handle_danger_fish_catch(casting_manager, fish_manager):
+class TimeAttackRules(Rules):
     """
-    Handle catching a danger fish immediately (no scream mechanic).
-
-    Args:
-        casting_manager: The casting rod manager.
-        fish_manager: The fish manager.
-
-    Returns:
-        dict: Fish info if a danger fish was caught, None otherwise.
-    """
-    if casting_manager.pending_danger_fish is not None:
-        fish = casting_manager.pending_danger_fish
-        fish_value = getattr(fish, 'value', 25)
-        fish_type = getattr(fish, 'fish_type', 'Danger Fish')
-        fish_rarity = getattr(fish, 'rarity', 'danger')
-
-        # Mark fish as caught
-        fish.is_hooked = False
-        fish.is_caught = True
-        fish.caught = True
-
-        # Create death animation
-        death_anim = fish.create_death_animation()
-        if death_anim:
-            fish_manager.death_animations.add(death_anim)
-
-        # Remove from sprite groups
-        fish.kill()
-
-        # Add to recent catches display
-        catch_data = {
-            "type": fish_type,
-            "value": fish_value,
-            "rarity": fish_rarity,
-            "current_frame": 0,
-            "frame_counter": 0,
-            "frame_delay": 8,
-        }
-        fish_manager.recent_catches.append(catch_data)
-        if len(fish_manager.recent_catches) > fish_manager.max_recent_catches:
-            fish_manager.recent_catches.pop(0)
-
-        # Clear pending state
-        casting_manager.pending_danger_fish = None
-        casting_manager.attached_fish = None
-        casting_manager.start_cooldown()
-
-        return {
-            "type": fish_type,
-            "value": fish_value,
-            "rarity": fish_rarity,
-            "penalty": True
-        }
-    return None
-
-
-def main():
-    """
-    Main game loop for Time Attack Mode.
+    Countdown timer rules: the game ends when GAME_DURATION runs out.
 
-    Returns:
-        int: Final score achieved.
+    Attributes:
+        start_ticks (int): pygame ticks when the game started.
+        paused_time (int): Milliseconds spent paused.
+        pause_start (int): pygame ticks when the current pause started.
+        time_remaining (float): Seconds left.
     """
-    pygame.init()
-
-    # Load assets
-    sounds = load_sounds()
-    graphics = load_graphics()
-    sounds['background_timeattack'].play(-1)
-
-    # Initialize game state
-    running = True
-    game_over = False
-    paused = False
-    pygame.display.set_caption("Fish-O-Mania: Time Attack")
-
-    # Initialize managers
-    fish_manager = FastFishManager()
-    background_manager = BackgroundManager()
-    casting_manager = CastingRod(ROD_MAX_LENGTH, ROD_SPEED)
-
-    # Spawn initial fish (more than classic mode)
-    for i in range(INITIAL_FISH_COUNT):
-        fish_manager.spawn_fish()
-
-    # Game variables
-    score = 0
-    caught_fish = []
-    fish_caught_count = 0
-    boat_x = graphics['boat_x']
-    boat_y = graphics['boat_y']
-    high_score_result = None
-
-    # Timer
-    start_ticks = pygame.time.get_ticks()
-    paused_time = 0  # Track total time spent paused
-    pause_start = 0  # When current pause started
-    time_remaining = GAME_DURATION
-
-    # Fade in effect
-    fade_alpha = 255
-
-    # Main game loop
-    while running:
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-
-                elif event.key == pygame.K_SPACE:
-                    if not game_over and not paused:
-                        casting_manager.toggle_cast()
-                        sounds['casting'].play()
-
-                elif event.key == pygame.K_p:
-                    if not game_over:
-                        if paused:
-                            # Resuming - add paused duration to total
-                            paused_time += (
-                                    pygame.time.get_ticks() - pause_start)
-                            paused = False
-                        else:
-                            # Pausing - record when pause started
-                            pause_start = pygame.time.get_ticks()
-                            paused = True
-
-                elif event.key == pygame.K_RETURN:
-                    if game_over:
-                        # Restart game
-                        fish_manager.clear_all()
-                        casting_manager.reset()
-                        score = 0
-                        caught_fish = []
-                        fish_caught_count = 0
-                        for i in range(INITIAL_FISH_COUNT):
-                            fish_manager.spawn_fish()
-                        game_over = False
-                        high_score_result = None
-                        start_ticks = pygame.time.get_ticks()
-                        paused_time = 0
-
-        # Update game state
-        if not game_over and not paused:
-            # Update timer (accounting for paused time)
-            elapsed = (pygame.time.get_ticks() -
-                       start_ticks - paused_time) / 1000
-            time_remaining = max(0, GAME_DURATION - elapsed)
-
-            if time_remaining <= 0:
-                game_over = True
-                high_score_result = update_high_score("time_attack",
-                                                      score, fish_caught_count)
-
-            fish_manager.update()
-            background_manager.update()
-
-            # Boat movement
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_LEFT]:
-                boat_x -= BOAT_SPEED
-            if keys[pygame.K_RIGHT]:
-                boat_x += BOAT_SPEED
-
-            boat_x = max(
-                0,
-                min(boat_x, SCREEN_WIDTH - graphics['boat_image'].get_width())
-            )
-
-            # Hook position
-            rod_x = boat_x + graphics['boat_image'].get_width() - 65
-            rod_top_y = boat_y + 160
-
-            # Casting
-            result = casting_manager.update(
-                graphics['hook_rect'],
-                fish_manager,
-                sounds['casting']
-            )
-
-            if result:
-                if result.get('penalty'):
-                    # Danger fish caught - handle immediately
-                    danger_result = handle_danger_fish_catch(
-                        casting_manager, fish_manager)
-                    if danger_result:
-                        score += danger_result["value"]
-                        fish_caught_count += 1
-                        caught_fish.append(danger_result)
-                        fish_manager.catch_sound.play()
-                else:
-                    score += result["value"]
-                    fish_caught_count += 1
-                    caught_fish.append(result)
-
-            # Update hook rect
-            hook_x = rod_x
-            hook_y = rod_top_y + casting_manager.rod_length
-            graphics['hook_rect'].x = (
-                hook_x - graphics['hook_image'].get_width() // 2
-            )
-            graphics['hook_rect'].y = hook_y
-
-        # Drawing
-        draw_water_background(screen)
-        background_manager.draw(screen)
-
-        # Boat
-        screen.blit(graphics['boat_image'], (boat_x, boat_y))
-
-        # Fishing line
-        rod_x = boat_x + graphics['boat_image'].get_width() - 65
-        rod_top_y = boat_y + 160
-        hook_x = rod_x
-        hook_y = rod_top_y + casting_manager.rod_length
-
-        pygame.draw.line(
-            screen,
-            WHITE,
-            (rod_x - 5, rod_top_y),
-            (hook_x - 5, hook_y),
-            2
-        )
-
-        # Hook
-        screen.blit(graphics['hook_image'], graphics['hook_rect'])
-
-        # Fish
-        fish_manager.draw(screen)
 
+    mode = "time_attack"
+    caption = "Fish-O-Mania: Time Attack"
+    music = "background_timeattack"
+    fish_manager_class = FastFishManager
+
+    def load_sounds(self):
+        """Load the time attack sounds."""
+        return load_sounds()
+
+    def start(self, session):
+        """Start the timer."""
+        self.start_ticks = game_clock.get_ticks()
+        self.paused_time = 0
+        self.pause_start = 0
+        self.time_remaining = GAME_DURATION
+
+    def on_pause(self, session):
+        """Stop the clock while paused."""
+        if session.paused:
+            # Pausing - record when pause started
+            self.pause_start = game_clock.get_ticks()
+        else:
+            # Resuming - add paused duration to total
+            self.paused_time += game_clock.get_ticks() - self.pause_start
+
+    def update_play(self, session):
+        """Count down, ending the game at zero."""
+        # Update timer (accounting for paused time)
+        elapsed = (game_clock.get_ticks() -
+                   self.start_ticks - self.paused_time) / 1000
+        self.time_remaining = max(0, GAME_DURATION - elapsed)
+
+        if self.time_remaining <= 0:
+            session.end_game()
+
+    def draw_hud(self, session, surface):
+        """Draw the timer, score, fish count and instructions."""
         # Timer display (top center)
-        timer_color = (255, 100, 100) if time_remaining <= 10 else WHITE
-        timer_text = timer_font.render(
-            f"{int(time_remaining)}", True, timer_color)
+        timer_color = (255, 100, 100) if self.time_remaining <= 10 else WHITE
+        timer_text = render_text(
+            timer_font, f"{int(self.time_remaining)}", timer_color)
         timer_rect = timer_text.get_rect(center=(SCREEN_WIDTH - 125, 50))
-        screen.blit(timer_text, timer_rect)
+        surface.blit(timer_text, timer_rect)
 
         # Score and fish count
-        score_text = big_font.render(f"Score: {score}", True, WHITE)
-        screen.blit(score_text, (10, 10))
-
-        count_text = font.render(
-            f"Fish caught: {fish_caught_count}", True, WHITE)
-        screen.blit(count_text, (10, 50))
+        super().draw_hud(session, surface)
+        count_text = render_text(
+            font, f"Fish caught: {session.fish_caught_count}", WHITE)
+        surface.blit(count_text, (10, 50))
 
         # Instructions
-        if not game_over and not paused:
+        if not session.game_over and not session.paused:
             # Mode indicator
-            mode_text = font.render(
-                "Race against the timer, catch them all!",
-                True,
-                (200, 255, 200)
-            )
-            mode_rect = mode_text.get_rect(
-                center=(SCREEN_WIDTH // 2, 20))
-            screen.blit(mode_text, mode_rect)
+            mode_text = render_text(
+                font, "Race against the timer, catch them all!",
+                (200, 255, 200))
+            mode_rect = mode_text.get_rect(center=(SCREEN_WIDTH // 2, 20))
+            surface.blit(mode_text, mode_rect)
 
             instructions = [
                 "SPACE: Cast",
@@ -484,36 +245,36 @@ def main():
             ]
             y_offset = 80
             for instruction in instructions:
-                text = font.render(instruction, True, WHITE)
-                screen.blit(text, (10, y_offset))
+                text = render_text(font, instruction, WHITE)
+                surface.blit(text, (10, y_offset))
                 y_offset += 25
 
-        # Pause overlay
-        if paused:
-            draw_pause_overlay(screen, time_remaining)
+    def draw_pause(self, session, surface):
+        """Draw the pause overlay with the time left."""
+        draw_pause_overlay(surface, self.time_remaining)
 
-        # Game over screen
-        if game_over:
-            draw_game_over_screen(screen, score,
-                                  fish_caught_count, high_score_result)
+    def draw_game_over(self, session, surface):
+        """Draw the time's up screen."""
+        draw_game_over_screen(surface, session.score,
+                              session.fish_caught_count,
+                              session.high_score_result)
 
-        # Draw red flash (still shows but no penalty)
-        fish_manager.draw_red_flash(screen)
 
-        # Fade in
-        if fade_alpha > 0:
-            fade_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            fade_surf.fill((0, 0, 0))
-            fade_surf.set_alpha(fade_alpha)
-            screen.blit(fade_surf, (0, 0))
-            fade_alpha -= 8
+def main(driver=None, background=None):
+    """
+    Main game loop for Time Attack Mode.
 
-        pygame.display.flip()
-        clock.tick(FPS)
+    Args:
+        driver (GameDriver): Input and frame pacing, defaults to live
+            keyboard input at FPS.
+        background (BackgroundManager): Background shared with the menu,
+            defaults to a new one.
 
-    # Cleanup
-    sounds['background_timeattack'].stop()
-    return score
+    Returns:
+        int: Final score achieved.
+    """
+    rules = TimeAttackRules(INITIAL_FISH_COUNT, CATCH_LOGGING)
+    return GameSession(rules, driver, background).run()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,902 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Game Session Engine for Fish-O-Mania.
+
+Every mode runs the same session loop: events, boat movement, the rod
+and hook, fish and background updates, catches, drawing, restart and
+quit, and the instrumentation (profiler, pacing, latency, metrics,
+flight recorder, GC policy, hitch sampler and replays). What makes a
+mode is its Rules object:
+    classic: lives, and a scream window for danger fish
+        (mode_classic.ClassicRules)
+    time_attack: a countdown timer (mode_time_attack.TimeAttackRules)
+    endless: no end, a session clock and a summary on ESC
+        (mode_endless.EndlessRules)
+
+Game time (mechanics/game_clock) moves on by each frame's length when
+the driver ticks. A driver with a seed (recording or playing a replay,
+see mechanics/replay) also gets the game's random streams seeded when
+the session starts (mechanics/random_streams), so the same input plays
+the same game.
+
+Drawing caches shared by every mode:
+    - the sky and water gradient is drawn once and then blitted
+    - full-screen overlays (pause, game over, fade-in) are built once
+      per colour instead of every frame
+    - HUD text is only rendered again when it changes
+
+Usage in a mode:
+    class TimeAttackRules(Rules):
+        mode = "time_attack"
+        ...
+
+    def main(driver=None, background=None):
+        rules = TimeAttackRules(INITIAL_FISH_COUNT, CATCH_LOGGING)
+        return GameSession(rules, driver, background).run()
+
+Functions:
+    draw_water_background: Draw the sky and water gradient background.
+    dim: Blend a colour over the whole surface.
+    render_text: Render text through the shared text cache.
+    load_graphics: Load the boat and hook.
+    handle_danger_fish_catch: Catch a danger fish without a scream window.
+
+Classes:
+    TextCache: Rendered text by font, text and colour.
+    Rules: Base class of a mode's rules.
+    GameSession: One mode's game loop.
+"""
+
+import pygame
+from mechanics.constants import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    WHITE,
+    SKY_BLUE,
+    AZURE,
+    DEEP_BLUE,
+    WATER_SURFACE,
+    BOAT_SPEED,
+    ROD_MAX_LENGTH,
+    ROD_SPEED,
+)
+from fish.fish_manager import FishManager
+from background import BackgroundManager
+from mechanics.casting import CastingRod
+from mechanics.game_driver import GameDriver
+from mechanics.assets import load_image
+from mechanics.catch_log import CatchLogger
+from mechanics.profiler import FrameProfiler
+from mechanics.pacing import start_pacing, end_pacing
+from mechanics.latency import start_latency, end_latency
+from mechanics.metrics import LoopMetrics
+from mechanics.flight_recorder import start_flight, end_flight
+from mechanics import gc_policy
+from mechanics import game_clock
+from mechanics import hitch_sampler
+from mechanics import replay
+from mechanics.random_streams import seed_streams
+from mechanics.tracing import traced
+from mechanics import startup
+from mechanics.scores import update_high_score
+from mechanics.game_log import fields, get_logger
+
+log = get_logger("session")
+
+# Initialize pygame (already done when started from the menu)
+with startup.phase("session pygame.init", "init"):
+    if not pygame.get_init():
+        pygame.init()
+
+# Display setup; reuse the menu's window instead of creating a new one
+SCREEN_RESOLUTION = (SCREEN_WIDTH, SCREEN_HEIGHT)
+with startup.phase("session set_mode", "init"):
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != SCREEN_RESOLUTION:
+        screen = pygame.display.set_mode(SCREEN_RESOLUTION)
+clock = pygame.time.Clock()
+with startup.phase("session fonts", "init"):
+    font = pygame.font.Font(None, 24)
+    big_font = pygame.font.Font(None, 36)
+
+# Fade-in from black when a session starts or restarts
+FADE_STEP = 8
+
+# Pre-rendered water background by surface size
+_water_cache = {}
+
+# Full-screen overlay surfaces by (size, colour)
+_overlay_cache = {}
+
+
+def _build_water_background(size):
+    """Draw the sky, water, surface line and gradient on a new surface."""
+    width, height = size
+    water = pygame.Surface(size)
+    if pygame.display.get_surface() is not None:
+        water = water.convert()
+
+    # Sky
+    water.fill(SKY_BLUE)
+
+    # Water area
+    pygame.draw.rect(water, DEEP_BLUE,
+                     (0, WATER_SURFACE, width, height - WATER_SURFACE))
+
+    # Water surface line
+    pygame.draw.line(water, WHITE, (0, WATER_SURFACE),
+                     (width, WATER_SURFACE), 2)
+
+    # Water gradient
+    for y in range(WATER_SURFACE, height):
+        ratio = (y - WATER_SURFACE) / (height - WATER_SURFACE)
+        color = tuple(
+            int(AZURE[i] + (DEEP_BLUE[i] - AZURE[i]) * ratio)
+            for i in range(3)
+        )
+        pygame.draw.line(water, color, (0, y), (width, y))
+    return water
+
+
+def draw_water_background(surface):
+    """
+    Draw the sky and water gradient background.
+
+    The background never changes, so it is drawn once per surface size
+    and blitted after that.
+
+    Args:
+        surface (pygame.Surface): Surface to draw on.
+    """
+    size = surface.get_size()
+    water = _water_cache.get(size)
+    if water is None:
+        water = _water_cache[size] = _build_water_background(size)
+    surface.blit(water, (0, 0))
+
+
+def dim(surface, color, alpha):
+    """
+    Blend a colour over the whole surface.
+
+    Args:
+        surface (pygame.Surface): Surface to draw on.
+        color (tuple): RGB colour of the overlay.
+        alpha (int): Opacity, 0-255.
+    """
+    key = (surface.get_size(), color)
+    overlay = _overlay_cache.get(key)
+    if overlay is None:
+        overlay = pygame.Surface(key[0])
+        overlay.fill(color)
+        _overlay_cache[key] = overlay
+    overlay.set_alpha(alpha)
+    surface.blit(overlay, (0, 0))
+
+
+class TextCache:
+    """
+    Rendered text by font, text and colour.
+
+    The HUD draws the same strings every frame; they are rendered once
+    and again only when the text changes (e.g. the score).
+
+    Attributes:
+        max_entries (int): The cache is emptied when it grows past this.
+    """
+
+    def __init__(self, max_entries=256):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): Size at which the cache is emptied.
+        """
+        self.max_entries = max_entries
+        self._rendered = {}
+
+    def render(self, text_font, text, color):
+        """
+        Get rendered, antialiased text.
+
+        Args:
+            text_font (pygame.font.Font): Font to render with.
+            text (str): The text.
+            color (tuple): RGB colour.
+
+        Returns:
+            pygame.Surface: The shared rendered text; don't draw on it.
+        """
+        key = (text_font, text, color)
+        rendered = self._rendered.get(key)
+        if rendered is None:
+            if len(self._rendered) >= self.max_entries:
+                self._rendered.clear()
+            rendered = self._rendered[key] = text_font.render(
+                text, True, color)
+        return rendered
+
+
+# Shared cache used by render_text
+_text_cache = TextCache()
+
+
+def render_text(text_font, text, color):
+    """
+    Render text through the shared text cache.
+
+    Args:
+        text_font (pygame.font.Font): Font to render with.
+        text (str): The text.
+        color (tuple): RGB colour.
+
+    Returns:
+        pygame.Surface: The rendered text; don't draw on it.
+    """
+    return _text_cache.render(text_font, text, color)
+
+
+@traced("load_graphics", "assets")
+def load_graphics():
+    """
+    Load and configure all graphic assets.
+
+    Returns:
+        dict: Dictionary containing loaded images and their rects.
+    """
+    # Load boat
+    boat_image = load_image("graphics/boat.png", "ui", (310, 260))
+    boat_x = SCREEN_WIDTH // 2 - boat_image.get_width() // 2 - 300
+    boat_y = WATER_SURFACE - boat_image.get_height() // 2 - 20
+
+    # Load fishing hook
+    hook_image = load_image("graphics/fishing_hook.png", "ui", (30, 30))
+    hook_rect = hook_image.get_rect()
+
+    return {
+        'boat_image': boat_image,
+        'boat_x': boat_x,
+        'boat_y': boat_y,
+        'hook_image': hook_image,
+        'hook_rect': hook_rect
+    }
+
+
+def handle_danger_fish_catch(casting_manager, fish_manager):
+    """
+    Handle catching a danger fish immediately (no scream mechanic).
+
+    Args:
+        casting_manager: The casting rod manager.
+        fish_manager: The fish manager.
+
+    Returns:
+        dict: Fish info if a danger fish was caught, None otherwise.
+    """
+    if casting_manager.pending_danger_fish is not None:
+        fish = casting_manager.pending_danger_fish
+        fish_value = getattr(fish, 'value', 25)
+        fish_type = getattr(fish, 'fish_type', 'Danger Fish')
+        fish_rarity = getattr(fish, 'rarity', 'danger')
+
+        # Mark fish as caught
+        fish.is_hooked = False
+        fish.is_caught = True
+        fish.caught = True
+
+        # Create death animation
+        death_anim = fish.create_death_animation()
+        if death_anim:
+            fish_manager.death_animations.add(death_anim)
+
+        # Remove from sprite groups
+        fish.kill()
+
+        # Add to recent catches display
+        catch_data = {
+            "type": fish_type,
+            "value": fish_value,
+            "rarity": fish_rarity,
+            "current_frame": 0,
+            "frame_counter": 0,
+            "frame_delay": 8,
+        }
+        fish_manager.recent_catches.append(catch_data)
+        if len(fish_manager.recent_catches) > fish_manager.max_recent_catches:
+            fish_manager.recent_catches.pop(0)
+
+        # Clear pending state
+        casting_manager.pending_danger_fish = None
+        casting_manager.attached_fish = None
+        casting_manager.start_cooldown()
+
+        return {
+            "type": fish_type,
+            "value": fish_value,
+            "rarity": fish_rarity,
+            "penalty": True
+        }
+    return None
+
+
+class Rules:
+    """
+    Base class of a mode's rules.
+
+    GameSession calls these hooks; the defaults are a mode without lives
+    or a timer, where danger fish are caught straight away.
+
+    Attributes:
+        mode (str): Mode name used for scores, logs and metrics.
+        caption (str): Window caption.
+        music (str): Key of the background track in load_sounds().
+        fish_manager_class (type): Fish manager to create.
+        auto_reel (bool): Reel in automatically at full length.
+        start_fish (int): Fish spawned at the start of a session.
+        catch_logging (bool): Log catches to catch_logs/.
+    """
+
+    mode = None
+    caption = None
+    music = None
+    fish_manager_class = FishManager
+    auto_reel = True
+
+    def __init__(self, start_fish, catch_logging=True):
+        """
+        Initialize the rules.
+
+        Args:
+            start_fish (int): Fish spawned at the start of a session.
+            catch_logging (bool): Log catches to catch_logs/.
+        """
+        self.start_fish = start_fish
+        self.catch_logging = catch_logging
+
+    def load_sounds(self):
+        """
+        Load the mode's sounds.
+
+        Returns:
+            dict: Sounds; "casting" and the music key are required, and
+                "game_over" is played when the game ends if present.
+        """
+        raise NotImplementedError
+
+    def start(self, session):
+        """
+        Reset the mode's state; called at the start and on restart.
+
+        Args:
+            session (GameSession): The session.
+        """
+
+    def blocking(self):
+        """
+        Whether a mode overlay (e.g. the scream window) holds play.
+
+        Returns:
+            bool: True while play is held.
+        """
+        return False
+
+    def cast(self, session):
+        """
+        Space pressed during play: cast or reel.
+
+        Args:
+            session (GameSession): The session.
+        """
+        session.casting_manager.toggle_cast()
+
+    def on_pause(self, session):
+        """
+        Called after pausing or resuming.
+
+        Args:
+            session (GameSession): The session; session.paused is the
+                new state.
+        """
+
+    def on_escape(self, session):
+        """
+        ESC pressed.
+
+        Args:
+            session (GameSession): The session.
+
+        Returns:
+            bool: True to leave the mode.
+        """
+        return True
+
+    def update(self, session):
+        """
+        Called every frame before the game state is updated.
+
+        Args:
+            session (GameSession): The session.
+        """
+
+    def update_play(self, session):
+        """
+        Called during play before the fish are updated.
+
+        Args:
+            session (GameSession): The session.
+        """
+
+    def control(self, session):
+        """
+        Called during play before the rod is updated, to steer it.
+
+        Args:
+            session (GameSession): The session.
+        """
+
+    def update_blocked(self, session):
+        """
+        Called instead of the play update while blocking() is True.
+
+        Args:
+            session (GameSession): The session.
+        """
+
+    def on_penalty(self, session, result):
+        """
+        A danger fish was hooked: catch it straight away.
+
+        Args:
+            session (GameSession): The session.
+            result (dict): Result of CastingRod.update().
+        """
+        danger_result = handle_danger_fish_catch(
+            session.casting_manager, session.fish_manager)
+        if danger_result:
+            session.add_catch(danger_result)
+            session.fish_manager.catch_sound.play()
+
+    def save_score(self, session):
+        """
+        Record the finished game's score.
+
+        Args:
+            session (GameSession): The session.
+
+        Returns:
+            dict: Result of update_high_score.
+        """
+        return update_high_score(self.mode, session.score,
+                                 session.fish_caught_count)
+
+    def draw_hud(self, session, surface):
+        """
+        Draw the score and the mode's HUD.
+
+        Args:
+            session (GameSession): The session.
+            surface (pygame.Surface): Surface to draw on.
+        """
+        surface.blit(render_text(big_font, f"Score: {session.score}", WHITE),
+                     (10, 10))
+
+    def draw_overlays(self, session, surface):
+        """
+        Draw the pause and game over overlays.
+
+        Args:
+            session (GameSession): The session.
+            surface (pygame.Surface): Surface to draw on.
+        """
+        if session.paused:
+            self.draw_pause(session, surface)
+        if session.game_over:
+            self.draw_game_over(session, surface)
+
+    def draw_pause(self, session, surface):
+        """
+        Draw the pause overlay.
+
+        Args:
+            session (GameSession): The session.
+            surface (pygame.Surface): Surface to draw on.
+        """
+        raise NotImplementedError
+
+    def draw_game_over(self, session, surface):
+        """
+        Draw the game over overlay.
+
+        Args:
+            session (GameSession): The session.
+            surface (pygame.Surface): Surface to draw on.
+        """
+        raise NotImplementedError
+
+    def flight_flags(self, session):
+        """
+        Get the state flags recorded by the flight recorder.
+
+        Args:
+            session (GameSession): The session.
+
+        Returns:
+            dict: Flag name -> value.
+        """
+        return {"paused": session.paused, "game_over": session.game_over}
+
+    def close(self, session):
+        """
+        Release the mode's resources when leaving the mode.
+
+        Args:
+            session (GameSession): The session.
+        """
+
+
+class GameSession:
+    """
+    One mode's game loop.
+
+    Attributes:
+        rules (Rules): The mode's rules.
+        driver (GameDriver): Input and frame pacing.
+        sounds (dict): Loaded sounds.
+        graphics (dict): Boat and hook images and the hook rect.
+        fish_manager (FishManager): The fish.
+        background_manager (BackgroundManager): The background.
+        casting_manager (CastingRod): The rod.
+        catch_logger (CatchLogger): Catch log of the current game.
+        score (int): Current score.
+        caught_fish (list): Catch results of the current game.
+        fish_caught_count (int): Fish caught in the current game.
+        boat_x (int): Boat position.
+        boat_y (int): Boat height.
+        paused (bool): The game is paused.
+        game_over (bool): The game has ended (or the summary is shown).
+        high_score_result (dict): Result of saving the score, or None.
+        fade_alpha (int): Opacity of the fade-in.
+        running (bool): False once the player leaves the mode.
+    """
+
+    def __init__(self, rules, driver=None, background=None):
+        """
+        Initialize a session; run() sets it up and plays it.
+
+        Args:
+            rules (Rules): The mode's rules.
+            driver (GameDriver): Input and frame pacing, defaults to live
+                keyboard input at FPS.
+            background (BackgroundManager): Background shared with the
+                menu, defaults to a new one.
+        """
+        self.rules = rules
+        self.driver = driver if driver is not None else GameDriver(clock)
+        self.background_manager = (background if background is not None
+                                   else BackgroundManager())
+
+    def playing(self):
+        """
+        Whether the game is being played (not over, paused or held).
+
+        Returns:
+            bool: True during play.
+        """
+        return (not self.game_over and not self.paused
+                and not self.rules.blocking())
+
+    def spawn_start_fish(self):
+        """Spawn the fish a game starts with."""
+        for i in range(self.rules.start_fish):
+            self.fish_manager.spawn_fish()
+
+    def add_catch(self, result):
+        """
+        Score a caught fish.
+
+        Args:
+            result (dict): Catch result with "type", "value" and
+                "penalty".
+        """
+        self.score += result["value"]
+        self.fish_caught_count += 1
+        log.info("Caught: %s (+%d pts)", result['type'], result['value'],
+                 extra=fields(score=self.score))
+        self.caught_fish.append(result)
+        self.catch_logger.log_catch(result, self.graphics['hook_rect'],
+                                    self.casting_manager)
+
+    def end_game(self):
+        """End the game: save the score and show the game over screen."""
+        log.info("GAME OVER!", extra=fields(score=self.score))
+        self.game_over = True
+        gc_policy.natural_pause()
+        self.high_score_result = self.rules.save_score(self)
+        self.catch_logger.close(self.casting_manager.cast_count)
+        if 'game_over' in self.sounds:
+            self.sounds['game_over'].play()
+
+    def restart(self):
+        """Start a new game after the game over screen."""
+        self.fish_manager.clear_all()
+        self.casting_manager.reset()
+        self.score = 0
+        self.caught_fish = []
+        self.fish_caught_count = 0
+        self.spawn_start_fish()
+        self.game_over = False
+        self.high_score_result = None
+        self.fade_alpha = 255
+        self.catch_logger = CatchLogger(self.rules.mode,
+                                        enabled=self.rules.catch_logging)
+        self.rules.start(self)
+
+    def handle_key(self, key):
+        """
+        Handle a key press.
+
+        Args:
+            key (int): pygame key constant.
+        """
+        self.latency.key_down(key)
+        self.flight.key_down(key)
+        if key == pygame.K_ESCAPE:
+            if self.rules.on_escape(self):
+                self.running = False
+
+        elif key == pygame.K_F3:
+            self.profiler.toggle()
+
+        elif key == pygame.K_F9:
+            self.flight.dump("hotkey", background=True)
+
+        elif key == pygame.K_SPACE:
+            if self.playing():
+                self.rules.cast(self)
+                self.sounds['casting'].play()
+
+        elif key == pygame.K_p:
+            if not self.game_over and not self.rules.blocking():
+                self.paused = not self.paused
+                self.rules.on_pause(self)
+                if self.paused:
+                    gc_policy.natural_pause()
+
+        elif key == pygame.K_RETURN:
+            if self.game_over:
+                self.restart()
+
+    def update(self):
+        """Update the game state for one frame."""
+        profiler = self.profiler
+        rules = self.rules
+        graphics = self.graphics
+        rules.update(self)
+
+        if self.playing():
+            rules.update_play(self)
+            self.fish_manager.update()
+            profiler.lap("fish update")
+            self.background_manager.update()
+            profiler.lap("bg update")
+            rules.control(self)
+
+            # Boat movement
+            keys = self.driver.get_pressed()
+            if keys[pygame.K_LEFT]:
+                self.boat_x -= BOAT_SPEED
+            if keys[pygame.K_RIGHT]:
+                self.boat_x += BOAT_SPEED
+
+            # Keep boat on screen
+            self.boat_x = max(
+                0,
+                min(self.boat_x,
+                    SCREEN_WIDTH - graphics['boat_image'].get_width())
+            )
+
+            # Update casting and check for catches
+            caught = self.casting_manager.update(
+                graphics['hook_rect'],
+                self.fish_manager,
+                self.sounds['casting']
+            )
+            profiler.lap("casting")
+
+            if caught:
+                if caught['penalty']:
+                    rules.on_penalty(self, caught)
+                else:
+                    self.add_catch(caught)
+                    if caught.get('game_over'):
+                        self.end_game()
+
+            # Update hook rect position
+            rod_x, rod_top_y = self.rod_top()
+            graphics['hook_rect'].x = (
+                rod_x - graphics['hook_image'].get_width() // 2
+            )
+            graphics['hook_rect'].y = (rod_top_y
+                                       + self.casting_manager.rod_length)
+
+        elif not self.game_over and not self.paused:
+            rules.update_blocked(self)
+
+        self.latency.observe(self.boat_x, self.casting_manager.rod_length,
+                             self.paused)
+
+    def rod_top(self):
+        """
+        Get where the fishing line leaves the rod.
+
+        Returns:
+            tuple: (x, y) of the rod tip.
+        """
+        return (self.boat_x + self.graphics['boat_image'].get_width() - 65,
+                self.boat_y + 160)
+
+    def draw(self, surface):
+        """
+        Draw one frame.
+
+        Args:
+            surface (pygame.Surface): Surface to draw on.
+        """
+        profiler = self.profiler
+        graphics = self.graphics
+
+        draw_water_background(surface)
+        profiler.lap("water")
+        self.background_manager.draw(surface)
+        profiler.lap("bg draw")
+
+        # Boat
+        surface.blit(graphics['boat_image'], (self.boat_x, self.boat_y))
+
+        # Fishing line
+        rod_x, rod_top_y = self.rod_top()
+        hook_y = rod_top_y + self.casting_manager.rod_length
+        pygame.draw.line(surface, WHITE, (rod_x - 5, rod_top_y),
+                         (rod_x - 5, hook_y), 2)
+
+        # Hook
+        surface.blit(graphics['hook_image'], graphics['hook_rect'])
+
+        # Fish
+        self.fish_manager.draw(surface)
+        profiler.lap("fish draw")
+
+        # HUD and overlays
+        self.rules.draw_hud(self, surface)
+        self.rules.draw_overlays(self, surface)
+
+        # Red flash effect
+        self.fish_manager.draw_red_flash(surface)
+
+        # Fade in
+        if self.fade_alpha > 0:
+            dim(surface, (0, 0, 0), self.fade_alpha)
+            self.fade_alpha = max(0, self.fade_alpha - FADE_STEP)
+
+        profiler.lap("hud")
+        profiler.draw(surface)
+        profiler.lap("profiler")
+
+    def setup(self):
+        """Load assets, create the managers and spawn the first fish."""
+        rules = self.rules
+        mode = rules.mode
+        self.driver = replay.begin_session(mode, self.driver)
+
+        with startup.phase("load_sounds", "assets"):
+            self.sounds = rules.load_sounds()
+        with startup.phase("load_graphics", "assets"):
+            self.graphics = load_graphics()
+        self.sounds[rules.music].play(-1)  # Loop background music
+        pygame.display.set_caption(rules.caption)
+
+        # Same seed, same fish and effects: replays depend on it
+        seed = getattr(self.driver, "seed", None)
+        if seed is not None:
+            seed_streams(seed)
+            self.background_manager.reset_timers()
+
+        # Managers
+        self.fish_manager = rules.fish_manager_class()
+        self.casting_manager = CastingRod(ROD_MAX_LENGTH, ROD_SPEED,
+                                          auto_reel=rules.auto_reel)
+        self.catch_logger = CatchLogger(mode, enabled=rules.catch_logging)
+        self.latency = start_latency(mode)
+        self.profiler = FrameProfiler(latency=self.latency)
+        self.pacing = start_pacing(mode)
+        hitch_sampler.begin_session(mode)
+        self.loop_metrics = LoopMetrics(mode, self.fish_manager.get_stats)
+        self.flight = start_flight(mode)
+
+        # Game state
+        self.running = True
+        self.paused = False
+        self.game_over = False
+        self.high_score_result = None
+        self.score = 0
+        self.caught_fish = []
+        self.fish_caught_count = 0
+        self.boat_x = self.graphics['boat_x']
+        self.boat_y = self.graphics['boat_y']
+        self.fade_alpha = 255
+
+        with startup.phase("initial spawn_fish", "setup"):
+            self.spawn_start_fish()
+        rules.start(self)
+
+    def run(self):
+        """
+        Play the mode until the player leaves it.
+
+        Returns:
+            int: Final score achieved.
+        """
+        self.setup()
+        surface = pygame.display.get_surface()
+        driver = self.driver
+        profiler = self.profiler
+        loop_metrics = self.loop_metrics
+        pacing = self.pacing
+        flight = self.flight
+
+        # Long-lived objects are loaded; keep full collections out of play
+        gc_policy.freeze()
+        gc_policy.begin_gameplay(pacing)
+
+        # The first tick also measures loading; game time starts after it
+        first_tick = True
+
+        while self.running:
+            profiler.begin_frame()
+            loop_metrics.begin_frame()
+
+            # Event handling
+            for event in driver.get_events():
+                if event.type == pygame.QUIT:
+                    self.running = False
+                elif event.type == pygame.KEYDOWN:
+                    self.handle_key(event.key)
+            profiler.lap("events")
+
+            self.update()
+            loop_metrics.end_update()
+
+            self.draw(surface)
+
+            # Update display
+            pygame.display.flip()
+            self.latency.presented()
+            loop_metrics.end_draw()
+            startup.first_frame()
+            profiler.lap("flip")
+            hitch_sampler.end_frame()
+            frame_ms = driver.tick()
+            hitch_sampler.begin_frame()
+            if not first_tick:
+                game_clock.advance(frame_ms)
+            first_tick = False
+            pacing.record(frame_ms)
+            loop_metrics.end_frame(frame_ms)
+            flight.frame(frame_ms, self.fish_manager, self.casting_manager,
+                         self.boat_x, self.score,
+                         **self.rules.flight_flags(self))
+            gc_policy.frame()
+            profiler.lap("tick")
+
+        # Cleanup
+        gc_policy.end_gameplay()
+        hitch_sampler.end_session()
+        end_pacing(pacing)
+        end_latency(self.latency)
+        end_flight()
+        self.sounds[self.rules.music].stop()
+        self.catch_logger.close(self.casting_manager.cast_count)
+        self.rules.close(self)
+        replay.end_session(self.driver, self.score)
+        return self.score
@@ -0,0 +1,133 @@
+"""
+Unit tests for the asset cache.
+"""
+
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+pygame.init()
+pygame.display.set_mode((800, 600), pygame.HIDDEN)
+
+from fish.shark import Shark
+from mechanics import assets
+from mechanics.assets import AssetCache, asset_size, load_image
+
+
+def surface(width=10, height=10):
+    """A 32-bit surface of a known size."""
+    return pygame.Surface((width, height), pygame.SRCALPHA)
+
+
+class TestAssetSize(unittest.TestCase):
+    """Tests for asset_size."""
+
+    def test_surface(self):
+        """A 32-bit surface uses four bytes per pixel."""
+        self.assertEqual(asset_size(surface(10, 5)), 200)
+
+    def test_collections(self):
+        """Lists and dicts should add up their assets."""
+        frames = [surface(), surface()]
+        self.assertEqual(asset_size(frames), 800)
+        self.assertEqual(asset_size({"a": frames, "b": surface()}), 1200)
+        self.assertEqual(asset_size("not an asset"), 0)
+
+
+class TestAssetCache(unittest.TestCase):
+    """Tests for AssetCache."""
+
+    def setUp(self):
+        self.cache = AssetCache()
+        self.loads = []
+
+    def loader(self, name, size=10):
+        def load():
+            self.loads.append(name)
+            return surface(size, size)
+        return load
+
+    def test_loaded_once(self):
+        """A second lookup should return the same object without loading."""
+        first = self.cache.get("a", self.loader("a"), "fish")
+        second = self.cache.get("a", self.loader("a"), "fish")
+        self.assertIs(first, second)
+        self.assertEqual(self.loads, ["a"])
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_failed_load_not_cached(self):
+        """A loader error should pass through and leave nothing cached."""
+        def broken():
+            raise pygame.error("missing")
+
+        with self.assertRaises(pygame.error):
+            self.cache.get("a", broken, "fish")
+        self.assertNotIn("a", self.cache)
+        self.assertEqual(self.cache.total_bytes, 0)
+
+    def test_report_by_category(self):
+        """Totals should be kept per category."""
+        self.cache.get("a", self.loader("a"), "fish")
+        self.cache.get("b", self.loader("b"), "fish")
+        self.cache.get("c", self.loader("c", 20), "ui")
+        report = self.cache.report()
+        self.assertEqual(report["fish"], {"count": 2, "bytes": 800})
+        self.assertEqual(report["ui"], {"count": 1, "bytes": 1600})
+        self.assertEqual(report["total"]["bytes"], 2400)
+
+    def test_trim_evicts_least_recently_used(self):
+        """Trimming should evict the assets used longest ago first."""
+        for name in "abc":
+            self.cache.get(name, self.loader(name), "fish")
+        self.cache.get("a", self.loader("a"), "fish")  # a is now newest
+
+        evicted = self.cache.trim(800)
+        self.assertEqual(evicted, ["b"])
+        self.assertEqual(self.cache.total_bytes, 800)
+        self.assertIn("a", self.cache)
+        self.assertIn("c", self.cache)
+
+    def test_trim_keeps_assets_in_use(self):
+        """An asset something still holds should survive trimming."""
+        held = self.cache.get("a", self.loader("a"), "fish")
+        for name in "bc":
+            self.cache.get(name, self.loader(name), "fish")
+
+        evicted = self.cache.trim(0)
+        self.assertEqual(evicted, ["b", "c"])
+        self.assertIn("a", self.cache)
+        self.assertEqual(self.cache.total_bytes, 400)
+        self.assertIs(self.cache.get("a", self.loader("a"), "fish"), held)
+        self.assertEqual(self.loads, ["a", "b", "c"])
+
+    def test_no_budget(self):
+        """Without a budget nothing should be evicted."""
+        self.cache.get("a", self.loader("a"), "fish")
+        self.assertEqual(self.cache.trim(), [])
+
+
+class TestSharedAssets(unittest.TestCase):
+    """Tests for assets shared through the module cache."""
+
+    def test_fish_share_frames(self):
+        """Fish of one type should share their frames."""
+        first = Shark(100, 300)
+        second = Shark(200, 400)
+        self.assertIs(first.frames, second.frames)
+
+    def test_load_image_scaled(self):
+        """Scaled images should be cached per size."""
+        small = load_image("graphics/fishing_hook.png", "ui", (30, 30))
+        large = load_image("graphics/fishing_hook.png", "ui", (60, 60))
+        self.assertEqual(small.get_size(), (30, 30))
+        self.assertEqual(large.get_size(), (60, 60))
+        self.assertIs(small, load_image("graphics/fishing_hook.png", "ui",
+                                        (30, 30)))
+        self.assertGreater(assets.get_asset_report()["ui"]["bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
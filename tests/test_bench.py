@@ -0,0 +1,69 @@
+"""
+Unit tests for the micro-benchmark runner and comparison.
+"""
+
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.micro import compare, run, time_call
+
+
+def results(**medians):
+    """Build a results dict with the given medians and no noise."""
+    return {"results": {name: {"median_us": value, "stdev_us": 0.0}
+                        for name, value in medians.items()}}
+
+
+class TestCompare(unittest.TestCase):
+    """Tests for compare()."""
+
+    def statuses(self, baseline, current, threshold=0.1):
+        return {row[0]: row[4] for row in
+                compare(baseline, current, threshold)}
+
+    def test_flags_regression(self):
+        """A slowdown past the threshold should be a regression."""
+        statuses = self.statuses(results(a=10.0, b=10.0),
+                                 results(a=12.0, b=10.5))
+        self.assertEqual(statuses, {"a": "regression", "b": "ok"})
+
+    def test_flags_improvement(self):
+        """A speedup past the threshold should be reported."""
+        statuses = self.statuses(results(a=10.0), results(a=5.0))
+        self.assertEqual(statuses["a"], "improved")
+
+    def test_noise_is_not_a_regression(self):
+        """Slowdowns within the baseline's noise should be ignored."""
+        baseline = {"results": {"a": {"median_us": 10.0, "stdev_us": 2.0}}}
+        statuses = self.statuses(baseline, results(a=13.0))
+        self.assertEqual(statuses["a"], "ok")
+
+    def test_new_and_missing_benchmarks(self):
+        """Benchmarks only in one of the runs should be marked."""
+        statuses = self.statuses(results(old=1.0), results(new=1.0))
+        self.assertEqual(statuses, {"old": "missing", "new": "new"})
+
+
+class TestRun(unittest.TestCase):
+    """Tests for timing and running benchmarks."""
+
+    def test_time_call(self):
+        """time_call should report per-call statistics."""
+        timing = time_call(lambda: sum(range(100)), repeat=3,
+                           min_time=0.001)
+        self.assertEqual(timing["rounds"], 3)
+        self.assertGreater(timing["median_us"], 0)
+        self.assertLessEqual(timing["min_us"], timing["median_us"])
+
+    def test_run_selected_benchmark(self):
+        """run should only time benchmarks matching the pattern."""
+        output = run("Wave.*", repeat=2, min_time=0.001, verbose=False)
+        self.assertEqual(list(output["results"]), ["Wave.get_wave_points"])
+        self.assertIn("python", output["meta"])
+
+
+if __name__ == "__main__":
+    unittest.main()
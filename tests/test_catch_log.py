@@ -0,0 +1,181 @@
+"""
+Unit tests for the catch log and the catch analysis tool.
+"""
+
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mechanics.constants import WATER_SURFACE
+from mechanics.catch_log import (
+    CatchLogger,
+    EVENT_CATCH,
+    EVENT_PENALTY,
+    EVENT_RELEASE,
+    META_FILE
+)
+from mechanics.catch_analysis import (
+    load_sessions,
+    rates_by_species,
+    rates_by_depth,
+    rates_by_mode
+)
+
+
+class FakeRod:
+    """Stand-in for CastingRod with a fixed time since the cast."""
+
+    def __init__(self, since_cast=1.5):
+        self.since_cast = since_cast
+
+    def time_since_cast(self):
+        return self.since_cast
+
+
+class CatchLogTestCase(unittest.TestCase):
+    """Base class that logs into a temporary directory."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def log_session(self, mode, catches, casts=5):
+        """Log (event, fish_type, value, depth) tuples as one session."""
+        logger = CatchLogger(mode, directory=self.directory)
+        for event, fish_type, value, depth in catches:
+            logger.log(event, fish_type, value,
+                       (100, WATER_SURFACE + depth), since_cast=2.0)
+        logger.close(casts)
+        logger.wait()
+        return logger
+
+
+class TestCatchLogger(CatchLogTestCase):
+    """Tests for CatchLogger."""
+
+    def test_events_are_buffered_until_batch_is_full(self):
+        """Nothing should be written before the first batch fills up."""
+        logger = CatchLogger("classic", directory=self.directory,
+                             batch_size=3)
+        rect = pygame.Rect(90, WATER_SURFACE + 40, 20, 20)
+        for _ in range(2):
+            logger.log_catch({"type": "Cod", "value": 10}, rect, FakeRod())
+        self.assertIsNone(logger.path)
+
+        logger.log_catch({"type": "Cod", "value": 10}, rect, FakeRod())
+        logger.wait()
+        events = np.fromfile(os.path.join(logger.path, "event.bin"),
+                             dtype="u1")
+        self.assertEqual(len(events), 3)
+
+    def test_close_writes_columns_and_meta(self):
+        """Closing should flush the columns and describe the session."""
+        logger = CatchLogger("endless", directory=self.directory)
+        rect = pygame.Rect(90, WATER_SURFACE + 40, 20, 20)
+        logger.log_catch({"type": "Cod", "value": 10}, rect, FakeRod(3.0))
+        logger.log_catch({"type": "Danger Fish", "value": 25,
+                          "penalty": True}, rect, FakeRod())
+        logger.close(casts=4)
+        logger.wait()
+
+        with open(os.path.join(logger.path, META_FILE)) as f:
+            meta = json.load(f)
+        self.assertEqual(meta["mode"], "endless")
+        self.assertEqual(meta["casts"], 4)
+        self.assertEqual(meta["species"], ["Cod", "Danger Fish"])
+
+        events = np.fromfile(os.path.join(logger.path, "event.bin"),
+                             dtype="u1")
+        depth = np.fromfile(os.path.join(logger.path, "depth.bin"),
+                            dtype="<f4")
+        since_cast = np.fromfile(
+            os.path.join(logger.path, "since_cast.bin"), dtype="<f4")
+        self.assertEqual(list(events), [EVENT_CATCH, EVENT_PENALTY])
+        self.assertEqual(list(depth), [60, 60])
+        self.assertAlmostEqual(float(since_cast[0]), 3.0)
+
+    def test_disabled_logger_writes_nothing(self):
+        """A disabled logger should not create any files."""
+        logger = CatchLogger("classic", directory=self.directory,
+                             enabled=False)
+        logger.log(EVENT_CATCH, "Cod", 10, (0, 300))
+        logger.close(1)
+        logger.wait()
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_empty_session_writes_nothing(self):
+        """A session without events should not leave a directory."""
+        logger = CatchLogger("classic", directory=self.directory)
+        logger.close(3)
+        logger.wait()
+        self.assertIsNone(logger.path)
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+class TestCatchAnalysis(CatchLogTestCase):
+    """Tests for the vectorized catch rate analysis."""
+
+    def setUp(self):
+        super().setUp()
+        self.log_session("classic", [
+            (EVENT_CATCH, "Cod", 10, 50),
+            (EVENT_CATCH, "Shark", 75, 350),
+            (EVENT_RELEASE, "Danger Fish", 25, 200),
+        ], casts=4)
+        self.log_session("time_attack", [
+            (EVENT_CATCH, "Shark", 75, 320),
+            (EVENT_PENALTY, "Danger Fish", 25, 120),
+            (EVENT_CATCH, "Shark", 75, 380),
+        ], casts=3)
+
+    def test_load_merges_species_tables(self):
+        """Species codes should be remapped onto one shared table."""
+        data = load_sessions(self.directory)
+        self.assertEqual(data.session_count, 2)
+        self.assertEqual(data.event_count, 6)
+        names = [data.species[i] for i in data.columns["species"]]
+        self.assertEqual(names.count("Shark"), 3)
+        self.assertEqual(names.count("Danger Fish"), 2)
+
+    def test_rates_by_species(self):
+        """Releases should be counted separately from catches."""
+        rates = {row[0]: row for row in
+                 rates_by_species(load_sessions(self.directory))}
+        self.assertEqual(rates["Shark"][1], 3)
+        self.assertEqual(rates["Danger Fish"][1:3], (1, 1))
+        self.assertAlmostEqual(rates["Shark"][4], 3 / 5)
+
+    def test_rates_by_depth(self):
+        """Catches should be grouped into depth bands."""
+        bands = {row[0]: row[2] for row in
+                 rates_by_depth(load_sessions(self.directory), band=100)}
+        self.assertEqual(bands, {0: 1, 100: 1, 300: 3})
+
+    def test_rates_by_mode(self):
+        """Catches per cast should use the casts stored per session."""
+        modes = {row[0]: row for row in
+                 rates_by_mode(load_sessions(self.directory))}
+        self.assertEqual(modes["classic"][2], 2)
+        self.assertAlmostEqual(modes["classic"][4], 2 / 4)
+        self.assertAlmostEqual(modes["time_attack"][4], 3 / 3)
+
+    def test_empty_directory(self):
+        """Loading a directory without sessions should give empty tables."""
+        data = load_sessions(os.path.join(self.directory, "missing"))
+        self.assertEqual(data.event_count, 0)
+        self.assertEqual(rates_by_depth(data), [])
+        self.assertEqual(rates_by_species(data), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""
+Unit tests for the flight recorder.
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+pygame.init()
+pygame.display.set_mode((800, 600), pygame.HIDDEN)
+
+from fish.fish_manager import FishManager
+from mechanics import flight_recorder
+from mechanics.casting import CastingRod
+from mechanics.constants import ROD_MAX_LENGTH, ROD_SPEED
+from mechanics.flight_recorder import FlightRecorder, MAX_HITCH_DUMPS
+
+
+class TestFlightRecorder(unittest.TestCase):
+    """Tests for FlightRecorder."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.recorder = FlightRecorder(seconds=1, fps=10,
+                                       directory=self.tmp.name, hitch_ms=100)
+        self.recorder.begin_session("test")
+        self.fish_manager = FishManager()
+        self.rod = CastingRod(ROD_MAX_LENGTH, ROD_SPEED)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def frame(self, frame_ms=16, **flags):
+        self.recorder.frame(frame_ms, self.fish_manager, self.rod, 100, 0,
+                            **flags)
+
+    def test_buffer_size_is_constant(self):
+        """Only the last seconds * fps frames should be kept."""
+        for _ in range(25):
+            self.frame()
+        self.assertEqual(len(self.recorder.records()), 10)
+        self.assertEqual(self.recorder.frames, 25)
+
+    def test_frame_contents(self):
+        """Frames should carry inputs, fish, rod state and flags."""
+        self.fish_manager.spawn_fish()
+        self.recorder.key_down(pygame.K_SPACE)
+        self.recorder.input("scream")
+        self.frame(paused=True)
+        self.frame()
+
+        first, second = self.recorder.records()
+        self.assertEqual(first["inputs"], ["space", "scream"])
+        self.assertEqual(first["fish"], 1)
+        self.assertEqual(first["rod_length"], 0)
+        self.assertEqual(first["flags"], {"paused": True})
+        self.assertEqual(second["inputs"], [])
+
+    def test_severe_hitch_dumps(self):
+        """A slow frame should be written, but not the first one."""
+        self.frame(frame_ms=500)
+        self.recorder.wait()
+        self.assertEqual(self.recorder.dumps, [])
+        self.frame(frame_ms=500)
+        self.recorder.wait()
+        self.assertEqual(len(self.recorder.dumps), 1)
+
+        with open(self.recorder.dumps[0]) as f:
+            report = json.load(f)
+        self.assertEqual(report["reason"], "hitch")
+        self.assertEqual(report["details"]["frame_ms"], 500)
+        self.assertEqual(len(report["records"]), 2)
+
+    def test_hitch_dumps_are_limited(self):
+        """Hitch dumps should be rate limited and capped per session."""
+        self.frame()
+        for _ in range(MAX_HITCH_DUMPS + 2):
+            self.frame(frame_ms=500)
+            self.recorder._last_dump -= flight_recorder.MIN_DUMP_INTERVAL
+        self.recorder.wait()
+        self.assertEqual(len(self.recorder.dumps), MAX_HITCH_DUMPS)
+
+    def test_hitch_dump_is_a_snapshot(self):
+        """A background dump should hold the frames up to the hitch."""
+        self.frame()
+        self.frame(frame_ms=500)
+        for _ in range(3):
+            self.frame()
+        self.recorder.wait()
+
+        with open(self.recorder.dumps[0]) as f:
+            report = json.load(f)
+        self.assertEqual(len(report["records"]), 2)
+        self.assertEqual(report["records"][-1]["frame_ms"], 500)
+
+    def test_excepthook_dumps(self):
+        """An unhandled exception should write the buffer with the
+        traceback before the previous hook runs."""
+        calls = []
+        shared = flight_recorder._recorder
+        saved = (flight_recorder._previous_excepthook, sys.excepthook,
+                 shared.directory)
+        try:
+            flight_recorder._previous_excepthook = None
+            sys.excepthook = lambda *args: calls.append(args)
+            flight_recorder.install_excepthook()
+            recorder = flight_recorder.start_flight("crash")
+            recorder.directory = self.tmp.name
+            recorder.frame(16, self.fish_manager, self.rod, 100, 0)
+            try:
+                raise RuntimeError("boom")
+            except RuntimeError:
+                sys.excepthook(*sys.exc_info())
+        finally:
+            (flight_recorder._previous_excepthook, sys.excepthook,
+             shared.directory) = saved
+
+        self.assertEqual(len(calls), 1)
+        with open(recorder.dumps[0]) as f:
+            report = json.load(f)
+        self.assertEqual(report["reason"], "exception")
+        self.assertIn("boom", report["details"]["exception"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unit tests for game logging.
+"""
+
+import unittest
+import io
+import json
+import logging
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mechanics.game_log import (
+    fields,
+    get_logger,
+    set_level,
+    start_logging,
+    stop_logging,
+)
+
+
+class TestGameLog(unittest.TestCase):
+    """Tests for the queued game logger."""
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.log = get_logger("test")
+
+    def tearDown(self):
+        start_logging()
+
+    def test_text_with_fields(self):
+        """Text lines should carry the level, message and fields."""
+        start_logging("INFO", "text", self.stream)
+        self.log.info("Caught: %s (+%d points)", "Shark", 50,
+                      extra=fields(type="Shark", value=50))
+        stop_logging()
+        self.assertEqual(
+            self.stream.getvalue(),
+            "INFO fish.test: Caught: Shark (+50 points) type=Shark value=50\n")
+
+    def test_json(self):
+        """JSON lines should have the fields as keys."""
+        start_logging("INFO", "json", self.stream)
+        self.log.warning("Error spawning fish: %s", "no video mode",
+                         extra=fields(lives=2))
+        stop_logging()
+        record = json.loads(self.stream.getvalue())
+        self.assertEqual(record["level"], "WARNING")
+        self.assertEqual(record["message"],
+                         "Error spawning fish: no video mode")
+        self.assertEqual(record["lives"], 2)
+
+    def test_disabled_level(self):
+        """Records below the level should never reach the queue or be
+        formatted."""
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("formatted a disabled record")
+
+        start_logging("WARNING", "text", self.stream)
+        self.assertFalse(self.log.isEnabledFor(logging.INFO))
+        self.log.info("%s", Exploding())
+        set_level("debug")
+        self.log.debug("now enabled")
+        stop_logging()
+        self.assertEqual(self.stream.getvalue(),
+                         "DEBUG fish.test: now enabled\n")
+
+    def test_unknown_level(self):
+        """An unknown level should be reported on stderr, not in the log,
+        and fall back to INFO."""
+        start_logging("WARNING", "text", self.stream)
+        stderr = io.StringIO()
+        real_stderr, sys.stderr = sys.stderr, stderr
+        try:
+            set_level("chatty")
+        finally:
+            sys.stderr = real_stderr
+        self.log.info("still logging")
+        stop_logging()
+        self.assertIn("Unknown log level", stderr.getvalue())
+        self.assertEqual(self.stream.getvalue(),
+                         "INFO fish.test: still logging\n")
+
+    def test_formatting_is_deferred(self):
+        """Arguments should be formatted by the writer, not the caller."""
+        formatted = []
+
+        class Tracked:
+            def __str__(self):
+                formatted.append(threading.get_ident())
+                return "tracked"
+
+        start_logging("INFO", "text", self.stream)
+        self.log.info("%s", Tracked())
+        stop_logging()
+        self.assertEqual(len(formatted), 1)
+        self.assertNotEqual(formatted[0], threading.get_ident())
+        self.assertIn("tracked", self.stream.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Unit tests for the garbage collection policy.
+"""
+
+import unittest
+import gc
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mechanics.gc_policy as gc_policy
+from mechanics.gc_policy import DEFERRED_THRESHOLD, GCPolicy
+from mechanics.pacing import FramePacing
+
+
+class TestGCPolicy(unittest.TestCase):
+    """Tests for GCPolicy."""
+
+    def setUp(self):
+        self.thresholds = gc.get_threshold()
+        self.policy = GCPolicy()
+        self.pacing = FramePacing("test")
+
+    def tearDown(self):
+        self.policy.end_gameplay()
+        if self.policy._callback in gc.callbacks:
+            gc.callbacks.remove(self.policy._callback)
+        gc.set_threshold(*self.thresholds)
+
+    def test_gameplay_defers_full_collections(self):
+        """Gameplay should raise the generation 2 threshold, then restore."""
+        self.policy.begin_gameplay(self.pacing)
+        self.assertEqual(gc.get_threshold()[2], DEFERRED_THRESHOLD)
+        self.assertEqual(gc.get_threshold()[:2], self.thresholds[:2])
+        self.policy.end_gameplay()
+        self.assertEqual(gc.get_threshold(), self.thresholds)
+
+    def test_begin_twice_restores_original(self):
+        """A second begin_gameplay must not save the deferred thresholds."""
+        self.policy.begin_gameplay()
+        self.policy.begin_gameplay()
+        self.policy.end_gameplay()
+        self.assertEqual(gc.get_threshold(), self.thresholds)
+
+    def test_collections_reported_to_pacing(self):
+        """Collections during gameplay should reach the frame stats."""
+        self.policy.begin_gameplay(self.pacing)
+        gc.collect(0)
+        gc.collect(2)
+        self.assertGreaterEqual(self.pacing.gc_pauses[0], 1)
+        self.assertGreaterEqual(self.pacing.gc_pauses[2], 1)
+        self.assertEqual(self.policy.collections, self.pacing.gc_pauses)
+        self.assertIn("gc_ms", self.pacing.summary())
+
+    def test_no_pacing_after_gameplay(self):
+        """Collections after end_gameplay should only be counted."""
+        self.policy.begin_gameplay(self.pacing)
+        self.policy.end_gameplay()
+        gc.collect(0)
+        self.assertEqual(self.pacing.gc_pauses, [0, 0, 0])
+        self.assertGreaterEqual(self.policy.collections[0], 1)
+
+    def test_freeze_and_unfreeze(self):
+        """Freezing should fill the permanent generation until the end."""
+        self.policy.freeze()
+        self.assertGreater(gc.get_freeze_count(), 0)
+        self.policy.end_gameplay()
+        self.assertEqual(gc.get_freeze_count(), 0)
+
+    def test_natural_pause_rate_limited(self):
+        """Back to back natural pauses should collect only once."""
+        self.policy.begin_gameplay(self.pacing)
+        self.policy.natural_pause()
+        self.policy.natural_pause()
+        self.assertEqual(self.policy.collections[2], 1)
+
+    def test_forced_collection_after_long_stretch(self):
+        """A full collection should run after too many frames."""
+        saved = gc_policy.MAX_DEFERRED_FRAMES
+        gc_policy.MAX_DEFERRED_FRAMES = 5
+        try:
+            self.policy.begin_gameplay(self.pacing)
+            for _ in range(5):
+                self.policy.frame()
+        finally:
+            gc_policy.MAX_DEFERRED_FRAMES = saved
+        self.assertEqual(self.policy.forced, 1)
+        self.assertEqual(self.policy.collections[2], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
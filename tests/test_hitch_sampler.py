@@ -0,0 +1,116 @@
+"""
+Unit tests for the hitch sampler.
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mechanics.hitch_sampler import HitchSampler
+
+
+def busy(seconds):
+    """Spin for a while so the frame goes over budget."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestHitchSampler(unittest.TestCase):
+    """Tests for HitchSampler."""
+
+    def setUp(self):
+        self.sampler = HitchSampler(threshold_ms=20,
+                                    thread_id=threading.get_ident())
+        self.sampler.begin_session("test")
+
+    def tearDown(self):
+        self.sampler.stop()
+
+    def test_collapse_outermost_first(self):
+        """Collapsed stacks should run from the outer call inwards."""
+        def inner():
+            return self.sampler.collapse(sys._getframe())
+
+        stack = inner().split(";")
+        self.assertEqual(stack[-1], "test_hitch_sampler.py:inner")
+        self.assertEqual(stack[-2],
+                         "test_hitch_sampler.py:test_collapse_outermost_first")
+
+    def test_fast_frame_not_kept(self):
+        """Frames within the threshold should not become hitches."""
+        self.sampler.begin_frame()
+        self.sampler.sample()
+        self.assertIsNone(self.sampler.end_frame())
+        self.assertEqual(self.sampler.hitches, [])
+        self.assertEqual(self.sampler.frames, 1)
+
+    def test_slow_frame_keeps_its_samples(self):
+        """A slow frame should keep only the samples taken during it."""
+        self.sampler.sample()  # Before the frame, must not be included
+        self.sampler.begin_frame()
+        self.sampler.sample()
+        busy(0.025)
+        self.sampler.sample()
+        hitch = self.sampler.end_frame()
+
+        self.assertIsNotNone(hitch)
+        self.assertEqual(hitch["samples"], 2)
+        self.assertGreater(hitch["duration_ms"], 20)
+        self.assertTrue(all("test_slow_frame_keeps_its_samples" in stack
+                            for stack in hitch["stacks"]))
+
+    def test_thread_samples_main_loop(self):
+        """The sampler thread should capture the busy function."""
+        self.sampler.start()
+        self.sampler.begin_frame()
+        busy(0.05)
+        hitch = self.sampler.end_frame()
+        self.assertGreater(hitch["samples"], 0)
+        self.assertTrue(any(stack.endswith(":busy")
+                            for stack in hitch["stacks"]))
+
+    def test_write_report(self):
+        """Hitches should be written as folded stacks and JSON."""
+        self.sampler.begin_frame()
+        self.sampler.sample()
+        busy(0.025)
+        self.sampler.end_frame()
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.sampler.directory = directory
+            path = self.sampler.write()
+            with open(path) as f:
+                lines = f.read().splitlines()
+            with open(path.replace(".folded", ".json")) as f:
+                report = json.load(f)
+
+        stack, count = lines[0].rsplit(" ", 1)
+        self.assertEqual(int(count), 1)
+        self.assertIn(";", stack)
+        self.assertEqual(len(report["hitches"]), 1)
+        self.assertEqual(report["name"], "test")
+
+    def test_sleep_between_frames_not_counted(self):
+        """Time between end_frame() and begin_frame() isn't frame work."""
+        self.sampler.begin_frame()
+        self.sampler.end_frame()
+        time.sleep(0.03)  # clock.tick()
+        self.sampler.begin_frame()
+        self.assertIsNone(self.sampler.end_frame())
+        self.assertEqual(self.sampler.hitches, [])
+        self.assertEqual(self.sampler.frames, 2)
+
+    def test_no_report_without_hitches(self):
+        """A session without hitches should not write anything."""
+        self.assertIsNone(self.sampler.write())
+
+
+if __name__ == "__main__":
+    unittest.main()
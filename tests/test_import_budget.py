@@ -0,0 +1,62 @@
+"""
+Unit tests for the import time budget.
+"""
+
+import unittest
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench.imports import check, parse_importtime
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:      1000 |     200000 | pygame
+import time:      2000 |       2000 | mechanics.scores
+import time:      3000 |       5000 | mechanics
+import time:       500 |        500 | ui
+"""
+
+
+class TestImportBudget(unittest.TestCase):
+    """Tests for parse_importtime() and check()."""
+
+    def test_parse(self):
+        """Self and cumulative times should be read in milliseconds."""
+        modules = parse_importtime(OUTPUT)
+        self.assertEqual(modules["pygame"], (1.0, 200.0))
+        self.assertEqual(len(modules), 4)
+
+    def test_only_game_modules_budgeted(self):
+        """Third-party time should be reported, not budgeted."""
+        report = check(parse_importtime(OUTPUT), budget=6.0)
+        self.assertAlmostEqual(report["game_ms"], 5.5)
+        self.assertEqual(report["third_party_ms"], {"pygame": 200.0})
+        self.assertTrue(report["ok"])
+        self.assertFalse(check(parse_importtime(OUTPUT), budget=5.0)["ok"])
+
+    def test_mode_only_module_fails(self):
+        """Importing PyAudio before a mode starts should fail the check."""
+        output = OUTPUT + "import time:      100 |        100 | pyaudio\n"
+        report = check(parse_importtime(output), budget=100.0)
+        self.assertEqual(report["mode_only"], ["pyaudio"])
+        self.assertFalse(report["ok"])
+
+    def test_menu_imports_no_pyaudio(self):
+        """The packages the menu imports shouldn't load the recorder."""
+        code = ("import sys, mechanics, ui, background; "
+                "print(sorted(m for m in ('pyaudio', 'mechanics.Recorder') "
+                "if m in sys.modules))")
+        env = dict(os.environ, SDL_VIDEODRIVER="dummy",
+                   SDL_AUDIODRIVER="dummy")
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                                env=env, capture_output=True, text=True,
+                                check=True)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
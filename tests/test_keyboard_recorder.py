@@ -0,0 +1,93 @@
+"""
+Unit tests for the keyboard recorder and the microphone fallback.
+"""
+
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+pygame.init()
+
+from mechanics.game_driver import GameDriver
+from mechanics.keyboard_recorder import KeyboardRecorder, SCREAM_AMPLITUDE
+
+
+class HeldKeys:
+    """Held key state with a settable set of keys."""
+
+    def __init__(self):
+        self.keys = set()
+
+    def __call__(self):
+        return self
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+class TestKeyboardRecorder(unittest.TestCase):
+    """Tests for KeyboardRecorder."""
+
+    def setUp(self):
+        self.held = HeldKeys()
+        self.recorder = KeyboardRecorder(frames_per_buffer=100,
+                                         get_pressed=self.held)
+
+    def test_held_key_is_loud(self):
+        """Blocks should be loud only while the scream key is held."""
+        self.recorder.start_recording()
+        self.assertEqual(self.recorder.get_frame_peak(), 0)
+        self.assertIsNone(self.recorder.get_onset_time(5000))
+
+        self.held.keys.add(pygame.K_s)
+        data = self.recorder.read_frames()
+        self.assertEqual(len(data), 200)
+        self.assertEqual(self.recorder.get_frame_peak(), SCREAM_AMPLITUDE)
+        self.assertEqual(self.recorder.get_onset_time(5000),
+                         self.recorder.last_read_time)
+        self.assertEqual(self.recorder.get_peak(), SCREAM_AMPLITUDE)
+
+    def test_paused(self):
+        """A paused recorder should read nothing."""
+        self.recorder.start_recording()
+        self.recorder.pause_recording()
+        self.assertIsNone(self.recorder.read_frames())
+        self.recorder.restart_recording()
+        self.assertIsNotNone(self.recorder.read_frames())
+
+    def test_key_name(self):
+        """The key name should be ready for on-screen hints."""
+        self.assertEqual(self.recorder.key_name, "S")
+
+
+class TestMicrophoneFallback(unittest.TestCase):
+    """Tests for GameDriver.create_recorder without PyAudio."""
+
+    def setUp(self):
+        self.saved = {name: sys.modules.pop(name, None)
+                      for name in ("pyaudio", "mechanics.Recorder")}
+        # None in sys.modules makes the import raise ImportError
+        sys.modules["pyaudio"] = None
+
+    def tearDown(self):
+        for name, module in self.saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+    def test_keyboard_without_pyaudio(self):
+        """Classic mode should get a keyboard recorder without PyAudio."""
+        driver = GameDriver()
+        recorder = driver.create_recorder()
+        self.assertIsInstance(recorder, KeyboardRecorder)
+        self.assertEqual(recorder.get_pressed, driver.get_pressed)
+        # Started like the microphone, so classic mode needn't start it
+        self.assertEqual(len(recorder.frames), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
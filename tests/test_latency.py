@@ -0,0 +1,110 @@
+"""
+Unit tests for input-to-display latency tracking.
+"""
+
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from mechanics.latency import (
+    InputLatency,
+    MAX_PENDING,
+    get_latency_summaries,
+    reset_latency,
+    start_latency,
+)
+
+
+class TestInputLatency(unittest.TestCase):
+    """Tests for InputLatency."""
+
+    def setUp(self):
+        self.latency = InputLatency("test")
+        # Steady state: boat still, hook still, not paused
+        self.latency.observe(100, 0, False)
+
+    def frame(self, boat_x=100, rod_length=0, paused=False, t=None):
+        """Observe one frame's state and present it."""
+        self.latency.observe(boat_x, rod_length, paused)
+        self.latency.presented(t)
+
+    def test_space_reflected_when_hook_moves(self):
+        """Space should be measured at the first frame the hook moves."""
+        self.latency.input("space", t=10.0)
+        self.frame(t=10.016)
+        self.frame(rod_length=5, t=10.033)
+        self.frame(rod_length=10, t=10.050)
+
+        count, mean, p50, p95, worst = self.latency.stats("space")
+        self.assertEqual(count, 1)
+        self.assertAlmostEqual(mean, 33.0, places=3)
+
+    def test_boat_direction(self):
+        """Arrow keys should only be reflected by movement that way."""
+        self.latency.input("left", t=1.0)
+        self.latency.input("right", t=1.0)
+        self.frame(boat_x=105, t=1.02)
+        self.assertIsNone(self.latency.stats("left"))
+        self.assertEqual(self.latency.stats("right")[0], 1)
+
+    def test_key_down(self):
+        """Measured keys should be timestamped; others ignored."""
+        self.latency.key_down(pygame.K_p)
+        self.latency.key_down(pygame.K_a)
+        self.frame(paused=True)
+        self.assertEqual(self.latency.stats("pause")[0], 1)
+        self.assertEqual(self.latency.counts["space"], 0)
+
+    def test_scream_needs_downward_hook(self):
+        """A scream is only reflected by the hook going down."""
+        self.frame(rod_length=10)
+        self.latency.input("scream", t=0.0)
+        self.frame(rod_length=5, t=0.01)  # Reeling up
+        self.assertIsNone(self.latency.stats("scream"))
+        self.frame(rod_length=8, t=0.02)  # Turned around, going down
+        self.assertEqual(self.latency.stats("scream")[0], 1)
+
+    def test_unreflected_input_expires(self):
+        """Inputs that never show up should be dropped and counted."""
+        self.latency.input("space", t=0.0)
+        self.frame(t=MAX_PENDING + 0.1)
+        self.assertEqual(self.latency.expired["space"], 1)
+        self.frame(rod_length=5, t=MAX_PENDING + 0.2)
+        self.assertIsNone(self.latency.stats("space"))
+
+    def test_repeated_input_keeps_first_time(self):
+        """A second press before the first is reflected is ignored."""
+        self.latency.input("space", t=1.0)
+        self.latency.input("space", t=1.5)
+        self.frame(rod_length=5, t=2.0)
+        self.assertAlmostEqual(self.latency.stats("space")[1], 1000.0)
+
+    def test_summary(self):
+        """Summary should have every kind, empty ones with None values."""
+        summary = self.latency.summary()
+        self.assertEqual(summary["space"]["count"], 0)
+        self.assertIsNone(summary["space"]["p95_ms"])
+
+
+class TestLatencyRegistry(unittest.TestCase):
+    """Tests for the per-mode trackers."""
+
+    def tearDown(self):
+        reset_latency()
+
+    def test_per_mode_tracker(self):
+        """Sessions of a mode should share a tracker."""
+        first = start_latency("endless")
+        first.input("pause", t=0.0)
+        second = start_latency("endless")
+        self.assertIs(first, second)
+        self.assertEqual(second._pending, {})
+        self.assertIn("endless", get_latency_summaries())
+
+
+if __name__ == "__main__":
+    unittest.main()
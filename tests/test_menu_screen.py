@@ -34,6 +34,17 @@ class TestMenuScreen(unittest.TestCase):
         self.menu_screen.showing_high_scores = False
         self.assertFalse(self.menu_screen.showing_high_scores)
 
+    def test_high_score_paging(self):
+        # Test paging through the modes in the high scores overlay
+        self.menu_screen.show_high_scores()
+        self.assertTrue(self.menu_screen.showing_high_scores)
+        self.assertEqual(self.menu_screen.high_score_page, 0)
+        self.menu_screen.change_high_score_page(-1)
+        self.assertEqual(self.menu_screen.high_score_page,
+                         len(self.menu_screen.HIGH_SCORE_PAGES) - 1)
+        self.menu_screen.change_high_score_page(1)
+        self.assertEqual(self.menu_screen.high_score_page, 0)
+
     def test_transitioning_state(self):
         # Test transitioning state
         self.assertFalse(self.menu_screen.transitioning)
@@ -42,6 +53,19 @@ class TestMenuScreen(unittest.TestCase):
         self.menu_screen.transitioning = False
         self.assertFalse(self.menu_screen.transitioning)
 
+    def test_reset_after_transition(self):
+        # Test coming back from a mode without rebuilding the menu
+        buttons = self.menu_screen.buttons
+        self.menu_screen.move_selection(1)
+        self.menu_screen.start_transition("classic")
+        for _ in range(5):
+            self.menu_screen.update()
+        self.menu_screen.reset()
+        self.assertIs(self.menu_screen.buttons, buttons)
+        self.assertFalse(self.menu_screen.transitioning)
+        self.assertEqual(self.menu_screen.selected_index, 0)
+        self.assertEqual(buttons[0].x, buttons[0].base_x)
+
     def test_button_count(self):
         # Test the number of buttons created
         self.assertEqual(len(self.menu_screen.buttons), 5)
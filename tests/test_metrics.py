@@ -0,0 +1,120 @@
+"""
+Unit tests for the metrics endpoint.
+"""
+
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mechanics import metrics
+from mechanics.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    LoopMetrics,
+    POPULATION_EVERY,
+    render,
+    scrape,
+    start_server,
+    stop_server,
+)
+
+
+class TestMetricTypes(unittest.TestCase):
+    """Tests for the counter, gauge and histogram types."""
+
+    def setUp(self):
+        self.registered = list(metrics._metrics)
+
+    def tearDown(self):
+        metrics._metrics[:] = self.registered
+
+    def test_counter(self):
+        """Counts should add up per label set."""
+        counter = Counter("test_total", "Test.", ("species",))
+        counter.inc(("Shark",))
+        counter.inc(("Shark",), 2)
+        counter.inc(("Turtle",))
+        lines = counter.render()
+        self.assertIn("# TYPE test_total counter", lines)
+        self.assertIn('test_total{species="Shark"} 3', lines)
+        self.assertIn('test_total{species="Turtle"} 1', lines)
+
+    def test_gauge_without_labels(self):
+        """A gauge without labels should render a bare sample."""
+        gauge = Gauge("test_gauge", "Test.")
+        gauge.set(7)
+        self.assertIn("test_gauge 7", gauge.render())
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Bucket counts should include every smaller bucket."""
+        histogram = Histogram("test_seconds", "Test.", (0.01, 0.1))
+        for value in (0.005, 0.01, 0.05, 2.0):
+            histogram.observe(value)
+        lines = histogram.render()
+        self.assertIn('test_seconds_bucket{le="0.01"} 2', lines)
+        self.assertIn('test_seconds_bucket{le="0.1"} 3', lines)
+        self.assertIn('test_seconds_bucket{le="+Inf"} 4', lines)
+        self.assertIn("test_seconds_count 4", lines)
+        self.assertIn("test_seconds_sum 2.065", lines)
+
+
+class TestLoopMetrics(unittest.TestCase):
+    """Tests for the mode loop metrics."""
+
+    def test_frames_and_population(self):
+        """Frames should be timed and the population sampled now and then."""
+        stats = {"total": 5, "danger": 1, "game_over": False}
+        loop = LoopMetrics("metrics_test", lambda: stats)
+        for _ in range(POPULATION_EVERY + 1):
+            loop.begin_frame()
+            loop.end_update()
+            loop.end_draw()
+            loop.end_frame(16)
+
+        frame_series = metrics.FRAME_SECONDS.values[("metrics_test",)]
+        self.assertEqual(frame_series[2], POPULATION_EVERY + 1)
+        draw_series = metrics.PHASE_SECONDS.values[("metrics_test", "draw")]
+        self.assertEqual(draw_series[2], POPULATION_EVERY + 1)
+        self.assertEqual(metrics.FISH_POPULATION.values[("total",)], 5)
+        self.assertNotIn(("game_over",), metrics.FISH_POPULATION.values)
+
+    def test_draw_without_update(self):
+        """A frame that skipped end_update shouldn't record a draw time."""
+        loop = LoopMetrics("metrics_skip")
+        loop.begin_frame()
+        loop.end_draw()
+        self.assertNotIn(("metrics_skip", "draw"),
+                         metrics.PHASE_SECONDS.values)
+
+
+class TestServer(unittest.TestCase):
+    """Tests for the HTTP endpoint."""
+
+    def tearDown(self):
+        stop_server()
+
+    def test_scrape(self):
+        """A scraper should see what the game recorded."""
+        metrics.SPAWNS.inc(("Scrape Fish",))
+        port = start_server(0)
+        self.assertIsNotNone(port)
+        samples = scrape(port)
+        self.assertGreaterEqual(
+            samples['fish_spawns_total{species="Scrape Fish"}'], 1)
+        self.assertIn("fish_frame_seconds", render())
+
+    def test_unknown_path(self):
+        """Only /metrics should be served."""
+        from urllib.error import HTTPError
+        from urllib.request import urlopen
+
+        port = start_server(0)
+        with self.assertRaises(HTTPError):
+            urlopen(f"http://127.0.0.1:{port}/", timeout=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
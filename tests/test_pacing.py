@@ -0,0 +1,110 @@
+"""
+Unit tests for the frame pacing collector.
+"""
+
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mechanics.pacing import (
+    FramePacing,
+    HISTOGRAM_MS,
+    get_pacing_summaries,
+    reset_pacing,
+    start_pacing,
+)
+
+
+class TestFramePacing(unittest.TestCase):
+    """Tests for FramePacing."""
+
+    def setUp(self):
+        self.pacing = FramePacing("test", fps=60)
+
+    def record(self, *frames):
+        for frame_ms in frames:
+            self.pacing.record(frame_ms)
+
+    def test_on_budget_frames(self):
+        """16 and 17 ms ticks at 60 FPS should not be over budget."""
+        self.record(16, 17, 16, 17)
+        summary = self.pacing.summary()
+        self.assertEqual(summary["frames"], 4)
+        self.assertEqual(summary["over_budget"], 0)
+        self.assertEqual(summary["hitches"], 0)
+        self.assertAlmostEqual(summary["mean_ms"], 16.5)
+
+    def test_over_budget_and_hitches(self):
+        """Slow frames should be counted, long ones also as hitches."""
+        self.record(16, 20, 25, 16, 40, 50, 45, 16)
+        summary = self.pacing.summary()
+        self.assertEqual(summary["over_budget"], 5)
+        self.assertEqual(summary["hitches"], 3)
+        self.assertEqual(summary["longest_over_budget_run"], 3)
+        self.assertEqual(summary["longest_hitch_run"], 3)
+        self.assertEqual(summary["max_ms"], 50)
+
+    def test_hitch_run_broken_by_slow_frame(self):
+        """A slow but not hitching frame should end a hitch run."""
+        self.record(40, 20, 40)
+        self.assertEqual(self.pacing.longest_hitch_run, 1)
+        self.assertEqual(self.pacing.longest_over_budget_run, 3)
+
+    def test_percentiles(self):
+        """Percentiles should come from the histogram bins."""
+        self.record(*([16] * 90 + [30] * 9 + [60]))
+        self.assertEqual(self.pacing.percentile(50), 16)
+        self.assertEqual(self.pacing.percentile(95), 30)
+        self.assertEqual(self.pacing.percentile(100), 60)
+
+    def test_long_frames_share_last_bin(self):
+        """Frames past the histogram should go in the last bin."""
+        self.record(HISTOGRAM_MS + 500)
+        self.assertEqual(self.pacing.counts[-1], 1)
+        self.assertEqual(self.pacing.percentile(50), HISTOGRAM_MS + 500)
+
+    def test_first_session_frame_skipped(self):
+        """The first tick of a session includes loading and is skipped."""
+        self.pacing.begin_session()
+        self.record(900, 16)
+        self.assertEqual(self.pacing.frames, 1)
+        self.assertEqual(self.pacing.max_ms, 16)
+
+    def test_empty_summary(self):
+        """An empty collector should summarize without errors."""
+        summary = self.pacing.summary()
+        self.assertEqual(summary["frames"], 0)
+        self.assertEqual(summary["fps"], 0.0)
+        self.assertEqual(summary["p95_ms"], 0)
+
+
+class TestPacingRegistry(unittest.TestCase):
+    """Tests for the per-mode collectors."""
+
+    def setUp(self):
+        reset_pacing()
+
+    def tearDown(self):
+        reset_pacing()
+
+    def test_sessions_accumulate_per_mode(self):
+        """Sessions of the same mode should share a collector."""
+        first = start_pacing("classic")
+        first.record(0)
+        first.record(16)
+        second = start_pacing("classic")
+        second.record(0)
+        second.record(17)
+        start_pacing("endless")
+
+        self.assertIs(first, second)
+        summaries = get_pacing_summaries()
+        self.assertEqual(set(summaries), {"classic", "endless"})
+        self.assertEqual(summaries["classic"]["frames"], 2)
+        self.assertEqual(summaries["classic"]["sessions"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Unit tests for the frame profiler overlay.
+"""
+
+import unittest
+import os
+import sys
+import time
+
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mechanics.profiler import FrameProfiler
+
+pygame.init()
+
+
+def run_frames(profiler, count, phase_time=0.001):
+    """Simulate frames with an "update" and a "draw" phase."""
+    for _ in range(count):
+        profiler.begin_frame()
+        time.sleep(phase_time)
+        profiler.lap("update")
+        profiler.lap("draw")
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Tests for FrameProfiler."""
+
+    def test_disabled_profiler_records_nothing(self):
+        """Laps while hidden should not collect anything."""
+        profiler = FrameProfiler()
+        run_frames(profiler, 5, phase_time=0)
+        self.assertIsNone(profiler.stats())
+
+    def test_toggle_enables_and_resets(self):
+        """F3 toggles the overlay and starts from a clean history."""
+        profiler = FrameProfiler()
+        profiler.toggle()
+        self.assertTrue(profiler.enabled)
+        run_frames(profiler, 3, phase_time=0)
+        profiler.toggle()
+        profiler.toggle()
+        self.assertIsNone(profiler.stats())
+
+    def test_phase_statistics(self):
+        """Each phase should get mean, p95 and max in milliseconds."""
+        profiler = FrameProfiler(enabled=True)
+        run_frames(profiler, 6)
+
+        stats = profiler.stats()
+        mean, p95, worst = stats["update"]
+        self.assertGreaterEqual(mean, 1.0)
+        self.assertLessEqual(mean, p95)
+        self.assertLessEqual(p95, worst)
+        self.assertLess(stats["draw"][0], stats["update"][0])
+        self.assertGreaterEqual(stats["frame"][0], mean)
+
+    def test_history_wraps_around(self):
+        """Statistics should only cover the most recent frames."""
+        profiler = FrameProfiler(enabled=True, history=4)
+        run_frames(profiler, 10)
+        run_frames(profiler, 4, phase_time=0)
+        self.assertLess(profiler.stats()["update"][2], 1.0)
+
+    def test_draw_overlay(self):
+        """Drawing should work before and after frames were recorded."""
+        surface = pygame.Surface((1200, 800))
+        profiler = FrameProfiler(enabled=True)
+        profiler.draw(surface)
+        run_frames(profiler, 20, phase_time=0)
+        profiler.draw(surface)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Unit tests for the seeded random streams.
+"""
+
+import unittest
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+pygame.init()
+pygame.display.set_mode((800, 600), pygame.HIDDEN)
+
+import background.background_manager as background_manager
+from background import BackgroundManager
+from background.bubble import Bubble
+from fish.fish_manager import FishManager
+from mechanics.random_streams import get_seed, seed_streams, stream
+
+
+class TestStreams(unittest.TestCase):
+    """Tests for stream() and seed_streams()."""
+
+    def test_same_seed_same_sequence(self):
+        """Seeding again should repeat a stream's numbers."""
+        seed_streams(99)
+        first = [stream("spawn").random() for _ in range(5)]
+        seed_streams(99)
+        self.assertEqual([stream("spawn").random() for _ in range(5)], first)
+        self.assertEqual(get_seed(), 99)
+
+    def test_streams_are_independent(self):
+        """Drawing from one stream shouldn't move another."""
+        seed_streams(7)
+        expected = stream("fish").random()
+        seed_streams(7)
+        for _ in range(100):
+            stream("bubbles").random()
+        self.assertEqual(stream("fish").random(), expected)
+
+    def test_reseed_in_place(self):
+        """A stream held before seeding should follow the new seed."""
+        held = stream("ripples")
+        seed_streams(3)
+        value = held.random()
+        seed_streams(3)
+        self.assertIs(stream("ripples"), held)
+        self.assertEqual(stream("ripples").random(), value)
+
+    def test_unknown_stream(self):
+        """An unknown name should raise KeyError."""
+        with self.assertRaises(KeyError):
+            stream("weather")
+
+    def test_injected_stream(self):
+        """An object given its own stream should use it."""
+        first = Bubble(10, 300, rng=random.Random(5))
+        second = Bubble(10, 300, rng=random.Random(5))
+        self.assertEqual(first.radius, second.radius)
+        self.assertEqual(first.speed, second.speed)
+
+
+class TestFishIgnoreEffects(unittest.TestCase):
+    """The fish shouldn't depend on how many effects the background has."""
+
+    def setUp(self):
+        self.intervals = (background_manager.RIPPLE_INTERVAL,
+                          background_manager.BUBBLE_INTERVAL)
+
+    def tearDown(self):
+        (background_manager.RIPPLE_INTERVAL,
+         background_manager.BUBBLE_INTERVAL) = self.intervals
+
+    def spawn_sequence(self, effect_interval):
+        """Spawn fish between background updates; return what spawned."""
+        background_manager.RIPPLE_INTERVAL = effect_interval
+        background_manager.BUBBLE_INTERVAL = effect_interval
+        seed_streams(1234)
+        background = BackgroundManager()
+        fish_manager = FishManager()
+        spawned = []
+        for _ in range(20):
+            for _ in range(10):
+                background.update()
+            fish = fish_manager.spawn_fish()
+            spawned.append((fish.fish_type, fish.rect.center, fish.speed_y,
+                            fish.frame_delay))
+        return spawned, len(background.ripples) + len(background.bubbles)
+
+    def test_same_fish_with_more_effects(self):
+        """More ripples and bubbles should leave the fish unchanged."""
+        few, few_effects = self.spawn_sequence((200, 300))
+        many, many_effects = self.spawn_sequence((1, 2))
+        self.assertGreater(many_effects, few_effects)
+        self.assertEqual(many, few)
+
+
+if __name__ == "__main__":
+    unittest.main()
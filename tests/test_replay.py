@@ -0,0 +1,167 @@
+"""
+Unit tests for replay recording and playback.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+pygame.init()
+pygame.display.set_mode((800, 600), pygame.HIDDEN)
+
+import mechanics.scores as scores
+from bench.scene import ScriptedDriver
+from mechanics import replay
+from mechanics.replay import (
+    RecordingDriver,
+    Replay,
+    ReplayDriver,
+    ReplayRecorder,
+)
+from modes.mode_classic import ClassicRules
+from modes.mode_time_attack import TimeAttackRules
+from modes.session import GameSession
+
+
+class TestReplayFormat(unittest.TestCase):
+    """Tests for encoding and decoding replays."""
+
+    def test_round_trip(self):
+        """A decoded replay should equal the one encoded."""
+        ticks = [(16, 1, 0, 0), (17, 3, 1, 20000), (16, 0, 0x80, 0)]
+        decoded = Replay.from_bytes(
+            Replay("classic", 1234, ticks, 450).to_bytes())
+        self.assertEqual(decoded.mode, "classic")
+        self.assertEqual(decoded.seed, 1234)
+        self.assertEqual(decoded.score, 450)
+        self.assertEqual(decoded.ticks, ticks)
+        self.assertEqual(decoded.duration_ms(), 49)
+
+    def test_compact(self):
+        """A minute of steady play should take well under a kilobyte."""
+        ticks = [(16, 2, 0, 0)] * 3600
+        self.assertLess(len(Replay("endless", 1, ticks).to_bytes()), 1024)
+
+    def test_rejects_other_files(self):
+        """Files that aren't replays should raise ValueError."""
+        with self.assertRaises(ValueError):
+            Replay.from_bytes(b"not a replay at all, just some bytes")
+
+    def test_save_and_load(self):
+        """A saved replay should load back."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.fomr")
+            Replay("endless", 7, [(16, 0, 0, 0)], 25).save(path)
+            self.assertEqual(replay.load_replay(path).score, 25)
+
+
+class TestReplayDriver(unittest.TestCase):
+    """Tests for ReplayDriver."""
+
+    def test_plays_back_ticks(self):
+        """Keys, peak and frame time should follow the recorded ticks."""
+        driver = ReplayDriver(Replay("classic", 1, [(20, 1, 1, 9000)]))
+        events = driver.get_events()
+        self.assertEqual([e.key for e in events], [pygame.K_SPACE])
+        self.assertTrue(driver.get_pressed()[pygame.K_LEFT])
+        self.assertFalse(driver.get_pressed()[pygame.K_RIGHT])
+        recorder = driver.create_recorder()
+        recorder.read_frames()
+        self.assertEqual(recorder.get_frame_peak(), 9000)
+        self.assertEqual(driver.tick(), 20)
+
+    def test_quits_after_last_tick(self):
+        """The driver should send QUIT once the ticks run out."""
+        driver = ReplayDriver(Replay("classic", 1, []))
+        self.assertEqual([e.type for e in driver.get_events()],
+                         [pygame.QUIT])
+
+    def test_recorder_interface(self):
+        """The stand-in recorder should report onsets only when loud."""
+        driver = ReplayDriver(Replay("classic", 1, [(16, 0, 0, 100)]))
+        recorder = ReplayRecorder(driver)
+        recorder.start_recording()
+        self.assertIsNone(recorder.get_onset_time(5000))
+        self.assertEqual(len(recorder.get_samples()),
+                         2 * recorder.frames_per_buffer)
+
+
+class TestRecordAndReplay(unittest.TestCase):
+    """Records scripted sessions and plays them back."""
+
+    def setUp(self):
+        """Keep the sessions' scores out of the real score file."""
+        self.store = scores._store
+        self.score_dir = tempfile.TemporaryDirectory()
+        scores._store = scores.ScoreStore(
+            os.path.join(self.score_dir.name, "highscores.json"))
+
+    def tearDown(self):
+        scores.flush_scores()
+        scores._store = self.store
+        self.score_dir.cleanup()
+
+    def record_and_replay(self, rules_class):
+        """Record 900 scripted frames, replay them; return both sessions."""
+        recording = RecordingDriver(ScriptedDriver(frames=900, warmup=0),
+                                    rules_class.mode, seed=42)
+        recorded = GameSession(rules_class(5, catch_logging=False),
+                               recording)
+        recorded.run()
+        self.assertEqual(recording.replay.score, recorded.score)
+
+        data = recording.replay.to_bytes()
+        replayed = GameSession(rules_class(5, catch_logging=False),
+                               ReplayDriver(Replay.from_bytes(data)))
+        replayed.run()
+        return recorded, replayed
+
+    def test_classic_reproduces_score(self):
+        """Classic should replay to the same score and casts."""
+        recorded, replayed = self.record_and_replay(ClassicRules)
+        self.assertEqual(replayed.score, recorded.score)
+        self.assertEqual(replayed.casting_manager.cast_count,
+                         recorded.casting_manager.cast_count)
+
+    def test_time_attack_reproduces_game(self):
+        """Time attack should replay to the same score and boat position."""
+        recorded, replayed = self.record_and_replay(TimeAttackRules)
+        self.assertEqual(replayed.score, recorded.score)
+        self.assertEqual(replayed.fish_caught_count,
+                         recorded.fish_caught_count)
+        self.assertEqual(replayed.boat_x, recorded.boat_x)
+
+
+class TestSessionRecording(unittest.TestCase):
+    """Tests for the module-level recording switch."""
+
+    def tearDown(self):
+        replay._directory = None
+
+    def test_off_by_default(self):
+        """Without start_replays() the driver should be left alone."""
+        driver = ScriptedDriver(frames=1)
+        self.assertIs(replay.begin_session("classic", driver), driver)
+
+    def test_session_written(self):
+        """A recorded session should be written to the directory."""
+        with tempfile.TemporaryDirectory() as directory:
+            replay.start_replays(directory)
+            driver = replay.begin_session("endless",
+                                          ScriptedDriver(frames=1))
+            driver.get_events()
+            driver.tick()
+            path = replay.end_session(driver, 100)
+            self.assertTrue(path.startswith(directory))
+            self.assertEqual(replay.load_replay(path).score, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit tests for the scripted scene benchmark driver.
+"""
+
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from bench.scene import ScriptedDriver, default_script, frame_stats
+
+
+class TestScriptedDriver(unittest.TestCase):
+    """Tests for ScriptedDriver."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    def run_frames(self, driver):
+        """Drive the loop until QUIT; return all events seen."""
+        seen = []
+        while True:
+            events = driver.get_events()
+            seen.extend(events)
+            driver.tick()
+            if any(e.type == pygame.QUIT for e in events):
+                return seen
+
+    def test_quits_after_frame_count(self):
+        """The driver should send QUIT after the requested frames."""
+        driver = ScriptedDriver(frames=50, warmup=0)
+        self.run_frames(driver)
+        self.assertEqual(driver.frame, 51)
+
+    def test_warmup_frames_not_measured(self):
+        """Warmup frames should be left out of frame_times."""
+        driver = ScriptedDriver(frames=50, warmup=10)
+        self.run_frames(driver)
+        self.assertEqual(len(driver.frame_times), 50 - 10)
+
+    def test_script_is_deterministic(self):
+        """The same frames should produce the same key presses."""
+        first = [e.key for e in self.run_frames(ScriptedDriver(300))
+                 if e.type == pygame.KEYDOWN]
+        second = [e.key for e in self.run_frames(ScriptedDriver(300))
+                  if e.type == pygame.KEYDOWN]
+        self.assertEqual(first, second)
+        self.assertIn(pygame.K_SPACE, first)
+
+    def test_held_keys_follow_script(self):
+        """get_pressed() should report the script's held keys."""
+        driver = ScriptedDriver(frames=10)
+        driver.get_events()
+        _, held, _ = default_script(0)
+        for key in held:
+            self.assertTrue(driver.get_pressed()[key])
+        self.assertFalse(driver.get_pressed()[pygame.K_ESCAPE])
+
+    def test_recorder_screams_on_script(self):
+        """The synthetic recorder should be loud only while screaming."""
+        driver = ScriptedDriver(frames=10)
+        recorder = driver.create_recorder()
+        recorder.start_recording()
+        quiet = recorder.get_frame_peak()
+        driver.screaming = True
+        recorder.read_frames()
+        self.assertGreater(recorder.get_frame_peak(), quiet * 5)
+        self.assertEqual(len(recorder.frames), 2)
+
+
+class TestFrameStats(unittest.TestCase):
+    """Tests for frame_stats()."""
+
+    def test_percentiles(self):
+        """Stats should be in milliseconds with the right fps."""
+        stats = frame_stats([0.01] * 99 + [0.05])
+        self.assertEqual(stats["frames"], 100)
+        self.assertAlmostEqual(stats["p50_ms"], 10.0)
+        self.assertAlmostEqual(stats["max_ms"], 50.0)
+        self.assertAlmostEqual(stats["fps"], 1000 / 10.4)
+
+    def test_empty(self):
+        """No frames should give no statistics."""
+        self.assertEqual(frame_stats([]), {"frames": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Unit tests for the scene stack.
+"""
+
+import unittest
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+pygame.init()
+pygame.display.set_mode((800, 600), pygame.HIDDEN)
+
+from ui import scenes
+from ui.scenes import ModeScene, Scene, SceneManager
+
+
+class RecordingScene(Scene):
+    """Scene that records its calls and pops itself after some steps."""
+
+    def __init__(self, name, log, steps=1, child=None):
+        self.name = name
+        self.log = log
+        self.steps = steps
+        self.child = child
+
+    def enter(self, manager):
+        super().enter(manager)
+        self.log.append(f"enter {self.name}")
+
+    def step(self):
+        self.log.append(f"step {self.name}")
+        if self.child is not None:
+            child, self.child = self.child, None
+            self.manager.push(child)
+            return
+        self.steps -= 1
+        if self.steps <= 0:
+            self.manager.pop()
+
+    def resume(self):
+        self.log.append(f"resume {self.name}")
+
+    def exit(self):
+        self.log.append(f"exit {self.name}")
+
+
+class TestSceneManager(unittest.TestCase):
+    """Tests for SceneManager."""
+
+    def test_stack_order(self):
+        """A pushed scene runs on top and the one below resumes after."""
+        log = []
+        mode = RecordingScene("mode", log)
+        menu = RecordingScene("menu", log, steps=1, child=mode)
+        SceneManager(None, None).run(menu)
+        self.assertEqual(log, [
+            "enter menu", "step menu",
+            "enter mode", "step mode", "exit mode",
+            "resume menu", "step menu", "exit menu",
+        ])
+
+
+class TestModeScene(unittest.TestCase):
+    """Tests for ModeScene."""
+
+    def setUp(self):
+        self.calls = []
+        module = types.ModuleType("fake_mode")
+        module.main = lambda **kwargs: self.calls.append(kwargs)
+        sys.modules["fake_mode"] = module
+        scenes.MODES["fake"] = ("fake_mode", "Fake", "Launching Fake...")
+
+    def tearDown(self):
+        del sys.modules["fake_mode"]
+        del scenes.MODES["fake"]
+
+    def test_mode_gets_shared_background(self):
+        """The mode should run once with the manager's background."""
+        background = object()
+        log = []
+        menu = RecordingScene("menu", log, child=ModeScene("fake"))
+        manager = SceneManager(None, None, background)
+        manager.run(menu)
+        self.assertEqual(self.calls, [{"background": background}])
+        self.assertIn("resume menu", log)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,23 +12,32 @@ import unittest
 import os
 import sys
 import json
+import threading
+import time
 
 # Add parent directory to path so we can import game modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import mechanics.scores as scores_module
+import mechanics.session_journal as journal_module
 from mechanics.scores import (
+    ScoreStore,
     get_default_scores,
     load_scores,
     save_scores,
     update_high_score,
     get_high_score,
     get_all_high_scores,
-    reset_scores
+    reset_scores,
+    flush_scores,
+    get_top_scores,
+    use_backend
 )
 
 # Use a test file instead of the real one
 TEST_SCORES_FILE = "highscores_test.json"
+TEST_JOURNAL_FILE = journal_module.journal_path(TEST_SCORES_FILE)
+TEST_DB_FILE = "highscores_test.db"
 
 
 def setUpModule():
@@ -38,14 +47,20 @@ def setUpModule():
 
 def tearDownModule():
     """Clean up test file after all tests complete."""
-    if os.path.exists(TEST_SCORES_FILE):
-        os.remove(TEST_SCORES_FILE)
+    flush_scores()
+    for path in (TEST_SCORES_FILE, TEST_JOURNAL_FILE):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 def reset_test_file():
-    """Create a fresh test file with default scores."""
+    """Create a fresh test file with default scores and no journal."""
+    # Let queued writes land first so they can't overwrite the fresh file
+    flush_scores()
     with open(TEST_SCORES_FILE, 'w') as f:
         json.dump(get_default_scores(), f)
+    if os.path.exists(TEST_JOURNAL_FILE):
+        os.remove(TEST_JOURNAL_FILE)
 
 
 class TestGetDefaultScores(unittest.TestCase):
@@ -72,8 +87,10 @@ class TestSaveAndLoadScores(unittest.TestCase):
 
     def setUp(self):
         """Delete test file before each test."""
-        if os.path.exists(TEST_SCORES_FILE):
-            os.remove(TEST_SCORES_FILE)
+        flush_scores()
+        for path in (TEST_SCORES_FILE, TEST_JOURNAL_FILE):
+            if os.path.exists(path):
+                os.remove(path)
 
     def test_load_returns_defaults_when_no_file(self):
         """Should return defaults when file doesn't exist."""
@@ -171,5 +188,321 @@ class TestResetScores(unittest.TestCase):
         self.assertEqual(scores["endless"]["best_time"], 0)
 
 
+class TestScoreStore(unittest.TestCase):
+    """Tests for the in-memory ScoreStore cache."""
+
+    def setUp(self):
+        """Start each test from a fresh file and store."""
+        reset_test_file()
+        self.store = ScoreStore(TEST_SCORES_FILE)
+
+    def test_serves_cached_scores_when_file_unchanged(self):
+        """Repeated reads should reuse the parsed scores."""
+        first = self.store.load()
+        second = self.store.load()
+        self.assertIs(first, second)
+
+    def test_reloads_when_file_changes(self):
+        """An external write should be picked up on the next read."""
+        self.store.load()
+
+        scores = get_default_scores()
+        scores["time_attack"]["high_score"] = 1234
+        with open(TEST_SCORES_FILE, 'w') as f:
+            json.dump(scores, f, indent=4)
+
+        self.assertEqual(self.store.load()["time_attack"]["high_score"], 1234)
+
+    def test_save_updates_cache(self):
+        """Saved scores should be served without re-reading the file."""
+        scores = get_default_scores()
+        scores["endless"]["high_score"] = 42
+        self.assertTrue(self.store.save(scores))
+
+        self.assertEqual(self.store.load()["endless"]["high_score"], 42)
+        self.store.flush()
+        self.assertEqual(self.store.load()["endless"]["high_score"], 42)
+
+    def test_load_scores_returns_private_copy(self):
+        """Modifying the result of load_scores() must not touch the cache."""
+        scores = load_scores()
+        scores["classic"]["high_score"] = 99999
+        self.assertEqual(get_high_score("classic"), 0)
+
+
+class TestBackgroundWrites(unittest.TestCase):
+    """Tests for the asynchronous, atomic score writer."""
+
+    def setUp(self):
+        """Reset test file before each test."""
+        reset_test_file()
+
+    def test_update_is_visible_before_flush(self):
+        """Reads should see a new score without waiting for the disk."""
+        update_high_score("time_attack", 321, fish_count=4)
+        self.assertEqual(get_high_score("time_attack"), 321)
+        flush_scores()
+
+    def test_flush_writes_file(self):
+        """After flushing, the file on disk should hold the new scores."""
+        save_scores({**get_default_scores(),
+                     "classic": {"high_score": 654,
+                                 "best_fish_count": 7,
+                                 "date": None}})
+        self.assertTrue(flush_scores(timeout=5))
+
+        with open(TEST_SCORES_FILE) as f:
+            on_disk = json.load(f)
+        self.assertEqual(on_disk["classic"]["high_score"], 654)
+        self.assertEqual(on_disk["classic"]["best_fish_count"], 7)
+
+    def test_burst_of_saves_keeps_newest(self):
+        """Coalesced saves should leave the newest scores on disk."""
+        for score in range(10, 110, 10):
+            scores = get_default_scores()
+            scores["endless"]["high_score"] = score
+            save_scores(scores)
+        flush_scores()
+
+        with open(TEST_SCORES_FILE) as f:
+            on_disk = json.load(f)
+        self.assertEqual(on_disk["endless"]["high_score"], 100)
+
+    def test_no_temporary_files_left(self):
+        """Atomic writes should clean up their temporary files."""
+        update_high_score("classic", 50)
+        flush_scores()
+
+        directory = os.path.dirname(os.path.abspath(TEST_SCORES_FILE))
+        leftovers = [name for name in os.listdir(directory)
+                     if name.startswith(".scores-")]
+        self.assertEqual(leftovers, [])
+
+    def test_invalidate_does_not_wait(self):
+        """Invalidating with a write queued should keep the new score."""
+        gate = threading.Event()
+        scores_module._writer.submit(lambda: gate.wait(5))
+        try:
+            update_high_score("classic", 75)
+            start = time.perf_counter()
+            scores_module.get_score_store().invalidate()
+            self.assertLess(time.perf_counter() - start, 1)
+            self.assertEqual(get_high_score("classic"), 75)
+        finally:
+            gate.set()
+        flush_scores()
+        self.assertEqual(get_high_score("classic"), 75)
+
+
+class TestSessionJournal(unittest.TestCase):
+    """Tests for the append-only session journal."""
+
+    def setUp(self):
+        """Reset test file and journal before each test."""
+        reset_test_file()
+
+    def read_journal(self):
+        """Return the records currently in the test journal."""
+        records, _ = journal_module.SessionJournal(
+            TEST_JOURNAL_FILE).read_from(0)
+        return records
+
+    def test_update_appends_session_record(self):
+        """Each finished session should become one journal line."""
+        update_high_score("endless", 120, fish_count=3, time_played=45.5)
+        flush_scores()
+
+        records = self.read_journal()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["mode"], "endless")
+        self.assertEqual(records[0]["score"], 120)
+        self.assertEqual(records[0]["fish_count"], 3)
+        self.assertEqual(records[0]["time_played"], 45.5)
+        self.assertIn("timestamp", records[0])
+
+    def test_update_does_not_rewrite_summary(self):
+        """Recording a session should leave the summary file alone."""
+        with open(TEST_SCORES_FILE) as f:
+            before = f.read()
+        update_high_score("classic", 500)
+        flush_scores()
+        with open(TEST_SCORES_FILE) as f:
+            self.assertEqual(f.read(), before)
+
+    def test_separate_instances_do_not_lose_updates(self):
+        """Sessions recorded by two stores should both survive."""
+        first = ScoreStore(TEST_SCORES_FILE)
+        second = ScoreStore(TEST_SCORES_FILE)
+        first.load()
+        second.load()
+
+        first.record_session("classic", 300, fish_count=9)
+        second.record_session("classic", 200, fish_count=12)
+        flush_scores()
+
+        merged = ScoreStore(TEST_SCORES_FILE).load()
+        self.assertEqual(merged["classic"]["high_score"], 300)
+        self.assertEqual(merged["classic"]["best_fish_count"], 12)
+
+        # Each store also picks up the other's session on its next read
+        self.assertEqual(first.load()["classic"]["best_fish_count"], 12)
+        self.assertEqual(second.load()["classic"]["high_score"], 300)
+
+    def test_compaction_folds_journal_into_summary(self):
+        """Compacting should empty the journal and keep the results."""
+        update_high_score("time_attack", 700, fish_count=6)
+        update_high_score("time_attack", 400, fish_count=8)
+        store = ScoreStore(TEST_SCORES_FILE)
+        store.compact()
+
+        self.assertEqual(self.read_journal(), [])
+        with open(TEST_SCORES_FILE) as f:
+            on_disk = json.load(f)
+        self.assertEqual(on_disk["time_attack"]["high_score"], 700)
+        self.assertEqual(on_disk["time_attack"]["best_fish_count"], 8)
+        self.assertEqual(get_high_score("time_attack"), 700)
+
+    def test_journal_stays_bounded(self):
+        """The journal should be compacted once it passes the threshold."""
+        original = scores_module.COMPACT_THRESHOLD
+        scores_module.COMPACT_THRESHOLD = 1024
+        try:
+            for score in range(100):
+                update_high_score("classic", score)
+            flush_scores()
+        finally:
+            scores_module.COMPACT_THRESHOLD = original
+
+        self.assertLess(os.path.getsize(TEST_JOURNAL_FILE), 1024)
+        self.assertEqual(ScoreStore(TEST_SCORES_FILE).load()
+                         ["classic"]["high_score"], 99)
+
+    def test_reset_clears_journal(self):
+        """Resetting scores should also forget journaled sessions."""
+        update_high_score("classic", 999)
+        reset_scores()
+        flush_scores()
+
+        self.assertEqual(self.read_journal(), [])
+        self.assertEqual(ScoreStore(TEST_SCORES_FILE).load()
+                         ["classic"]["high_score"], 0)
+
+
+class TestSqliteBackend(unittest.TestCase):
+    """Tests for the SQLite leaderboard backend."""
+
+    def setUp(self):
+        """Switch the module functions to a fresh test database."""
+        self.remove_db()
+        self.store = use_backend("sqlite", TEST_DB_FILE)
+
+    def tearDown(self):
+        """Switch back to the JSON backend and delete the database."""
+        use_backend("json")
+        self.remove_db()
+
+    def remove_db(self):
+        """Delete the test database and its WAL files."""
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(TEST_DB_FILE + suffix):
+                os.remove(TEST_DB_FILE + suffix)
+
+    def test_high_score_api_works(self):
+        """update/get_high_score should behave like the JSON backend."""
+        result = update_high_score("classic", 300, fish_count=4)
+        self.assertTrue(result["is_new_high"])
+        result = update_high_score("classic", 200, fish_count=7)
+        self.assertFalse(result["is_new_high"])
+        self.assertEqual(result["old_score"], 300)
+
+        flush_scores()
+        self.store.invalidate()
+        self.assertEqual(get_high_score("classic"), 300)
+        self.assertEqual(
+            get_all_high_scores()["classic"]["best_fish_count"], 7)
+
+    def test_every_session_is_kept(self):
+        """Top scores should list every session, best first."""
+        for score in (50, 400, 120, 400, 90):
+            update_high_score("time_attack", score)
+
+        top = get_top_scores("time_attack", limit=3)
+        self.assertEqual([row["score"] for row in top], [400, 400, 120])
+        page = get_top_scores("time_attack", limit=3, offset=3)
+        self.assertEqual([row["score"] for row in page], [90, 50])
+
+    def test_top_scores_use_index(self):
+        """The top-N query should be answered from an index."""
+        plan = self.store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT player, score FROM sessions "
+            "WHERE mode = ? ORDER BY score DESC LIMIT 10",
+            ("classic",)).fetchall()
+        detail = " ".join(row[-1] for row in plan)
+        self.assertIn("idx_sessions_mode_score", detail)
+        self.assertNotIn("TEMP B-TREE", detail)
+
+    def test_player_profile(self):
+        """Per-player bests should only include that player's sessions."""
+        update_high_score("classic", 500, fish_count=5, player="Ann")
+        update_high_score("classic", 800, fish_count=9, player="Bo")
+        update_high_score("endless", 60, fish_count=3, time_played=90,
+                          player="Ann")
+
+        profile = self.store.player_bests("Ann")
+        self.assertEqual(profile["sessions"], 2)
+        self.assertEqual(profile["total_fish"], 8)
+        self.assertEqual(profile["bests"]["classic"]["score"], 500)
+        self.assertEqual(profile["bests"]["endless"]["time_played"], 90)
+        self.assertNotIn("time_attack", profile["bests"])
+
+    def test_daily_bests(self):
+        """Daily bests should hold one entry per day played."""
+        update_high_score("classic", 10)
+        update_high_score("classic", 70)
+
+        days = self.store.daily_bests("classic")
+        self.assertEqual(len(days), 1)
+        self.assertEqual(days[0]["score"], 70)
+
+    def test_reads_do_not_wait_for_writer(self):
+        """Queued sessions should be merged in without waiting."""
+        update_high_score("classic", 300, fish_count=2, player="Ann")
+        flush_scores()
+        gate = threading.Event()
+        scores_module._writer.submit(lambda: gate.wait(5))
+        try:
+            update_high_score("classic", 500, fish_count=4, player="Ann")
+            update_high_score("classic", 100, fish_count=1, player="Bo")
+            start = time.perf_counter()
+            top = get_top_scores("classic")
+            profile = self.store.player_bests("Ann")
+            days = self.store.daily_bests("classic")
+            self.assertLess(time.perf_counter() - start, 1)
+        finally:
+            gate.set()
+
+        self.assertEqual([row["score"] for row in top], [500, 300, 100])
+        self.assertEqual(profile["sessions"], 2)
+        self.assertEqual(profile["total_fish"], 6)
+        self.assertEqual(profile["bests"]["classic"]["score"], 500)
+        self.assertEqual(days[0]["score"], 500)
+
+        # Once written, the sessions should be counted only once
+        flush_scores()
+        self.assertEqual([row["score"] for row in get_top_scores("classic")],
+                         [500, 300, 100])
+        self.assertEqual(self.store.player_bests("Ann")["sessions"], 2)
+
+    def test_reset_clears_leaderboard(self):
+        """Resetting scores should empty the leaderboard."""
+        update_high_score("endless", 250)
+        reset_scores()
+
+        self.assertEqual(get_top_scores("endless"), [])
+        flush_scores()
+        self.store.invalidate()
+        self.assertEqual(get_high_score("endless"), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,118 @@
+"""
+Unit tests for the spectral scream detector.
+"""
+
+import unittest
+import time
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mechanics.scream_detector import ScreamDetector, scream_confidence
+
+RATE = 44100
+BLOCK_SIZE = 735
+NUM_BLOCKS = 8
+
+
+def make_blocks(signal):
+    """Convert a float signal into int16 blocks of BLOCK_SIZE samples."""
+    clipped = np.clip(signal, -32768, 32767).astype(np.int16)
+    return clipped.reshape(NUM_BLOCKS, BLOCK_SIZE)
+
+
+def sample_times():
+    """Sample times covering NUM_BLOCKS blocks."""
+    return np.arange(BLOCK_SIZE * NUM_BLOCKS) / RATE
+
+
+def scream_signal():
+    """Loud harmonic signal in the voice band."""
+    t = sample_times()
+    return sum(np.sin(2 * np.pi * 600 * k * t) / k
+               for k in range(1, 6)) * 7000
+
+
+class TestScreamConfidence(unittest.TestCase):
+    """Tests for scream_confidence()."""
+
+    def test_loud_harmonic_voice_is_scream(self):
+        """A loud harmonic signal in the voice band scores high."""
+        confidence = scream_confidence(make_blocks(scream_signal()), RATE)
+        self.assertTrue(np.all(confidence > 0.9))
+
+    def test_broadband_noise_is_not_scream(self):
+        """Loud white noise (a cough or hiss) scores zero."""
+        rng = np.random.default_rng(0)
+        noise = rng.normal(0, 6000, BLOCK_SIZE * NUM_BLOCKS)
+        confidence = scream_confidence(make_blocks(noise), RATE)
+        self.assertTrue(np.all(confidence < 0.1))
+
+    def test_low_thump_is_not_scream(self):
+        """A loud low-frequency thump (a slammed door) scores zero."""
+        t = sample_times()
+        thump = np.sin(2 * np.pi * 60 * t) * 15000
+        confidence = scream_confidence(make_blocks(thump), RATE)
+        self.assertTrue(np.all(confidence < 0.1))
+
+    def test_quiet_voice_is_not_scream(self):
+        """Harmonic but quiet audio is not loud enough."""
+        quiet = scream_signal() / 20
+        confidence = scream_confidence(make_blocks(quiet), RATE)
+        self.assertTrue(np.all(confidence < 0.1))
+
+    def test_single_block_is_accepted(self):
+        """A 1D block returns a single confidence value."""
+        block = make_blocks(scream_signal())[0]
+        self.assertEqual(scream_confidence(block, RATE).shape, (1,))
+
+
+class TestScreamDetector(unittest.TestCase):
+    """Tests for the ScreamDetector worker process."""
+
+    def setUp(self):
+        self.detector = ScreamDetector(RATE, BLOCK_SIZE)
+
+    def tearDown(self):
+        self.detector.close()
+
+    def wait_for_result(self, timeout=5.0):
+        """Wait until the worker publishes a result."""
+        start = time.time()
+        while self.detector.result_sequence == 0:
+            if time.time() - start > timeout:
+                self.fail("Worker did not publish a result")
+            time.sleep(0.01)
+
+    def test_starts_silent(self):
+        """No scream is reported before any audio is pushed."""
+        self.assertEqual(self.detector.poll(), (False, 0.0))
+
+    def test_detects_pushed_scream(self):
+        """Blocks pushed through the ring buffer are classified."""
+        for block in make_blocks(scream_signal()):
+            self.detector.push(block.tobytes())
+        self.wait_for_result()
+
+        is_screaming, confidence = self.detector.poll()
+        self.assertTrue(is_screaming)
+        self.assertGreater(confidence, 0.5)
+
+    def test_push_ignores_empty_data(self):
+        """Pushing None or empty bytes is a no-op."""
+        self.detector.push(None)
+        self.detector.push(b"")
+        self.assertEqual(self.detector.result_sequence, 0)
+
+    def test_close_is_idempotent(self):
+        """Closing twice does not raise and disables reads."""
+        self.detector.close()
+        self.detector.close()
+        self.assertFalse(self.detector.is_screaming)
+
+
+if __name__ == "__main__":
+    unittest.main()
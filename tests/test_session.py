@@ -0,0 +1,104 @@
+"""
+Unit tests for the shared game session.
+"""
+
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+pygame.init()
+pygame.display.set_mode((800, 600), pygame.HIDDEN)
+
+from bench.scene import ScriptedDriver
+from modes import session
+from modes.session import GameSession, TextCache
+from modes.mode_classic import ClassicRules
+from modes.mode_endless import EndlessRules
+from modes.mode_time_attack import TimeAttackRules
+
+
+class TestTextCache(unittest.TestCase):
+    """Tests for TextCache."""
+
+    def test_same_text_is_rendered_once(self):
+        """Rendering the same text twice should reuse the surface."""
+        cache = TextCache()
+        first = cache.render(session.font, "Score: 10", (255, 255, 255))
+        second = cache.render(session.font, "Score: 10", (255, 255, 255))
+        self.assertIs(first, second)
+
+    def test_oldest_entry_evicted(self):
+        """The cache should stay within max_entries."""
+        cache = TextCache(max_entries=2)
+        first = cache.render(session.font, "a", (255, 255, 255))
+        cache.render(session.font, "b", (255, 255, 255))
+        cache.render(session.font, "c", (255, 255, 255))
+        self.assertIsNot(
+            cache.render(session.font, "a", (255, 255, 255)), first)
+
+
+class TestWaterBackground(unittest.TestCase):
+    """Tests for the cached water background."""
+
+    def test_matches_every_frame(self):
+        """Drawing twice should give the same pixels."""
+        first = pygame.Surface((800, 600))
+        second = pygame.Surface((800, 600))
+        session.draw_water_background(first)
+        session.draw_water_background(second)
+        self.assertEqual(pygame.image.tobytes(first, "RGB"),
+                         pygame.image.tobytes(second, "RGB"))
+
+    def test_sky_and_water(self):
+        """The top should be sky and the bottom water."""
+        surface = pygame.Surface((800, 600))
+        session.draw_water_background(surface)
+        self.assertNotEqual(surface.get_at((400, 10)),
+                            surface.get_at((400, 590)))
+
+
+class TestGameSession(unittest.TestCase):
+    """Runs each mode's rules through the session with scripted input."""
+
+    def run_rules(self, rules, frames=120):
+        """Run a session for some frames and return it."""
+        game = GameSession(rules, ScriptedDriver(frames=frames, warmup=0))
+        score = game.run()
+        self.assertEqual(score, game.score)
+        return game
+
+    def test_classic(self):
+        """Classic should open the recorder once for the session."""
+        game = self.run_rules(ClassicRules(4, catch_logging=False))
+        self.assertIsNotNone(game.rules.recorder)
+
+    def test_time_attack(self):
+        """Time attack should play without ending early."""
+        game = self.run_rules(TimeAttackRules(4, catch_logging=False))
+        self.assertFalse(game.game_over)
+
+    def test_endless(self):
+        """Endless should play and track the time played."""
+        game = self.run_rules(EndlessRules(4, catch_logging=False))
+        self.assertGreaterEqual(game.rules.elapsed, 0)
+
+    def test_restart_resets_score(self):
+        """Restarting should clear the score and respawn the fish."""
+        game = self.run_rules(TimeAttackRules(3, catch_logging=False), 5)
+        game.score = 50
+        game.game_over = True
+        game.handle_key(pygame.K_RETURN)
+        self.assertEqual(game.score, 0)
+        self.assertFalse(game.game_over)
+        self.assertEqual(game.fade_alpha, 255)
+        self.assertEqual(len(game.fish_manager.all_fish), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Unit tests for the soak test's sampling and trend checks.
+"""
+
+import unittest
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from bench.soak import SoakDriver, check, growth
+
+
+class TestGrowth(unittest.TestCase):
+    """Tests for growth()."""
+
+    def test_linear_growth(self):
+        """A line from 100 to 150 should be 50% growth."""
+        self.assertAlmostEqual(growth([0, 1, 2], [100, 125, 150]), 0.5)
+
+    def test_flat_with_noise(self):
+        """Noise around a flat line should be close to no growth."""
+        value = growth([0, 1, 2, 3, 4], [100, 102, 98, 101, 99])
+        self.assertLess(abs(value), 0.02)
+
+    def test_too_few_samples(self):
+        """Fewer than three samples should never fail a run."""
+        self.assertEqual(growth([0, 1], [1, 100]), 0.0)
+
+
+class TestSoakDriver(unittest.TestCase):
+    """Tests for SoakDriver sampling."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    def test_samples_at_interval(self):
+        """A sample should be taken every sample_frames frames."""
+        driver = SoakDriver(frames=40, sample_frames=10,
+                            use_tracemalloc=False, verbose=False)
+        while not any(e.type == pygame.QUIT for e in driver.get_events()):
+            driver.tick()
+        self.assertEqual([s["frame"] for s in driver.samples],
+                         [10, 20, 30, 40])
+        self.assertGreater(driver.samples[0]["objects"], 0)
+        self.assertIsNotNone(driver.samples[-1]["p95_ms"])
+
+    def test_driver_alone_does_not_leak(self):
+        """A session that allocates nothing should pass the memory check."""
+        tracemalloc.start()
+        try:
+            ballast = bytearray(2**20)  # Steady memory outside bench/
+            driver = SoakDriver(frames=3000, sample_frames=300,
+                                verbose=False)
+            while not any(e.type == pygame.QUIT
+                          for e in driver.get_events()):
+                driver.tick()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(len(ballast), 2**20)
+        self.assertLess(len(driver.frame_times), 300)
+        results = check(driver)
+        self.assertTrue(results["traced_mb"][2], results["traced_mb"])
+        self.assertTrue(results["objects"][2], results["objects"])
+
+
+class TestCheck(unittest.TestCase):
+    """Tests for check()."""
+
+    def driver_with(self, rss):
+        """Build a driver holding samples with the given RSS values."""
+        driver = SoakDriver(frames=1, sample_frames=1, verbose=False)
+        driver.samples = [{"minute": i, "rss_mb": value, "objects": 1000,
+                           "p95_ms": 10.0} for i, value in enumerate(rss)]
+        return driver
+
+    def test_passes_flat_memory(self):
+        """Flat memory should pass."""
+        results = check(self.driver_with([100] * 6))
+        self.assertTrue(all(passed for _, _, passed in results.values()))
+
+    def test_fails_growing_memory(self):
+        """Memory growing past the tolerance should fail."""
+        results = check(self.driver_with([100, 100, 110, 120, 130, 140]))
+        self.assertFalse(results["rss_mb"][2])
+        self.assertTrue(results["p95_ms"][2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Unit tests for startup and mode switch timing.
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mechanics import startup
+from mechanics.startup import StartupTimer
+
+
+class TestStartupTimer(unittest.TestCase):
+    """Tests for StartupTimer sections."""
+
+    def setUp(self):
+        self.timer = StartupTimer()
+
+    def test_startup_section_open(self):
+        """A new timer should have the startup section open."""
+        with self.timer.phase("load", "assets"):
+            pass
+        report = self.timer.report()
+        self.assertEqual(report["startup"]["name"], "startup")
+        self.assertEqual(report["startup"]["phases"][0]["name"], "load")
+        self.assertEqual(report["startup"]["phases"][0]["group"], "assets")
+
+    def test_first_frame_closes_section(self):
+        """Phases after the first frame should be ignored."""
+        section = self.timer.first_frame()
+        self.assertIsNotNone(section["total_ms"])
+        self.assertIsNone(self.timer.first_frame())
+        with self.timer.phase("late"):
+            pass
+        self.assertEqual(self.timer.report()["startup"]["phases"], [])
+
+    def test_mode_switch_sections(self):
+        """Each mode switch should be its own section."""
+        self.timer.first_frame()
+        self.timer.begin_mode_switch("classic")
+        with self.timer.phase("load_sounds", "assets"):
+            pass
+        self.timer.mark("transition done")
+        self.timer.first_frame()
+
+        switches = self.timer.report()["mode_switches"]
+        self.assertEqual(len(switches), 1)
+        self.assertEqual(switches[0]["name"], "classic")
+        self.assertEqual(switches[0]["phases"][0]["name"], "load_sounds")
+        self.assertIn("transition done", switches[0]["marks"])
+        self.assertGreaterEqual(switches[0]["total_ms"],
+                                switches[0]["marks"]["transition done"])
+
+    def test_phases_sorted_by_start(self):
+        """Nested phases should be reported in start order."""
+        with self.timer.phase("outer"):
+            with self.timer.phase("inner"):
+                pass
+        names = [p["name"] for p in self.timer.report()["startup"]["phases"]]
+        self.assertEqual(names, ["outer", "inner"])
+
+    def test_write(self):
+        """The report should be written as JSON only when enabled."""
+        self.assertFalse(self.timer.write())
+        with tempfile.TemporaryDirectory() as directory:
+            self.timer.path = os.path.join(directory, "startup.json")
+            self.assertTrue(self.timer.write())
+            with open(self.timer.path) as f:
+                self.assertIn("startup", json.load(f))
+
+
+class TestImportTiming(unittest.TestCase):
+    """Tests for timing the first import of watched modules."""
+
+    def test_import_is_timed(self):
+        """A watched module's import should be recorded as a phase."""
+        directory = tempfile.mkdtemp()
+        with open(os.path.join(directory, "startup_probe.py"), "w") as f:
+            f.write("VALUE = 42\n")
+
+        timer = StartupTimer()
+        saved = startup._timer, startup.TIMED_IMPORTS
+        startup._timer = timer
+        startup.TIMED_IMPORTS = frozenset({"startup_probe"})
+        sys.path.insert(0, directory)
+        startup.start_import_timing()
+        try:
+            import startup_probe
+        finally:
+            startup.stop_import_timing()
+            sys.path.remove(directory)
+            startup._timer, startup.TIMED_IMPORTS = saved
+            sys.modules.pop("startup_probe", None)
+
+        self.assertEqual(startup_probe.VALUE, 42)
+        phases = timer.report()["startup"]["phases"]
+        self.assertEqual([p["name"] for p in phases], ["import startup_probe"])
+        self.assertEqual(phases[0]["group"], "import")
+
+    def test_off_unless_profiling(self):
+        """Without the report switches no finder should be installed."""
+        self.assertFalse(any(isinstance(finder, startup._ImportTimer)
+                             for finder in sys.meta_path))
+
+    def test_stopped_at_first_menu_frame(self):
+        """The finder should leave sys.meta_path at the first frame."""
+        saved = startup._timer
+        startup._timer = StartupTimer()
+        startup.start_import_timing()
+        try:
+            finder = startup._import_timer
+            self.assertIn(finder, sys.meta_path)
+            startup.first_frame()
+            self.assertNotIn(finder, sys.meta_path)
+            self.assertIsNone(startup._import_timer)
+        finally:
+            startup.stop_import_timing()
+            startup._timer = saved
+
+
+if __name__ == "__main__":
+    unittest.main()
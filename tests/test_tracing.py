@@ -0,0 +1,122 @@
+"""
+Unit tests for the trace exporter.
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mechanics.tracing as tracing
+from mechanics.tracing import Tracer
+
+
+class TestTracer(unittest.TestCase):
+    """Tests for Tracer."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        self.tracer = Tracer()
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def read_events(self):
+        """Flush and return the non-metadata events."""
+        self.assertTrue(self.tracer.flush())
+        with open(self.path) as f:
+            trace = json.load(f)
+        return [e for e in trace["traceEvents"] if e["ph"] != "M"]
+
+    def test_disabled_tracer_records_nothing(self):
+        """Spans and instants should be ignored until started."""
+        with self.tracer.span("load"):
+            pass
+        self.tracer.instant("spawn")
+        self.assertFalse(self.tracer.flush())
+        self.assertEqual(self.tracer._events, [])
+
+    def test_span_records_complete_event(self):
+        """A span should become an "X" event with its duration."""
+        self.tracer.start(self.path)
+        with self.tracer.span("load_sounds", "assets", {"n": 2}):
+            time.sleep(0.002)
+
+        events = self.read_events()
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["ph"], "X")
+        self.assertEqual(events[0]["name"], "load_sounds")
+        self.assertEqual(events[0]["cat"], "assets")
+        self.assertEqual(events[0]["args"], {"n": 2})
+        self.assertGreaterEqual(events[0]["dur"], 2000)
+
+    def test_instant_events_in_order(self):
+        """Instant events should keep their order and timestamps."""
+        self.tracer.start(self.path)
+        self.tracer.instant("spawn", "fish")
+        self.tracer.instant("catch", "catch", {"type": "Shark"})
+
+        events = self.read_events()
+        self.assertEqual([e["name"] for e in events], ["spawn", "catch"])
+        self.assertEqual(events[0]["ph"], "i")
+        self.assertLessEqual(events[0]["ts"], events[1]["ts"])
+
+    def test_threads_get_their_own_track(self):
+        """Events from another thread should carry that thread's id."""
+        self.tracer.start(self.path)
+        self.tracer.instant("main")
+        worker = threading.Thread(
+            target=self.tracer.instant, args=("worker",), name="Writer")
+        worker.start()
+        worker.join()
+
+        events = self.read_events()
+        self.assertNotEqual(events[0]["tid"], events[1]["tid"])
+        with open(self.path) as f:
+            names = [e["args"]["name"] for e in json.load(f)["traceEvents"]
+                     if e["name"] == "thread_name"]
+        self.assertIn("Writer", names)
+
+    def test_flush_appends_new_events(self):
+        """Each flush should add only the events since the last one."""
+        self.tracer.start(self.path)
+        self.tracer.instant("first")
+        self.assertEqual([e["name"] for e in self.read_events()], ["first"])
+        self.assertEqual(self.tracer._events, [])
+        size = os.path.getsize(self.path)
+
+        self.assertTrue(self.tracer.flush())
+        self.assertEqual(os.path.getsize(self.path), size)
+
+        self.tracer.instant("second")
+        self.assertEqual([e["name"] for e in self.read_events()],
+                         ["first", "second"])
+
+    def test_traced_decorator(self):
+        """traced() should record one span per call when tracing is on."""
+        original = tracing._tracer
+        tracing._tracer = self.tracer
+        try:
+            @tracing.traced("work", "test")
+            def work(value):
+                return value * 2
+
+            self.assertEqual(work(2), 4)
+            self.assertEqual(self.tracer._events, [])
+
+            self.tracer.start(self.path)
+            self.assertEqual(work(3), 6)
+        finally:
+            tracing._tracer = original
+
+        self.assertEqual([e["name"] for e in self.read_events()], ["work"])
+
+
+if __name__ == "__main__":
+    unittest.main()
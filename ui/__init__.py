@@ -6,6 +6,9 @@ This package contains user interface components.
 Classes:
     Button: Interactive menu button with hover effects.
     MenuScreen: Main menu screen with navigation and transitions.
+    SceneManager: Scene stack sharing the display between menu and modes.
+    MenuScene: The main menu as a scene.
+    ModeScene: A game mode as a scene.
 
 Usage:
     from ui import Button, MenuScreen
@@ -19,8 +22,13 @@ Usage:
 
 from ui.button import Button
 from ui.menu_screen import MenuScreen
+from ui.scenes import MenuScene, ModeScene, Scene, SceneManager
 
 __all__ = [
     'Button',
     'MenuScreen',
+    'MenuScene',
+    'ModeScene',
+    'Scene',
+    'SceneManager',
 ]
\ No newline at end of file
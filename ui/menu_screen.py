@@ -17,7 +17,8 @@ from mechanics.constants import (
     WATER_SURFACE
 )
 from background import BackgroundManager
-from mechanics.scores import get_all_high_scores
+from mechanics.assets import load_image
+from mechanics.scores import get_all_high_scores, get_top_scores
 from ui.button import Button
 
 
@@ -30,26 +31,29 @@ class MenuScreen:
         buttons (list): List of menu Button objects.
         selected_index (int): Currently selected button index.
         showing_high_scores (bool): Whether high scores overlay is shown.
+        high_score_page (int): Index of the mode shown in the overlay.
         transitioning (bool): Whether exit transition is playing.
     """
 
-    def __init__(self):
-        # Initialize menu screen
-        self.background = BackgroundManager(use_terrain_files=True)
+    def __init__(self, background=None):
+        """
+        Initialize the menu screen.
+
+        Args:
+            background (BackgroundManager): Background shared with the
+                game modes, defaults to a new one.
+        """
+        if background is None:
+            background = BackgroundManager(use_terrain_files=True)
+        self.background = background
 
         # Load Sounds
         pygame.mixer.music.load("sounds/ambience_menu.mp3")
         pygame.mixer.music.set_volume(0.3)
-        pygame.mixer.music.play(-1)
 
         # Load or create boat image
         self._load_boat_image()
 
-        # Position settings
-        self.boat_x = SCREEN_WIDTH // 2 - 155
-        self.boat_y = WATER_SURFACE - 130
-        self.title_y = 80
-
         # Fonts
         self.title_font = pygame.font.Font(None, 80)
         self.subtitle_font = pygame.font.Font(None, 32)
@@ -58,27 +62,46 @@ class MenuScreen:
         # Create menu buttons
         self._create_buttons()
 
+        # Positions, navigation and screen states, and start the music
+        self.reset()
+
+    def reset(self):
+        """
+        Bring the menu back to its initial state, e.g. when returning
+        from a game mode: positions, selection, overlays, the transition
+        and the music. Nothing is reloaded.
+        """
+        # Position settings
+        self.boat_x = SCREEN_WIDTH // 2 - 155
+        self.boat_y = WATER_SURFACE - 130
+        self.title_y = 80
+        for btn in self.buttons:
+            btn.x = btn.base_x
+            btn.y = btn.base_y
+            btn.hovered = False
+            btn.selected = False
+
         # Navigation state
         self.selected_index = 0
         self.buttons[self.selected_index].selected = True
 
         # Screen states
         self.showing_high_scores = False
+        self.high_score_page = 0
+        self._high_score_rows = None  # Scores may have changed
         self.transitioning = False
         self.transition_speed = 0
         self.transition_target = None
         self.transition_done = False
         self.fade_alpha = 0
 
+        pygame.mixer.music.play(-1)
+
     def _load_boat_image(self):
         # Load boat image or create placeholder
         try:
-            self.boat_image = pygame.image.load(
-                "graphics/boat.png"
-            ).convert_alpha()
-            self.boat_image = pygame.transform.scale(
-                self.boat_image, (310, 260)
-            )
+            self.boat_image = load_image("graphics/boat.png", "ui",
+                                         (310, 260))
         except pygame.error:
             # Create placeholder boat shape
             self.boat_image = pygame.Surface((310, 260), pygame.SRCALPHA)
@@ -213,14 +236,53 @@ class MenuScreen:
 
         return None
 
+    # Modes shown by the high scores overlay, one page each
+    HIGH_SCORE_PAGES = [
+        ("Classic Mode", "classic"),
+        ("Time Attack", "time_attack"),
+        ("Endless Mode", "endless")
+    ]
+    HIGH_SCORE_ROWS = 10  # Entries per page
+
+    def show_high_scores(self):
+        """Open the high scores overlay on the first page."""
+        self.showing_high_scores = True
+        self.high_score_page = 0
+        self._high_score_rows = None
+
+    def change_high_score_page(self, direction):
+        """
+        Switch the high scores overlay to the previous or next mode.
+
+        Args:
+            direction (int): -1 for previous, 1 for next.
+        """
+        self.high_score_page = (
+            (self.high_score_page + direction) % len(self.HIGH_SCORE_PAGES)
+        )
+        self._high_score_rows = None
+
+    def _get_high_score_rows(self):
+        # Query the leaderboard once per page instead of every frame
+        if self._high_score_rows is None:
+            mode_key = self.HIGH_SCORE_PAGES[self.high_score_page][1]
+            self._high_score_rows = (
+                get_top_scores(mode_key, self.HIGH_SCORE_ROWS),
+                get_all_high_scores()[mode_key]
+            )
+        return self._high_score_rows
+
     def draw_high_scores(self, surface):
         """
         Draw the high scores overlay screen.
 
+        Shows the top entries of one mode per page; LEFT/RIGHT switches
+        between modes.
+
         Args:
             surface (pygame.Surface): Surface to draw on.
         """
-        scores = get_all_high_scores()
+        rows, summary = self._get_high_score_rows()
 
         # Semi-transparent overlay
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -233,59 +295,71 @@ class MenuScreen:
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title, title_rect)
 
-        # Score entries
-        y_pos = 160
         mode_font = pygame.font.Font(None, 40)
         score_font = pygame.font.Font(None, 32)
         date_font = pygame.font.Font(None, 24)
 
-        modes = [
-            ("Classic Mode", "classic"),
-            ("Time Attack", "time_attack"),
-            ("Endless Mode", "endless")
-        ]
-
-        for mode_name, mode_key in modes:
-            # Mode name
-            mode_text = mode_font.render(mode_name, True, WHITE)
-            mode_rect = mode_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-            surface.blit(mode_text, mode_rect)
-
-            # Score details
-            high_score = scores[mode_key]["high_score"]
-            fish_count = scores[mode_key].get("best_fish_count", 0)
-            date = scores[mode_key].get("date", "---")
+        # Mode name with page arrows
+        mode_name, mode_key = self.HIGH_SCORE_PAGES[self.high_score_page]
+        mode_text = mode_font.render(f"<  {mode_name}  >", True, WHITE)
+        mode_rect = mode_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
+        surface.blit(mode_text, mode_rect)
+
+        # Best fish count (and time) over all sessions of this mode
+        best_str = f"Most Fish: {summary.get('best_fish_count', 0)}"
+        if mode_key == "endless":
+            best_time = summary.get("best_time", 0)
+            mins = int(best_time // 60)
+            secs = int(best_time % 60)
+            best_str += f"  |  Best Time: {mins:02d}:{secs:02d}"
+        best_text = date_font.render(best_str, True, (120, 140, 160))
+        best_rect = best_text.get_rect(center=(SCREEN_WIDTH // 2, 185))
+        surface.blit(best_text, best_rect)
+
+        if not rows:
+            empty_text = score_font.render(
+                "No scores yet", True, (180, 200, 220)
+            )
+            empty_rect = empty_text.get_rect(
+                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+            )
+            surface.blit(empty_text, empty_rect)
 
-            score_str = f"Score: {high_score}  |  Fish: {fish_count}"
+        # Score entries
+        y_pos = 230
+        for rank, row in enumerate(rows, start=1):
+            score_str = f"{rank:>2}.  "
+            if row["player"]:
+                score_str += f"{row['player'][:12]}  -  "
+            score_str += f"Score: {row['score']}  |  Fish: {row['fish_count']}"
 
             # Add time for endless mode
             if mode_key == "endless":
-                best_time = scores[mode_key].get("best_time", 0)
-                mins = int(best_time // 60)
-                secs = int(best_time % 60)
-                score_str += f"  |  Best Time: {mins:02d}:{secs:02d}"
+                mins = int(row["time_played"] // 60)
+                secs = int(row["time_played"] % 60)
+                score_str += f"  |  Time: {mins:02d}:{secs:02d}"
 
             score_text = score_font.render(score_str, True, (180, 200, 220))
             score_rect = score_text.get_rect(
-                center=(SCREEN_WIDTH // 2, y_pos + 35)
+                midleft=(SCREEN_WIDTH // 2 - 330, y_pos)
             )
             surface.blit(score_text, score_rect)
 
             # Date achieved
-            if date:
+            if row["date"]:
                 date_text = date_font.render(
-                    f"Set: {date}", True, (120, 140, 160)
+                    row["date"], True, (120, 140, 160)
                 )
                 date_rect = date_text.get_rect(
-                    center=(SCREEN_WIDTH // 2, y_pos + 60)
+                    midright=(SCREEN_WIDTH // 2 + 330, y_pos)
                 )
                 surface.blit(date_text, date_rect)
 
-            y_pos += 110
+            y_pos += 45
 
         # Instructions
         instruction_text = self.instruction_font.render(
-            "Press ESC or ENTER to return", True, WHITE
+            "LEFT/RIGHT to change mode, ESC or ENTER to return", True, WHITE
         )
         instruction_rect = instruction_text.get_rect(
             center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)
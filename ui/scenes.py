@@ -0,0 +1,285 @@
+"""
+Tavish, Debbie, Zac, Aradhya
+
+Scenes for Fish-O-Mania.
+
+The game is a stack of scenes that share one display, one clock, the
+asset cache (mechanics.assets) and one BackgroundManager. The menu stays
+alive underneath a game mode: returning to it resets its positions and
+restarts its music instead of rebuilding the screen, background, fonts
+and buttons, and the modes reuse the menu's window and background.
+
+Usage:
+    manager = SceneManager(screen, clock)
+    manager.run(MenuScene())
+
+Classes:
+    Scene: Base class of a scene.
+    SceneManager: The scene stack and the shared display.
+    MenuScene: The main menu.
+    ModeScene: A game mode; runs the mode's loop until it returns.
+"""
+
+import importlib
+
+import pygame
+
+from mechanics import assets, gc_policy, startup
+from mechanics.constants import FPS
+from mechanics.game_log import fields, get_logger
+from mechanics.tracing import flush_trace
+from ui.menu_screen import MenuScreen
+
+log = get_logger("scenes")
+
+# Mode name -> (module, window caption, launch message)
+MODES = {
+    "classic": ("modes.mode_classic", "Fish-O-Mania: Classic Mode",
+                "Launching Classic Mode..."),
+    "time_attack": ("modes.mode_time_attack", "Fish-O-Mania: Time Attack",
+                    "Launching Time Attack..."),
+    "endless": ("modes.mode_endless", "Fish-O-Mania: Endless Mode",
+                "Launching Endless Mode..."),
+}
+
+
+class Scene:
+    """
+    Base class of a scene.
+
+    Attributes:
+        manager (SceneManager): The manager running the scene.
+    """
+
+    manager = None
+
+    def enter(self, manager):
+        """
+        Called when the scene is pushed.
+
+        Args:
+            manager (SceneManager): The manager running the scene.
+        """
+        self.manager = manager
+
+    def step(self):
+        """Run one step: a frame, or a whole blocking game loop."""
+        raise NotImplementedError
+
+    def resume(self):
+        """Called when the scene above this one is popped."""
+
+    def exit(self):
+        """Called when the scene is popped."""
+
+
+class SceneManager:
+    """
+    Runs a stack of scenes; the top scene is the active one.
+
+    Attributes:
+        screen (pygame.Surface): The shared display surface.
+        clock (pygame.time.Clock): The shared frame clock.
+        background (BackgroundManager): Background shared by the scenes,
+            None until the first scene creates it.
+        stack (list): Scenes, active scene last.
+    """
+
+    def __init__(self, screen, clock, background=None):
+        """
+        Initialize with an empty stack.
+
+        Args:
+            screen (pygame.Surface): The display surface.
+            clock (pygame.time.Clock): The frame clock.
+            background (BackgroundManager): Shared background, or None.
+        """
+        self.screen = screen
+        self.clock = clock
+        self.background = background
+        self.stack = []
+
+    def push(self, scene):
+        """
+        Make a scene the active one.
+
+        Args:
+            scene (Scene): The scene.
+        """
+        self.stack.append(scene)
+        scene.enter(self)
+
+    def pop(self):
+        """Remove the active scene and resume the one below it."""
+        scene = self.stack.pop()
+        scene.exit()
+        if self.stack:
+            self.stack[-1].resume()
+
+    def run(self, scene):
+        """
+        Run scenes until the stack is empty.
+
+        Args:
+            scene (Scene): The first scene.
+        """
+        self.push(scene)
+        while self.stack:
+            self.stack[-1].step()
+
+
+class MenuScene(Scene):
+    """
+    The main menu, kept alive for the whole process.
+
+    Attributes:
+        menu (MenuScreen): The menu screen.
+    """
+
+    menu = None
+
+    def enter(self, manager):
+        """Build the menu screen once."""
+        super().enter(manager)
+        with startup.phase("MenuScreen()", "ui"):
+            self.menu = MenuScreen(manager.background)
+        manager.background = self.menu.background
+        # Modules and menu assets live for the whole process
+        gc_policy.freeze()
+
+    def resume(self):
+        """Come back from a mode."""
+        flush_trace()
+        assets.trim()
+        # The mode's end_gameplay() unfroze the menu's objects too
+        gc_policy.freeze()
+        pygame.display.set_caption("Fish-O-Mania")
+        self.menu.reset()
+
+    def launch(self, action):
+        """
+        Start the transition to a game mode.
+
+        Args:
+            action (str): Mode name.
+        """
+        pygame.mixer.music.stop()
+        startup.begin_mode_switch(action)
+        self.menu.start_transition(action)
+        gc_policy.natural_pause()
+
+    def handle_key(self, key):
+        """
+        Handle a key press.
+
+        Args:
+            key (int): pygame key constant.
+        """
+        menu = self.menu
+        if key == pygame.K_ESCAPE:
+            if menu.showing_high_scores:
+                menu.showing_high_scores = False
+            else:
+                self.manager.pop()
+
+        elif not menu.transitioning:
+            if menu.showing_high_scores:
+                # Close high scores on Enter or Escape
+                if key in [pygame.K_RETURN, pygame.K_ESCAPE]:
+                    menu.showing_high_scores = False
+                # Page through the modes
+                elif key == pygame.K_LEFT:
+                    menu.change_high_score_page(-1)
+                elif key == pygame.K_RIGHT:
+                    menu.change_high_score_page(1)
+            else:
+                # Keyboard navigation
+                if key == pygame.K_UP:
+                    menu.move_selection(-1)
+                elif key == pygame.K_DOWN:
+                    menu.move_selection(1)
+                elif key == pygame.K_RETURN:
+                    self.handle_action(menu.select_current())
+
+    def handle_action(self, action):
+        """
+        Act on a selected or clicked button.
+
+        Args:
+            action (str): Button action, or None.
+        """
+        if action in MODES:
+            self.launch(action)
+        elif action == "high_scores":
+            self.menu.show_high_scores()
+        elif action == "quit":
+            self.manager.pop()
+
+    def step(self):
+        """Run one menu frame."""
+        menu = self.menu
+        mouse_clicked = False
+
+        # Event handling
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.manager.pop()
+                return
+
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1:  # Left click
+                    mouse_clicked = True
+
+            elif event.type == pygame.KEYDOWN:
+                self.handle_key(event.key)
+                if self.manager.stack[-1:] != [self]:
+                    return
+
+        # Handle mouse clicks
+        if mouse_clicked and not menu.transitioning:
+            if not menu.showing_high_scores:
+                self.handle_action(
+                    menu.handle_click(pygame.mouse.get_pos()))
+                if self.manager.stack[-1:] != [self]:
+                    return
+
+        # Update menu; launch the game mode after the transition
+        result = menu.update()
+        if result in MODES:
+            self.manager.push(ModeScene(result))
+            return
+
+        # Draw menu
+        menu.draw(self.manager.screen)
+        pygame.display.flip()
+        startup.first_frame()
+        self.manager.clock.tick(FPS)
+
+
+class ModeScene(Scene):
+    """
+    A game mode. The mode's loop runs to completion in one step, then
+    the scene pops itself.
+
+    Attributes:
+        mode (str): Mode name, a key of MODES.
+    """
+
+    def __init__(self, mode):
+        """
+        Initialize for a mode.
+
+        Args:
+            mode (str): Mode name, a key of MODES.
+        """
+        self.mode = mode
+
+    def step(self):
+        """Run the mode until the player leaves it."""
+        module_name, caption, message = MODES[self.mode]
+        startup.mark("transition done")
+        log.info(message, extra=fields(mode=self.mode))
+        pygame.display.set_caption(caption)
+        module = importlib.import_module(module_name)
+        module.main(background=self.manager.background)
+        self.manager.pop()